@@ -1,17 +1,27 @@
 import logging
+import os
 from typing import List
 
+import dotenv
 from fastapi import FastAPI, HTTPException, status
 from fastapi.responses import JSONResponse, RedirectResponse
 from pydantic import BaseModel
 
+from business_object.evaluateur_combinaison import EvaluateurCombinaison
+from dao.table_dao import TableDao
 from service.action_service import ActionService
 from service.credit_service import CreditService
+from service.equite_service import EquiteService
 from service.joueur_service import JoueurService
+from service.paquet_service import PaquetService
 from service.table_service import TableService
 from utils.log_init import initialiser_logs
 from utils.reset_database import ResetDatabase
+from utils.verrous import GestionnaireVerrous
 
+# Les routes sont des fonctions synchrones : FastAPI les exécute dans son pool de threads,
+# sans bloquer la boucle d'événements (accès aux bases, calcul d'équité). L'état partagé
+# des tables et des joueurs est protégé par leurs verrous (voir GestionnaireVerrous).
 app = FastAPI(title="ENS'ALL IN")
 
 
@@ -20,8 +30,14 @@ initialiser_logs("Webservice")
 joueur_service = JoueurService()
 credit_service = CreditService()
 action_service = ActionService()
+equite_service = EquiteService()
 table_service = TableService()
 
+# Sauvegarde des tables entre deux redémarrages, restaurées à la demande
+dotenv.load_dotenv()
+if os.environ.get("SAUVEGARDE_TABLES"):
+    TableService.activer_sauvegarde(TableDao(os.environ["SAUVEGARDE_TABLES"]))
+
 
 @app.get("/", include_in_schema=False)
 async def redirect_to_docs():
@@ -39,7 +55,7 @@ class JoueurModel(BaseModel):
 
 
 @app.put("/admin/crediter/{pseudo}/{montant}", tags=["Admin"])
-async def crediter(pseudo: str, montant: int):
+def crediter(pseudo: str, montant: int):
     joueur = joueur_service.trouver_par_pseudo(pseudo)
     credit_service.crediter(joueur, montant)
     message = f"L'admin a bien crédité {montant} à {joueur.pseudo}"
@@ -47,22 +63,47 @@ async def crediter(pseudo: str, montant: int):
 
 
 @app.put("/admin/debiter/{pseudo}/{montant}", tags=["Admin"])
-async def debiter(pseudo, montant: int):
+def debiter(pseudo, montant: int):
     joueur = joueur_service.trouver_par_pseudo(pseudo)
     credit_service.debiter(joueur.id_joueur, montant)
     message = f"l'admin a bien débité {montant} à {joueur.pseudo}"
     return message
 
 
+@app.get("/admin/cache_evaluation", tags=["Admin"])
+def cache_evaluation():
+    """Taille et taux de succès du cache des évaluations de mains"""
+    return EvaluateurCombinaison.cache().statistiques()
+
+
+@app.get("/admin/verrous", tags=["Admin"])
+def verrous():
+    """Acquisitions et temps d'attente des verrous de tables et de joueurs"""
+    return GestionnaireVerrous().statistiques()
+
+
+@app.get("/admin/paquets", tags=["Admin"])
+def pool_paquets():
+    """Taille, ruptures, débit de remplissage (paquets remis par seconde) et de mélange du pool"""
+    return PaquetService().statistiques()
+
+
+@app.get("/admin/equite/{numero_table}", tags=["Admin"])
+def equite_manche_admin(numero_table: int, budget: float = 0.5):
+    """Chances de gain des joueurs en lice, toutes les mains étant connues"""
+    logging.info("calcule l'équité des joueurs (point de vue admin)")
+    return calculer_equite(numero_table, None, budget)
+
+
 @app.get("/joueur/", tags=["Joueurs"])
-async def joueur_lister():
+def joueur_lister():
     """Liste tous les joueurs"""
     logging.info("Liste tous les joueurs")
     return joueur_service.lister_tous()
 
 
 @app.get("/joueur/connexion/{pseudo}", tags=["Joueurs"])
-async def joueur_connexion(pseudo: str):
+def joueur_connexion(pseudo: str):
     """Connecte le joueur"""
     logging.info("Connecte le joueur")
 
@@ -79,28 +120,28 @@ async def joueur_connexion(pseudo: str):
 
 
 @app.get("/joueur/deconnexion/{id_joueur}", tags=["Joueurs"])
-async def joueur_deconnexion(id_joueur: int):
+def joueur_deconnexion(id_joueur: int):
     """Deconnecte le joueur"""
     logging.info("Deconnecte le joueur")
     return joueur_service.deconnexion(id_joueur)
 
 
 @app.get("/joueur/connectes/", tags=["Joueurs"])
-async def joueur_connectes():
+def joueur_connectes():
     """Liste tous les joueurs"""
     logging.info("Liste tous les joueurs connéctés")
     return joueur_service.joueurs_connectes()
 
 
 @app.get("/joueur/connectes/id/{id_joueur}", tags=["Joueurs"])
-async def joueur_par_id(id_joueur: int):
+def joueur_par_id(id_joueur: int):
     """Trouver un joueur à partir de son id"""
     logging.info("Trouver un joueur à partir de son id")
     return joueur_service.trouver_par_id(id_joueur)
 
 
 @app.post("/joueur/", tags=["Joueurs"])
-async def creer_joueur(j: JoueurModel):
+def creer_joueur(j: JoueurModel):
     """Créer un joueur"""
     logging.info("Créer un joueur")
     if joueur_service.pseudo_deja_utilise(j.pseudo):
@@ -114,7 +155,7 @@ async def creer_joueur(j: JoueurModel):
 
 
 @app.put("/joueur/{id_joueur}/{pseudo}/{pays}", tags=["Joueurs"])
-async def modifier_joueur(id_joueur: int, pseudo: str, pays: str):
+def modifier_joueur(id_joueur: int, pseudo: str, pays: str):
     """Modifier un joueur"""
     logging.info("Modifier un joueur")
     joueur = joueur_service.trouver_par_id(id_joueur)
@@ -132,7 +173,7 @@ async def modifier_joueur(id_joueur: int, pseudo: str, pays: str):
 
 
 @app.delete("/joueur/{pseudo}", tags=["Joueurs"])
-async def supprimer_joueur(pseudo: str):
+def supprimer_joueur(pseudo: str):
     """Supprimer un joueur"""
     logging.info("Supprimer un joueur")
     joueur = joueur_service.trouver_par_pseudo(pseudo)
@@ -154,14 +195,21 @@ class TableModel(BaseModel):
 
 
 @app.get("/table/", tags=["Table"])
-async def liste_tables():
+def liste_tables():
     """liste les tables"""
     logging.info("liste les tables")
     return table_service.affichages_tables()
 
 
+@app.get("/table/ouvertes/", tags=["Table"])
+def tables_ouvertes(grosse_blind: int | None = None):
+    """liste les tables où il reste une place, éventuellement pour une grosse blind"""
+    logging.info("liste les tables ouvertes")
+    return [str(table) for table in table_service.tables_ouvertes(grosse_blind)]
+
+
 @app.post("/table/", tags=["Table"])
-async def creer_table(t: TableModel):
+def creer_table(t: TableModel):
     """Créer une table"""
     logging.info("Créer une table")
 
@@ -176,14 +224,14 @@ async def creer_table(t: TableModel):
 
 
 @app.get("/table/joueurs/{numero_table}", tags=["Table"])
-async def joueurs_dans_table(numero_table: int):
+def joueurs_dans_table(numero_table: int):
     table = table_service.table_par_numero(numero_table)
 
     return table.id_joueurs
 
 
 @app.put("/table/ajouter/{numero_table}/{id_joueur}", tags=["Table"])
-async def ajouter_joueur(numero_table: int, id_joueur: int):
+def ajouter_joueur(numero_table: int, id_joueur: int):
     """ajoute un joueur a la table"""
     logging.info(f"ajoute le joueur {id_joueur} a la table {numero_table}")
     joueur = joueur_service.trouver_par_id(id_joueur)
@@ -192,7 +240,7 @@ async def ajouter_joueur(numero_table: int, id_joueur: int):
 
 
 @app.put("/table/retirer/{id_joueur}", tags=["Table"])
-async def retirer_un_joueur(id_joueur: int):
+def retirer_un_joueur(id_joueur: int):
     """retire un joueur a la table"""
     logging.info(f"retire le joueur {id_joueur} de la table")
     table_service.retirer_joueur(id_joueur)
@@ -200,7 +248,7 @@ async def retirer_un_joueur(id_joueur: int):
 
 
 @app.delete("/table/{numero_table}", tags=["Table"])
-async def supprimer_table(numero_table: int):
+def supprimer_table(numero_table: int):
     """Supprimer une table"""
     logging.info("Supprimer une table")
     table_service.supprimer_table(numero_table)
@@ -208,7 +256,7 @@ async def supprimer_table(numero_table: int):
 
 
 @app.put("/manche/lancer/{numero_table}", tags=["Manche"])
-async def lancer_manche(numero_table: int):
+def lancer_manche(numero_table: int):
     logging.info("lance une manche")
 
     try:
@@ -221,36 +269,74 @@ async def lancer_manche(numero_table: int):
 
 
 @app.get("/manche/affichage/{numero_table}", tags=["Manche"])
-async def affichage_general(numero_table: int):
+def affichage_general(numero_table: int):
     """affichage general"""
     logging.info("affichage general")
     return table_service.affichage_general(numero_table=numero_table)
 
 
 @app.get("/manche/main/{numero_table}/{id_joueur}", tags=["Manche"])
-async def regarder_main(id_joueur: int):
+def regarder_main(id_joueur: int):
     """regarder sa main"""
     logging.info("regarder sa main")
     return table_service.regarder_main(id_joueur)
 
 
+@app.get("/manche/equite/{numero_table}", tags=["Manche"])
+def equite_manche(numero_table: int, id_joueur: int, budget: float = 0.5):
+    """Chances de gain des joueurs en lice, vues par id_joueur (seule sa main est connue)"""
+    logging.info("calcule l'équité des joueurs")
+    return calculer_equite(numero_table, id_joueur, budget)
+
+
+def calculer_equite(numero_table: int, id_joueur: int | None, budget: float) -> dict:
+    """Équité des joueurs en lice, une erreur de manche devenant une réponse 400"""
+    try:
+        resultats = equite_service.equite_table(numero_table, id_joueur=id_joueur, budget=budget)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {id_joueur: resultat.to_dict() for id_joueur, resultat in resultats.items()}
+
+
 @app.put("/manche/terminer/{numero_table}", tags=["Manche"])
-async def terminer_manche(numero_table: int):
+def terminer_manche(numero_table: int):
     """termine une manche"""
     logging.info("termine une manche")
     texte = table_service.terminer_manche(numero_table=numero_table)
     return f"la manche est terminé sur la table {numero_table}\n\n" + texte
 
 
+@app.get("/manche/resultat/{numero_table}", tags=["Manche"])
+def resultat_manche(numero_table: int):
+    """résultat détaillé d'une manche terminée"""
+    logging.info("consulte le résultat d'une manche")
+    try:
+        resultat = table_service.resultat_manche(numero_table)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return resultat.to_dict()
+
+
+@app.get("/manche/historique/{numero_table}", tags=["Manche"])
+def historique_manche(numero_table: int):
+    """historique des événements de la manche d'une table"""
+    logging.info("consulte l'historique d'une manche")
+    try:
+        historique = table_service.historique_manche(numero_table)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return historique
+
+
 @app.get("/action/{id_joueur}", tags=["Action"])
-async def manche_joueur(id_joueur: int):
+def manche_joueur(id_joueur: int):
     """Trouver la manche auquel joue le joueur"""
     logging.info("Trouver la manche auquel joue le joueur")
     return action_service.manche_joueur(id_joueur)
 
 
 @app.put("/action/all_in/{id_joueur}", tags=["Action"])
-async def all_in(id_joueur: int):
+def all_in(id_joueur: int):
     """Joue all_in pour le joueur"""
     logging.info("Joue all_in pour le joueur")
     try:
@@ -265,7 +351,7 @@ async def all_in(id_joueur: int):
 
 
 @app.put("/action/checker/{id_joueur}", tags=["Action"])
-async def checker(id_joueur: int):
+def checker(id_joueur: int):
     """Joue checker pour le joueur"""
     logging.info("Joue checker pour le joueur")
     try:
@@ -279,14 +365,14 @@ async def checker(id_joueur: int):
 
 
 @app.put("/action/se_coucher/{id_joueur}", tags=["Action"])
-async def se_coucher(id_joueur: int):
+def se_coucher(id_joueur: int):
     """Joue se_coucher pour le joueur"""
     logging.info("Joue se_coucher pour le joueur")
     return action_service.se_coucher(id_joueur)
 
 
 @app.put("/action/suivre/{id_joueur}/{relance}", tags=["Action"])
-async def suivre(id_joueur: int, relance: int):
+def suivre(id_joueur: int, relance: int):
     """Joue suivre pour le joueur"""
     logging.info("Joue suivre pour le joueur")
     try:
@@ -0,0 +1 @@
+"""Mesures de performance des évaluateurs et de la fin de manche"""
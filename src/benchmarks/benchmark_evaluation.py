@@ -0,0 +1,240 @@
+"""
+Mesure le débit de l'évaluation des mains et de la fin de manche
+
+Trois familles de mesures, toutes exprimées en opérations par seconde :
+- eval_<n>_cartes : EvaluateurCombinaison.eval sur des mains de 5, 6 et 7 cartes
+- classement_<n>_joueurs : Manche.classement sur un board complet, de 2 à 10 joueurs
+- gains_<n>_joueurs : Manche.gains avec des mises différentes (pots annexes)
+
+Les mains sont tirées avec une graine fixe, pour que deux rapports soient comparables.
+Le rapport est écrit au format JSON. S'il est comparé à une référence, le programme
+échoue (code de retour 1) dès qu'une mesure baisse de plus de la tolérance indiquée.
+
+Les débits dépendent de la machine et de l'interpréteur : la référence n'est pas versionnée,
+elle s'enregistre localement (--enregistrer-reference) avant toute comparaison, sur la
+même machine et avec la même version de Python que les rapports qui lui seront comparés.
+
+Utilisation (depuis la racine du dépôt) :
+    PYTHONPATH=src python -m benchmarks.benchmark_evaluation --enregistrer-reference
+    PYTHONPATH=src python -m benchmarks.benchmark_evaluation --reference data/benchmark_reference.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from business_object.board import Board
+from business_object.carte import Carte
+from business_object.evaluateur_combinaison import EvaluateurCombinaison
+from business_object.info_manche import InfoManche
+from business_object.main import Main
+from business_object.manche import Manche
+
+VERSION_RAPPORT = 1
+REFERENCE = Path(__file__).resolve().parents[2] / "data" / "benchmark_reference.json"
+
+
+def mesurer(preparer, executer, n_repetitions: int = 3) -> float:
+    """
+    Mesure le meilleur débit de plusieurs répétitions
+
+    Paramètres
+    ----------
+    preparer : Callable[[], list]
+        construit les entrées d'une répétition (non chronométré)
+    executer : Callable
+        opération chronométrée, appelée sur chaque entrée
+    n_repetitions : int
+        nombre de répétitions, seule la plus rapide est retenue
+
+    Renvois
+    -------
+    float
+        nombre d'opérations par seconde
+    """
+
+    meilleur = 0.0
+    for _ in range(n_repetitions):
+        entrees = preparer()
+        debut = time.perf_counter()
+        for entree in entrees:
+            executer(entree)
+        duree = time.perf_counter() - debut
+        meilleur = max(meilleur, len(entrees) / duree)
+    return meilleur
+
+
+def tirer_mains(n_cartes: int, n_mains: int, graine: int) -> list[list[Carte]]:
+    """Tire n_mains ensembles de n_cartes cartes distinctes"""
+
+    generateur = random.Random(graine)
+    paquet = [Carte.from_code(code) for code in range(52)]
+    return [generateur.sample(paquet, n_cartes) for _ in range(n_mains)]
+
+
+def tirer_manches(n_joueurs: int, n_manches: int, graine: int) -> list[Manche]:
+    """
+    Construit des manches arrivées à l'abattage : mains distribuées, board complet
+    et mises toutes différentes, de sorte que les gains passent par des pots annexes
+    """
+
+    generateur = random.Random(graine)
+    paquet = [Carte.from_code(code) for code in range(52)]
+    manches = []
+    for _ in range(n_manches):
+        cartes = generateur.sample(paquet, 2 * n_joueurs + 5)
+        info = InfoManche(list(range(n_joueurs)))
+        info.assignation_mains([Main(cartes[2 * i : 2 * i + 2]) for i in range(n_joueurs)])
+        for i, mise in enumerate(generateur.sample(range(10, 1000, 10), n_joueurs)):
+            info.modifier_mise(i, mise)
+
+        manche = Manche(info, grosse_blind=10)
+        manche._Manche__board = Board(cartes[2 * n_joueurs :])
+        manches.append(manche)
+    return manches
+
+
+def executer(
+    n_mains: int = 5000, n_manches: int = 500, graine: int = 39, joueurs=range(2, 11)
+) -> dict:
+    """
+    Exécute toutes les mesures
+
+    Paramètres
+    ----------
+    n_mains : int
+        nombre de mains évaluées par répétition
+    n_manches : int
+        nombre de manches classées par répétition
+    graine : int
+        graine des tirages
+    joueurs : iterable[int]
+        nombres de joueurs pour le classement et les gains
+
+    Renvois
+    -------
+    dict
+        rapport : paramètres, environnement et débits (opérations par seconde)
+    """
+
+    mesures = {}
+    for n_cartes in (5, 6, 7):
+        mains = tirer_mains(n_cartes, n_mains, graine)
+        mesures[f"eval_{n_cartes}_cartes"] = mesurer(lambda m=mains: m, EvaluateurCombinaison.eval)
+
+    # Manches reconstruites à chaque répétition : l'analyse du board n'est pas réutilisée
+    for n_joueurs in joueurs:
+        mesures[f"classement_{n_joueurs}_joueurs"] = mesurer(
+            lambda n=n_joueurs: tirer_manches(n, n_manches, graine), Manche.classement
+        )
+    for n_joueurs in joueurs:
+        mesures[f"gains_{n_joueurs}_joueurs"] = mesurer(
+            lambda n=n_joueurs: tirer_manches(n, n_manches, graine), Manche.gains
+        )
+
+    return {
+        "version": VERSION_RAPPORT,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "parametres": {"n_mains": n_mains, "n_manches": n_manches, "graine": graine},
+        "mesures": {nom: round(debit, 1) for nom, debit in mesures.items()},
+    }
+
+
+def comparer(rapport: dict, reference: dict, tolerance: float) -> list[str]:
+    """
+    Compare un rapport à une référence
+
+    Paramètres
+    ----------
+    rapport : dict
+        rapport mesuré
+    reference : dict
+        rapport de référence
+    tolerance : float
+        baisse de débit acceptée, en pourcentage
+
+    Renvois
+    -------
+    list[str]
+        une description par mesure en régression (vide si aucune)
+
+    Exceptions
+    ----------
+    ValueError
+        si la tolérance n'est pas comprise entre 0 et 100
+        si les deux rapports n'ont pas la même version
+    """
+
+    if not 0 <= tolerance <= 100:
+        raise ValueError(f"La tolérance doit être un pourcentage entre 0 et 100 : {tolerance}")
+    if rapport.get("version") != reference.get("version"):
+        raise ValueError(
+            f"Versions de rapport incompatibles : {rapport.get('version')} "
+            f"et {reference.get('version')}"
+        )
+
+    regressions = []
+    for nom, debit_reference in reference["mesures"].items():
+        debit = rapport["mesures"].get(nom)
+        if debit is None:
+            continue
+        baisse = 100 * (1 - debit / debit_reference)
+        if baisse > tolerance:
+            regressions.append(
+                f"{nom} : {debit:.0f} op/s contre {debit_reference:.0f} (-{baisse:.1f} %)"
+            )
+    return regressions
+
+
+def main(arguments: list[str] = None) -> int:
+    """Point d'entrée en ligne de commande, renvoie le code de retour"""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sortie", type=Path, help="fichier JSON du rapport")
+    parser.add_argument("--reference", type=Path, help="rapport de référence à comparer")
+    parser.add_argument("--tolerance", type=float, default=20.0, help="baisse acceptée (%%)")
+    parser.add_argument("--mains", type=int, default=5000, help="mains par répétition")
+    parser.add_argument("--manches", type=int, default=500, help="manches par répétition")
+    parser.add_argument("--graine", type=int, default=39)
+    parser.add_argument(
+        "--enregistrer-reference",
+        action="store_true",
+        help=f"écrit le rapport comme nouvelle référence ({REFERENCE.name})",
+    )
+    arguments = parser.parse_args(arguments)
+
+    rapport = executer(arguments.mains, arguments.manches, arguments.graine)
+    texte = json.dumps(rapport, indent=2, ensure_ascii=False)
+    print(texte)
+
+    if arguments.sortie is not None:
+        arguments.sortie.write_text(texte + "\n", encoding="utf-8")
+    if arguments.enregistrer_reference:
+        REFERENCE.write_text(texte + "\n", encoding="utf-8")
+
+    if arguments.reference is not None:
+        reference = json.loads(arguments.reference.read_text(encoding="utf-8"))
+        for cle in ("python", "machine"):
+            if reference.get(cle) != rapport[cle]:
+                print(
+                    f"Attention : référence mesurée avec {cle} {reference.get(cle)}, "
+                    f"rapport avec {cle} {rapport[cle]} ; les débits ne sont pas comparables",
+                    file=sys.stderr,
+                )
+        regressions = comparer(rapport, reference, arguments.tolerance)
+        for regression in regressions:
+            print(f"Régression : {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
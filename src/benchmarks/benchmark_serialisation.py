@@ -0,0 +1,92 @@
+"""
+Mesure la taille et la vitesse du format binaire des manches (voir FormatBinaire)
+
+Des manches sont jouées jusqu'au premier tour d'enchères, puis leur état
+(Manche.etat) est encodé et décodé avec FormatBinaire, pickle et JSON. Les débits sont
+exprimés en opérations par seconde, les tailles en octets par état.
+
+Objectif du format binaire : un état au moins deux fois plus petit qu'avec pickle
+(environ 220 octets à six joueurs, pseudos compris). Les débits dépendent de la machine ;
+les tests ne vérifient qu'un plancher volontairement bas (DEBIT_MINIMAL), car ils
+tournent aussi sous mesure de couverture, qui ralentit fortement le code Python.
+
+Utilisation (depuis la racine du dépôt) :
+    PYTHONPATH=src python -m benchmarks.benchmark_serialisation
+"""
+
+import json
+import pickle
+import sys
+
+from benchmarks.benchmark_evaluation import mesurer
+from business_object.format_binaire import FormatBinaire
+from business_object.info_manche import InfoManche
+from business_object.manche import Manche
+
+# Encodages ou décodages par seconde en dessous desquels le format est jugé en régression
+DEBIT_MINIMAL = 500
+
+
+def etats_en_cours(n_joueurs: int, n_etats: int) -> list[dict]:
+    """États de manches en cours de jeu : blinds payées et premières relances suivies"""
+
+    etats = []
+    for i in range(n_etats):
+        joueurs = list(range(1000 * i + 1, 1000 * i + n_joueurs + 1))
+        manche = Manche(InfoManche(joueurs, [f"joueur{j}" for j in joueurs]), grosse_blind=20)
+        manche.preflop()
+        manche.action(joueurs[0], "suivre", 5000, 10)
+        manche.action(joueurs[1], "suivre", 5000, 10)
+        manche.fin_des_blinds()
+        for j in joueurs[2:]:
+            manche.action(j, "suivre", 5000, 20 * (i % 5))
+        etats.append(manche.etat())
+    return etats
+
+
+def encoder_json(etat: dict) -> str:
+    """Encodage JSON de référence (octets en hexadécimal)"""
+    return json.dumps(etat, default=bytes.hex)
+
+
+def executer(n_joueurs: int = 6, n_etats: int = 2000) -> dict:
+    """
+    Exécute les mesures
+
+    Paramètres
+    ----------
+    n_joueurs : int
+        nombre de joueurs par manche
+    n_etats : int
+        nombre d'états encodés par répétition
+
+    Renvois
+    -------
+    dict
+        tailles moyennes (octets) et débits (opérations par seconde) par format
+    """
+
+    etats = etats_en_cours(n_joueurs, n_etats)
+    binaires = [FormatBinaire.encoder_etat(etat) for etat in etats]
+    pickles = [pickle.dumps(etat) for etat in etats]
+
+    return {
+        "taille_binaire": sum(map(len, binaires)) / n_etats,
+        "taille_pickle": sum(map(len, pickles)) / n_etats,
+        "taille_json": sum(len(encoder_json(etat)) for etat in etats) / n_etats,
+        "encodage_binaire": round(mesurer(lambda: etats, FormatBinaire.encoder_etat), 1),
+        "decodage_binaire": round(mesurer(lambda: binaires, FormatBinaire.decoder_etat), 1),
+        "encodage_pickle": round(mesurer(lambda: etats, pickle.dumps), 1),
+        "decodage_pickle": round(mesurer(lambda: pickles, pickle.loads), 1),
+        "encodage_json": round(mesurer(lambda: etats, encoder_json), 1),
+    }
+
+
+def main() -> int:
+    """Point d'entrée en ligne de commande"""
+    print(json.dumps(executer(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""Implémentation de la classe AnalyseMain"""
+
+from collections import Counter
+
+from business_object.carte import Carte
+
+
+class AnalyseMain:
+    """
+    Analyse en une seule passe d'une liste de cartes.
+
+    Regroupe les informations dont ont besoin toutes les combinaisons :
+    histogramme des valeurs, cartes par couleur, masque des valeurs présentes
+    (pour les quintes) et valeurs triées. Elle est construite une seule fois par
+    évaluation puis transmise à chaque est_present / from_cartes.
+    """
+
+    __QUINTE_BASSE = 0b1000000001111  # As-2-3-4-5
+
+    def __init__(self, cartes: list[Carte]):
+        """
+        Analyse une liste de cartes
+
+        Paramètres
+        ----------
+        cartes : list[Carte]
+            cartes à analyser
+        """
+
+        self.__cartes = cartes
+        self.__histogramme = [0] * 13
+        self.__masques_couleur = [0, 0, 0, 0]
+        self.__masque = 0
+        self.__signature = 1
+        self.__ajouter(cartes)
+
+    def __ajouter(self, cartes: list[Carte]) -> None:
+        """Ajoute des cartes aux compteurs et masques, et invalide les valeurs dérivées"""
+
+        histogramme = self.__histogramme
+        masques_couleur = self.__masques_couleur
+        masque = self.__masque
+        signature = self.__signature
+        premiers = Carte.PREMIERS
+        for carte in cartes:
+            rang = carte.rang
+            histogramme[rang] += 1
+            masque |= 1 << rang
+            masques_couleur[carte.indice_couleur] |= 1 << rang
+            signature *= premiers[rang]
+
+        self.__masque = masque
+        self.__signature = signature
+        self.__groupes = None
+        self.__rangs = None
+        self.__couleurs = None
+
+    def fusionner(self, cartes: list[Carte]) -> "AnalyseMain":
+        """
+        Renvoie l'analyse de ces cartes ajoutées à celles déjà analysées
+
+        L'analyse courante n'est pas modifiée : seules les nouvelles cartes sont
+        parcourues, ce qui permet de partager l'analyse du board entre les joueurs.
+
+        Paramètres
+        ----------
+        cartes : list[Carte]
+            cartes à ajouter (typiquement les deux cartes d'une main)
+
+        Renvois
+        -------
+        AnalyseMain
+            analyse de l'ensemble des cartes
+        """
+
+        fusion = AnalyseMain.__new__(AnalyseMain)
+        fusion.__cartes = self.__cartes + cartes
+        fusion.__histogramme = self.__histogramme[:]
+        fusion.__masques_couleur = self.__masques_couleur[:]
+        fusion.__masque = self.__masque
+        fusion.__signature = self.__signature
+        fusion.__ajouter(cartes)
+        return fusion
+
+    @property
+    def cartes(self) -> list[Carte]:
+        """Cartes analysées"""
+        return self.__cartes
+
+    @property
+    def histogramme(self) -> list[int]:
+        """Nombre de cartes de chaque valeur, indexé par rang (0 pour 2, 12 pour As)"""
+        return self.__histogramme
+
+    @property
+    def couleurs(self) -> dict[str, list[Carte]]:
+        """Cartes regroupées par couleur, de la plus haute à la plus basse"""
+        if self.__couleurs is None:
+            couleurs = {}
+            for carte in sorted(self.__cartes, key=lambda c: c.rang, reverse=True):
+                couleurs.setdefault(carte.couleur, []).append(carte)
+            self.__couleurs = couleurs
+        return self.__couleurs
+
+    @property
+    def masque(self) -> int:
+        """Masque de 13 bits des valeurs présentes"""
+        return self.__masque
+
+    @property
+    def masques_couleur(self) -> list[int]:
+        """Masque de 13 bits des valeurs présentes dans chaque couleur (à ne pas modifier)"""
+        return self.__masques_couleur
+
+    @property
+    def signature(self) -> int:
+        """Produit des nombres premiers associés aux valeurs des cartes (Carte.PREMIERS)"""
+        return self.__signature
+
+    @property
+    def groupes(self) -> dict[int, list[int]]:
+        """Rangs regroupés par nombre d'occurrences (1 à 4), du plus haut au plus bas"""
+        if self.__groupes is None:
+            groupes = {1: [], 2: [], 3: [], 4: []}
+            for rang in range(12, -1, -1):
+                if self.__histogramme[rang]:
+                    groupes[min(self.__histogramme[rang], 4)].append(rang)
+            self.__groupes = groupes
+        return self.__groupes
+
+    @property
+    def rangs(self) -> list[int]:
+        """Rangs de toutes les cartes, du plus haut au plus bas (doublons compris)"""
+        if self.__rangs is None:
+            self.__rangs = sorted((carte.rang for carte in self.__cartes), reverse=True)
+        return self.__rangs
+
+    @property
+    def compteur(self) -> dict[str, int]:
+        """Nombre de cartes de chaque valeur, dans l'ordre d'apparition des valeurs"""
+        return dict(Counter(carte.valeur for carte in self.__cartes))
+
+    def rangs_par_compte(self, n: int, exact: bool = False) -> list[int]:
+        """
+        Rangs présents au moins (ou exactement) n fois, du plus haut au plus bas
+
+        Paramètres
+        ----------
+        n : int
+            nombre d'occurrences recherché
+        exact : bool
+            si True, seuls les rangs présents exactement n fois sont renvoyés
+
+        Renvois
+        -------
+        list[int]
+            les rangs correspondants
+        """
+
+        groupes = self.groupes
+        if exact:
+            return groupes[n] if n <= 4 else []
+        if n <= 1:
+            return [rang for rang in range(12, -1, -1) if self.__histogramme[rang]]
+        if n >= 4:
+            return groupes[4]
+        return sorted([rang for compte in range(n, 5) for rang in groupes[compte]], reverse=True)
+
+    def couleur_max(self) -> str | None:
+        """Renvoie la couleur comptant au moins 5 cartes, None s'il n'y en a pas"""
+        for indice, masque in enumerate(self.__masques_couleur):
+            if masque.bit_count() >= 5:
+                return Carte.COULEURS()[indice]
+        return None
+
+    @classmethod
+    def hauteur_quinte(cls, masque: int) -> int | None:
+        """
+        Rang de la carte haute de la meilleure quinte contenue dans un masque de valeurs
+
+        Paramètres
+        ----------
+        masque : int
+            masque de 13 bits des valeurs présentes
+
+        Renvois
+        -------
+        int | None
+            rang de la carte haute (3 pour As-2-3-4-5), None s'il n'y a pas de quinte
+        """
+
+        for hauteur in range(12, 3, -1):
+            suite = 0b11111 << (hauteur - 4)
+            if masque & suite == suite:
+                return hauteur
+        if masque & cls.__QUINTE_BASSE == cls.__QUINTE_BASSE:
+            return 3
+        return None
+
+    def quinte(self) -> int | None:
+        """Rang de la carte haute de la meilleure quinte, None s'il n'y en a pas"""
+        return self.hauteur_quinte(self.__masque)
+
+    def quinte_flush(self) -> int | None:
+        """Rang de la carte haute de la meilleure quinte flush, None s'il n'y en a pas"""
+        for masque in self.__masques_couleur:
+            if masque.bit_count() >= 5:
+                return self.hauteur_quinte(masque)
+        return None
@@ -1,5 +1,6 @@
 """Implémentation de la classe Board"""
 
+from business_object.analyse_main import AnalyseMain
 from business_object.carte import Carte
 from business_object.liste_cartes import AbstractListeCartes
 
@@ -33,6 +34,19 @@ class Board(AbstractListeCartes):
             raise ValueError(f"Le nombre de cartes dans le board est trop grand : {len(cartes)}")
 
         super().__init__(cartes, complet)
+        self.__analyse = None
+
+    @property
+    def analyse(self) -> AnalyseMain:
+        """
+        Analyse des cartes du board (valeurs, couleurs, masque des quintes).
+
+        Elle est calculée une seule fois par tour d'enchères, à la première demande,
+        puis partagée par les évaluations de tous les joueurs.
+        """
+        if self.__analyse is None:
+            self.__analyse = AnalyseMain(self.copie())
+        return self.__analyse
 
     def affichage_board(self) -> str:
         """Retourne un affichge plus joli des cartes d'un board"""
@@ -64,9 +78,14 @@ class Board(AbstractListeCartes):
             si le board a déjà plus de 5 cartes
         """
 
-        if carte is not None and len(self.cartes) > 4:
-            raise ValueError(
-                f"Le nombre de cartes dans le board est trop grand : {len(self.cartes) + 1}"
-            )
+        if carte is not None and len(self) > 4:
+            raise ValueError(f"Le nombre de cartes dans le board est trop grand : {len(self) + 1}")
 
         super().ajouter_carte(carte)
+        self.__analyse = None
+
+    def retirer_carte(self, indice: int = 0) -> Carte:
+        """Retire une carte du board selon son indice (voir AbstractListeCartes)"""
+        carte = super().retirer_carte(indice)
+        self.__analyse = None
+        return carte
@@ -0,0 +1,155 @@
+"""Implémentation de la classe CacheEvaluation"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+
+from business_object.carte import Carte
+
+
+class CacheEvaluation:
+    """
+    Cache borné des évaluations de mains, avec éviction du moins récemment utilisé (LRU).
+
+    La clé d'une main est le masque de 52 bits de ses cartes (bit `carte.code`) :
+    deux listes contenant les mêmes cartes, dans n'importe quel ordre, partagent donc
+    la même entrée. Les compteurs de succès et d'échecs permettent de suivre
+    l'efficacité du cache.
+    """
+
+    def __init__(self, evaluer: Callable, taille_max: int = 100_000):
+        """
+        Initialise un cache vide
+
+        Paramètres
+        ----------
+        evaluer : Callable
+            fonction d'évaluation appelée en cas d'absence dans le cache
+        taille_max : int
+            nombre maximal d'évaluations conservées
+
+        Exceptions
+        ----------
+        TypeError
+            si evaluer n'est pas appelable
+        ValueError
+            si taille_max n'est pas un entier strictement positif
+        """
+
+        if not callable(evaluer):
+            raise TypeError("La fonction d'évaluation doit être appelable")
+        if not isinstance(taille_max, int) or taille_max <= 0:
+            raise ValueError(
+                f"La taille maximale du cache doit être un entier positif : {taille_max}"
+            )
+
+        self.__evaluer = evaluer
+        self.__taille_max = taille_max
+        self.__entrees = OrderedDict()
+        self.__verrou = Lock()
+        self.__succes = 0
+        self.__echecs = 0
+
+    @property
+    def taille_max(self) -> int:
+        """Nombre maximal d'évaluations conservées"""
+        return self.__taille_max
+
+    @property
+    def succes(self) -> int:
+        """Nombre d'évaluations trouvées dans le cache"""
+        return self.__succes
+
+    @property
+    def echecs(self) -> int:
+        """Nombre d'évaluations absentes du cache, donc calculées"""
+        return self.__echecs
+
+    @property
+    def taux_succes(self) -> float:
+        """Proportion des demandes servies par le cache (0 si aucune demande)"""
+        total = self.__succes + self.__echecs
+        return self.__succes / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self.__entrees)
+
+    def __contains__(self, cartes) -> bool:
+        return self.cle(cartes) in self.__entrees
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheEvaluation({len(self)}/{self.__taille_max}, "
+            f"succès={self.__succes}, échecs={self.__echecs})"
+        )
+
+    @staticmethod
+    def cle(cartes: list[Carte]) -> int:
+        """
+        Masque de 52 bits d'un ensemble de cartes
+
+        Paramètres
+        ----------
+        cartes : list[Carte]
+            cartes de la main
+
+        Renvois
+        -------
+        int
+            entier dont le bit `carte.code` est à 1 pour chaque carte
+        """
+
+        return Carte.masque(cartes)
+
+    def eval(self, cartes: list[Carte], cle: int = None):
+        """
+        Renvoie l'évaluation d'une main, depuis le cache si elle y figure
+
+        Paramètres
+        ----------
+        cartes : list[Carte]
+            cartes de la main
+        cle : int
+            masque des cartes s'il est déjà connu (par exemple l'union des masques
+            du board et de la main), sinon il est calculé
+
+        Renvois
+        -------
+        le résultat de la fonction d'évaluation pour ces cartes
+        """
+
+        if cle is None:
+            cle = self.cle(cartes)
+        with self.__verrou:
+            if cle in self.__entrees:
+                self.__entrees.move_to_end(cle)
+                self.__succes += 1
+                return self.__entrees[cle]
+            self.__echecs += 1
+
+        # Évaluation hors verrou : deux calculs concurrents d'une même main sont sans gravité
+        resultat = self.__evaluer(cartes)
+
+        with self.__verrou:
+            self.__entrees[cle] = resultat
+            self.__entrees.move_to_end(cle)
+            while len(self.__entrees) > self.__taille_max:
+                self.__entrees.popitem(last=False)
+        return resultat
+
+    def statistiques(self) -> dict:
+        """Renvoie l'état du cache : taille, taille maximale, succès, échecs et taux de succès"""
+        return {
+            "taille": len(self),
+            "taille_max": self.__taille_max,
+            "succes": self.__succes,
+            "echecs": self.__echecs,
+            "taux_succes": self.taux_succes,
+        }
+
+    def vider(self) -> None:
+        """Supprime toutes les évaluations et remet les compteurs à zéro"""
+        with self.__verrou:
+            self.__entrees.clear()
+            self.__succes = 0
+            self.__echecs = 0
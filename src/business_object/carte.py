@@ -2,13 +2,31 @@
 
 
 class Carte:
-    """Modélisation d'une carte dans un jeu de cartes"""
+    """
+    Modélisation d'une carte dans un jeu de cartes
+
+    Il n'existe qu'une seule instance par carte (52 au maximum) : construire deux fois
+    la même carte renvoie le même objet. Chaque carte possède un code entier compris
+    entre 0 et 51, dont les 2 bits de poids faible donnent la couleur et les bits
+    suivants la valeur (code = rang * 4 + indice de couleur).
+    """
 
     """Attributs de la classe"""
     __VALEURS = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "Valet", "Dame", "Roi", "As")
     __COULEURS = ("Pique", "Carreau", "Coeur", "Trêfle")
 
-    def __init__(self, valeur: str, couleur: str) -> "Carte":
+    __slots__ = ("__valeur", "__couleur", "__rang", "__indice_couleur", "__code", "__hash")
+
+    __REGISTRE = {}
+    __PAR_CODE = [None] * 52
+
+    # Masque des 52 cartes du paquet (voir Carte.masque)
+    MASQUE_PAQUET = (1 << 52) - 1
+
+    # Un nombre premier par rang : le produit ne dépend que du multi-ensemble des valeurs
+    PREMIERS = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+    def __new__(cls, valeur: str, couleur: str) -> "Carte":
         """
         Instanciation d'une carte (Jeu de cartes)
 
@@ -22,7 +40,7 @@ class Carte:
         Renvois
         -------
         Carte
-            Instance de 'Carte'
+            Instance unique de 'Carte' correspondant à la valeur et à la couleur
 
         Exceptions
         ----------
@@ -31,13 +49,106 @@ class Carte:
             si la couleur n'existe pas dans un jeu de cartes
         """
 
-        if valeur not in self.__VALEURS:
+        carte = cls.__REGISTRE.get((valeur, couleur))
+        if carte is not None:
+            return carte
+
+        if valeur not in cls.__VALEURS:
             raise ValueError(f"Valeur de la carte incorrecte : {valeur}")
-        if couleur not in self.__COULEURS:
+        if couleur not in cls.__COULEURS:
             raise ValueError(f"Couleur de la carte incorrecte : {couleur}")
 
-        self.__valeur = valeur
-        self.__couleur = couleur
+        carte = super().__new__(cls)
+        carte.__valeur = valeur
+        carte.__couleur = couleur
+        carte.__rang = cls.__VALEURS.index(valeur)
+        carte.__indice_couleur = cls.__COULEURS.index(couleur)
+        carte.__code = carte.__rang << 2 | carte.__indice_couleur
+        carte.__hash = hash(f"Carte({valeur}, {couleur})")
+
+        cls.__REGISTRE[(valeur, couleur)] = carte
+        cls.__PAR_CODE[carte.__code] = carte
+        return carte
+
+    @classmethod
+    def from_code(cls, code: int) -> "Carte":
+        """
+        Retourne la carte correspondant à un code entier
+
+        Paramètres
+        ----------
+        code : int
+            code de la carte, compris entre 0 et 51
+
+        Renvois
+        -------
+        Carte
+            Instance unique de la carte
+
+        Exceptions
+        ----------
+        ValueError
+            si le code n'est pas compris entre 0 et 51
+        """
+
+        if not isinstance(code, int) or not 0 <= code < 52:
+            raise ValueError(f"Code de carte incorrect : {code}")
+
+        carte = cls.__PAR_CODE[code]
+        if carte is None:
+            carte = cls(cls.__VALEURS[code >> 2], cls.__COULEURS[code & 3])
+        return carte
+
+    @staticmethod
+    def masque(cartes) -> int:
+        """
+        Masque de 52 bits d'un ensemble de cartes
+
+        Le bit numéro `carte.code` vaut 1 pour chaque carte présente : l'union,
+        l'intersection et la différence d'ensembles de cartes deviennent des opérations
+        entières (|, &, & ~).
+
+        Paramètres
+        ----------
+        cartes : iterable[Carte]
+            cartes de l'ensemble
+
+        Renvois
+        -------
+        int
+            masque des cartes
+        """
+
+        masque = 0
+        for carte in cartes:
+            masque |= 1 << carte.code
+        return masque
+
+    @classmethod
+    def depuis_masque(cls, masque: int) -> list["Carte"]:
+        """
+        Cartes d'un masque de 52 bits, par code croissant
+
+        Paramètres
+        ----------
+        masque : int
+            masque de cartes (voir Carte.masque)
+
+        Renvois
+        -------
+        list[Carte]
+            les cartes dont le bit est à 1
+        """
+
+        if not isinstance(masque, int) or not 0 <= masque <= cls.MASQUE_PAQUET:
+            raise ValueError(f"Masque de cartes incorrect : {masque}")
+
+        cartes = []
+        while masque:
+            bas = masque & -masque
+            cartes.append(cls.from_code(bas.bit_length() - 1))
+            masque ^= bas
+        return cartes
 
     @classmethod
     def VALEURS(cls) -> tuple[str]:
@@ -59,6 +170,33 @@ class Carte:
         """Retourne la couleur de la carte"""
         return self.__couleur
 
+    @property
+    def rang(self) -> int:
+        """Retourne l'indice de la valeur de la carte (0 pour le 2, 12 pour l'As)"""
+        return self.__rang
+
+    @property
+    def indice_couleur(self) -> int:
+        """Retourne l'indice de la couleur de la carte"""
+        return self.__indice_couleur
+
+    @property
+    def code(self) -> int:
+        """Retourne le code entier de la carte, compris entre 0 et 51"""
+        return self.__code
+
+    def __copy__(self) -> "Carte":
+        """Une carte est unique : sa copie est elle-même"""
+        return self
+
+    def __deepcopy__(self, memo) -> "Carte":
+        """Une carte est unique : sa copie est elle-même"""
+        return self
+
+    def __reduce__(self):
+        """Reconstruit la carte via le registre lors de la désérialisation"""
+        return (Carte, (self.__valeur, self.__couleur))
+
     def __str__(self) -> str:
         """Représentation informelle d'un objet de type Carte"""
         return f"{self.__valeur} de {self.__couleur.lower()}"
@@ -85,7 +223,7 @@ class Carte:
         if not isinstance(other, Carte):
             return False
 
-        return self.__valeur == other.__valeur and self.__couleur == other.__couleur
+        return self.__code == other.__code
 
     def __lt__(self, other) -> bool:
         """
@@ -105,7 +243,7 @@ class Carte:
         if not isinstance(other, Carte):
             raise TypeError(f"L'objet comparé n'est pas de type Carte : {type(other)}")
 
-        return self.VALEURS().index(self.valeur) < self.VALEURS().index(other.valeur)
+        return self.__rang < other.__rang
 
     def __gt__(self, other) -> bool:
         """
@@ -125,11 +263,11 @@ class Carte:
         if not isinstance(other, Carte):
             raise TypeError(f"L'objet comparé n'est pas de type Carte : {type(other)}")
 
-        return self.VALEURS().index(self.valeur) > self.VALEURS().index(other.valeur)
+        return self.__rang > other.__rang
 
     def __hash__(self) -> int:
         """Code de hachage déterminé selon la représentation officielle de la carte"""
-        return hash(self.__repr__())
+        return self.__hash
 
     def valeur_egale(self, other) -> bool:
         """
@@ -150,4 +288,4 @@ class Carte:
         if not isinstance(other, Carte):
             raise TypeError(f"L'objet comparé n'est pas de type Carte : {type(other)}")
 
-        return self.VALEURS().index(self.valeur) == self.VALEURS().index(other.valeur)
+        return self.__rang == other.__rang
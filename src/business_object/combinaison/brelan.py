@@ -1,5 +1,4 @@
-from collections import Counter
-
+from business_object.analyse_main import AnalyseMain
 from business_object.carte import Carte
 from business_object.combinaison.combinaison import AbstractCombinaison
 
@@ -40,12 +39,12 @@ class Brelan(AbstractCombinaison):
         int
             Valeur numérique représentant la force d’un Brelan.
             Plus la valeur est élevée, plus la combinaison est forte.
-            Ici, un Brelan a une force de 4.
+            Ici, un Brelan a une force de 3.
         """
-        return 4
+        return 3
 
     @classmethod
-    def est_present(cls, cartes: list[Carte]) -> bool:
+    def est_present(cls, cartes: list[Carte], analyse: AnalyseMain = None) -> bool:
         """
         Vérifie la présence d'un Brelan dans une liste de cartes.
 
@@ -53,18 +52,20 @@ class Brelan(AbstractCombinaison):
         ----------
         cartes : list[Carte]
             Liste des cartes à analyser.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Renvois
         -------
         bool
             True si au moins trois cartes de même valeur sont présentes, False sinon.
         """
-        valeurs = [c.valeur for c in cartes]
-        freq = Counter(valeurs).values()
-        return 3 in freq
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
+        return bool(analyse.rangs_par_compte(3, exact=True))
 
     @classmethod
-    def from_cartes(cls, cartes: list[Carte]) -> "Brelan":
+    def from_cartes(cls, cartes: list[Carte], analyse: AnalyseMain = None) -> "Brelan":
         """
         Construit un objet Brelan à partir d'une liste de cartes.
 
@@ -72,6 +73,8 @@ class Brelan(AbstractCombinaison):
         ----------
         cartes : list[Carte]
             Liste des cartes disponibles pour former le Brelan.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Renvois
         -------
@@ -84,22 +87,17 @@ class Brelan(AbstractCombinaison):
             Levée si aucune combinaison de trois cartes de même valeur n’est trouvée.
         """
         cls.verifier_min_cartes(cartes)
-        valeurs = [c.valeur for c in cartes]
-        compteur = Counter(valeurs)
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
 
-        brelans = [v for v, count in compteur.items() if count == 3]
+        brelans = analyse.rangs_par_compte(3, exact=True)
         if not brelans:
-            details = ", ".join(f"{val}:{nb}" for val, nb in compteur.items())
+            details = ", ".join(f"{val}:{nb}" for val, nb in analyse.compteur.items())
             raise ValueError(f"Aucun brelan présent dans les cartes {details}")
 
-        hauteur = max(brelans, key=lambda v: Carte.VALEURS().index(v))
-        autres = sorted(
-            (c for c in cartes if c.valeur != hauteur),
-            key=lambda c: Carte.VALEURS().index(c.valeur),
-            reverse=True,
-        )
-        kicker = tuple(c.valeur for c in autres[:2])
-        return cls(hauteur, kicker)
+        hauteur = brelans[0]
+        kicker = tuple(Carte.VALEURS()[r] for r in analyse.rangs if r != hauteur)[:2]
+        return cls(Carte.VALEURS()[hauteur], kicker)
 
     def __str__(self) -> str:
         """
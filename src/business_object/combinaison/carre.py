@@ -1,6 +1,6 @@
-from collections import Counter
 from typing import List
 
+from business_object.analyse_main import AnalyseMain
 from business_object.carte import Carte
 
 from .combinaison import AbstractCombinaison
@@ -50,7 +50,7 @@ class Carre(AbstractCombinaison):
         return 7
 
     @classmethod
-    def est_present(cls, cartes: List[Carte]) -> bool:
+    def est_present(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> bool:
         """
         Vérifie la présence d'un Carré dans une liste de cartes.
 
@@ -58,18 +58,20 @@ class Carre(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Liste des cartes à analyser.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Renvois
         -------
         bool
             True si au moins quatre cartes de même valeur sont présentes, False sinon.
         """
-        valeurs = [c.valeur for c in cartes]
-        compteur = Counter(valeurs)
-        return any(count >= 4 for count in compteur.values())
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
+        return bool(analyse.rangs_par_compte(4))
 
     @classmethod
-    def from_cartes(cls, cartes: List[Carte]) -> "Carre":
+    def from_cartes(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> "Carre":
         """
         Construit un Carré à partir d’une liste de cartes.
 
@@ -77,6 +79,8 @@ class Carre(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Liste des cartes disponibles.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Renvois
         -------
@@ -89,21 +93,17 @@ class Carre(AbstractCombinaison):
             Levée si aucun Carré n’est trouvé dans les cartes.
         """
         cls.verifier_min_cartes(cartes)
-        valeurs = [c.valeur for c in cartes]
-        compteur = Counter(valeurs)
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
 
-        carres_possibles = [v for v, count in compteur.items() if count >= 4]
+        carres_possibles = analyse.rangs_par_compte(4)
         if not carres_possibles:
-            raise ValueError(f"Aucun Carré présent dans les cartes : {dict(compteur)}")
+            raise ValueError(f"Aucun Carré présent dans les cartes : {analyse.compteur}")
 
-        # Hauteur = Carré le plus fort
-        hauteur = max(carres_possibles, key=lambda v: Carte.VALEURS().index(v))
-
-        # Kicker = carte la plus haute hors Carré
-        autres = [c for c in cartes if c.valeur != hauteur]
-        kicker_valeur = max(autres, key=lambda c: Carte.VALEURS().index(c.valeur)).valeur
-
-        return cls(hauteur, (kicker_valeur,))
+        # Hauteur = Carré le plus fort, kicker = carte la plus haute hors Carré
+        hauteur = carres_possibles[0]
+        kicker = next(r for r in analyse.rangs if r != hauteur)
+        return cls(Carte.VALEURS()[hauteur], (Carte.VALEURS()[kicker],))
 
     def __str__(self) -> str:
         """
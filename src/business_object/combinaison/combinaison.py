@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from functools import total_ordering
 from typing import List, Optional, Tuple, Union
 
+from business_object.analyse_main import AnalyseMain
 from business_object.carte import Carte
 
 
@@ -23,6 +24,8 @@ class AbstractCombinaison(ABC):
         Levée si les types de `hauteur` ou `kicker` ne sont pas valides.
     """
 
+    __RANGS = {valeur: rang for rang, valeur in enumerate(Carte.VALEURS())}
+
     def __init__(
         self,
         hauteur: Union[str, Tuple[str, ...], List[str]],
@@ -45,6 +48,7 @@ class AbstractCombinaison(ABC):
             raise TypeError("Le kicker doit être un str, une liste, un tuple ou None.")
 
         self._hauteur = hauteur
+        self._cle = self._calculer_cle()
 
     @staticmethod
     def verifier_min_cartes(cartes: list, n: int = 5) -> None:
@@ -110,7 +114,7 @@ class AbstractCombinaison(ABC):
 
     @classmethod
     @abstractmethod
-    def est_present(cls, cartes: List[Carte]) -> bool:
+    def est_present(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> bool:
         """
         Indique si la combinaison est présente dans une liste de cartes.
 
@@ -118,6 +122,8 @@ class AbstractCombinaison(ABC):
         ----------
         cartes : list[Carte]
             Cartes à analyser.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée, partagée entre les combinaisons.
 
         Renvois
         -------
@@ -128,7 +134,9 @@ class AbstractCombinaison(ABC):
 
     @classmethod
     @abstractmethod
-    def from_cartes(cls, cartes: List[Carte]) -> "AbstractCombinaison":
+    def from_cartes(
+        cls, cartes: List[Carte], analyse: AnalyseMain = None
+    ) -> "AbstractCombinaison":
         """
         Construit une instance de la combinaison à partir d’une liste de cartes.
 
@@ -136,6 +144,8 @@ class AbstractCombinaison(ABC):
         ----------
         cartes : list[Carte]
             Cartes à partir desquelles construire la combinaison.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée, partagée entre les combinaisons.
 
         Renvois
         -------
@@ -145,38 +155,58 @@ class AbstractCombinaison(ABC):
         pass # pragma: no cover
 
     # --- Comparaison entre combinaisons ---
-    def _valeur_comparaison(self) -> Tuple[int, Tuple[int, ...], Tuple[int, ...]]:
+    def _calculer_cle(self) -> int:
         """
-        Renvoie les valeurs numériques permettant de comparer deux combinaisons.
+        Calcule la clé entière de comparaison de la combinaison.
+
+        La FORCE occupe les bits de poids fort, suivie des rangs (4 bits chacun)
+        des cinq premières valeurs de hauteur puis de kicker. Le format est celui
+        des forces d'EvaluateurRapide.
 
         Renvois
         -------
-        tuple
-            Triplet (force, indices hauteur, indices kicker) pour comparaison.
+        int
+            Clé de comparaison.
+
+        Exceptions
+        ----------
+        ValueError
+            Levée si une valeur de hauteur ou de kicker n'existe pas.
         """
-        # Hauteur → indices
-        if isinstance(self._hauteur, (list, tuple)):
-            hauteur_vals = tuple(Carte.VALEURS().index(h) for h in self._hauteur)
-        else:
-            hauteur_vals = (Carte.VALEURS().index(self._hauteur),)
+        hauteur = self._hauteur if isinstance(self._hauteur, list) else [self._hauteur]
+        valeurs = (hauteur + list(self._kicker))[:5]
 
-        # Kicker → indices
-        if not self._kicker:
-            kicker_vals = ()
-        else:
-            kicker_vals = tuple(Carte.VALEURS().index(k) for k in self._kicker)
+        cle = self.FORCE()
+        for valeur in valeurs:
+            if valeur not in self.__RANGS:
+                raise ValueError(f"Valeur de la carte incorrecte : {valeur}")
+            cle = (cle << 4) | self.__RANGS[valeur]
+        return cle << (4 * (5 - len(valeurs)))
 
-        return (self.FORCE(), hauteur_vals, kicker_vals)
+    @property
+    def cle(self) -> int:
+        """
+        Retourne la clé entière de comparaison, calculée à la construction.
+
+        Renvois
+        -------
+        int
+            Clé comparable à celle de toute autre combinaison.
+        """
+        return self._cle
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, AbstractCombinaison):
             return NotImplemented
-        return self._valeur_comparaison() == other._valeur_comparaison()
+        return self._cle == other._cle
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, AbstractCombinaison):
             return NotImplemented
-        return self._valeur_comparaison() < other._valeur_comparaison()
+        return self._cle < other._cle
+
+    def __hash__(self) -> int:
+        return hash(self._cle)
 
     # --- Représentations ---
     def _fmt_valeurs(self, val) -> Optional[str]:
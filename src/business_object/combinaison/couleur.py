@@ -1,6 +1,6 @@
-from collections import Counter
 from typing import List
 
+from business_object.analyse_main import AnalyseMain
 from business_object.carte import Carte
 
 from .combinaison import AbstractCombinaison
@@ -40,7 +40,7 @@ class Couleur(AbstractCombinaison):
         return 5
 
     @classmethod
-    def est_present(cls, cartes: List[Carte]) -> bool:
+    def est_present(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> bool:
         """
         Vérifie la présence d'une Couleur dans une liste de cartes.
 
@@ -48,18 +48,20 @@ class Couleur(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Main de cartes à analyser.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Returns
         -------
         bool
             True si au moins cinq cartes ont la même couleur, False sinon.
         """
-        couleurs = [c.couleur for c in cartes]
-        freq = Counter(couleurs)
-        return any(count >= 5 for count in freq.values())
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
+        return analyse.couleur_max() is not None
 
     @classmethod
-    def from_cartes(cls, cartes: List[Carte]) -> "Couleur":
+    def from_cartes(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> "Couleur":
         """
         Construit une combinaison Couleur à partir d'une liste de cartes.
 
@@ -67,6 +69,8 @@ class Couleur(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Liste de cartes disponibles.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Returns
         -------
@@ -79,16 +83,13 @@ class Couleur(AbstractCombinaison):
             Si aucune couleur n'est présente.
         """
         cls.verifier_min_cartes(cartes)
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
 
-        couleurs = [c.couleur for c in cartes]
-        couleur_max = next((c for c in set(couleurs) if couleurs.count(c) >= 5), None)
+        couleur_max = analyse.couleur_max()
         if couleur_max is None:
             raise ValueError("Aucune Couleur présente dans les cartes")
-
-        cartes_couleur = [c for c in cartes if c.couleur == couleur_max]
-        cartes_couleur.sort(key=lambda c: Carte.VALEURS().index(c.valeur), reverse=True)
-
-        hauteur = [c.valeur for c in cartes_couleur[:5]]
+        hauteur = [c.valeur for c in analyse.couleurs[couleur_max][:5]]
         return cls(hauteur=hauteur, kicker=None)
 
     def __str__(self) -> str:
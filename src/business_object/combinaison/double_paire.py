@@ -1,6 +1,6 @@
-from collections import Counter
 from typing import List, Tuple
 
+from business_object.analyse_main import AnalyseMain
 from business_object.carte import Carte
 
 from .combinaison import AbstractCombinaison
@@ -41,7 +41,7 @@ class DoublePaire(AbstractCombinaison):
         return 2
 
     @classmethod
-    def est_present(cls, cartes: List[Carte]) -> bool:
+    def est_present(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> bool:
         """
         Vérifie la présence d'une Double Paire dans une liste de cartes.
 
@@ -49,19 +49,20 @@ class DoublePaire(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Liste de cartes à analyser.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Returns
         -------
         bool
             True si au moins deux valeurs apparaissent au moins deux fois.
         """
-        valeurs = [c.valeur for c in cartes]
-        freq = Counter(valeurs)
-        paires = [v for v, count in freq.items() if count >= 2]
-        return len(paires) >= 2
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
+        return len(analyse.rangs_par_compte(2)) >= 2
 
     @classmethod
-    def from_cartes(cls, cartes: List[Carte]) -> "DoublePaire":
+    def from_cartes(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> "DoublePaire":
         """
         Construit une Double Paire à partir d'une liste de cartes.
 
@@ -69,6 +70,8 @@ class DoublePaire(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Liste de cartes disponibles.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Returns
         -------
@@ -81,26 +84,22 @@ class DoublePaire(AbstractCombinaison):
             Si aucune Double Paire n'est présente.
         """
         cls.verifier_min_cartes(cartes)
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
 
-        valeurs = [c.valeur for c in cartes]
-        compteur = Counter(valeurs)
-        paires_possibles = [v for v, count in compteur.items() if count >= 2]
-
+        paires_possibles = analyse.rangs_par_compte(2)
         if len(paires_possibles) < 2:
             raise ValueError("Aucune Double Paire présente dans les cartes")
 
         # Sélection des deux paires les plus fortes
-        paires_hautes = tuple(
-            sorted(paires_possibles, key=lambda v: Carte.VALEURS().index(v), reverse=True)[:2]
-        )
+        paires_hautes = paires_possibles[:2]
 
         # Kicker : carte la plus haute restante
-        cartes_restantes = [v for v in valeurs if v not in paires_hautes]
+        cartes_restantes = [r for r in analyse.rangs if r not in paires_hautes]
         kicker = ()
         if cartes_restantes:
-            kicker = (max(cartes_restantes, key=lambda v: Carte.VALEURS().index(v)),)
-
-        return cls(hauteur=paires_hautes, kicker=kicker)
+            kicker = (Carte.VALEURS()[cartes_restantes[0]],)
+        return cls(hauteur=tuple(Carte.VALEURS()[r] for r in paires_hautes), kicker=kicker)
 
     def __str__(self) -> str:
         """
@@ -1,6 +1,6 @@
-from collections import Counter
 from typing import List, Optional
 
+from business_object.analyse_main import AnalyseMain
 from business_object.carte import Carte
 
 from .combinaison import AbstractCombinaison
@@ -41,7 +41,7 @@ class Full(AbstractCombinaison):
         return 6
 
     @classmethod
-    def est_present(cls, cartes: List[Carte]) -> bool:
+    def est_present(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> bool:
         """
         Vérifie la présence d'un Full dans une liste de cartes.
 
@@ -49,20 +49,21 @@ class Full(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Main de cartes à analyser.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Returns
         -------
         bool
             True si un Brelan et une Paire distincte sont présents.
         """
-        valeurs = [c.valeur for c in cartes]
-        compteur = Counter(valeurs)
-        has_brelan = any(count >= 3 for count in compteur.values())
-        has_paire = any(count >= 2 for v, count in compteur.items() if count < 3)
-        return has_brelan and has_paire
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
+        # La paire peut provenir d'un second brelan
+        return bool(analyse.rangs_par_compte(3)) and len(analyse.rangs_par_compte(2)) >= 2
 
     @classmethod
-    def from_cartes(cls, cartes: List[Carte]) -> "Full":
+    def from_cartes(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> "Full":
         """
         Construit un Full à partir d'une liste de cartes.
 
@@ -70,6 +71,8 @@ class Full(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Liste de cartes disponibles.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Returns
         -------
@@ -82,28 +85,20 @@ class Full(AbstractCombinaison):
             Si aucun Brelan ou Paire n'est trouvé.
         """
         cls.verifier_min_cartes(cartes)
-        valeurs = [c.valeur for c in cartes]
-        compteur = Counter(valeurs)
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
 
         # Brelan le plus fort
-        brelans = [v for v, count in compteur.items() if count >= 3]
+        brelans = analyse.rangs_par_compte(3)
         if not brelans:
             raise ValueError("Aucun brelan pour former un Full")
-        brelan = max(brelans, key=lambda v: Carte.VALEURS().index(v))
+        brelan = brelans[0]
 
         # Paire la plus forte différente du brelan
-        paires = [v for v, count in compteur.items() if count >= 2 and v != brelan]
+        paires = [r for r in analyse.rangs_par_compte(2) if r != brelan]
         if not paires:
             raise ValueError("Aucune paire pour former un Full")
-        paire = max(paires, key=lambda v: Carte.VALEURS().index(v))
-
-        return cls(hauteur=[brelan, paire])
-
-    def _valeur_comparaison(self):
-        # Brelan puis paire
-        brelan_val = Carte.VALEURS().index(self._hauteur[0])
-        paire_val = Carte.VALEURS().index(self._hauteur[1])
-        return (self.FORCE(), (brelan_val, paire_val), ())
+        return cls(hauteur=[Carte.VALEURS()[brelan], Carte.VALEURS()[paires[0]]])
 
     def __str__(self) -> str:
         """
@@ -1,6 +1,6 @@
-from collections import Counter
 from typing import List, Tuple
 
+from business_object.analyse_main import AnalyseMain
 from business_object.carte import Carte
 
 from .combinaison import AbstractCombinaison
@@ -40,7 +40,7 @@ class Paire(AbstractCombinaison):
         return 1
 
     @classmethod
-    def est_present(cls, cartes: List[Carte]) -> bool:
+    def est_present(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> bool:
         """
         Vérifie si une Paire est présente dans une liste de cartes.
 
@@ -48,18 +48,20 @@ class Paire(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Main de cartes à analyser.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Returns
         -------
         bool
             True si au moins une Paire est présente.
         """
-        valeurs = [c.valeur for c in cartes]
-        compteur = Counter(valeurs)
-        return any(count >= 2 for count in compteur.values())
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
+        return bool(analyse.rangs_par_compte(2))
 
     @classmethod
-    def from_cartes(cls, cartes: List[Carte]) -> "Paire":
+    def from_cartes(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> "Paire":
         """
         Construit une Paire à partir d'une liste de cartes.
 
@@ -67,6 +69,8 @@ class Paire(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Liste de cartes disponibles.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Returns
         -------
@@ -79,20 +83,15 @@ class Paire(AbstractCombinaison):
             Si aucune Paire n'est présente.
         """
         cls.verifier_min_cartes(cartes)
-        valeurs = [c.valeur for c in cartes]
-        compteur = Counter(valeurs)
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
 
-        paires = [v for v, count in compteur.items() if count >= 2]
+        paires = analyse.rangs_par_compte(2)
         if not paires:
             raise ValueError("Aucune Paire présente")
-
-        meilleure_paire = max(paires, key=lambda v: Carte.VALEURS().index(v))
-        cartes_restantes = [v for v in valeurs if v != meilleure_paire]
-        kickers = tuple(
-            sorted(cartes_restantes, key=lambda v: Carte.VALEURS().index(v), reverse=True)
-        )
-
-        return cls(hauteur=meilleure_paire, kicker=kickers)
+        meilleure_paire = paires[0]
+        kickers = tuple(Carte.VALEURS()[r] for r in analyse.rangs if r != meilleure_paire)[:3]
+        return cls(hauteur=Carte.VALEURS()[meilleure_paire], kicker=kickers)
 
     def __str__(self) -> str:
         """
@@ -1,5 +1,6 @@
 from typing import List
 
+from business_object.analyse_main import AnalyseMain
 from business_object.carte import Carte
 
 from .combinaison import AbstractCombinaison
@@ -43,7 +44,7 @@ class Quinte(AbstractCombinaison):
         return 4
 
     @classmethod
-    def est_present(cls, cartes: List[Carte]) -> bool:
+    def est_present(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> bool:
         """
         Vérifie si une Quinte est présente dans la main.
 
@@ -51,24 +52,20 @@ class Quinte(AbstractCombinaison):
         ----------
         cartes : list[Carte]
             Liste de cartes à analyser.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Renvois
         -------
         bool
             True si une Quinte est présente, False sinon.
         """
-        valeurs = sorted({Carte.VALEURS().index(c.valeur) for c in cartes})
-        if 12 in valeurs:  # gérer As bas pour A-2-3-4-5
-            valeurs = [-1 if v == 12 else v for v in valeurs] + valeurs
-        valeurs = sorted(set(valeurs))
-
-        for i in range(len(valeurs) - 4):
-            if valeurs[i : i + 5] == list(range(valeurs[i], valeurs[i] + 5)):
-                return True
-        return False
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
+        return analyse.quinte() is not None
 
     @classmethod
-    def from_cartes(cls, cartes: List[Carte]) -> "Quinte":
+    def from_cartes(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> "Quinte":
         """
         Construit une Quinte à partir d'une main de cartes.
 
@@ -76,6 +73,8 @@ class Quinte(AbstractCombinaison):
         ----------
         cartes : list[Carte]
             Liste de cartes à partir de laquelle on cherche une Quinte.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Renvois
         -------
@@ -88,23 +87,13 @@ class Quinte(AbstractCombinaison):
             Si aucune Quinte n'est détectée dans la main.
         """
         cls.verifier_min_cartes(cartes)
-        valeurs = sorted({Carte.VALEURS().index(c.valeur) for c in cartes})
-        if 12 in valeurs:  # As bas
-            valeurs = [-1 if v == 12 else v for v in valeurs] + valeurs
-        valeurs = sorted(set(valeurs))
-
-        suites = []
-        for i in range(len(valeurs) - 4):
-            suite = valeurs[i : i + 5]
-            if suite == list(range(suite[0], suite[0] + 5)):
-                suites.append(suite)
-
-        if not suites:
-            raise ValueError("Aucune Quinte présente.")
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
 
-        max_suite = max(suites, key=lambda s: s[-1])
-        hauteur = Carte.VALEURS()[max_suite[-1] if max_suite[-1] != -1 else 12]
-        return cls(hauteur=hauteur)
+        hauteur = analyse.quinte()
+        if hauteur is None:
+            raise ValueError("Aucune Quinte présente.")
+        return cls(hauteur=Carte.VALEURS()[hauteur])
 
     def __str__(self) -> str:
         """
@@ -1,5 +1,6 @@
 from typing import List
 
+from business_object.analyse_main import AnalyseMain
 from business_object.carte import Carte
 
 from .combinaison import AbstractCombinaison
@@ -39,7 +40,7 @@ class QuinteFlush(AbstractCombinaison):
         return 8
 
     @classmethod
-    def est_present(cls, cartes: List[Carte]) -> bool:
+    def est_present(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> bool:
         """
         Vérifie si une Quinte Flush est présente.
 
@@ -47,31 +48,20 @@ class QuinteFlush(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Main de cartes à analyser.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Returns
         -------
         bool
             True si une suite de 5 cartes de même couleur existe.
         """
-        couleurs = [c.couleur for c in cartes]
-        for couleur_max in set(couleurs):
-            cartes_couleur = [c for c in cartes if c.couleur == couleur_max]
-            if len(cartes_couleur) < 5:
-                continue
-
-            valeurs = sorted({Carte.VALEURS().index(c.valeur) for c in cartes_couleur})
-            # Gérer l'As bas pour A-2-3-4-5
-            if 12 in valeurs:  # As
-                valeurs = [-1 if v == 12 else v for v in valeurs] + valeurs
-            valeurs = sorted(set(valeurs))
-
-            for i in range(len(valeurs) - 4):
-                if valeurs[i : i + 5] == list(range(valeurs[i], valeurs[i] + 5)):
-                    return True
-        return False
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
+        return analyse.quinte_flush() is not None
 
     @classmethod
-    def from_cartes(cls, cartes: List[Carte]) -> "QuinteFlush":
+    def from_cartes(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> "QuinteFlush":
         """
         Construit une Quinte Flush à partir d'une main de cartes.
 
@@ -79,6 +69,8 @@ class QuinteFlush(AbstractCombinaison):
         ----------
         cartes : List[Carte]
             Liste de cartes disponibles.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Returns
         -------
@@ -91,30 +83,13 @@ class QuinteFlush(AbstractCombinaison):
             Si aucune Quinte Flush n'est trouvée.
         """
         cls.verifier_min_cartes(cartes)
-        couleurs = [c.couleur for c in cartes]
-
-        for couleur_max in set(couleurs):
-            cartes_couleur = [c for c in cartes if c.couleur == couleur_max]
-            if len(cartes_couleur) < 5:
-                continue
-
-            valeurs = sorted({Carte.VALEURS().index(c.valeur) for c in cartes_couleur})
-            if 12 in valeurs:
-                valeurs = [-1 if v == 12 else v for v in valeurs] + valeurs
-            valeurs = sorted(set(valeurs))
-
-            suites = [
-                valeurs[i : i + 5]
-                for i in range(len(valeurs) - 4)
-                if valeurs[i : i + 5] == list(range(valeurs[i], valeurs[i] + 5))
-            ]
-
-            if suites:
-                max_suite = max(suites, key=lambda s: s[-1])
-                hauteur = Carte.VALEURS()[max_suite[-1] if max_suite[-1] != -1 else 12]
-                return cls(hauteur=hauteur)
-
-        raise ValueError("Aucune Quinte Flush présente.")
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
+
+        hauteur = analyse.quinte_flush()
+        if hauteur is None:
+            raise ValueError("Aucune Quinte Flush présente.")
+        return cls(hauteur=Carte.VALEURS()[hauteur])
 
     def __str__(self) -> str:
         """
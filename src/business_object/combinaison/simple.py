@@ -1,5 +1,6 @@
 from typing import List, Tuple
 
+from business_object.analyse_main import AnalyseMain
 from business_object.carte import Carte
 
 from .combinaison import AbstractCombinaison
@@ -43,7 +44,7 @@ class Simple(AbstractCombinaison):
         return 0
 
     @classmethod
-    def est_present(cls, cartes: List[Carte]) -> bool:
+    def est_present(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> bool:
         """
         Vérifie si une combinaison Simple est présente.
 
@@ -51,6 +52,8 @@ class Simple(AbstractCombinaison):
         ----------
         cartes : list[Carte]
             Liste de cartes à analyser.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Renvois
         -------
@@ -60,7 +63,7 @@ class Simple(AbstractCombinaison):
         return len(cartes) >= 1
 
     @classmethod
-    def from_cartes(cls, cartes: List[Carte]) -> "Simple":
+    def from_cartes(cls, cartes: List[Carte], analyse: AnalyseMain = None) -> "Simple":
         """
         Construit une instance de Simple à partir d'une liste de cartes.
 
@@ -68,6 +71,8 @@ class Simple(AbstractCombinaison):
         ----------
         cartes : list[Carte]
             Liste de cartes à partir de laquelle on sélectionne la carte haute.
+        analyse : AnalyseMain, optionnel
+            Analyse des cartes déjà calculée (construite à partir des cartes si absente).
 
         Renvois
         -------
@@ -80,9 +85,12 @@ class Simple(AbstractCombinaison):
             Si la liste de cartes est vide.
         """
         cls.verifier_min_cartes(cartes)
-        cartes_triees = sorted(cartes, key=lambda c: Carte.VALEURS().index(c.valeur), reverse=True)
-        hauteur = cartes_triees[0].valeur
-        kickers = tuple(c.valeur for c in cartes_triees[1:5])
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
+
+        rangs = analyse.rangs
+        hauteur = Carte.VALEURS()[rangs[0]]
+        kickers = tuple(Carte.VALEURS()[r] for r in rangs[1:5])
         return cls(hauteur=hauteur, kicker=kickers)
 
     def __str__(self) -> str:
@@ -0,0 +1,557 @@
+"""Implémentation des classes ResultatEquite et CalculateurEquite"""
+
+import math
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, combinations
+from pathlib import Path
+
+import numpy as np
+
+from business_object.board import Board
+from business_object.carte import Carte
+from business_object.evaluateur_vectoriel import EvaluateurVectoriel
+from business_object.main import Main
+
+
+class ResultatEquite:
+    """Équité d'un siège : pourcentages de victoire, d'égalité et intervalle de confiance"""
+
+    def __init__(self, victoire: float, egalite: float, equite: float, marge: float, n_essais: int):
+        """
+        Instanciation d'un résultat d'équité
+
+        Paramètres
+        ----------
+        victoire : float
+            pourcentage de donnes remportées seul
+        egalite : float
+            pourcentage de donnes partagées avec au moins un autre joueur
+        equite : float
+            part moyenne du pot remportée, en pourcentage
+        marge : float
+            demi-largeur de l'intervalle de confiance à 95 % sur l'équité (0 si exacte)
+        n_essais : int
+            nombre de donnes évaluées
+        """
+
+        self.__victoire = victoire
+        self.__egalite = egalite
+        self.__equite = equite
+        self.__marge = marge
+        self.__n_essais = n_essais
+
+    @property
+    def victoire(self) -> float:
+        """Pourcentage de donnes remportées seul"""
+        return self.__victoire
+
+    @property
+    def egalite(self) -> float:
+        """Pourcentage de donnes partagées"""
+        return self.__egalite
+
+    @property
+    def equite(self) -> float:
+        """Part moyenne du pot remportée, en pourcentage"""
+        return self.__equite
+
+    @property
+    def marge(self) -> float:
+        """Demi-largeur de l'intervalle de confiance à 95 % sur l'équité"""
+        return self.__marge
+
+    @property
+    def intervalle(self) -> tuple[float, float]:
+        """Intervalle de confiance à 95 % sur l'équité"""
+        return (max(0.0, self.__equite - self.__marge), min(100.0, self.__equite + self.__marge))
+
+    @property
+    def n_essais(self) -> int:
+        """Nombre de donnes évaluées"""
+        return self.__n_essais
+
+    def __repr__(self) -> str:
+        """Représentation d'un résultat d'équité"""
+        return (
+            f"ResultatEquite(victoire={self.victoire:.2f}, egalite={self.egalite:.2f}, "
+            f"equite={self.equite:.2f} ± {self.marge:.2f}, n_essais={self.n_essais})"
+        )
+
+    def to_dict(self) -> dict:
+        """Convertit le résultat en dictionnaire"""
+        return {
+            "victoire": self.victoire,
+            "egalite": self.egalite,
+            "equite": self.equite,
+            "marge": self.marge,
+            "n_essais": self.n_essais,
+        }
+
+
+def _cumuler(forces: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Agrège un lot de donnes évaluées
+
+    forces est de dimension (n_sieges, n_donnes). Renvoie, par siège, le nombre de
+    victoires, d'égalités, la somme des parts de pot et la somme de leurs carrés.
+    """
+
+    gagnants = forces == forces.max(axis=0)
+    n_gagnants = gagnants.sum(axis=0)
+    parts = gagnants / n_gagnants
+    return (
+        (gagnants & (n_gagnants == 1)).sum(axis=1),
+        (gagnants & (n_gagnants > 1)).sum(axis=1),
+        parts.sum(axis=1),
+        (parts * parts).sum(axis=1),
+    )
+
+
+def _evaluer(mains: list[list[int] | None], board: list[int], tirees: np.ndarray) -> np.ndarray:
+    """
+    Évalue un lot de donnes complétées
+
+    tirees est de dimension (n_donnes, k) : les cartes manquantes du board, puis les
+    deux cartes de chaque main inconnue, dans l'ordre des sièges. Renvoie les forces
+    de dimension (n_sieges, n_donnes).
+    """
+
+    m = len(tirees)
+    n_board = 5 - len(board)
+    board_complet = np.hstack([np.broadcast_to(board, (m, len(board))), tirees[:, :n_board]])
+
+    position = n_board
+    lot = np.empty((len(mains), m, 7), dtype=np.int64)
+    for siege, main in enumerate(mains):
+        if main is None:
+            lot[siege, :, :2] = tirees[:, position : position + 2]
+            position += 2
+        else:
+            lot[siege, :, :2] = main
+        lot[siege, :, 2:] = board_complet
+
+    forces, _ = EvaluateurVectoriel.eval_batch(lot.reshape(-1, 7))
+    return forces.reshape(len(mains), m)
+
+
+def _simuler(
+    mains: list[list[int] | None],
+    board: list[int],
+    restants: np.ndarray,
+    n_essais: int,
+    graine: np.random.SeedSequence,
+    echeance: float | None,
+    taille_lot: int,
+) -> tuple[int, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Tâche d'un processus de simulation (fonction de module pour pouvoir être sérialisée)
+
+    Tire des donnes par lots jusqu'à atteindre n_essais ou l'échéance, et renvoie le
+    nombre de donnes tirées ainsi que les cumuls de _cumuler.
+    """
+
+    rng = np.random.default_rng(graine)
+    n_tirees = 5 - len(board) + 2 * sum(1 for main in mains if main is None)
+
+    cumuls = [np.zeros(len(mains), dtype=np.int64) for _ in range(2)]
+    cumuls += [np.zeros(len(mains), dtype=np.float64) for _ in range(2)]
+    n = 0
+    while n < n_essais:
+        m = min(taille_lot, n_essais - n)
+
+        # Tirage sans remise de n_tirees cartes parmi les restantes, pour chaque donne
+        if n_tirees:
+            indices = rng.random((m, len(restants))).argpartition(n_tirees - 1, axis=1)
+            tirees = restants[indices[:, :n_tirees]]
+        else:
+            tirees = np.empty((m, 0), dtype=np.int64)
+
+        for cumul, valeur in zip(cumuls, _cumuler(_evaluer(mains, board, tirees))):
+            cumul += valeur
+        n += m
+
+        if echeance is not None and time.time() >= echeance:
+            break
+
+    return (n, *cumuls)
+
+
+def _enumerer(restants: list[int], tailles: list[int]) -> np.ndarray:
+    """
+    Énumère toutes les façons de tirer successivement des paquets de cartes
+
+    Renvoie un tableau (n_donnes, somme des tailles) de codes : chaque ligne est
+    une donne, les paquets étant tirés sans remise parmi les cartes restantes.
+    """
+
+    donnes = np.zeros((1, 0), dtype=np.int8)
+    masques = np.zeros(1, dtype=np.int64)
+    for taille in tailles:
+        if taille == 0:
+            continue
+        paquets = np.fromiter(
+            chain.from_iterable(combinations(restants, taille)), dtype=np.int8
+        ).reshape(-1, taille)
+        masques_paquets = np.bitwise_or.reduce(
+            np.left_shift(1, paquets.astype(np.int64)), axis=1, initial=0
+        )
+
+        # Produit cartésien des donnes et des paquets, sans carte en commun
+        i, j = np.nonzero((masques[:, None] & masques_paquets[None, :]) == 0)
+        donnes = np.hstack([donnes[i], paquets[j]])
+        masques = masques[i] | masques_paquets[j]
+
+    return donnes
+
+
+class CalculateurEquite:
+    """
+    Calcule l'équité de chaque siège d'une donne en cours.
+
+    Les mains connues et le board sont fixés, les cartes manquantes (fin du board
+    et mains inconnues) sont tirées parmi les cartes restantes du paquet. Les forces
+    sont calculées par lots avec EvaluateurVectoriel.
+    """
+
+    TAILLE_LOT = 2000
+    MAX_DONNES = 5_000_000
+
+    FICHIER_PREFLOP = Path(__file__).resolve().parents[2] / "data" / "equite_preflop.bin"
+    ENTETE_PREFLOP = struct.Struct("<4sBHI")
+    SIGNATURE_PREFLOP = b"EQPF"
+
+    __VALEURS = "23456789TJQKA"
+    __table_preflop = None
+
+    def __init__(self, mains: list[Main | None], board: Board = None, cartes_mortes: list = None):
+        """
+        Instanciation d'un calculateur d'équité
+
+        Paramètres
+        ----------
+        mains : list[Main | None]
+            mains des joueurs encore en lice, None (ou main vide) si la main est inconnue
+        board : Board
+            cartes communes déjà révélées (aucune par défaut)
+        cartes_mortes : list[Carte]
+            cartes connues hors du jeu, qui ne peuvent pas être tirées
+
+        Exceptions
+        ----------
+        ValueError
+            si moins de deux mains sont fournies
+            si une main connue ne contient pas exactement 2 cartes
+            si une carte apparaît plusieurs fois
+            s'il ne reste pas assez de cartes pour compléter la donne
+        """
+
+        if len(mains) < 2:
+            raise ValueError(f"Au moins deux mains sont nécessaires : {len(mains)} fournies")
+
+        self.__mains = []
+        for main in mains:
+            if main is None or len(main) == 0:
+                self.__mains.append(None)
+            elif len(main) != 2:
+                raise ValueError(f"Une main doit contenir 2 cartes, pas {len(main)}")
+            else:
+                self.__mains.append([carte.code for carte in main.cartes])
+
+        self.__board = [] if board is None else [carte.code for carte in board.cartes]
+        self.__mortes = [] if cartes_mortes is None else [carte.code for carte in cartes_mortes]
+
+        # Une carte en double se voit à ce que l'union des masques compte moins de bits
+        connues = [code for main in self.__mains if main is not None for code in main]
+        connues += self.__board + self.__mortes
+        masque_connues = 0
+        for code in connues:
+            masque_connues |= 1 << code
+        if masque_connues.bit_count() != len(connues):
+            raise ValueError("Une même carte ne peut apparaître plusieurs fois")
+
+        restants = Carte.MASQUE_PAQUET & ~masque_connues
+        self.__restants = np.array(
+            [code for code in range(52) if restants >> code & 1], dtype=np.int64
+        )
+        if len(self.__restants) < self.n_tirees:
+            raise ValueError("Il ne reste pas assez de cartes pour compléter la donne")
+
+    @property
+    def n_sieges(self) -> int:
+        """Nombre de sièges évalués"""
+        return len(self.__mains)
+
+    @property
+    def n_tirees(self) -> int:
+        """Nombre de cartes à tirer pour compléter une donne"""
+        return 5 - len(self.__board) + 2 * sum(1 for main in self.__mains if main is None)
+
+    @property
+    def n_donnes(self) -> int:
+        """Nombre de donnes distinctes parcourues par l'énumération exacte"""
+        n, reste = math.comb(len(self.__restants), 5 - len(self.__board)), len(self.__restants)
+        reste -= 5 - len(self.__board)
+        for main in self.__mains:
+            if main is None:
+                n *= math.comb(reste, 2)
+                reste -= 2
+        return n
+
+    @property
+    def preflop_tete_a_tete(self) -> bool:
+        """Indique si la donne est couverte par la table préflop (deux mains connues, pas de board)"""
+        return (
+            self.n_sieges == 2
+            and not self.__board
+            and not self.__mortes
+            and None not in self.__mains
+        )
+
+    @property
+    def restants(self) -> list[Carte]:
+        """Cartes pouvant encore être tirées"""
+        return [Carte.from_code(int(code)) for code in self.__restants]
+
+    @staticmethod
+    def _resultats(
+        n: int, victoires, egalites, parts, parts_carres, exacte: bool = False
+    ) -> list[ResultatEquite]:
+        """Convertit les cumuls en résultats (pourcentages et intervalles à 95 %)"""
+
+        resultats = []
+        for siege in range(len(victoires)):
+            moyenne = parts[siege] / n
+            variance = max(0.0, parts_carres[siege] / n - moyenne * moyenne)
+            if exacte:
+                marge = 0.0
+            else:
+                marge = 1.96 * math.sqrt(variance / n) if n > 1 else 100.0
+            resultats.append(
+                ResultatEquite(
+                    victoire=100 * float(victoires[siege]) / n,
+                    egalite=100 * float(egalites[siege]) / n,
+                    equite=100 * float(moyenne),
+                    marge=100 * marge,
+                    n_essais=n,
+                )
+            )
+        return resultats
+
+    def monte_carlo(
+        self,
+        n_essais: int = 10000,
+        graine: int = None,
+        n_processus: int = 1,
+        budget: float = None,
+    ) -> list[ResultatEquite]:
+        """
+        Estime l'équité de chaque siège par tirage aléatoire des cartes manquantes
+
+        Paramètres
+        ----------
+        n_essais : int
+            nombre maximal de donnes tirées
+        graine : int
+            graine du générateur, pour des résultats reproductibles (sans budget).
+            Chaque processus reçoit sa propre graine dérivée de celle-ci.
+        n_processus : int
+            nombre de processus entre lesquels les essais sont répartis
+        budget : float
+            durée maximale du calcul en secondes : le tirage s'arrête à l'échéance,
+            même si n_essais n'est pas atteint (au moins un lot est toujours évalué)
+
+        Renvois
+        -------
+        list[ResultatEquite]
+            l'équité de chaque siège, dans l'ordre des mains fournies
+
+        Exceptions
+        ----------
+        ValueError
+            si n_essais ou n_processus n'est pas strictement positif
+        """
+
+        if n_essais < 1:
+            raise ValueError(f"Le nombre d'essais doit être positif : {n_essais}")
+        if n_processus < 1:
+            raise ValueError(f"Le nombre de processus doit être positif : {n_processus}")
+
+        echeance = None if budget is None else time.time() + budget
+        graines = np.random.SeedSequence(graine).spawn(n_processus)
+        parts_essais = [
+            n_essais // n_processus + (i < n_essais % n_processus) for i in range(n_processus)
+        ]
+        taches = [
+            (self.__mains, self.__board, self.__restants, n, g, echeance, self.TAILLE_LOT)
+            for n, g in zip(parts_essais, graines)
+            if n > 0
+        ]
+
+        if len(taches) == 1:
+            retours = [_simuler(*taches[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=len(taches)) as executeur:
+                retours = list(executeur.map(_simuler, *zip(*taches)))
+
+        n = sum(retour[0] for retour in retours)
+        cumuls = [sum(retour[i] for retour in retours) for i in range(1, 5)]
+        return self._resultats(n, *cumuls)
+
+    def exacte(self) -> list[ResultatEquite]:
+        """
+        Calcule l'équité exacte de chaque siège en énumérant toutes les donnes possibles
+
+        Toutes les fins de board (et toutes les mains inconnues) sont parcourues, chaque
+        donne ayant le même poids. En tête-à-tête avant le flop, cela représente
+        1 712 304 boards (quelques secondes) : voir estimation_preflop pour une valeur
+        approchée immédiate.
+
+        Renvois
+        -------
+        list[ResultatEquite]
+            l'équité de chaque siège, dans l'ordre des mains fournies
+
+        Exceptions
+        ----------
+        ValueError
+            si le nombre de donnes à énumérer dépasse MAX_DONNES
+        """
+
+        if self.n_donnes > self.MAX_DONNES:
+            raise ValueError(f"Trop de donnes à énumérer ({self.n_donnes}), utilisez monte_carlo")
+
+        tailles = [5 - len(self.__board)] + [2 for main in self.__mains if main is None]
+        donnes = _enumerer([int(code) for code in self.__restants], tailles)
+
+        cumuls = [np.zeros(self.n_sieges, dtype=np.int64) for _ in range(2)]
+        cumuls += [np.zeros(self.n_sieges, dtype=np.float64) for _ in range(2)]
+        for debut in range(0, len(donnes), 10 * self.TAILLE_LOT):
+            tirees = donnes[debut : debut + 10 * self.TAILLE_LOT].astype(np.int64)
+            for cumul, valeur in zip(
+                cumuls, _cumuler(_evaluer(self.__mains, self.__board, tirees))
+            ):
+                cumul += valeur
+
+        return self._resultats(len(donnes), *cumuls, exacte=True)
+
+    @classmethod
+    def indice_classe(cls, codes: list[int]) -> int:
+        """
+        Retourne l'indice (entre 0 et 168) de la classe préflop de deux cartes
+
+        Les classes forment une grille 13 x 13 indexée par les valeurs des cartes :
+        les paires sur la diagonale, les mains assorties (même couleur) en
+        ligne = valeur haute, les mains dépareillées en ligne = valeur basse.
+        """
+
+        haute, basse = max(codes[0] >> 2, codes[1] >> 2), min(codes[0] >> 2, codes[1] >> 2)
+        if (codes[0] & 3) == (codes[1] & 3):
+            return haute * 13 + basse
+        return basse * 13 + haute
+
+    @classmethod
+    def nom_classe(cls, indice: int) -> str:
+        """Retourne le nom usuel d'une classe préflop (AA, AKs, T9o, ...)"""
+
+        ligne, colonne = divmod(indice, 13)
+        if ligne == colonne:
+            return cls.__VALEURS[ligne] * 2
+        if ligne > colonne:
+            return cls.__VALEURS[ligne] + cls.__VALEURS[colonne] + "s"
+        return cls.__VALEURS[colonne] + cls.__VALEURS[ligne] + "o"
+
+    @classmethod
+    def charger_table_preflop(cls, chemin: Path = None) -> tuple[np.ndarray, np.ndarray, int]:
+        """
+        Charge la table préflop tête-à-tête (une seule fois pour le fichier par défaut)
+
+        Le fichier commence par un en-tête (signature, version, nombre de classes,
+        nombre d'essais par confrontation) suivi de deux triangles supérieurs
+        (i <= j) d'entiers uint16 : probabilité de victoire de i contre j, puis
+        probabilité d'égalité, sur une échelle de 0 à 65535.
+
+        Renvois
+        -------
+        tuple[np.ndarray, np.ndarray, int]
+            matrices 169 x 169 des probabilités de victoire et d'égalité, et nombre
+            d'essais utilisés pour chaque confrontation
+
+        Exceptions
+        ----------
+        ValueError
+            si le fichier n'est pas une table préflop valide
+        """
+
+        if chemin is None and cls.__table_preflop is not None:
+            return cls.__table_preflop
+
+        contenu = Path(chemin or cls.FICHIER_PREFLOP).read_bytes()
+        entete = cls.ENTETE_PREFLOP
+        signature, version, n_classes, n_essais = entete.unpack_from(contenu.ljust(entete.size))
+        n_triangle = n_classes * (n_classes + 1) // 2
+        if (
+            signature != cls.SIGNATURE_PREFLOP
+            or version != 1
+            or len(contenu) != entete.size + 4 * n_triangle
+        ):
+            raise ValueError("Le fichier n'est pas une table d'équité préflop valide")
+        valeurs = np.frombuffer(contenu, dtype="<u2", offset=entete.size)
+
+        lignes, colonnes = np.triu_indices(n_classes)
+        victoires = np.zeros((n_classes, n_classes))
+        egalites = np.zeros((n_classes, n_classes))
+        victoires[lignes, colonnes] = valeurs[:n_triangle] / 65535
+        egalites[lignes, colonnes] = valeurs[n_triangle:] / 65535
+        egalites[colonnes, lignes] = egalites[lignes, colonnes]
+        victoires[colonnes, lignes] = 1 - victoires[lignes, colonnes] - egalites[lignes, colonnes]
+        # Sur la diagonale, les deux sièges ont la même probabilité de victoire
+        diagonale = np.arange(n_classes)
+        victoires[diagonale, diagonale] = valeurs[:n_triangle][lignes == colonnes] / 65535
+
+        table = (victoires, egalites, n_essais)
+        if chemin is None:
+            cls.__table_preflop = table
+        return table
+
+    def estimation_preflop(self) -> list[ResultatEquite]:
+        """
+        Équité tête-à-tête avant le flop, lue dans la table préflop (valeur approchée)
+
+        La table donne, pour chaque confrontation de classes (AKs contre QQ, ...), une
+        estimation par tirage aléatoire moyennée sur les couleurs : le résultat n'est
+        pas exact, sa marge (environ 1 % pour 5 000 essais par confrontation) et son
+        nombre d'essais sont ceux de la table. Voir exacte pour la valeur exacte.
+
+        Renvois
+        -------
+        list[ResultatEquite]
+            l'équité des deux mains
+
+        Exceptions
+        ----------
+        ValueError
+            si la donne n'est pas couverte par la table (voir preflop_tete_a_tete)
+        """
+
+        if not self.preflop_tete_a_tete:
+            raise ValueError("La table préflop ne couvre que deux mains connues, sans board")
+
+        victoires, egalites, n_essais = self.charger_table_preflop()
+        i, j = (self.indice_classe(main) for main in self.__mains)
+
+        resultats = []
+        for a, b in ((i, j), (j, i)):
+            equite = victoires[a, b] + egalites[a, b] / 2
+            marge = 1.96 * math.sqrt(equite * (1 - equite) / n_essais)
+            resultats.append(
+                ResultatEquite(
+                    victoire=100 * float(victoires[a, b]),
+                    egalite=100 * float(egalites[a, b]),
+                    equite=100 * float(equite),
+                    marge=100 * marge,
+                    n_essais=n_essais,
+                )
+            )
+        return resultats
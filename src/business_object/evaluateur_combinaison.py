@@ -1,5 +1,7 @@
 from typing import List
 
+from business_object.analyse_main import AnalyseMain
+from business_object.cache_evaluation import CacheEvaluation
 from business_object.carte import Carte
 from business_object.combinaison.brelan import Brelan
 from business_object.combinaison.carre import Carre
@@ -33,8 +35,11 @@ class EvaluateurCombinaison:
         Simple,
     ]
 
+    TAILLE_CACHE = 100_000
+    __cache = None
+
     @staticmethod
-    def eval(cartes: List[Carte]) -> AbstractCombinaison:
+    def eval(cartes: List[Carte], analyse: AnalyseMain = None) -> AbstractCombinaison:
         """
         Détermine et retourne la meilleure combinaison d'une liste de cartes.
 
@@ -42,6 +47,9 @@ class EvaluateurCombinaison:
         ----------
         cartes : list[Carte]
             Liste de cartes composant la main à évaluer. Doit contenir au moins 5 cartes.
+        analyse : AnalyseMain
+            analyse déjà calculée de ces cartes (par exemple celle du board fusionnée
+            avec une main), sinon elle est calculée ici
 
         Renvois
         -------
@@ -57,9 +65,46 @@ class EvaluateurCombinaison:
         if not cartes or len(cartes) < 5:
             raise ValueError(f"Au moins 5 cartes sont nécessaires, actuellement {len(cartes)}")
 
+        # Histogramme, couleurs et quintes calculés une seule fois pour toutes les combinaisons
+        if analyse is None:
+            analyse = AnalyseMain(cartes)
         for C in EvaluateurCombinaison.COMBINAISONS:
-            if C.est_present(cartes):
-                return C.from_cartes(cartes)
+            if C.est_present(cartes, analyse):
+                return C.from_cartes(cartes, analyse)
 
         # Si aucune combinaison ne correspond
-        return Simple.from_cartes(cartes)
+        return Simple.from_cartes(cartes, analyse)
+
+    @classmethod
+    def cache(cls) -> CacheEvaluation:
+        """Retourne le cache partagé des évaluations, créé à la première utilisation"""
+        if cls.__cache is None:
+            cls.__cache = CacheEvaluation(cls.eval, taille_max=cls.TAILLE_CACHE)
+        return cls.__cache
+
+    @classmethod
+    def eval_cache(cls, cartes: List[Carte], cle: int = None) -> AbstractCombinaison:
+        """
+        Comme eval, mais en passant par le cache partagé des évaluations.
+
+        Deux listes contenant les mêmes cartes renvoient la même instance de
+        combinaison, qui ne doit donc pas être modifiée.
+
+        Paramètres
+        ----------
+        cartes : list[Carte]
+            Liste de cartes composant la main à évaluer. Doit contenir au moins 5 cartes.
+        cle : int
+            masque des cartes (voir Carte.masque), s'il est déjà connu
+
+        Renvois
+        -------
+        AbstractCombinaison
+            Instance de la sous-classe correspondant à la combinaison détectée
+
+        Exceptions
+        ----------
+        ValueError
+            Levée si la liste de cartes contient moins de 5 cartes.
+        """
+        return cls.cache().eval(cartes, cle)
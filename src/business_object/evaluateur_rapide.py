@@ -0,0 +1,317 @@
+"""Implémentation de la classe EvaluateurRapide"""
+
+from itertools import combinations_with_replacement
+
+from business_object.analyse_main import AnalyseMain
+from business_object.carte import Carte
+from business_object.combinaison.combinaison import AbstractCombinaison
+
+
+class EvaluateurRapide:
+    """
+    Évalue la force d'un ensemble de 5 à 7 cartes sous la forme d'un entier unique.
+
+    L'évaluation repose sur des tables précalculées :
+    - une table des couleurs, indexée par le masque des valeurs d'une même couleur
+    - une table sans couleur, indexée par le produit des nombres premiers associés
+      aux valeurs des cartes (le produit ne dépend pas de l'ordre des cartes)
+
+    La force est codée sur 24 bits : la catégorie de la combinaison (FORCE de la
+    combinaison) occupe les 4 bits de poids fort, puis viennent jusqu'à cinq valeurs
+    de départage de 4 bits chacune. Deux forces se comparent donc directement.
+    """
+
+    # Catégories, identiques aux FORCE des combinaisons
+    SIMPLE = 0
+    PAIRE = 1
+    DOUBLE_PAIRE = 2
+    BRELAN = 3
+    QUINTE = 4
+    COULEUR = 5
+    FULL = 6
+    CARRE = 7
+    QUINTE_FLUSH = 8
+
+    __table_quintes = None
+    __table_couleurs = None
+    __table_sans_couleur = None
+
+    @staticmethod
+    def coder(categorie: int, rangs) -> int:
+        """
+        Construit la force entière d'une combinaison
+
+        Paramètres
+        ----------
+        categorie : int
+            catégorie de la combinaison (de 0 pour Simple à 8 pour Quinte Flush)
+        rangs : iterable[int]
+            indices des valeurs de départage, du plus important au moins important
+
+        Renvois
+        -------
+        int
+            force de la combinaison
+        """
+
+        force = categorie
+        n = 0
+        for rang in rangs:
+            force = (force << 4) | rang
+            n += 1
+        return force << (4 * (5 - n))
+
+    @staticmethod
+    def categorie(force: int) -> int:
+        """Retourne la catégorie (FORCE de la combinaison) d'une force entière"""
+        return force >> 20
+
+    @classmethod
+    def table_quintes(cls) -> list[int]:
+        """Retourne, pour chaque masque de 13 valeurs, la hauteur de sa meilleure quinte (-1 sinon)"""
+        if cls.__table_sans_couleur is None:
+            cls.__initialiser()
+        return cls.__table_quintes
+
+    @classmethod
+    def table_couleurs(cls) -> list[int]:
+        """Retourne, pour chaque masque de valeurs d'une même couleur, la force associée"""
+        if cls.__table_sans_couleur is None:
+            cls.__initialiser()
+        return cls.__table_couleurs
+
+    @classmethod
+    def __rangs_decroissants(cls, masque: int, n: int) -> list[int]:
+        """Retourne les n plus grands indices de valeurs présents dans un masque"""
+        rangs = []
+        rang = 12
+        while rang >= 0 and len(rangs) < n:
+            if masque >> rang & 1:
+                rangs.append(rang)
+            rang -= 1
+        return rangs
+
+    @classmethod
+    def __initialiser(cls) -> None:
+        """Construit les tables de correspondance (une seule fois)"""
+
+        # Quinte la plus haute pour chaque masque de valeurs (-1 si aucune)
+        suites = [(h, 0b11111 << (h - 4)) for h in range(12, 3, -1)]
+        suites.append((3, 0b1000000001111))  # As-2-3-4-5
+        quintes = []
+        for masque in range(1 << 13):
+            quintes.append(next((h for h, s in suites if masque & s == s), -1))
+
+        # Couleur ou quinte flush pour chaque masque d'une même couleur
+        couleurs = [0] * (1 << 13)
+        for masque in range(1 << 13):
+            if masque.bit_count() < 5:
+                continue
+            if quintes[masque] >= 0:
+                couleurs[masque] = cls.coder(cls.QUINTE_FLUSH, (quintes[masque],))
+            else:
+                couleurs[masque] = cls.coder(cls.COULEUR, cls.__rangs_decroissants(masque, 5))
+
+        # Combinaisons sans couleur, indexées par produit de nombres premiers
+        sans_couleur = {}
+        for n_cartes in (5, 6, 7):
+            for rangs in combinations_with_replacement(range(13), n_cartes):
+                compte = [0] * 13
+                for rang in rangs:
+                    compte[rang] += 1
+                if max(compte) > 4:
+                    continue
+
+                produit = 1
+                for rang in rangs:
+                    produit *= Carte.PREMIERS[rang]
+                sans_couleur[produit] = cls.__force_sans_couleur(compte, quintes)
+
+        cls.__table_quintes = quintes
+        cls.__table_couleurs = couleurs
+        cls.__table_sans_couleur = sans_couleur
+
+    @classmethod
+    def __force_sans_couleur(cls, compte: list[int], quintes: list[int]) -> int:
+        """Force d'un multi-ensemble de valeurs, en l'absence de couleur"""
+
+        masque = 0
+        carres, brelans, paires = [], [], []
+        for rang in range(12, -1, -1):
+            if compte[rang]:
+                masque |= 1 << rang
+            if compte[rang] == 4:
+                carres.append(rang)
+            elif compte[rang] == 3:
+                brelans.append(rang)
+            elif compte[rang] == 2:
+                paires.append(rang)
+
+        if carres:
+            carre = carres[0]
+            return cls.coder(
+                cls.CARRE, [carre] + cls.__rangs_decroissants(masque & ~(1 << carre), 1)
+            )
+
+        if brelans and (len(brelans) > 1 or paires):
+            brelan = brelans[0]
+            paire = max(brelans[1:] + paires)
+            return cls.coder(cls.FULL, (brelan, paire))
+
+        if quintes[masque] >= 0:
+            return cls.coder(cls.QUINTE, (quintes[masque],))
+
+        if brelans:
+            brelan = brelans[0]
+            return cls.coder(
+                cls.BRELAN, [brelan] + cls.__rangs_decroissants(masque & ~(1 << brelan), 2)
+            )
+
+        if len(paires) >= 2:
+            haute, basse = paires[0], paires[1]
+            reste = masque & ~(1 << haute) & ~(1 << basse)
+            return cls.coder(cls.DOUBLE_PAIRE, [haute, basse] + cls.__rangs_decroissants(reste, 1))
+
+        if paires:
+            paire = paires[0]
+            return cls.coder(
+                cls.PAIRE, [paire] + cls.__rangs_decroissants(masque & ~(1 << paire), 3)
+            )
+
+        return cls.coder(cls.SIMPLE, cls.__rangs_decroissants(masque, 5))
+
+    @classmethod
+    def force(cls, cartes: list[Carte]) -> int:
+        """
+        Calcule la force de la meilleure combinaison d'une liste de 5 à 7 cartes
+
+        Paramètres
+        ----------
+        cartes : list[Carte]
+            cartes à évaluer (main et board confondus)
+
+        Renvois
+        -------
+        int
+            force de la meilleure combinaison, plus elle est grande plus la main est forte
+
+        Exceptions
+        ----------
+        ValueError
+            si le nombre de cartes n'est pas compris entre 5 et 7
+            si une même valeur apparaît plus de 4 fois
+        """
+
+        return cls.force_codes([carte.code for carte in cartes])
+
+    @classmethod
+    def force_codes(cls, codes: list[int]) -> int:
+        """
+        Calcule la force de la meilleure combinaison à partir des codes des cartes
+
+        Paramètres
+        ----------
+        codes : list[int]
+            codes (entre 0 et 51) des 5 à 7 cartes à évaluer
+
+        Renvois
+        -------
+        int
+            force de la meilleure combinaison, plus elle est grande plus la main est forte
+
+        Exceptions
+        ----------
+        ValueError
+            si le nombre de cartes n'est pas compris entre 5 et 7
+            si une même valeur apparaît plus de 4 fois
+        """
+
+        if not 5 <= len(codes) <= 7:
+            raise ValueError(f"Entre 5 et 7 cartes sont nécessaires, actuellement {len(codes)}")
+
+        if cls.__table_sans_couleur is None:
+            cls.__initialiser()
+
+        produit = 1
+        masques = [0, 0, 0, 0]
+        for code in codes:
+            rang = code >> 2
+            produit *= Carte.PREMIERS[rang]
+            masques[code & 3] |= 1 << rang
+
+        for masque in masques:
+            if masque.bit_count() >= 5:
+                return cls.__table_couleurs[masque]
+
+        try:
+            return cls.__table_sans_couleur[produit]
+        except KeyError:
+            raise ValueError("Une même valeur ne peut apparaître plus de 4 fois") from None
+
+    @classmethod
+    def force_fusion(cls, analyse: AnalyseMain, cartes: list[Carte]) -> int:
+        """
+        Calcule la force d'une analyse déjà faite (le board) complétée par quelques cartes
+
+        Seules les cartes ajoutées sont parcourues : l'analyse du board est calculée
+        une fois par tour d'enchères, puis fusionnée avec les deux cartes de chaque main.
+
+        Paramètres
+        ----------
+        analyse : AnalyseMain
+            analyse des cartes communes
+        cartes : list[Carte]
+            cartes à ajouter (la main d'un joueur)
+
+        Renvois
+        -------
+        int
+            force de la meilleure combinaison, identique à force(analyse.cartes + cartes)
+
+        Exceptions
+        ----------
+        ValueError
+            si le nombre total de cartes n'est pas compris entre 5 et 7
+            si une même valeur apparaît plus de 4 fois
+        """
+
+        n_cartes = len(analyse.cartes) + len(cartes)
+        if not 5 <= n_cartes <= 7:
+            raise ValueError(f"Entre 5 et 7 cartes sont nécessaires, actuellement {n_cartes}")
+
+        if cls.__table_sans_couleur is None:
+            cls.__initialiser()
+
+        produit = analyse.signature
+        masques = analyse.masques_couleur[:]
+        for carte in cartes:
+            rang = carte.rang
+            produit *= Carte.PREMIERS[rang]
+            masques[carte.indice_couleur] |= 1 << rang
+
+        for masque in masques:
+            if masque.bit_count() >= 5:
+                return cls.__table_couleurs[masque]
+
+        try:
+            return cls.__table_sans_couleur[produit]
+        except KeyError:
+            raise ValueError("Une même valeur ne peut apparaître plus de 4 fois") from None
+
+    @classmethod
+    def force_combinaison(cls, combinaison: AbstractCombinaison) -> int:
+        """
+        Calcule la force entière d'une combinaison déjà construite
+
+        Paramètres
+        ----------
+        combinaison : AbstractCombinaison
+            combinaison à convertir
+
+        Renvois
+        -------
+        int
+            force de la combinaison, comparable à celle renvoyée par force()
+        """
+
+        return combinaison.cle
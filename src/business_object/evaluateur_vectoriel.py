@@ -0,0 +1,164 @@
+"""Implémentation de la classe EvaluateurVectoriel"""
+
+import numpy as np
+
+from business_object.evaluateur_rapide import EvaluateurRapide
+
+
+class EvaluateurVectoriel:
+    """
+    Évalue des milliers de mains en un seul appel grâce à NumPy.
+
+    Les mains sont fournies sous la forme d'un tableau (N, k) de codes de cartes
+    (voir Carte.code), avec 5 <= k <= 7. Les histogrammes de valeurs, les masques
+    de couleur et les masques de quinte sont calculés de façon vectorielle, et les
+    forces obtenues sont identiques à celles d'EvaluateurRapide.force_codes.
+    """
+
+    __PUISSANCES = 1 << np.arange(13, dtype=np.int64)
+
+    __quintes = None
+    __couleurs = None
+    __nb_bits = None
+    __hauteurs = None
+
+    @classmethod
+    def __initialiser(cls) -> None:
+        """Construit les tables NumPy à partir de celles de l'évaluateur scalaire"""
+
+        masques = np.arange(1 << 13, dtype=np.int64)
+
+        nb_bits = np.zeros(1 << 13, dtype=np.int64)
+        for rang in range(13):
+            nb_bits += (masques >> rang) & 1
+
+        # hauteurs[m, j] : j-ème plus grande valeur présente dans le masque m (-1 sinon)
+        hauteurs = np.full((1 << 13, 5), -1, dtype=np.int64)
+        rempli = np.zeros(1 << 13, dtype=np.int64)
+        for rang in range(12, -1, -1):
+            present = ((masques >> rang) & 1).astype(bool) & (rempli < 5)
+            hauteurs[present, rempli[present]] = rang
+            rempli += present
+
+        cls.__quintes = np.array(EvaluateurRapide.table_quintes(), dtype=np.int64)
+        cls.__couleurs = np.array(EvaluateurRapide.table_couleurs(), dtype=np.int64)
+        cls.__nb_bits = nb_bits
+        cls.__hauteurs = hauteurs
+
+    @classmethod
+    def __sans(cls, masque: np.ndarray, rang: np.ndarray) -> np.ndarray:
+        """Retire une valeur (éventuellement absente, -1) d'un masque"""
+        return masque & ~np.where(rang >= 0, 1 << np.maximum(rang, 0), 0)
+
+    @staticmethod
+    def __coder(categorie: int, *rangs: np.ndarray) -> np.ndarray:
+        """Version vectorielle de EvaluateurRapide.coder"""
+        force = np.int64(categorie) << 20
+        for position, rang in enumerate(rangs):
+            force = force | (np.maximum(rang, 0) << (16 - 4 * position))
+        return force
+
+    @classmethod
+    def eval_batch(cls, codes) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Évalue un lot de mains
+
+        Paramètres
+        ----------
+        codes : array_like
+            tableau (N, k) des codes des cartes de chaque main, avec 5 <= k <= 7
+
+        Renvois
+        -------
+        tuple[np.ndarray, np.ndarray]
+            - forces (N,) : forces comparables, identiques à EvaluateurRapide.force_codes
+            - categories (N,) : FORCE de la combinaison de chaque main
+              (0 pour Simple ... 8 pour Quinte Flush)
+
+        Exceptions
+        ----------
+        ValueError
+            si le tableau n'est pas de dimension (N, k) avec 5 <= k <= 7
+            si un code n'est pas compris entre 0 et 51
+        """
+
+        codes = np.asarray(codes, dtype=np.int64)
+        if codes.ndim != 2 or not 5 <= codes.shape[1] <= 7:
+            raise ValueError(f"Le lot doit être de dimension (N, 5 à 7) : {codes.shape}")
+        if codes.size and (codes.min() < 0 or codes.max() > 51):
+            raise ValueError("Les codes des cartes doivent être compris entre 0 et 51")
+
+        if cls.__hauteurs is None:
+            cls.__initialiser()
+
+        n = codes.shape[0]
+        lignes = np.arange(n)
+        rangs = codes >> 2
+        couleurs = codes & 3
+        bits = 1 << rangs
+
+        # Histogramme des valeurs et masques de valeurs par couleur. Une carte n'apparaît
+        # qu'une fois par main : la somme des bits d'une couleur est donc leur union.
+        histogramme = np.bincount((lignes[:, None] * 13 + rangs).ravel(), minlength=n * 13).reshape(
+            n, 13
+        )
+        masques_couleur = (
+            np.bincount(
+                (lignes[:, None] * 4 + couleurs).ravel(), weights=bits.ravel(), minlength=n * 4
+            )
+            .astype(np.int64)
+            .reshape(n, 4)
+        )
+
+        masque_tout = (histogramme > 0) @ cls.__PUISSANCES
+        masque_carres = (histogramme == 4) @ cls.__PUISSANCES
+        masque_brelans = (histogramme == 3) @ cls.__PUISSANCES
+        masque_paires = (histogramme == 2) @ cls.__PUISSANCES
+
+        hauteurs = cls.__hauteurs
+        candidats = []
+
+        # Couleur et quinte flush (au plus une couleur possède 5 cartes)
+        couleur = np.where(cls.__nb_bits[masques_couleur] >= 5, masques_couleur, 0).max(axis=1)
+        candidats.append(np.where(couleur > 0, cls.__couleurs[couleur], 0))
+
+        # Carré
+        carre = hauteurs[masque_carres, 0]
+        kicker = hauteurs[cls.__sans(masque_tout, carre), 0]
+        candidats.append(
+            np.where(carre >= 0, cls.__coder(EvaluateurRapide.CARRE, carre, kicker), 0)
+        )
+
+        # Full (la paire peut venir d'un second brelan)
+        brelan = hauteurs[masque_brelans, 0]
+        paire_full = hauteurs[cls.__sans(masque_brelans, brelan) | masque_paires, 0]
+        full = cls.__coder(EvaluateurRapide.FULL, brelan, paire_full)
+        candidats.append(np.where((brelan >= 0) & (paire_full >= 0), full, 0))
+
+        # Quinte
+        quinte = cls.__quintes[masque_tout]
+        candidats.append(np.where(quinte >= 0, cls.__coder(EvaluateurRapide.QUINTE, quinte), 0))
+
+        # Brelan
+        restes = hauteurs[cls.__sans(masque_tout, brelan)]
+        brelans = cls.__coder(EvaluateurRapide.BRELAN, brelan, restes[:, 0], restes[:, 1])
+        candidats.append(np.where(brelan >= 0, brelans, 0))
+
+        # Double paire et paire
+        haute = hauteurs[masque_paires, 0]
+        basse = hauteurs[masque_paires, 1]
+        kicker = hauteurs[cls.__sans(cls.__sans(masque_tout, haute), basse), 0]
+        double = cls.__coder(EvaluateurRapide.DOUBLE_PAIRE, haute, basse, kicker)
+        candidats.append(np.where(basse >= 0, double, 0))
+
+        restes = hauteurs[cls.__sans(masque_tout, haute)]
+        paire = cls.__coder(EvaluateurRapide.PAIRE, haute, restes[:, 0], restes[:, 1], restes[:, 2])
+        candidats.append(np.where(haute >= 0, paire, 0))
+
+        # Carte haute
+        restes = hauteurs[masque_tout]
+        candidats.append(cls.__coder(EvaluateurRapide.SIMPLE, *(restes[:, j] for j in range(5))))
+
+        # Les forces étant ordonnées, la meilleure combinaison présente est la plus grande
+        forces = np.maximum.reduce(candidats)
+        return forces, (forces >> 20).astype(np.int8)
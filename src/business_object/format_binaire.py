@@ -0,0 +1,470 @@
+"""Implémentation de la classe FormatBinaire"""
+
+from array import array
+
+from business_object.board import Board
+from business_object.carte import Carte
+from business_object.info_manche import InfoManche
+from business_object.journal_manche import JournalManche
+from business_object.main import Main
+from business_object.manche import Manche
+from business_object.reserve import Reserve
+
+
+class FormatBinaire:
+    """
+    Format binaire compact et versionné des objets d'une manche.
+
+    Chaque encodage commence par deux octets : la version du format puis le type de
+    l'objet (MAIN, BOARD, RESERVE, INFO, ETAT, EVENEMENT). Le reste n'utilise que :
+    - les codes des cartes (voir Carte.code), un octet par carte ;
+    - les statuts, un octet par joueur ;
+    - des varints (LEB128) pour les entiers : identifiants, mises et montants sont
+      codés en zigzag, si bien qu'une mise inférieure à 64 tient en un octet.
+
+    Une manche est encodée par son état (voir Manche.etat) : c'est ce format que
+    TableDao utilise pour sauvegarder les instantanés et les événements des journaux.
+    """
+
+    VERSION = 1
+    MAIN, BOARD, RESERVE, INFO, ETAT, EVENEMENT = range(1, 7)
+
+    # Bits de l'octet d'options d'un état
+    __FIN, __ENREGISTREE, __RESERVE_MELANGEE, __GRAINE = 1, 2, 4, 8
+
+    # ------------------------------------------------------------------ encodage
+
+    @classmethod
+    def encoder(cls, objet) -> bytes:
+        """
+        Encode une Main, un Board, une Reserve, une InfoManche ou une Manche
+
+        Paramètres
+        ----------
+        objet : Main | Board | Reserve | InfoManche | Manche
+            objet à encoder
+
+        Renvois
+        -------
+        bytes
+            encodage binaire, décodé par FormatBinaire.decoder
+
+        Exceptions
+        ----------
+        TypeError
+            si l'objet n'est pas d'un type pris en charge
+        """
+
+        if isinstance(objet, Manche):
+            return cls.encoder_etat(objet.etat())
+
+        tampon = bytearray()
+        if isinstance(objet, Main):
+            cls.__entete(tampon, cls.MAIN)
+            cls.__ecrire_cartes(tampon, [carte.code for carte in objet.cartes])
+        elif isinstance(objet, Board):
+            cls.__entete(tampon, cls.BOARD)
+            cls.__ecrire_cartes(tampon, [carte.code for carte in objet.cartes])
+        elif isinstance(objet, Reserve):
+            cls.__entete(tampon, cls.RESERVE)
+            cls.__ecrire_octets(tampon, objet.graine)
+            cls.__ecrire_cartes(tampon, objet.codes())
+        elif isinstance(objet, InfoManche):
+            cls.__entete(tampon, cls.INFO)
+            mains = [
+                None if main is None else [carte.code for carte in main.cartes]
+                for main in objet.mains
+            ]
+            cls.__ecrire_info(
+                tampon,
+                objet.joueurs,
+                objet.pseudos,
+                objet.statuts,
+                objet.mises,
+                objet.tour_couche,
+                mains,
+            )
+        else:
+            raise TypeError(f"Type non pris en charge par le format binaire : {type(objet)}")
+        return bytes(tampon)
+
+    @classmethod
+    def encoder_etat(cls, etat: dict) -> bytes:
+        """
+        Encode l'état d'une manche (voir Manche.etat)
+
+        Paramètres
+        ----------
+        etat : dict
+            état renvoyé par Manche.etat
+
+        Renvois
+        -------
+        bytes
+            encodage binaire de l'état
+        """
+
+        tampon = bytearray()
+        cls.__entete(tampon, cls.ETAT)
+        options = (
+            cls.__FIN * etat["fin"]
+            | cls.__ENREGISTREE * etat["enregistree"]
+            | cls.__RESERVE_MELANGEE * etat["reserve_melangee"]
+            | cls.__GRAINE * (etat["graine"] is not None)
+        )
+        tampon.append(options)
+        tampon.append(etat["tour"])
+        cls.__ecrire_entier(tampon, etat["grosse_blind"])
+        cls.__ecrire_entier(tampon, etat["indice_joueur_actuel"])
+        cls.__ecrire_info(
+            tampon,
+            etat["joueurs"],
+            etat["pseudos"],
+            etat["statuts"],
+            etat["mises"],
+            etat["tour_couche"],
+            etat["mains"],
+        )
+        cls.__ecrire_cartes(tampon, etat["board"])
+        cls.__ecrire_cartes(tampon, etat["reserve"])
+        if etat["graine"] is not None:
+            cls.__ecrire_octets(tampon, etat["graine"])
+        return bytes(tampon)
+
+    @classmethod
+    def encoder_evenement(cls, evenement: tuple) -> bytes:
+        """
+        Encode un événement d'un journal de manche (voir JournalManche)
+
+        Paramètres
+        ----------
+        evenement : tuple
+            événement du journal
+
+        Renvois
+        -------
+        bytes
+            encodage binaire de l'événement
+
+        Exceptions
+        ----------
+        ValueError
+            si le type d'événement est inconnu
+        """
+
+        tampon = bytearray()
+        cls.__entete(tampon, cls.EVENEMENT)
+        type_evenement = evenement[0]
+        tampon.append(type_evenement)
+        if type_evenement == JournalManche.OUVERTURE:
+            _, joueurs, pseudos, grosse_blind = evenement
+            cls.__ecrire_joueurs(tampon, joueurs, pseudos)
+            cls.__ecrire_entier(tampon, grosse_blind)
+        elif type_evenement == JournalManche.PREFLOP:
+            cls.__ecrire_octets(tampon, evenement[1])
+        elif type_evenement == JournalManche.ACTION:
+            _, id_joueur, code, credit_joueur, relance = evenement
+            cls.__ecrire_entier(tampon, id_joueur)
+            tampon.append(code)
+            cls.__ecrire_entier(tampon, credit_joueur)
+            cls.__ecrire_entier(tampon, relance)
+        elif type_evenement == JournalManche.TOUR:
+            tampon.append(evenement[1])
+            cls.__ecrire_cartes(tampon, evenement[2])
+        elif type_evenement == JournalManche.FIN:
+            cls.__ecrire_cartes(tampon, evenement[1])
+        elif type_evenement != JournalManche.BLINDS:
+            raise ValueError(f"Type d'événement inconnu : {type_evenement}")
+        return bytes(tampon)
+
+    @staticmethod
+    def __entete(tampon: bytearray, type_objet: int) -> None:
+        tampon.append(FormatBinaire.VERSION)
+        tampon.append(type_objet)
+
+    @staticmethod
+    def __ecrire_varint(tampon: bytearray, n: int) -> None:
+        """Écrit un entier positif en LEB128 : 7 bits par octet, bit de poids fort = suite"""
+        while n > 0x7F:
+            tampon.append(n & 0x7F | 0x80)
+            n >>= 7
+        tampon.append(n)
+
+    @classmethod
+    def __ecrire_entier(cls, tampon: bytearray, n: int) -> None:
+        """Écrit un entier signé en zigzag (0, -1, 1, -2... -> 0, 1, 2, 3...)"""
+        cls.__ecrire_varint(tampon, 2 * n if n >= 0 else -2 * n - 1)
+
+    @classmethod
+    def __ecrire_octets(cls, tampon: bytearray, octets: bytes) -> None:
+        """Écrit des octets précédés de leur longueur + 1 (0 pour None)"""
+        if octets is None:
+            tampon.append(0)
+            return
+        cls.__ecrire_varint(tampon, len(octets) + 1)
+        tampon += octets
+
+    @staticmethod
+    def __ecrire_cartes(tampon: bytearray, codes) -> None:
+        """Écrit le nombre de cartes puis leurs codes"""
+        tampon.append(len(codes))
+        tampon += bytes(codes)
+
+    @classmethod
+    def __ecrire_joueurs(cls, tampon: bytearray, joueurs, pseudos) -> None:
+        cls.__ecrire_varint(tampon, len(joueurs))
+        for id_joueur in joueurs:
+            cls.__ecrire_entier(tampon, id_joueur)
+        tampon.append(pseudos is not None)
+        for pseudo in pseudos or ():
+            cls.__ecrire_octets(tampon, pseudo.encode())
+
+    @classmethod
+    def __ecrire_info(cls, tampon, joueurs, pseudos, statuts, mises, tours, mains) -> None:
+        cls.__ecrire_joueurs(tampon, joueurs, pseudos)
+        tampon += bytes(statuts)
+        for mise in mises:
+            cls.__ecrire_entier(tampon, mise)
+        for tour in tours:
+            cls.__ecrire_entier(tampon, -1 if tour is None else tour)
+        for main in mains:
+            if main is None:
+                tampon.append(0xFF)
+            else:
+                cls.__ecrire_cartes(tampon, main)
+
+    # ------------------------------------------------------------------ décodage
+
+    @classmethod
+    def decoder(cls, donnees: bytes):
+        """
+        Décode un objet encodé par FormatBinaire.encoder
+
+        Paramètres
+        ----------
+        donnees : bytes
+            encodage binaire
+
+        Renvois
+        -------
+        Main | Board | Reserve | InfoManche | Manche
+            objet décodé (une Manche pour un état)
+
+        Exceptions
+        ----------
+        ValueError
+            si la version ou le type est inconnu, ou si les données sont tronquées
+        """
+
+        type_objet = cls.__lire_entete(donnees)
+        lecteur = _Lecteur(donnees, 2)
+        if type_objet == cls.MAIN:
+            objet = Main([Carte.from_code(code) for code in lecteur.cartes()])
+        elif type_objet == cls.BOARD:
+            objet = Board([Carte.from_code(code) for code in lecteur.cartes()])
+        elif type_objet == cls.RESERVE:
+            graine = lecteur.octets()
+            objet = Reserve.depuis_codes(array("b", lecteur.cartes()), graine)
+        elif type_objet == cls.INFO:
+            joueurs, pseudos, statuts, mises, tours, mains = cls.__lire_info(lecteur)
+            objet = InfoManche(list(joueurs), None if pseudos is None else list(pseudos))
+            objet.statuts[:] = statuts
+            objet.mises[:] = mises
+            objet.tour_couche[:] = tours
+            if all(main is not None for main in mains):
+                objet.assignation_mains(
+                    [Main([Carte.from_code(code) for code in main]) for main in mains]
+                )
+        elif type_objet == cls.ETAT:
+            return Manche.depuis_etat(cls.decoder_etat(donnees))
+        else:
+            raise ValueError(f"Type d'objet inconnu pour FormatBinaire.decoder : {type_objet}")
+        lecteur.fin()
+        return objet
+
+    @classmethod
+    def decoder_etat(cls, donnees: bytes) -> dict:
+        """
+        Décode l'état d'une manche encodé par FormatBinaire.encoder_etat
+
+        Paramètres
+        ----------
+        donnees : bytes
+            encodage binaire
+
+        Renvois
+        -------
+        dict
+            état de la manche, identique à celui de Manche.etat
+
+        Exceptions
+        ----------
+        ValueError
+            si les données ne sont pas un état, ou sont tronquées
+        """
+
+        if cls.__lire_entete(donnees) != cls.ETAT:
+            raise ValueError("Les données ne sont pas l'état d'une manche")
+        lecteur = _Lecteur(donnees, 2)
+        options = lecteur.octet()
+        tour = lecteur.octet()
+        grosse_blind = lecteur.entier()
+        indice_joueur_actuel = lecteur.entier()
+        joueurs, pseudos, statuts, mises, tours, mains = cls.__lire_info(lecteur)
+        etat = {
+            "joueurs": joueurs,
+            "pseudos": pseudos,
+            "grosse_blind": grosse_blind,
+            "tour": tour,
+            "indice_joueur_actuel": indice_joueur_actuel,
+            "fin": bool(options & cls.__FIN),
+            "enregistree": bool(options & cls.__ENREGISTREE),
+            "statuts": statuts,
+            "mises": mises,
+            "tour_couche": tours,
+            "mains": mains,
+            "board": tuple(lecteur.cartes()),
+            "reserve": lecteur.cartes(),
+            "graine": lecteur.octets() if options & cls.__GRAINE else None,
+            "reserve_melangee": bool(options & cls.__RESERVE_MELANGEE),
+        }
+        lecteur.fin()
+        return etat
+
+    @classmethod
+    def decoder_evenement(cls, donnees: bytes) -> tuple:
+        """
+        Décode un événement encodé par FormatBinaire.encoder_evenement
+
+        Paramètres
+        ----------
+        donnees : bytes
+            encodage binaire
+
+        Renvois
+        -------
+        tuple
+            événement du journal
+
+        Exceptions
+        ----------
+        ValueError
+            si les données ne sont pas un événement, ou sont tronquées
+        """
+
+        if cls.__lire_entete(donnees) != cls.EVENEMENT:
+            raise ValueError("Les données ne sont pas un événement de journal")
+        lecteur = _Lecteur(donnees, 2)
+        type_evenement = lecteur.octet()
+        if type_evenement == JournalManche.OUVERTURE:
+            joueurs, pseudos = cls.__lire_joueurs(lecteur)
+            evenement = (type_evenement, joueurs, pseudos, lecteur.entier())
+        elif type_evenement == JournalManche.PREFLOP:
+            evenement = (type_evenement, lecteur.octets())
+        elif type_evenement == JournalManche.BLINDS:
+            evenement = (type_evenement,)
+        elif type_evenement == JournalManche.ACTION:
+            id_joueur = lecteur.entier()
+            code = lecteur.octet()
+            evenement = (type_evenement, id_joueur, code, lecteur.entier(), lecteur.entier())
+        elif type_evenement == JournalManche.TOUR:
+            tour = lecteur.octet()
+            evenement = (type_evenement, tour, tuple(lecteur.cartes()))
+        elif type_evenement == JournalManche.FIN:
+            evenement = (type_evenement, tuple(lecteur.cartes()))
+        else:
+            raise ValueError(f"Type d'événement inconnu : {type_evenement}")
+        lecteur.fin()
+        return evenement
+
+    @classmethod
+    def __lire_entete(cls, donnees: bytes) -> int:
+        """Vérifie la version et renvoie le type de l'objet encodé"""
+        if len(donnees) < 2:
+            raise ValueError("Données binaires tronquées")
+        if donnees[0] != cls.VERSION:
+            raise ValueError(
+                f"Version du format binaire non prise en charge : {donnees[0]} "
+                f"(version courante : {cls.VERSION})"
+            )
+        return donnees[1]
+
+    @staticmethod
+    def __lire_joueurs(lecteur: "_Lecteur") -> tuple:
+        n_joueurs = lecteur.varint()
+        joueurs = tuple(lecteur.entier() for _ in range(n_joueurs))
+        pseudos = None
+        if lecteur.octet():
+            pseudos = tuple(lecteur.octets().decode() for _ in range(n_joueurs))
+        return joueurs, pseudos
+
+    @classmethod
+    def __lire_info(cls, lecteur: "_Lecteur") -> tuple:
+        joueurs, pseudos = cls.__lire_joueurs(lecteur)
+        n_joueurs = len(joueurs)
+        statuts = tuple(lecteur.bloc(n_joueurs))
+        mises = tuple(lecteur.entier() for _ in range(n_joueurs))
+        tours = tuple(lecteur.entier() for _ in range(n_joueurs))
+        tours = tuple(None if tour == -1 else tour for tour in tours)
+        mains = tuple(lecteur.main() for _ in range(n_joueurs))
+        return joueurs, pseudos, statuts, mises, tours, mains
+
+
+class _Lecteur:
+    """Curseur de lecture sur des données binaires, qui signale les données tronquées"""
+
+    __slots__ = ("donnees", "position")
+
+    def __init__(self, donnees: bytes, position: int = 0):
+        self.donnees = donnees
+        self.position = position
+
+    def octet(self) -> int:
+        try:
+            valeur = self.donnees[self.position]
+        except IndexError:
+            raise ValueError("Données binaires tronquées") from None
+        self.position += 1
+        return valeur
+
+    def bloc(self, n: int) -> bytes:
+        fin = self.position + n
+        if fin > len(self.donnees):
+            raise ValueError("Données binaires tronquées")
+        valeur = bytes(self.donnees[self.position : fin])
+        self.position = fin
+        return valeur
+
+    def varint(self) -> int:
+        valeur, decalage = 0, 0
+        while True:
+            octet = self.octet()
+            valeur |= (octet & 0x7F) << decalage
+            if octet < 0x80:
+                return valeur
+            decalage += 7
+
+    def entier(self) -> int:
+        n = self.varint()
+        return n >> 1 if not n & 1 else -(n >> 1) - 1
+
+    def octets(self) -> bytes | None:
+        longueur = self.varint()
+        return None if longueur == 0 else self.bloc(longueur - 1)
+
+    def cartes(self) -> bytes:
+        codes = self.bloc(self.octet())
+        if any(code >= 52 for code in codes):
+            raise ValueError("Code de carte incorrect dans les données binaires")
+        return codes
+
+    def main(self) -> tuple | None:
+        n = self.octet()
+        if n == 0xFF:
+            return None
+        self.position -= 1
+        return tuple(self.cartes())
+
+    def fin(self) -> None:
+        if self.position != len(self.donnees):
+            raise ValueError("Données binaires inattendues après la fin de l'objet")
@@ -1,6 +1,7 @@
 """Implémentation de la classe InfoManche"""
 
 from business_object.main import Main
+from business_object.tableaux import TableauMises, TableauStatuts, TableauTours
 
 
 class InfoManche:
@@ -38,12 +39,15 @@ class InfoManche:
                 f"Au moins deux joueurs doivent être présents : {len(joueurs)} présents"
             )
 
-        self.__joueurs = joueurs
+        # Copie : les arrivées et départs à la table n'affectent pas la manche en cours
+        self.__joueurs = list(joueurs)
+        # Index id_joueur -> indice ; en cas de doublon, la première occurrence l'emporte
+        self.__indices = {j: i for i, j in reversed(list(enumerate(joueurs)))}
         self.__pseudos = pseudos
-        self.__statuts = [0 for _ in joueurs]
+        self.__statuts = TableauStatuts(0 for _ in joueurs)
         self.__mains = [None for _ in joueurs]
-        self.__mises = [0 for _ in joueurs]
-        self.__tour_couche = [None for _ in joueurs]
+        self.__mises = TableauMises(0 for _ in joueurs)
+        self.__tour_couche = TableauTours(None for _ in joueurs)
 
     @property
     def joueurs(self) -> list[int]:
@@ -58,21 +62,47 @@ class InfoManche:
 
         return self.__joueurs
 
+    def indice_joueur(self, id_joueur: int) -> int:
+        """
+        Retourne l'indice d'un joueur dans la manche, en temps constant
+
+        Paramètres
+        ----------
+        id_joueur : int
+            identifiant du joueur recherché
+
+        Renvois
+        -------
+        int
+            indice du joueur dans joueurs
+
+        Exceptions
+        ----------
+        ValueError
+            si le joueur n'est pas présent dans la manche
+        """
+
+        try:
+            return self.__indices[id_joueur]
+        except KeyError:
+            raise ValueError("Le joueur n'est pas dans cette manche") from None
+
     @property
     def pseudos(self) -> list[str]:
         """Renvoie le pseudo des joueurs"""
         return self.__pseudos
 
     @property
-    def statuts(self) -> list[int]:
+    def statuts(self) -> TableauStatuts:
         """
         Renvoie la liste des statuts des joueurs.
 
         Chaque statut est représenté par un entier selon la liste interne __STATUTS.
+        Le tableau tient à jour le nombre de joueurs de chaque statut (voir compte_statut).
 
         Renvois
         -------
-        list[int]
+        TableauStatuts
             Statuts des joueurs.
         """
 
@@ -92,31 +122,53 @@ class InfoManche:
         return self.__mains
 
     @property
-    def mises(self) -> list[int]:
+    def mises(self) -> TableauMises:
         """
         Renvoie les mises actuelles de chaque joueur.
 
         Renvois
         -------
-        list[int]
-            Montants misés par les joueurs.
+        TableauMises
+            Montants misés par les joueurs, dont le total est tenu à jour.
         """
 
         return self.__mises
 
     @property
-    def tour_couche(self) -> list[int]:
+    def tour_couche(self) -> TableauTours:
         """
         Indique si un joueur est couché lors d'un tour.
 
         Renvois
         -------
-        list[int | None]
+        TableauTours
             None pour un joueur actif, sinon le numéro du tour où il s'est couché.
         """
 
         return self.__tour_couche
 
+    @property
+    def pot(self) -> int:
+        """Somme des mises de tous les joueurs, sans parcourir les mises"""
+        return self.__mises.total
+
+    def compte_statut(self, statut: int) -> int:
+        """
+        Renvoie le nombre de joueurs ayant un statut, sans parcourir les statuts.
+
+        Paramètres
+        ----------
+        statut : int
+            statut recherché (indice dans la liste interne __STATUTS)
+
+        Renvois
+        -------
+        int
+            nombre de joueurs ayant ce statut
+        """
+
+        return self.__statuts.compte(statut)
+
     def __str__(self) -> str:
         """
         Représentation informelle de l'objet pour l'affichage.
@@ -0,0 +1,211 @@
+"""Implémentation de la classe JournalManche"""
+
+from business_object.carte import Carte
+from business_object.melangeur import Melangeur
+
+
+class JournalManche:
+    """
+    Journal des événements d'une manche, avec des instantanés périodiques.
+
+    Chaque événement est un tuple compact d'entiers dont le premier élément est son type :
+    - (OUVERTURE, joueurs, pseudos, grosse_blind) : création de la manche
+    - (PREFLOP, graine) : mélange et distribution ; la graine suffit à refaire le paquet
+    - (BLINDS,) : fin des blinds, la grosse blind garde la parole
+    - (ACTION, id_joueur, code_action, credit_joueur, relance) : appel à Manche.action
+    - (TOUR, tour, codes) : passage au flop, au turn ou à la river, cartes révélées
+    - (FIN, codes) : fin de la manche, board complet
+
+    Seuls PREFLOP, BLINDS et ACTION sont rejoués : les autres événements en découlent et
+    servent à l'historique et à la vérification. Toutes les INTERVALLE_INSTANTANES
+    entrées, la manche enregistre son état (voir Manche.etat), si bien qu'une
+    reconstruction repart du dernier instantané au lieu de rejouer toute la manche.
+    """
+
+    OUVERTURE, PREFLOP, BLINDS, ACTION, TOUR, FIN = range(6)
+    TYPES = ("ouverture", "preflop", "blinds", "action", "tour", "fin")
+    ACTIONS = ("checker", "suivre", "all-in", "se coucher")
+    INTERVALLE_INSTANTANES = 16
+
+    def __init__(self, joueurs: list[int], pseudos: list[str], grosse_blind: int):
+        """
+        Crée le journal d'une nouvelle manche, qui commence par l'événement d'ouverture
+
+        Paramètres
+        ----------
+        joueurs : list[int]
+            identifiants des joueurs, dans l'ordre des sièges
+        pseudos : list[str]
+            pseudos des joueurs (None si inconnus)
+        grosse_blind : int
+            montant de la grosse blind
+        """
+
+        pseudos = None if pseudos is None else tuple(pseudos)
+        self.__evenements = [(self.OUVERTURE, tuple(joueurs), pseudos, grosse_blind)]
+        # Couples (nombre d'événements couverts, état de la manche), par position croissante
+        self.__instantanes = []
+
+    @property
+    def evenements(self) -> list[tuple]:
+        """Événements enregistrés, dans l'ordre (copie)"""
+        return list(self.__evenements)
+
+    @property
+    def instantanes(self) -> list[tuple[int, dict]]:
+        """Instantanés (nombre d'événements couverts, état de la manche) (copie)"""
+        return list(self.__instantanes)
+
+    def __len__(self) -> int:
+        """Nombre d'événements enregistrés"""
+        return len(self.__evenements)
+
+    def ajouter(self, evenement: tuple) -> None:
+        """Ajoute un événement à la fin du journal"""
+        self.__evenements.append(evenement)
+
+    def tronquer(self, n: int) -> None:
+        """Oublie les événements (et instantanés) au-delà des n premiers"""
+        del self.__evenements[n:]
+        while self.__instantanes and self.__instantanes[-1][0] > n:
+            self.__instantanes.pop()
+
+    @property
+    def instantane_attendu(self) -> bool:
+        """Indique si assez d'événements ont été ajoutés depuis le dernier instantané"""
+        dernier = self.__instantanes[-1][0] if self.__instantanes else 0
+        return len(self.__evenements) - dernier >= self.INTERVALLE_INSTANTANES
+
+    def ajouter_instantane(self, etat: dict) -> None:
+        """Enregistre l'état de la manche après le dernier événement"""
+        self.__instantanes.append((len(self.__evenements), etat))
+
+    def copie(self, n: int = None) -> "JournalManche":
+        """Copie des n premiers événements et des instantanés correspondants"""
+        n = len(self.__evenements) if n is None else n
+        journal = JournalManche.__new__(JournalManche)
+        journal.__evenements = self.__evenements[:n]
+        journal.__instantanes = [i for i in self.__instantanes if i[0] <= n]
+        return journal
+
+    @classmethod
+    def depuis_evenements(
+        cls, evenements: list[tuple], instantanes: list[tuple[int, dict]] = ()
+    ) -> "JournalManche":
+        """
+        Recrée un journal à partir d'événements et d'instantanés sauvegardés
+
+        Paramètres
+        ----------
+        evenements : list[tuple]
+            événements du journal, en commençant par l'ouverture
+        instantanes : list[tuple[int, dict]]
+            instantanés (nombre d'événements couverts, état de la manche)
+
+        Exceptions
+        ----------
+        ValueError
+            si le premier événement n'est pas une ouverture
+        """
+
+        evenements = list(evenements)
+        if not evenements or evenements[0][0] != cls.OUVERTURE:
+            raise ValueError("Le journal doit commencer par l'ouverture de la manche")
+        journal = cls.__new__(cls)
+        journal.__evenements = evenements
+        journal.__instantanes = sorted(instantanes, key=lambda instantane: instantane[0])
+        return journal
+
+    def reconstruire(self, n: int = None):
+        """
+        Reconstruit la manche telle qu'elle était après les n premiers événements
+
+        La reconstruction part du dernier instantané couvrant au plus n événements (ou de
+        la manche vide), puis rejoue les événements suivants. Le journal produit par la
+        manche reconstruite doit être identique à celui-ci.
+
+        Paramètres
+        ----------
+        n : int
+            nombre d'événements à prendre en compte, par défaut tout le journal
+
+        Renvois
+        -------
+        Manche
+            manche reconstruite, avec son propre journal
+
+        Exceptions
+        ----------
+        ValueError
+            si n est hors du journal, ou si la manche rejouée ne reproduit pas le journal
+        """
+
+        from business_object.manche import Manche
+
+        n = len(self.__evenements) if n is None else n
+        if not 1 <= n <= len(self.__evenements):
+            raise ValueError(f"Le journal contient {len(self.__evenements)} événements : {n}")
+
+        instantanes = [i for i in self.__instantanes if i[0] <= n]
+        if instantanes:
+            debut, etat = instantanes[-1]
+            manche = Manche.depuis_etat(etat, self.copie(debut))
+        else:
+            debut = 1
+            _, joueurs, pseudos, grosse_blind = self.__evenements[0]
+            manche = Manche.depuis_ouverture(joueurs, pseudos, grosse_blind)
+
+        for evenement in self.__evenements[debut:n]:
+            manche.rejouer(evenement)
+
+        if manche.journal.evenements != self.__evenements[:n]:
+            raise ValueError("La manche rejouée ne correspond pas au journal")
+        return manche
+
+    def historique(self) -> list[dict]:
+        """
+        Exporte le journal en une suite de dictionnaires lisibles (historique de la main)
+
+        La graine du mélange permet de refaire le paquet, donc de connaître toutes les
+        mains et le board à venir : elle n'apparaît qu'une fois la manche terminée
+        (événement FIN). Son engagement (empreinte SHA-256) est publié dès la donne, ce
+        qui permet de vérifier a posteriori que la graine révélée est bien celle du mélange.
+
+        Renvois
+        -------
+        list[dict]
+            un dictionnaire par événement, avec son type et ses informations
+        """
+
+        def cartes(codes):
+            return [str(Carte.from_code(code)) for code in codes]
+
+        terminee = self.__evenements[-1][0] == self.FIN
+        historique = []
+        for evenement in self.__evenements:
+            type_evenement = evenement[0]
+            ligne = {"type": self.TYPES[type_evenement]}
+            if type_evenement == self.OUVERTURE:
+                ligne.update(
+                    joueurs=list(evenement[1]),
+                    pseudos=None if evenement[2] is None else list(evenement[2]),
+                    grosse_blind=evenement[3],
+                )
+            elif type_evenement == self.PREFLOP:
+                graine = evenement[1]
+                ligne["engagement"] = None if graine is None else Melangeur.engagement(graine)
+                if terminee:
+                    ligne["graine"] = None if graine is None else graine.hex()
+            elif type_evenement == self.ACTION:
+                ligne.update(
+                    joueur=evenement[1],
+                    action=self.ACTIONS[evenement[2]],
+                    credit=evenement[3],
+                    relance=evenement[4],
+                )
+            elif type_evenement == self.TOUR:
+                ligne.update(tour=evenement[1], cartes=cartes(evenement[2]))
+            elif type_evenement == self.FIN:
+                ligne["board"] = cartes(evenement[1])
+            historique.append(ligne)
+        return historique
@@ -1,10 +1,10 @@
 """Implémentation de la classe AbstractListeCartes"""
 
 from abc import ABC
-from copy import deepcopy
-from random import shuffle
 
 from business_object.carte import Carte
+from business_object.melangeur import Melangeur
+from business_object.vue_cartes import VueCartes
 
 
 class AbstractListeCartes(ABC):
@@ -38,6 +38,38 @@ class AbstractListeCartes(ABC):
             si cartes n'est pas de type list ou si un élément de cette liste n'est pas de type Carte
         """
 
+        self._verifier_cartes(cartes)
+
+        if cartes is None:
+            self.__cartes = []
+
+        # Copie : le masque et les comptes ne doivent pas suivre la liste de l'appelant
+        if cartes is not None:
+            self.__cartes = list(cartes)
+
+        # Créer un jeu de cartes complet
+        if complet:
+            self.__cartes = [Carte.from_code(code) for code in range(52)]
+
+        self.__vue = VueCartes(self.__cartes)
+
+        # Masque de 52 bits des cartes présentes, et nombre d'exemplaires de chaque carte
+        self.__comptes = bytearray(52)
+        for carte in self.__cartes:
+            self.__comptes[carte.code] += 1
+        self.__masque = Carte.masque(self.__cartes)
+
+    @staticmethod
+    def _verifier_cartes(cartes: list[Carte]) -> None:
+        """
+        Vérifie qu'une liste initiale de cartes est valide
+
+        Exceptions
+        ----------
+        TypeError
+            si cartes n'est pas de type list ou si un élément de cette liste n'est pas de type Carte
+        """
+
         if not isinstance(cartes, list) and cartes is not None:
             raise TypeError(f"cartes n'est pas list ou None : {type(cartes)}")
 
@@ -49,29 +81,71 @@ class AbstractListeCartes(ABC):
                         f"cartes ne doit contenir que des objet de type Carte : {type(carte)}"
                     )
 
-        if cartes is None:
-            self.__cartes = []
+    def _verifier_indice(self, indice: int) -> None:
+        """
+        Vérifie qu'une carte peut être retirée à cet indice
 
-        if cartes is not None:
-            self.__cartes = cartes
+        Exceptions
+        ----------
+        Exception
+            Si la liste est vide.
+        TypeError
+            Si l'indice n'est pas un entier.
+        ValueError
+            Si l'indice est invalide.
+        """
 
-        # Créer un jeu de cartes complet
-        if complet:
-            self.__cartes = [
-                Carte(valeur, couleur) for valeur in Carte.VALEURS() for couleur in Carte.COULEURS()
-            ]
+        if len(self) == 0:
+            raise Exception("La liste de cartes est vide, aucune carte ne peut être retirée.")
+
+        if not isinstance(indice, int):
+            raise TypeError(f"L'indice renseigné n'est pas de type int : {type(indice)}")
+
+        if not (0 <= indice < len(self)):
+            raise ValueError(f"L'indice renseigné est trop grand : {indice}")
 
     @property
-    def cartes(self) -> list[Carte]:
+    def cartes(self) -> VueCartes:
+        """
+        Retourne une vue en lecture seule des cartes présentes dans la liste.
+
+        La vue ne copie pas les cartes et suit les modifications de la liste.
+
+        Renvois
+        -------
+        VueCartes
+            Vue sur les cartes contenues dans la liste.
+        """
+        return self.__vue
+
+    @property
+    def masque(self) -> int:
+        """
+        Masque de 52 bits des cartes présentes dans la liste (voir Carte.masque).
+
+        Renvois
+        -------
+        int
+            entier dont le bit `carte.code` vaut 1 pour chaque carte de la liste
+        """
+        return self.__masque
+
+    def __contains__(self, carte) -> bool:
+        """Indique si une carte est présente dans la liste, par un test de bit"""
+        return isinstance(carte, Carte) and bool(self.masque >> carte.code & 1)
+
+    def copie(self) -> list[Carte]:
         """
-        Retourne une copie profonde des cartes présentes dans la liste.
+        Retourne une copie modifiable des cartes présentes dans la liste.
+
+        Les cartes étant uniques et immuables, seule la liste est copiée.
 
         Renvois
         -------
         list[Carte]
-            Copie des cartes contenues dans la liste.
+            Nouvelle liste contenant les cartes, dans le même ordre.
         """
-        return deepcopy(self.__cartes)
+        return list(self.__cartes)
 
     def __str__(self) -> str:
         """
@@ -82,11 +156,11 @@ class AbstractListeCartes(ABC):
         str
             Chaîne affichant toutes les cartes dans la liste.
         """
-        if len(self.__cartes) == 0:
+        if len(self) == 0:
             return "[]"
 
         texte = "["
-        for carte in self.__cartes:
+        for carte in self.cartes:
             texte += f"{carte}, "
 
         return texte[:-2] + "]"
@@ -121,14 +195,7 @@ class AbstractListeCartes(ABC):
         if type(self) is not type(other):
             return False
 
-        if len(self) != len(other):
-            return False
-
-        for carte in range(len(self)):
-            if self.cartes[carte] != other.cartes[carte]:
-                return False
-
-        return True
+        return self.cartes == other.cartes
 
     def ajouter_carte(self, carte: Carte) -> None:
         """
@@ -144,6 +211,8 @@ class AbstractListeCartes(ABC):
             raise TypeError(f"l'objet à ajouter n'est pas de type Carte : {type(carte)}")
 
         self.__cartes.append(carte)
+        self.__comptes[carte.code] += 1
+        self.__masque |= 1 << carte.code
 
     def retirer_carte(self, indice: int = 0) -> Carte:
         """
@@ -167,17 +236,28 @@ class AbstractListeCartes(ABC):
             Si l'indice est invalide.
         """
 
-        if len(self) == 0:
-            raise Exception("La liste de cartes est vide, aucune carte ne peut être retirée.")
+        self._verifier_indice(indice)
 
-        if not isinstance(indice, int):
-            raise TypeError(f"L'indice renseigné n'est pas de type int : {type(indice)}")
+        carte = self.__cartes.pop(indice)
+        self.__comptes[carte.code] -= 1
+        if not self.__comptes[carte.code]:
+            self.__masque &= ~(1 << carte.code)
+        return carte
 
-        if not (0 <= indice < len(self)):
-            raise ValueError(f"L'indice renseigné est trop grand : {indice}")
+    def melanger(self, melangeur: Melangeur = None) -> bytes:
+        """
+        Mélange aléatoirement les cartes de la liste
 
-        return self.__cartes.pop(indice)
+        Paramètres
+        ----------
+        melangeur : Melangeur
+            mélangeur à utiliser, par défaut le mélangeur sûr partagé
 
-    def melanger(self):
-        """Mélange aléatoirement les cartes de la liste"""
-        shuffle(self.__cartes)
+        Renvois
+        -------
+        bytes
+            graine du mélange, qui permet de le rejouer
+        """
+        if melangeur is None:
+            melangeur = Melangeur.defaut()
+        return melangeur.melanger(self.__cartes)
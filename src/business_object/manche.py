@@ -1,8 +1,17 @@
 """Implémentation de la classe Manche"""
 
+from array import array
+
 from business_object.board import Board
 from business_object.evaluateur_combinaison import EvaluateurCombinaison
+from business_object.evaluateur_rapide import EvaluateurRapide
+from business_object.carte import Carte
 from business_object.info_manche import InfoManche
+from business_object.journal_manche import JournalManche
+from business_object.main import Main
+from business_object.melangeur import Melangeur
+from business_object.pot import Pot
+from business_object.resultat_manche import ResultatManche
 from business_object.reserve import Reserve
 from utils.log_decorator import log
 
@@ -12,7 +21,7 @@ class Manche:
 
     __TOURS = ("preflop", "flop", "turn", "river")
 
-    def __init__(self, info: InfoManche, grosse_blind: int):
+    def __init__(self, info: InfoManche, grosse_blind: int, reserve: Reserve = None):
         """
         Initialise une manche de poker.
 
@@ -22,6 +31,8 @@ class Manche:
             Informations sur les joueurs et leurs mains
         grosse_blind : int
             Montant de la grosse blind, qui doit être > 2
+        reserve : Reserve
+            paquet déjà mélangé à utiliser ; par défaut un paquet neuf, mélangé au préflop
 
         Exceptions
         ----------
@@ -46,12 +57,19 @@ class Manche:
 
         self.__tour = 0
         self.__info = info
-        self.__reserve = Reserve(None)
+        self.__reserve = Reserve(None) if reserve is None else reserve
+        self.__reserve_melangee = reserve is not None
+        self.__graine = None
         self.__board = Board([])
         self.__indice_joueur_actuel = 0
         self.__grosse_blind = grosse_blind
         self.__fin = False
         self.__enregistree = False
+        self.__resultat = None
+        self.__journal = JournalManche(info.joueurs, info.pseudos, grosse_blind)
+        # Joueurs en lice, recalculés seulement quand les statuts changent
+        self.__en_lice = None
+        self.__en_lice_cle = None
 
     @property
     def tour(self) -> int:
@@ -80,6 +98,21 @@ class Manche:
         """Retourne les cartes communes visibles sur la table"""
         return self.__board
 
+    @property
+    def journal(self) -> JournalManche:
+        """Journal des événements de la manche (voir JournalManche)"""
+        return self.__journal
+
+    @property
+    def graine(self) -> bytes | None:
+        """Graine du mélange du paquet, connue après le préflop (permet de rejouer la donne)"""
+        return self.__graine
+
+    @property
+    def engagement(self) -> str | None:
+        """Empreinte SHA-256 de la graine, publiable avant la donne puis vérifiable"""
+        return None if self.__graine is None else Melangeur.engagement(self.__graine)
+
     @property
     def indice_joueur_actuel(self) -> int:
         """Renvoie l'indice du joueur dont c'est le tour"""
@@ -123,11 +156,11 @@ class Manche:
 
     def indice_joueur(self, id_joueur: int) -> int:
         """
-        Retourne l'indice du joueur si il est présent dans la manche
+        Retourne l'indice du joueur si il est présent dans la manche (en temps constant)
 
         Paramètres
         ----------
-        joueur : Joueur
+        id_joueur : int
             Le joueur recherché dans la manche
 
         Renvois
@@ -141,10 +174,7 @@ class Manche:
             si le joueur n'est pas présent dans la manche
         """
 
-        for i in range(len(self.info.joueurs)):
-            if self.info.joueurs[i] == id_joueur:
-                return i
-        raise ValueError("Le joueur n'est pas dans cette manche")
+        return self.info.indice_joueur(id_joueur)
 
     def regarder_cartes(self, id_joueur: int) -> str:
         """
@@ -203,7 +233,7 @@ class Manche:
             si tous les jouers sont couchés
         """
 
-        if all(s == 3 for s in self.info.statuts):
+        if self.info.compte_statut(3) == len(self.info.statuts):
             raise ValueError("Tous les joueurs ne peuvent être couchés")
 
         indice = self.indice_joueur_actuel
@@ -233,8 +263,11 @@ class Manche:
 
     def statuts_nouveau_tour(self):
         """Met à jour les statuts des joueurs pour un nouveau tour"""
-        for i in range(len(self.info.statuts)):
-            if self.info.statuts[i] not in [3, 4]:
+        statuts = self.info.statuts
+        if statuts.compte(3) + statuts.compte(4) + statuts.compte(0) == len(statuts):
+            return
+        for i, statut in enumerate(statuts):
+            if statut in (1, 2):
                 self.info.modifier_statut(i, 0)
 
     def nouveau_tour(self):
@@ -248,8 +281,16 @@ class Manche:
     @log
     def preflop(self):
         """Distribution des cartes initiales et mise des blinds"""
-        self.reserve.melanger()
+        if not self.__reserve_melangee:
+            self.reserve.melanger()
+        self.__graine = self.reserve.graine
         self.info.assignation_mains(self.reserve.distribuer(len(self.info.joueurs)))
+        self.__journaliser((JournalManche.PREFLOP, self.__graine))
+
+    def fin_des_blinds(self) -> None:
+        """Après les blinds, la grosse blind garde la parole (statut innactif)"""
+        self.info.modifier_statut(1, 0)
+        self.__journaliser((JournalManche.BLINDS,))
 
     @log
     def flop(self) -> str:
@@ -258,6 +299,7 @@ class Manche:
         for _ in range(3):
             self.__reserve.reveler(self.__board)
         self.nouveau_tour()
+        self.__journaliser_tour(3)
         return "La phase de flop commence !"
 
     @log
@@ -266,6 +308,7 @@ class Manche:
         self.__reserve.bruler()
         self.__reserve.reveler(self.__board)
         self.nouveau_tour()
+        self.__journaliser_tour(1)
         return "La phase de turn commence !"
 
     @log
@@ -274,22 +317,24 @@ class Manche:
         self.__reserve.bruler()
         self.__reserve.reveler(self.__board)
         self.nouveau_tour()
+        self.__journaliser_tour(1)
         return "La phase de river commence !"
 
     def fin_du_tour(self) -> bool:
         """Vérifie si tous les joueurs ont égalisé / couché / All-in"""
-        return all(s not in [0, 1] for s in self.info.statuts)
+        return self.info.compte_statut(0) + self.info.compte_statut(1) == 0
 
     def fin_de_manche(self) -> bool:
         """Vérifie si la manche est terminée"""
-        n = sum(1 for s in self.info.statuts if s != 3)
-        n_all = sum(1 for s in self.info.statuts if s == 4)
-        n_late = sum(1 for s in self.info.statuts if s == 1)
+        # Compteurs tenus à jour par InfoManche : aucun parcours des statuts
+        n = len(self.info.statuts) - self.info.compte_statut(3)
+        n_all = self.info.compte_statut(4)
+        n_late = self.info.compte_statut(1)
         if n == 0:
             raise ValueError("Les joueurs ne peuvent être tous couchés")
         return (
-            n_all == len(self.joueurs_en_lice)
-            or (n_all == len(self.joueurs_en_lice) - 1 and n_late == 0)
+            n_all == n
+            or (n_all == n - 1 and n_late == 0)
             or n == 1
             or (self.fin_du_tour() and self.tour == 3)
         )
@@ -366,9 +411,9 @@ class Manche:
         self.info.modifier_statut(indice_joueur, 2)
 
         if relance > 0:
-            for i in range(len(self.info.statuts)):
-                if i != indice_joueur and self.info.statuts[i] in [0, 2]:
-                    self.info.statuts[i] = 1
+            for i, statut in enumerate(self.info.statuts):
+                if i != indice_joueur and statut in (0, 2):
+                    self.info.modifier_statut(i, 1)
 
         return pour_suivre + relance
 
@@ -407,9 +452,9 @@ class Manche:
         self.info.modifier_statut(indice_joueur, 4)
 
         if montant > pour_suivre:
-            for i in range(len(self.info.statuts)):
-                if self.info.statuts[i] in (0, 2):
-                    self.info.statuts[i] = 1
+            for i, statut in enumerate(self.info.statuts):
+                if statut in (0, 2):
+                    self.info.modifier_statut(i, 1)
 
         return montant
 
@@ -449,7 +494,7 @@ class Manche:
             somme des mises de tous les joueurs
         """
 
-        return sum(self.info.mises)
+        return self.info.pot
 
     @property
     def joueurs_en_lice(self) -> list[int]:
@@ -465,9 +510,42 @@ class Manche:
         list[int]
             Indices des joueurs actifs.
         """
-        return [i for i, statut in enumerate(self.info.statuts) if statut != 3]
+        statuts = self.info.statuts
+        cle = (id(statuts), statuts.version)
+        if self.__en_lice_cle != cle:
+            self.__en_lice = [i for i, statut in enumerate(statuts) if statut != 3]
+            self.__en_lice_cle = cle
+        return self.__en_lice
+
+    def forces(self) -> dict[int, int]:
+        """
+        Calcule la force entière de la meilleure combinaison de chaque joueur en lice.
+
+        Paramètres
+        ----------
+        None
+
+        Renvois
+        -------
+        dict[int, int]
+            dictionnaire associant l'indice de chaque joueur en lice à sa force
+        """
+
+        forces = {}
+        # Analyse du board partagée : seules les deux cartes de chaque main sont ajoutées
+        analyse_board = self.board.analyse
+
+        for i in self.joueurs_en_lice:
+            main = self.info.mains[i]
+            # On prend la combinaison forcée si elle existe
+            if hasattr(main, "_combinaison") and main._combinaison:
+                forces[i] = EvaluateurRapide.force_combinaison(main._combinaison)
+            else:
+                forces[i] = EvaluateurRapide.force_fusion(analyse_board, main.cartes)
+
+        return forces
 
-    def classement(self) -> list[int]:
+    def classement(self, forces: dict[int, int] = None) -> list[int]:
         """
         Classe les joueurs selon la force de leur main combinée avec le board.
 
@@ -476,7 +554,8 @@ class Manche:
 
         Paramètres
         ----------
-        None
+        forces : dict[int, int]
+            forces des joueurs en lice si elles sont déjà connues, sinon voir forces()
 
         Renvois
         -------
@@ -493,18 +572,9 @@ class Manche:
             raise ValueError("Impossible de classer : le board n'est pas complet")
 
         joueurs_actifs = self.joueurs_en_lice
-        evals = {}
+        evals = self.forces() if forces is None else forces
 
-        for i in joueurs_actifs:
-            cartes_totales = self.info.mains[i].cartes + self.board.cartes
-            # On prend la combinaison forcée si elle existe
-            if hasattr(self.info.mains[i], "_combinaison") and self.info.mains[i]._combinaison:
-                comb = self.info.mains[i]._combinaison
-            else:
-                comb = EvaluateurCombinaison.eval(cartes_totales)
-            evals[i] = comb._valeur_comparaison()
-
-        # Tri décroissant par valeur de combinaison
+        # Tri décroissant par force de combinaison
         sorted_joueurs = sorted(joueurs_actifs, key=lambda i: evals[i], reverse=True)
 
         classement_dict = {}
@@ -556,12 +626,24 @@ class Manche:
             return [0, mise]
         return [mise - montant_a_recupere, montant_a_recupere]
 
+    def pots(self) -> list[Pot]:
+        """
+        Découpe les mises de la manche en pot principal et side pots
+
+        Renvois
+        -------
+        list[Pot]
+            pots du principal au dernier side pot, avec les joueurs pouvant les remporter
+        """
+
+        return Pot.construire(self.info.mises, self.joueurs_en_lice)
+
     def gains(self) -> dict:
         """
         Calcule les gains de chaque joueur à la fin de la manche.
 
         Prend en compte :
-        - Les side pots (mises différentes)
+        - Les side pots (mises différentes), construits par Pot.construire
         - Les ex-aequo (partage équitable du pot)
 
         Paramètres
@@ -583,61 +665,18 @@ class Manche:
             gains = {self.info.joueurs[self.joueurs_en_lice[0]]: self.valeur_pot()}
             return gains
 
-        if len(self.board.cartes) != 5 and not self.fin:
+        if len(self.board) != 5 and not self.fin:
             raise ValueError("Le board n'est pas complet, impossible de calculer les gains.")
 
-        # copies / structures locales
-        mises_restantes = self.info.mises[:]  # liste modifiable
-        classement = self.classement()        # liste des rangs (1 = meilleur, 0 = hors course)
-        joueurs = self.info.joueurs           # liste d'objets Joueur
-        n = len(joueurs)
+        return self.__repartir(self.pots(), self.classement())
 
-        # init gains à 0 (clé : Joueur)
+    def __repartir(self, pots: list[Pot], classement: list[int]) -> dict[int, int]:
+        """Additionne, pour chaque joueur, ses parts des différents pots"""
+        joueurs = self.info.joueurs
         gains = {j: 0 for j in joueurs}
-
-        # tant qu'il reste de l'argent à distribuer
-        while any(m > 0 for m in mises_restantes):
-            # participants qui ont contribué à ce round (TOUS ceux avec mise > 0)
-            participants_all = [i for i, m in enumerate(mises_restantes) if m > 0]
-            if not participants_all:
-                break  # sécurité
-
-            # niveau minimal parmi ces participants
-            mise_min = min(mises_restantes[i] for i in participants_all)
-
-            # valeur du pot courant (prend mise_min de chaque participant_all)
-            pot = sum(min(mises_restantes[i], mise_min) for i in participants_all)
-
-            # retirer la part correspondant à ce niveau
-            for i in participants_all:
-                prises = min(mises_restantes[i], mise_min)
-                mises_restantes[i] -= prises
-
-            # candidats au pot = participants_all
-            # mais seuls les joueurs encore en lice peuvent gagner (statut "en lice")
-            candidats = [i for i in participants_all if i in self.joueurs_en_lice]
-
-            # s'il n'y a pas de candidat (rare/impossible normalement), on répartit aux contributeurs
-            if not candidats:
-                candidats = participants_all
-
-            # trouver le meilleur rang parmi les candidats (1 = top)
-            meilleurs_rang = min(classement[i] for i in candidats)
-            winners = [i for i in candidats if classement[i] == meilleurs_rang]
-
-            # partage équitable
-            part_entiere = pot // len(winners)
-            reste = pot - part_entiere * len(winners)
-
-            for i in winners:
-                gains[joueurs[i]] += part_entiere
-
-            # distribuer le reste suivant une règle déterministe :
-            # par ex. au winner ayant l'indice minimal dans la table (ou selon dealer).
-            # Ici on donne le reste aux winners dans l'ordre d'apparition.
-            for k in range(reste):
-                gains[joueurs[winners[k % len(winners)]]] += 1
-
+        for pot in pots:
+            for i, gain in pot.repartir(classement).items():
+                gains[joueurs[i]] += gain
         return gains
 
     @log
@@ -668,6 +707,24 @@ class Manche:
             si l'action est invalide
         """
 
+        n_evenements = len(self.__journal)
+        if action in JournalManche.ACTIONS:
+            code = JournalManche.ACTIONS.index(action)
+            self.__journaliser(
+                (JournalManche.ACTION, id_joueur, code, credit_joueur, relance), instantane=False
+            )
+        try:
+            montant = self.__jouer_action(id_joueur, action, credit_joueur, relance)
+        except Exception:
+            # Une action refusée ne laisse pas de trace dans le journal
+            self.__journal.tronquer(n_evenements)
+            raise
+        self.__instantane_si_besoin()
+        return montant
+
+    def __jouer_action(self, id_joueur: int, action: str, credit_joueur: int, relance: int):
+        """Applique une action déjà journalisée (voir action)"""
+
         indice_joueur = self.indice_joueur(id_joueur)
 
         if indice_joueur != self.indice_joueur_actuel:
@@ -701,6 +758,8 @@ class Manche:
                 self.__reserve.reveler(self.__board)
 
             self.__fin = True
+            codes = tuple(carte.code for carte in self.__board.cartes)
+            self.__journaliser((JournalManche.FIN, codes), instantane=False)
             return montant
 
         if self.fin_du_tour():
@@ -715,45 +774,209 @@ class Manche:
         self.joueur_suivant()
         return montant
 
+    @property
+    def resultat(self) -> ResultatManche:
+        """
+        Résultat de la manche terminée, calculé une seule fois
+
+        Chaque main en lice est évaluée une fois ; le classement, les pots et les gains
+        sont déduits de ces évaluations.
+
+        Renvois
+        -------
+        ResultatManche
+            combinaisons, classement, pots et gains de la manche
+
+        Exceptions
+        ----------
+        Exception
+            si la manche n'est pas terminée
+        """
+
+        if self.__resultat is None:
+            if not self.fin:
+                raise Exception("La manche n'est pas encore terminée !")
+            self.__resultat = self.__calculer_resultat()
+        return self.__resultat
+
+    def __calculer_resultat(self) -> ResultatManche:
+        """Évalue les mains en lice puis construit le ResultatManche"""
+
+        info = self.info
+        en_lice = self.joueurs_en_lice
+        pots = self.pots()
+
+        if len(en_lice) == 1:
+            gains = {info.joueurs[en_lice[0]]: self.valeur_pot()}
+            return ResultatManche(info.joueurs, info.pseudos, en_lice, pots, gains)
+
+        combinaisons = [None] * len(info.joueurs)
+        forces = {}
+        for i in en_lice:
+            main = info.mains[i]
+            if hasattr(main, "_combinaison") and main._combinaison:
+                combinaison = main._combinaison
+            else:
+                combinaison = EvaluateurCombinaison.eval_cache(
+                    self.board.cartes + main.cartes, cle=self.board.masque | main.masque
+                )
+            combinaisons[i] = combinaison
+            forces[i] = EvaluateurRapide.force_combinaison(combinaison)
+
+        classement = self.classement(forces)
+        return ResultatManche(
+            info.joueurs,
+            info.pseudos,
+            en_lice,
+            pots,
+            self.__repartir(pots, classement),
+            combinaisons,
+            classement,
+        )
+
     def terminer_manche(self) -> dict:
         """Termine la manche et retourne les gains de chaque joueurs"""
         if self.__enregistree:
             return
 
-        if not self.fin:
-            raise Exception("La manche n'est pas encore terminée !")
-        else:
-            gains = self.gains()
-            self.__enregistree = True
-            return gains
+        gains = dict(self.resultat.gains)
+        self.__enregistree = True
+        return gains
 
     def resultats(self) -> str:
-        """Affiche le détail complet de fin de partie"""
+        """Affiche le détail complet de fin de partie (voir ResultatManche.texte)"""
+        return self.resultat.texte()
+
+    def __journaliser(self, evenement: tuple, instantane: bool = True) -> None:
+        """Ajoute un événement au journal, suivi d'un instantané si l'intervalle est atteint"""
+        self.__journal.ajouter(evenement)
+        if instantane:
+            self.__instantane_si_besoin()
+
+    def __journaliser_tour(self, n_cartes: int) -> None:
+        """Journalise le passage au tour suivant avec les n_cartes dernières cartes révélées"""
+        codes = tuple(carte.code for carte in self.__board.cartes[-n_cartes:])
+        self.__journal.ajouter((JournalManche.TOUR, self.__tour, codes))
+
+    def __instantane_si_besoin(self) -> None:
+        """Enregistre l'état de la manche dans le journal si l'intervalle est atteint"""
+        if self.__journal.instantane_attendu:
+            self.__journal.ajouter_instantane(self.etat())
+
+    def etat(self) -> dict:
+        """
+        État complet de la manche en types simples (entiers, tuples, octets)
+
+        Avec Manche.depuis_etat, il permet de reprendre la manche sans le journal
+        complet : il sert d'instantané au journal et de point de reprise après un arrêt.
 
-        texte = "Combinaisons :\n"
+        Renvois
+        -------
+        dict
+            joueurs, statuts, mises, mains, board, réserve restante et avancement
+        """
 
-        if len(self.joueurs_en_lice) > 1:
-            for j in range(len(self.info.joueurs)):
-                if j in self.joueurs_en_lice:
-                    combinaison = EvaluateurCombinaison().eval(
-                        self.board.cartes + self.info.mains[j].cartes
-                    )
-                    texte += f"{self.info.pseudos[j]} : {combinaison}\n"
-                else:
-                    texte += f"{self.info.pseudos[j]} : [?]\n"
+        info = self.info
+        return {
+            "joueurs": tuple(info.joueurs),
+            "pseudos": None if info.pseudos is None else tuple(info.pseudos),
+            "grosse_blind": self.__grosse_blind,
+            "tour": self.__tour,
+            "indice_joueur_actuel": self.__indice_joueur_actuel,
+            "fin": self.__fin,
+            "enregistree": self.__enregistree,
+            "statuts": tuple(info.statuts),
+            "mises": tuple(info.mises),
+            "tour_couche": tuple(info.tour_couche),
+            "mains": tuple(
+                None if main is None else tuple(carte.code for carte in main.cartes)
+                for main in info.mains
+            ),
+            "board": tuple(carte.code for carte in self.__board.cartes),
+            "reserve": self.__reserve.codes(),
+            "graine": self.__graine,
+            "reserve_melangee": self.__reserve_melangee,
+        }
 
-        else:
-            texte += "NA : seul un joueur ne s'est pas couché"
+    @classmethod
+    def depuis_etat(cls, etat: dict, journal: JournalManche = None) -> "Manche":
+        """
+        Reconstruit une manche à partir de son état (voir etat)
 
-        texte += "\nGains :\n"
+        Paramètres
+        ----------
+        etat : dict
+            état renvoyé par Manche.etat
+        journal : JournalManche
+            journal à rattacher à la manche, par défaut un journal qui commence à l'état
 
-        if len(self.joueurs_en_lice) > 1:
-            for j in range(len(self.info.joueurs)):
-                id_joueur = self.info.joueurs[j]
-                gain = self.gains()[id_joueur]
-                texte += f"{self.info.pseudos[j]} : {gain}\n"
-        else:
-            gain = self.valeur_pot()
-            texte += f"{self.info.pseudos[self.joueurs_en_lice[0]]} : {gain}"
+        Renvois
+        -------
+        Manche
+            manche dans l'état décrit
+        """
+
+        info = InfoManche(
+            list(etat["joueurs"]), None if etat["pseudos"] is None else list(etat["pseudos"])
+        )
+        info.statuts[:] = etat["statuts"]
+        info.mises[:] = etat["mises"]
+        info.tour_couche[:] = etat["tour_couche"]
+        if all(main is not None for main in etat["mains"]):
+            info.assignation_mains(
+                [Main([Carte.from_code(code) for code in main]) for main in etat["mains"]]
+            )
+
+        reserve = Reserve.depuis_codes(array("b", etat["reserve"]), etat["graine"])
+        manche = cls(info, etat["grosse_blind"], reserve)
+        manche.__reserve_melangee = etat["reserve_melangee"]
+        manche.__graine = etat["graine"]
+        manche.__board = Board([Carte.from_code(code) for code in etat["board"]])
+        manche.__tour = etat["tour"]
+        manche.__indice_joueur_actuel = etat["indice_joueur_actuel"]
+        manche.__fin = etat["fin"]
+        manche.__enregistree = etat["enregistree"]
+        if journal is not None:
+            manche.__journal = journal
+        return manche
+
+    @classmethod
+    def depuis_ouverture(cls, joueurs: list[int], pseudos: list[str], grosse_blind: int):
+        """Crée la manche vide décrite par l'événement d'ouverture d'un journal"""
+        return cls(
+            InfoManche(list(joueurs), None if pseudos is None else list(pseudos)), grosse_blind
+        )
+
+    def rejouer(self, evenement: tuple) -> None:
+        """
+        Rejoue un événement du journal d'une autre manche (voir JournalManche.reconstruire)
+
+        Les événements qui découlent des autres (tours, fin) sont ignorés : la manche
+        les produit elle-même en rejouant les actions.
+
+        Paramètres
+        ----------
+        evenement : tuple
+            événement de JournalManche
+
+        Exceptions
+        ----------
+        ValueError
+            si le paquet ne peut pas être reconstruit (mélange sans graine)
+        """
 
-        return texte
+        type_evenement = evenement[0]
+        if type_evenement == JournalManche.PREFLOP:
+            graine = evenement[1]
+            if graine is None:
+                raise ValueError("Paquet sans graine : la distribution ne peut être rejouée")
+            reserve_melangee = self.__reserve_melangee
+            self.__reserve = Reserve.depuis_graine(graine)
+            self.__reserve_melangee = True
+            self.preflop()
+            self.__reserve_melangee = reserve_melangee
+        elif type_evenement == JournalManche.BLINDS:
+            self.fin_des_blinds()
+        elif type_evenement == JournalManche.ACTION:
+            _, id_joueur, code, credit_joueur, relance = evenement
+            self.action(id_joueur, JournalManche.ACTIONS[code], credit_joueur, relance)
@@ -0,0 +1,179 @@
+"""Implémentation de la classe Melangeur"""
+
+import hashlib
+import os
+from array import array
+from threading import Lock
+
+
+class Melangeur:
+    """
+    Mélange des paquets de cartes, de façon sûre ou reproductible.
+
+    Chaque mélange est entièrement déterminé par une graine de 32 octets : la
+    permutation est un mélange de Fisher-Yates dont les tirages sont lus dans le flux
+    SHAKE-256 de la graine. Conserver la graine suffit donc à rejouer une donne, et
+    publier son empreinte SHA-256 (l'engagement) avant la donne permet de vérifier
+    ensuite que le paquet n'a pas été modifié.
+
+    - mode sûr (sans graine) : les graines sont tirées de l'entropie du système
+      (os.urandom), lue par blocs pour éviter un appel système par paquet
+    - mode déterministe (avec graine) : les graines successives sont dérivées de la
+      graine maîtresse et d'un compteur, la suite des paquets est reproductible
+    """
+
+    TAILLE_GRAINE = 32
+    TAILLE_BLOC = 4096
+    TAILLE_PAQUET = 52
+
+    __defaut = None
+
+    def __init__(self, graine: int | str | bytes = None):
+        """
+        Initialise un mélangeur
+
+        Paramètres
+        ----------
+        graine : int | str | bytes
+            graine maîtresse du mode déterministe ; None pour le mode sûr
+
+        Exceptions
+        ----------
+        TypeError
+            si la graine n'est ni un entier, ni une chaîne, ni des octets
+        """
+
+        if graine is not None and not isinstance(graine, (int, str, bytes)):
+            raise TypeError(f"La graine doit être un entier, une chaîne ou des octets : {graine}")
+
+        if isinstance(graine, int):
+            graine = str(graine)
+        if isinstance(graine, str):
+            graine = graine.encode()
+
+        self.__maitresse = None if graine is None else hashlib.sha256(graine).digest()
+        self.__compteur = 0
+        self.__entropie = b""
+        self.__position = 0
+        self.__verrou = Lock()
+
+    @classmethod
+    def defaut(cls) -> "Melangeur":
+        """Retourne le mélangeur sûr partagé, créé à la première utilisation"""
+        if cls.__defaut is None:
+            cls.__defaut = cls()
+        return cls.__defaut
+
+    @property
+    def securise(self) -> bool:
+        """Indique si les graines proviennent de l'entropie du système"""
+        return self.__maitresse is None
+
+    def nouvelle_graine(self) -> bytes:
+        """
+        Tire la graine du prochain mélange
+
+        Renvois
+        -------
+        bytes
+            graine de TAILLE_GRAINE octets
+        """
+
+        with self.__verrou:
+            if self.__maitresse is not None:
+                self.__compteur += 1
+                return hashlib.shake_256(
+                    self.__maitresse + self.__compteur.to_bytes(8, "big")
+                ).digest(self.TAILLE_GRAINE)
+
+            if self.__position + self.TAILLE_GRAINE > len(self.__entropie):
+                self.__entropie = os.urandom(self.TAILLE_BLOC)
+                self.__position = 0
+            debut = self.__position
+            self.__position += self.TAILLE_GRAINE
+            return self.__entropie[debut : self.__position]
+
+    @staticmethod
+    def engagement(graine: bytes) -> str:
+        """Empreinte SHA-256 (hexadécimale) d'une graine, publiable avant la donne"""
+        return hashlib.sha256(graine).hexdigest()
+
+    @staticmethod
+    def permuter(graine: bytes, elements: list) -> None:
+        """
+        Mélange une liste sur place, de façon entièrement déterminée par la graine
+
+        Paramètres
+        ----------
+        graine : bytes
+            graine du mélange
+        elements : list
+            liste à mélanger
+        """
+
+        # Deux octets par tirage ; les rares tirages rejetés allongent le flux
+        longueur = 4 * len(elements) + 64
+        flux = hashlib.shake_256(graine).digest(longueur)
+        position = 0
+        for i in range(len(elements) - 1, 0, -1):
+            borne = 65536 - 65536 % (i + 1)
+            while True:
+                if position + 2 > longueur:
+                    longueur *= 2
+                    flux = hashlib.shake_256(graine).digest(longueur)
+                tirage = flux[position] << 8 | flux[position + 1]
+                position += 2
+                if tirage < borne:
+                    break
+            j = tirage % (i + 1)
+            elements[i], elements[j] = elements[j], elements[i]
+
+    @classmethod
+    def paquet_depuis_graine(cls, graine: bytes) -> array:
+        """Reconstruit le paquet de 52 codes correspondant à une graine"""
+        codes = list(range(cls.TAILLE_PAQUET))
+        cls.permuter(graine, codes)
+        return array("b", codes)
+
+    def melanger(self, elements: list) -> bytes:
+        """
+        Mélange une liste sur place avec une nouvelle graine
+
+        Paramètres
+        ----------
+        elements : list
+            liste à mélanger
+
+        Renvois
+        -------
+        bytes
+            graine utilisée, qui permet de rejouer le mélange
+        """
+
+        graine = self.nouvelle_graine()
+        self.permuter(graine, elements)
+        return graine
+
+    def paquet(self) -> tuple[bytes, array]:
+        """Renvoie la graine et les 52 codes d'un nouveau paquet mélangé"""
+        graine = self.nouvelle_graine()
+        return graine, self.paquet_depuis_graine(graine)
+
+    def paquets(self, n: int) -> list[tuple[bytes, array]]:
+        """
+        Génère un lot de paquets mélangés, par exemple pour une simulation
+
+        Paramètres
+        ----------
+        n : int
+            nombre de paquets
+
+        Renvois
+        -------
+        list[tuple[bytes, array]]
+            la graine et les codes de chaque paquet
+        """
+
+        if not isinstance(n, int) or n < 0:
+            raise ValueError(f"Le nombre de paquets doit être un entier positif : {n}")
+        return [self.paquet() for _ in range(n)]
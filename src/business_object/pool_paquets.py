@@ -0,0 +1,214 @@
+"""Implémentation de la classe PoolPaquets"""
+
+import time
+from array import array
+from collections import deque
+from threading import Condition, Thread
+
+from business_object.melangeur import Melangeur
+from business_object.reserve import Reserve
+
+
+class PoolPaquets:
+    """
+    Réserve bornée de paquets déjà mélangés, remplie en tâche de fond.
+
+    Chaque paquet est un tableau de 52 codes de cartes (array('b')), accompagné de la
+    graine de son mélange (voir Melangeur). Un fil d'exécution
+    (thread) complète le pool dès qu'un paquet est pris, si bien que lancer une manche
+    se résume à retirer un paquet prêt. Si le pool est vide, le paquet est mélangé
+    immédiatement et la rupture est comptabilisée.
+    """
+
+    # Fenêtre glissante du débit de remplissage, en secondes
+    FENETRE_REMPLISSAGE = 60.0
+
+    def __init__(self, taille_max: int = 32, melangeur: Melangeur = None):
+        """
+        Initialise un pool vide, sans démarrer le remplissage
+
+        Paramètres
+        ----------
+        taille_max : int
+            nombre maximal de paquets prêts
+        melangeur : Melangeur
+            mélangeur des paquets, par défaut le mélangeur sûr partagé
+
+        Exceptions
+        ----------
+        ValueError
+            si taille_max n'est pas un entier strictement positif
+        """
+
+        if not isinstance(taille_max, int) or taille_max <= 0:
+            raise ValueError(
+                f"La taille maximale du pool doit être un entier positif : {taille_max}"
+            )
+
+        self.__taille_max = taille_max
+        self.__melangeur = Melangeur.defaut() if melangeur is None else melangeur
+        self.__paquets = deque()
+        self.__condition = Condition()
+        self.__thread = None
+        self.__arret = False
+
+        self.__paquets_servis = 0
+        self.__ruptures = 0
+        self.__paquets_remplis = 0
+        self.__duree_remplissage = 0.0
+        # Instants (time.monotonic) des paquets remis dans le pool, sur la fenêtre glissante
+        self.__debut = time.monotonic()
+        self.__remises = deque()
+
+    @property
+    def taille(self) -> int:
+        """Nombre de paquets prêts"""
+        return len(self.__paquets)
+
+    @property
+    def taille_max(self) -> int:
+        """Nombre maximal de paquets prêts"""
+        return self.__taille_max
+
+    @property
+    def actif(self) -> bool:
+        """Indique si le remplissage en tâche de fond est en cours"""
+        return self.__thread is not None and self.__thread.is_alive()
+
+    @property
+    def paquets_servis(self) -> int:
+        """Nombre de paquets distribués, qu'ils viennent du pool ou non"""
+        return self.__paquets_servis
+
+    @property
+    def ruptures(self) -> int:
+        """Nombre de demandes arrivées alors que le pool était vide"""
+        return self.__ruptures
+
+    @property
+    def debit_melange(self) -> float:
+        """
+        Paquets mélangés par seconde de mélange (0 si aucun)
+
+        Seul le temps passé à mélanger est compté, pas l'attente du fil d'exécution
+        lorsque le pool est plein : c'est la capacité de remplissage, pas le rythme
+        auquel les paquets sont effectivement remplacés.
+        """
+        if self.__duree_remplissage == 0:
+            return 0.0
+        return self.__paquets_remplis / self.__duree_remplissage
+
+    @property
+    def debit_remplissage(self) -> float:
+        """
+        Paquets remis dans le pool par seconde, sur la dernière minute (FENETRE_REMPLISSAGE)
+
+        Le rythme réel du remplissage : attente comprise, il suit la consommation des
+        paquets tant que le pool n'est pas en rupture. Avant la première minute, le débit
+        est rapporté au temps écoulé depuis la création du pool.
+        """
+        with self.__condition:
+            maintenant = time.monotonic()
+            self.__oublier_remises(maintenant)
+            duree = min(self.FENETRE_REMPLISSAGE, maintenant - self.__debut)
+            return len(self.__remises) / duree if duree > 0 else 0.0
+
+    def __oublier_remises(self, maintenant: float) -> None:
+        """Retire les remises sorties de la fenêtre glissante (verrou déjà pris)"""
+        while self.__remises and self.__remises[0] <= maintenant - self.FENETRE_REMPLISSAGE:
+            self.__remises.popleft()
+
+    def remplir(self) -> int:
+        """
+        Complète le pool jusqu'à sa taille maximale, dans le fil d'exécution appelant
+
+        Renvois
+        -------
+        int
+            nombre de paquets ajoutés
+        """
+
+        n_ajoutes = 0
+        while len(self.__paquets) < self.__taille_max:
+            self.__ajouter_paquet()
+            n_ajoutes += 1
+        return n_ajoutes
+
+    def __ajouter_paquet(self) -> None:
+        """Mélange un paquet hors verrou puis l'ajoute au pool"""
+        debut = time.perf_counter()
+        paquet = self.__melangeur.paquet()
+        with self.__condition:
+            self.__duree_remplissage += time.perf_counter() - debut
+            self.__paquets_remplis += 1
+            if len(self.__paquets) < self.__taille_max:
+                self.__paquets.append(paquet)
+                maintenant = time.monotonic()
+                self.__remises.append(maintenant)
+                self.__oublier_remises(maintenant)
+
+    def __boucle(self) -> None:
+        """Remplit le pool dès qu'il n'est plus plein, jusqu'à l'arrêt"""
+        while True:
+            with self.__condition:
+                while not self.__arret and len(self.__paquets) >= self.__taille_max:
+                    self.__condition.wait()
+                if self.__arret:
+                    return
+            self.__ajouter_paquet()
+
+    def demarrer(self) -> None:
+        """Démarre le remplissage en tâche de fond (sans effet s'il est déjà actif)"""
+        with self.__condition:
+            if self.actif:
+                return
+            self.__arret = False
+            self.__thread = Thread(target=self.__boucle, name="pool-paquets", daemon=True)
+            self.__thread.start()
+
+    def arreter(self) -> None:
+        """Arrête le remplissage en tâche de fond et attend la fin du fil d'exécution"""
+        with self.__condition:
+            self.__arret = True
+            self.__condition.notify_all()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def prendre(self) -> tuple[bytes, array]:
+        """
+        Retire un paquet mélangé du pool
+
+        Renvois
+        -------
+        tuple[bytes, array]
+            la graine du mélange et les 52 codes des cartes, dans l'ordre du tirage
+        """
+
+        with self.__condition:
+            self.__paquets_servis += 1
+            if self.__paquets:
+                paquet = self.__paquets.popleft()
+                self.__condition.notify()
+                return paquet
+            self.__ruptures += 1
+
+        # Pool vide : le paquet est mélangé dans le fil d'exécution appelant
+        return self.__melangeur.paquet()
+
+    def reserve(self) -> Reserve:
+        """Retourne une réserve construite sur un paquet du pool"""
+        graine, codes = self.prendre()
+        return Reserve.depuis_codes(codes, graine)
+
+    def statistiques(self) -> dict:
+        """Renvoie l'état du pool : taille, ruptures, débits de remplissage et de mélange"""
+        return {
+            "taille": self.taille,
+            "taille_max": self.__taille_max,
+            "actif": self.actif,
+            "paquets_servis": self.__paquets_servis,
+            "ruptures": self.__ruptures,
+            "debit_remplissage": round(self.debit_remplissage, 1),
+            "debit_melange": round(self.debit_melange, 1),
+        }
@@ -0,0 +1,181 @@
+"""Implémentation de la classe Pot"""
+
+
+class Pot:
+    """
+    Pot (principal ou side pot) d'une manche : un montant et les sièges qui peuvent le gagner.
+
+    Les pots se construisent en une seule passe sur les mises triées (voir construire) :
+    chaque palier de mise forme une couche à laquelle contribuent tous les joueurs ayant
+    misé au moins ce palier, et seuls les joueurs encore en lice peuvent la remporter.
+    Deux couches successives ouvertes aux mêmes joueurs forment un seul pot.
+    """
+
+    __slots__ = ("__montant", "__niveau", "__eligibles", "__contributeurs")
+
+    def __init__(self, montant: int, niveau: int, eligibles: tuple[int], contributeurs: tuple[int]):
+        """
+        Crée un pot
+
+        Paramètres
+        ----------
+        montant : int
+            somme des jetons du pot
+        niveau : int
+            mise cumulée jusqu'à laquelle ce pot est alimenté
+        eligibles : tuple[int]
+            indices des joueurs pouvant remporter le pot, dans l'ordre des sièges
+        contributeurs : tuple[int]
+            indices des joueurs ayant alimenté le pot, dans l'ordre des sièges
+
+        Exceptions
+        ----------
+        ValueError
+            si le montant est négatif ou si aucun joueur ne peut remporter le pot
+        """
+
+        if not isinstance(montant, int) or montant < 0:
+            raise ValueError(f"Le montant du pot doit être un entier positif : {montant}")
+        if not eligibles:
+            raise ValueError("Au moins un joueur doit pouvoir remporter le pot")
+
+        self.__montant = montant
+        self.__niveau = niveau
+        self.__eligibles = tuple(eligibles)
+        self.__contributeurs = tuple(contributeurs)
+
+    @property
+    def montant(self) -> int:
+        """Somme des jetons du pot"""
+        return self.__montant
+
+    @property
+    def niveau(self) -> int:
+        """Mise cumulée jusqu'à laquelle ce pot est alimenté"""
+        return self.__niveau
+
+    @property
+    def eligibles(self) -> tuple[int]:
+        """Indices des joueurs pouvant remporter le pot"""
+        return self.__eligibles
+
+    @property
+    def contributeurs(self) -> tuple[int]:
+        """Indices des joueurs ayant alimenté le pot"""
+        return self.__contributeurs
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Pot):
+            return NotImplemented
+        return (
+            self.__montant == other.__montant
+            and self.__niveau == other.__niveau
+            and self.__eligibles == other.__eligibles
+            and self.__contributeurs == other.__contributeurs
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.__montant, self.__niveau, self.__eligibles, self.__contributeurs))
+
+    def __repr__(self) -> str:
+        return (
+            f"Pot(montant={self.__montant}, niveau={self.__niveau}, eligibles={self.__eligibles})"
+        )
+
+    def to_dict(self) -> dict:
+        """Représentation du pot en types simples, pour l'affichage ou la persistance"""
+        return {
+            "montant": self.__montant,
+            "niveau": self.__niveau,
+            "eligibles": list(self.__eligibles),
+            "contributeurs": list(self.__contributeurs),
+        }
+
+    @classmethod
+    def construire(cls, mises: list[int], en_lice: list[int]) -> list["Pot"]:
+        """
+        Découpe les mises d'une manche en pot principal et side pots
+
+        Les joueurs sont triés une fois par mise croissante, puis parcourus une seule
+        fois : chaque mise distincte ferme une couche (palier précédent -> mise) alimentée
+        par tous les joueurs restants. Une couche ouverte aux mêmes joueurs que la
+        précédente (les éligibles ne changent que lorsque l'un d'eux atteint sa mise)
+        s'ajoute au pot courant : seuls les sièges d'un nouveau pot sont recalculés.
+
+        Les jetons indivisibles d'un pot fusionné sont répartis une seule fois (voir
+        repartir), et non couche par couche.
+
+        Paramètres
+        ----------
+        mises : list[int]
+            mise totale de chaque joueur sur la manche
+        en_lice : list[int]
+            indices des joueurs qui ne se sont pas couchés
+
+        Renvois
+        -------
+        list[Pot]
+            pots du principal au dernier side pot ; leur somme vaut la somme des mises
+        """
+
+        en_lice = set(en_lice)
+        # Joueurs ayant misé, par mise croissante puis par siège
+        ordre = sorted((i for i, m in enumerate(mises) if m > 0), key=mises.__getitem__)
+
+        pots = []
+        palier = 0
+        debut = 0
+        nouveau_pot = True
+        while debut < len(ordre):
+            niveau = mises[ordre[debut]]
+            # Les joueurs ordre[debut:] ont misé au moins ce niveau
+            montant = (niveau - palier) * (len(ordre) - debut)
+
+            if nouveau_pot:
+                contributeurs = tuple(sorted(ordre[debut:]))
+                eligibles = tuple(i for i in contributeurs if i in en_lice) or contributeurs
+                ensemble_eligibles = set(eligibles)
+                pots.append(cls(montant, niveau, eligibles, contributeurs))
+            else:
+                precedent = pots[-1]
+                pots[-1] = cls(
+                    precedent.montant + montant,
+                    niveau,
+                    precedent.eligibles,
+                    precedent.contributeurs,
+                )
+
+            # Les joueurs dont la mise est atteinte ne contribuent plus aux couches suivantes ;
+            # un nouveau pot ne commence que si l'un d'eux pouvait remporter le pot courant
+            nouveau_pot = False
+            while debut < len(ordre) and mises[ordre[debut]] == niveau:
+                nouveau_pot = nouveau_pot or ordre[debut] in ensemble_eligibles
+                debut += 1
+            palier = niveau
+
+        return pots
+
+    def repartir(self, classement: list[int]) -> dict[int, int]:
+        """
+        Partage le pot entre les meilleurs joueurs éligibles
+
+        Les ex-aequo se partagent le pot ; les jetons indivisibles sont donnés un par un
+        aux gagnants dans l'ordre des sièges, une seule fois pour tout le pot (même s'il
+        réunit plusieurs couches de mises).
+
+        Paramètres
+        ----------
+        classement : list[int]
+            rang de chaque joueur (1 = meilleure main), voir Manche.classement
+
+        Renvois
+        -------
+        dict[int, int]
+            gain de chaque gagnant, par indice de joueur
+        """
+
+        meilleur_rang = min(classement[i] for i in self.__eligibles)
+        gagnants = [i for i in self.__eligibles if classement[i] == meilleur_rang]
+
+        part, reste = divmod(self.__montant, len(gagnants))
+        return {i: part + (1 if k < reste else 0) for k, i in enumerate(gagnants)}
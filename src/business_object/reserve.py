@@ -1,13 +1,25 @@
 """Implémentation de la classe Reserve"""
 
+from array import array
+
 from business_object.board import Board
 from business_object.carte import Carte
 from business_object.liste_cartes import AbstractListeCartes
 from business_object.main import Main
+from business_object.melangeur import Melangeur
+from business_object.vue_cartes import VueCartes
 
 
 class Reserve(AbstractListeCartes):
-    """Modélisation de la réserve de cartes (pioche) pour une manche de poker"""
+    """
+    Modélisation de la réserve de cartes (pioche) pour une manche de poker
+
+    Les cartes sont stockées sous forme de codes entiers dans un tableau circulaire de
+    taille fixe, lu à partir d'un curseur : tirer, brûler et révéler une carte sont de
+    simples déplacements du curseur, sans décalage ni allocation.
+    """
+
+    TAILLE_PAQUET = 52
 
     def __init__(self, cartes: list[Carte] = None, complet: bool = True):
         """
@@ -17,14 +29,246 @@ class Reserve(AbstractListeCartes):
         ----------
         cartes : list[Carte]
             Liste de cartes
+        complet : bool
+            si la réserve doit contenir toutes les cartes d'un jeu de cartes
 
         Renvois
         -------
         Reserve
             Instance de 'Reserve'
+
+        Exceptions
+        ----------
+        TypeError
+            si cartes n'est pas de type list ou si un élément de cette liste n'est pas de type Carte
+        """
+
+        self._verifier_cartes(cartes)
+        # La liste de la classe mère reste vide : les cartes vivent dans le tableau de codes
+        super().__init__(None, False)
+
+        if complet:
+            codes = range(self.TAILLE_PAQUET)
+        else:
+            codes = [carte.code for carte in cartes or []]
+
+        self.__codes = array("b", codes)
+        self.__codes.extend([0] * max(0, self.TAILLE_PAQUET - len(self.__codes)))
+        self.__debut = 0
+        self.__taille = len(codes)
+        self.__vue = VueCartes(self)
+        self.__compter(codes)
+        self.__graine = None
+
+    @classmethod
+    def depuis_codes(cls, codes: array, graine: bytes = None) -> "Reserve":
+        """
+        Crée une réserve à partir d'un paquet de codes déjà mélangé, sans le copier
+
+        Paramètres
+        ----------
+        codes : array
+            tableau ('b') des codes des cartes (0 à 51), dans l'ordre du tirage ;
+            la réserve en devient propriétaire
+        graine : bytes
+            graine du mélange ayant produit ce paquet, si elle est connue
+
+        Renvois
+        -------
+        Reserve
+            réserve dont la carte du dessus est codes[0]
+
+        Exceptions
+        ----------
+        TypeError
+            si codes n'est pas un tableau d'entiers signés sur un octet
+        """
+
+        if not isinstance(codes, array) or codes.typecode != "b":
+            raise TypeError(f"codes doit être un array('b') : {type(codes)}")
+
+        reserve = cls(None, False)
+        reserve.__taille = len(codes)
+        if len(codes) < cls.TAILLE_PAQUET:
+            codes.extend([0] * (cls.TAILLE_PAQUET - len(codes)))
+        reserve.__codes = codes
+        reserve.__graine = graine
+        reserve.__compter(codes[: reserve.__taille])
+        return reserve
+
+    def __compter(self, codes) -> None:
+        """Initialise le masque et le nombre d'exemplaires de chaque carte"""
+        self.__comptes = bytearray(self.TAILLE_PAQUET)
+        self.__masque = 0
+        for code in codes:
+            self.__comptes[code] += 1
+            self.__masque |= 1 << code
+
+    @property
+    def masque(self) -> int:
+        """Masque de 52 bits des cartes restant dans la réserve (voir Carte.masque)"""
+        return self.__masque
+
+    @classmethod
+    def depuis_graine(cls, graine: bytes) -> "Reserve":
+        """
+        Reconstruit la réserve complète mélangée avec une graine (voir Melangeur)
+
+        Paramètres
+        ----------
+        graine : bytes
+            graine enregistrée lors du mélange
+
+        Renvois
+        -------
+        Reserve
+            réserve de 52 cartes, dans l'ordre exact du mélange d'origine
+        """
+        return cls.depuis_codes(Melangeur.paquet_depuis_graine(graine), graine)
+
+    @property
+    def graine(self) -> bytes | None:
+        """Graine du dernier mélange de la réserve, None si elle n'a pas été mélangée"""
+        return self.__graine
+
+    def __len__(self) -> int:
+        """Nombre de cartes restant dans la réserve"""
+        return self.__taille
+
+    def __getitem__(self, indice):
+        """Carte (ou liste de cartes pour une tranche) à une position, 0 étant le dessus"""
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(self.__taille))]
+        if indice < 0:
+            indice += self.__taille
+        if not 0 <= indice < self.__taille:
+            raise IndexError(f"L'indice renseigné est trop grand : {indice}")
+        return Carte.from_code(self.__codes[(self.__debut + indice) % len(self.__codes)])
+
+    def __iter__(self):
+        """Parcourt les cartes de la réserve dans l'ordre du tirage"""
+        capacite = len(self.__codes)
+        for i in range(self.__taille):
+            yield Carte.from_code(self.__codes[(self.__debut + i) % capacite])
+
+    @property
+    def cartes(self) -> VueCartes:
+        """
+        Retourne une vue en lecture seule des cartes de la réserve, dans l'ordre du tirage.
+
+        Renvois
+        -------
+        VueCartes
+            Vue sur le tableau circulaire, sans copie.
+        """
+        return self.__vue
+
+    def copie(self) -> list[Carte]:
+        """Retourne une liste des cartes de la réserve, dans l'ordre du tirage"""
+        return list(self)
+
+    def codes(self) -> bytes:
+        """Codes des cartes de la réserve (voir Carte.code), dans l'ordre du tirage"""
+        fin = self.__debut + self.__taille
+        if fin <= len(self.__codes):
+            return self.__codes[self.__debut : fin].tobytes()
+        return (self.__codes[self.__debut :] + self.__codes[: fin - len(self.__codes)]).tobytes()
+
+    def __agrandir(self) -> None:
+        """Double la capacité du tableau en remettant les cartes dans l'ordre à partir de 0"""
+        codes = [carte.code for carte in self.copie()]
+        self.__codes = array("b", codes + [0] * len(codes))
+        self.__debut = 0
+
+    def ajouter_carte(self, carte: Carte) -> None:
+        """
+        Ajoute une carte sous la réserve
+
+        Paramètres
+        ----------
+        carte : Carte
+            Carte à ajouter.
+
+        Exceptions
+        ----------
+        TypeError
+            si carte n'est pas de type Carte
         """
 
-        super().__init__(cartes, complet)
+        if not isinstance(carte, Carte):
+            raise TypeError(f"l'objet à ajouter n'est pas de type Carte : {type(carte)}")
+
+        if self.__taille == len(self.__codes):
+            self.__agrandir()
+
+        self.__codes[(self.__debut + self.__taille) % len(self.__codes)] = carte.code
+        self.__taille += 1
+        self.__comptes[carte.code] += 1
+        self.__masque |= 1 << carte.code
+
+    def retirer_carte(self, indice: int = 0) -> Carte:
+        """
+        Retire une carte de la réserve selon son indice
+
+        Retirer la carte du dessus (indice 0) revient à avancer le curseur. Les autres
+        indices, inutilisés en jeu, décalent les cartes suivantes.
+
+        Paramètres
+        ----------
+        indice : int, optionnel
+            Position de la carte à retirer (par défaut la carte du dessus).
+
+        Renvois
+        -------
+        Carte
+            Carte retirée de la réserve.
+
+        Exceptions
+        ----------
+        Exception
+            Si la réserve est vide.
+        ValueError
+            Si l'indice est invalide.
+        """
+
+        self._verifier_indice(indice)
+
+        capacite = len(self.__codes)
+        code = self.__codes[(self.__debut + indice) % capacite]
+        if indice == 0:
+            self.__debut = (self.__debut + 1) % capacite
+        else:
+            for i in range(indice, self.__taille - 1):
+                self.__codes[(self.__debut + i) % capacite] = self.__codes[
+                    (self.__debut + i + 1) % capacite
+                ]
+        self.__taille -= 1
+        self.__comptes[code] -= 1
+        if not self.__comptes[code]:
+            self.__masque &= ~(1 << code)
+        return Carte.from_code(code)
+
+    def melanger(self, melangeur: Melangeur = None) -> bytes:
+        """
+        Mélange aléatoirement les cartes de la réserve
+
+        Paramètres
+        ----------
+        melangeur : Melangeur
+            mélangeur à utiliser, par défaut le mélangeur sûr partagé
+
+        Renvois
+        -------
+        bytes
+            graine du mélange, également conservée dans l'attribut graine
+        """
+        if melangeur is None:
+            melangeur = Melangeur.defaut()
+        codes = [carte.code for carte in self.copie()]
+        self.__graine = melangeur.melanger(codes)
+        self.__codes[: len(codes)] = array("b", codes)
+        self.__debut = 0
+        return self.__graine
 
     def bruler(self) -> None:
         """
@@ -39,7 +283,13 @@ class Reserve(AbstractListeCartes):
         None
         """
 
-        self.ajouter_carte(self.retirer_carte())
+        if self.__taille == 0:
+            raise Exception("La liste de cartes est vide, aucune carte ne peut être retirée.")
+
+        # La carte du dessus est recopiée juste après la dernière, puis le curseur avance
+        capacite = len(self.__codes)
+        self.__codes[(self.__debut + self.__taille) % capacite] = self.__codes[self.__debut]
+        self.__debut = (self.__debut + 1) % capacite
 
     def reveler(self, board: Board) -> None:
         """
@@ -81,10 +331,8 @@ class Reserve(AbstractListeCartes):
         """
 
         # Vérification qu'il y a assez de cartes à distribuer
-        if len(self.cartes) < n_joueurs * 2:
-            raise ValueError(
-                f"le nombre de carte dans la reserve est trop petit : {len(self.cartes)}"
-            )
+        if len(self) < n_joueurs * 2:
+            raise ValueError(f"le nombre de carte dans la reserve est trop petit : {len(self)}")
 
         distribution = [[] for i in range(n_joueurs)]
 
@@ -0,0 +1,134 @@
+"""Implémentation de la classe ResultatManche"""
+
+from types import MappingProxyType
+
+from business_object.combinaison.combinaison import AbstractCombinaison
+from business_object.pot import Pot
+
+
+class ResultatManche:
+    """
+    Résultat figé d'une manche terminée : combinaison et rang de chaque joueur, pots et gains.
+
+    Il est calculé une seule fois par Manche.resultat, puis lu par terminer_manche,
+    l'affichage des résultats et l'API, sans réévaluer les mains.
+    """
+
+    def __init__(
+        self,
+        joueurs: list[int],
+        pseudos: list[str],
+        en_lice: list[int],
+        pots: list[Pot],
+        gains: dict[int, int],
+        combinaisons: list[AbstractCombinaison] = None,
+        classement: list[int] = None,
+    ):
+        """
+        Instanciation du résultat d'une manche
+
+        Paramètres
+        ----------
+        joueurs : list[int]
+            identifiants des joueurs, dans l'ordre des sièges
+        pseudos : list[str]
+            pseudos des joueurs, dans l'ordre des sièges (None si inconnus)
+        en_lice : list[int]
+            indices des joueurs qui ne se sont pas couchés
+        pots : list[Pot]
+            pot principal et side pots
+        gains : dict[int, int]
+            gain de chaque joueur, par identifiant
+        combinaisons : list[AbstractCombinaison]
+            combinaison de chaque siège (None pour un joueur couché) ; None s'il n'y a
+            pas eu d'abattage (un seul joueur en lice)
+        classement : list[int]
+            rang de chaque siège (1 = meilleure main) ; None s'il n'y a pas eu d'abattage
+        """
+
+        self.__joueurs = tuple(joueurs)
+        self.__pseudos = None if pseudos is None else tuple(pseudos)
+        self.__en_lice = tuple(en_lice)
+        self.__pots = tuple(pots)
+        self.__gains = MappingProxyType(dict(gains))
+        self.__combinaisons = None if combinaisons is None else tuple(combinaisons)
+        self.__classement = None if classement is None else tuple(classement)
+
+    @property
+    def joueurs(self) -> tuple[int]:
+        """Identifiants des joueurs, dans l'ordre des sièges"""
+        return self.__joueurs
+
+    @property
+    def pseudos(self) -> tuple[str]:
+        """Pseudos des joueurs, dans l'ordre des sièges"""
+        return self.__pseudos
+
+    @property
+    def en_lice(self) -> tuple[int]:
+        """Indices des joueurs qui ne se sont pas couchés"""
+        return self.__en_lice
+
+    @property
+    def abattage(self) -> bool:
+        """Indique si les mains ont été comparées (plus d'un joueur en lice)"""
+        return self.__combinaisons is not None
+
+    @property
+    def pots(self) -> tuple[Pot]:
+        """Pot principal et side pots"""
+        return self.__pots
+
+    @property
+    def gains(self) -> MappingProxyType:
+        """Gain de chaque joueur, par identifiant (lecture seule)"""
+        return self.__gains
+
+    @property
+    def combinaisons(self) -> tuple[AbstractCombinaison]:
+        """Combinaison de chaque siège (None si couché), None sans abattage"""
+        return self.__combinaisons
+
+    @property
+    def classement(self) -> tuple[int]:
+        """Rang de chaque siège, None sans abattage"""
+        return self.__classement
+
+    def __repr__(self) -> str:
+        return f"ResultatManche(joueurs={self.__joueurs}, gains={dict(self.__gains)})"
+
+    def texte(self) -> str:
+        """Détail complet de fin de partie : combinaisons puis gains de chaque joueur"""
+
+        texte = "Combinaisons :\n"
+
+        if self.abattage:
+            for j, combinaison in enumerate(self.__combinaisons):
+                affichage = "[?]" if combinaison is None else combinaison
+                texte += f"{self.__pseudos[j]} : {affichage}\n"
+        else:
+            texte += "NA : seul un joueur ne s'est pas couché"
+
+        texte += "\nGains :\n"
+
+        if self.abattage:
+            for j, id_joueur in enumerate(self.__joueurs):
+                texte += f"{self.__pseudos[j]} : {self.__gains[id_joueur]}\n"
+        else:
+            gagnant = self.__en_lice[0]
+            texte += f"{self.__pseudos[gagnant]} : {self.__gains[self.__joueurs[gagnant]]}"
+
+        return texte
+
+    def to_dict(self) -> dict:
+        """Convertit le résultat en dictionnaire"""
+        return {
+            "joueurs": list(self.__joueurs),
+            "en_lice": list(self.__en_lice),
+            "combinaisons": None
+            if self.__combinaisons is None
+            else [None if c is None else str(c) for c in self.__combinaisons],
+            "classement": None if self.__classement is None else list(self.__classement),
+            "pots": [pot.to_dict() for pot in self.__pots],
+            "gains": {str(id_joueur): gain for id_joueur, gain in self.__gains.items()},
+        }
@@ -5,6 +5,7 @@ import logging
 from business_object.info_manche import InfoManche
 from business_object.joueur import Joueur
 from business_object.manche import Manche
+from business_object.reserve import Reserve
 from utils.log_decorator import log
 
 logger = logging.getLogger(__name__)
@@ -60,7 +61,10 @@ class Table:
         if id_joueurs is None:
             self.__id_joueurs = []
         else:
-            self.__id_joueurs = id_joueurs
+            self.__id_joueurs = list(id_joueurs)
+
+        # Index id_joueur -> siège, tenu à jour à chaque arrivée ou départ
+        self.__sieges = {id_joueur: i for i, id_joueur in enumerate(self.__id_joueurs)}
 
     @property
     def joueurs_max(self):
@@ -100,6 +104,33 @@ class Table:
         """Retourne le nombre de joueurs à la table"""
         return len(self.id_joueurs)
 
+    def indice_joueur(self, id_joueur: int) -> int:
+        """
+        Retourne le siège d'un joueur, en temps constant
+
+        Paramètres
+        ----------
+        id_joueur : int
+            identifiant du joueur recherché
+
+        Renvois
+        -------
+        int
+            indice du joueur dans id_joueurs
+
+        Exceptions
+        ----------
+        ValueError
+            si le joueur n'est pas à la table
+        """
+
+        try:
+            return self.__sieges[id_joueur]
+        except KeyError:
+            raise ValueError(
+                f"Le joueur {id_joueur} n'est pas à la table {self.numero_table}"
+            ) from None
+
     @log
     def ajouter_joueur(self, id_joueur: int) -> None:
         """
@@ -118,6 +149,9 @@ class Table:
         if not isinstance(id_joueur, int):
             raise TypeError(f"L'id_joueur n'est pas un entier : {type(id_joueur)}")
 
+        if id_joueur in self.__sieges:
+            raise ValueError(f"Le joueur {id_joueur} est déjà à la table")
+
         if len(self.__id_joueurs) >= self.__joueurs_max:
             logger.warning(f"Table pleine : impossible d'ajouter le joueur {id_joueur}")
             raise ValueError("Nombre maximum de joueurs atteint")
@@ -125,6 +159,7 @@ class Table:
         logger.info(
             f"Le joueur {id_joueur} rejoint la table {self.numero_table} ({len(self.id_joueurs)}/{self.joueurs_max})"
         )
+        self.__sieges[id_joueur] = len(self.__id_joueurs)
         self.__id_joueurs.append(id_joueur)
 
     @log
@@ -155,7 +190,11 @@ class Table:
             raise IndexError("Indice négatif impossible")
 
         logger.info(f"Le joueur {self.id_joueurs[indice]} est retiré de la table")
-        return self.__id_joueurs.pop(indice)
+        id_joueur = self.__id_joueurs.pop(indice)
+        del self.__sieges[id_joueur]
+        for i in range(indice, len(self.__id_joueurs)):
+            self.__sieges[self.__id_joueurs[i]] = i
+        return id_joueur
 
     @log
     def mettre_grosse_blind(self, montant: int) -> None:
@@ -197,13 +236,16 @@ class Table:
         logger.info(f"Le joueur {dealer} devient dealer")
 
     @log
-    def nouvelle_manche(self, pseudos: list[str] = None) -> None:
+    def nouvelle_manche(self, pseudos: list[str] = None, reserve: Reserve = None) -> None:
         """
         Lance une nouvelle manche sur la table.
 
         Paramètres
         ----------
-        Aucun
+        pseudos : list[str]
+            pseudos des joueurs de la table
+        reserve : Reserve
+            paquet déjà mélangé pour la manche (voir PaquetService), sinon un paquet neuf
 
         Renvois
         -------
@@ -221,5 +263,7 @@ class Table:
             )
 
         self.__manche = Manche(
-            info=InfoManche(self.__id_joueurs, pseudos), grosse_blind=self.__grosse_blind
+            info=InfoManche(self.__id_joueurs, pseudos),
+            grosse_blind=self.__grosse_blind,
+            reserve=reserve,
         )
@@ -0,0 +1,160 @@
+"""Tableaux typés de taille fixe utilisés par InfoManche (un élément par joueur)"""
+
+from array import array
+
+
+class TableauEntiers(array):
+    """
+    Tableau d'entiers compact, de taille fixe, comparable à une liste.
+
+    La taille est celle de la table : les éléments se modifient (y compris par tranche
+    de même longueur) mais ne s'ajoutent ni ne se suppriment.
+    """
+
+    TYPE = "q"
+
+    def __new__(cls, valeurs):
+        return super().__new__(cls, cls.TYPE, valeurs)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return super().__eq__(other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __reduce_ex__(self, protocole):
+        # Reconstruit la sous-classe (et ses compteurs) lors d'une copie ou d'un pickle
+        return type(self), (list(self),)
+
+    def __copy__(self):
+        return type(self)(list(self))
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+    def _nouvelles_valeurs(self, indice, valeurs) -> tuple[range, list]:
+        """Indices concernés par une affectation et valeurs correspondantes"""
+
+        if isinstance(indice, slice):
+            indices = range(*indice.indices(len(self)))
+            valeurs = list(valeurs)
+            if len(valeurs) != len(indices):
+                raise ValueError(
+                    f"Le tableau a une taille fixe : {len(valeurs)} valeurs pour "
+                    f"{len(indices)} places"
+                )
+            return indices, valeurs
+        if indice < 0:
+            indice += len(self)
+        return range(indice, indice + 1), [valeurs]
+
+    def __setitem__(self, indice, valeur) -> None:
+        if type(indice) is int and indice >= 0:
+            self._affecter(indice, valeur)
+            return
+        indices, valeurs = self._nouvelles_valeurs(indice, valeur)
+        for i, v in zip(indices, valeurs):
+            self._affecter(i, v)
+
+    def _affecter(self, i: int, valeur) -> None:
+        """Affecte un seul élément (point d'extension des sous-classes)"""
+        array.__setitem__(self, i, valeur)
+
+    def __delitem__(self, indice) -> None:
+        raise TypeError("Le tableau a une taille fixe")
+
+    def __taille_fixe(self, *args) -> None:
+        raise TypeError("Le tableau a une taille fixe")
+
+    append = extend = insert = pop = remove = __taille_fixe
+    frombytes = fromfile = fromlist = fromunicode = __iadd__ = __imul__ = __taille_fixe
+
+    def byteswap(self) -> None:
+        # Modifierait les éléments sans passer par _affecter (compteurs des sous-classes)
+        raise TypeError("Le tableau ne se modifie qu'élément par élément")
+
+
+class TableauStatuts(TableauEntiers):
+    """
+    Statuts des joueurs, avec le nombre de joueurs de chaque statut tenu à jour.
+
+    Chaque affectation met à jour les compteurs : savoir combien de joueurs sont en
+    retard, couchés ou à tapis ne demande plus de parcourir le tableau. La version
+    augmente à chaque modification, ce qui permet de mettre en cache des valeurs
+    dérivées des statuts.
+    """
+
+    TYPE = "b"
+    N_STATUTS = 5
+
+    def __init__(self, valeurs):
+        self.__comptes = [0] * self.N_STATUTS
+        for statut in self:
+            self.__comptes[statut] += 1
+        self.__version = 0
+
+    @property
+    def version(self) -> int:
+        """Nombre de modifications effectives depuis la création"""
+        return self.__version
+
+    def compte(self, statut: int) -> int:
+        """Nombre de joueurs ayant ce statut"""
+        return self.__comptes[statut]
+
+    def _affecter(self, i: int, statut: int) -> None:
+        if not 0 <= statut < self.N_STATUTS:
+            raise ValueError(f"Statut incorrect : {statut}")
+        ancien = array.__getitem__(self, i)
+        if ancien != statut:
+            array.__setitem__(self, i, statut)
+            self.__comptes[ancien] -= 1
+            self.__comptes[statut] += 1
+            self.__version += 1
+
+
+class TableauMises(TableauEntiers):
+    """Mises des joueurs, avec leur total (la valeur du pot) tenu à jour"""
+
+    def __init__(self, valeurs):
+        self.__total = sum(self)
+
+    @property
+    def total(self) -> int:
+        """Somme des mises"""
+        return self.__total
+
+    def _affecter(self, i: int, mise: int) -> None:
+        ancienne = array.__getitem__(self, i)
+        array.__setitem__(self, i, mise)
+        self.__total += mise - ancienne
+
+
+class TableauTours(TableauEntiers):
+    """Tour auquel chaque joueur s'est couché ; None (stocké -1) s'il ne l'est pas"""
+
+    TYPE = "b"
+    __ABSENT = -1
+
+    def __new__(cls, valeurs):
+        return super().__new__(cls, (cls.__ABSENT if v is None else v for v in valeurs))
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        tour = array.__getitem__(self, indice)
+        return None if tour == self.__ABSENT else tour
+
+    def __iter__(self):
+        for tour in array.__iter__(self):
+            yield None if tour == self.__ABSENT else tour
+
+    def _affecter(self, i: int, tour) -> None:
+        array.__setitem__(self, i, self.__ABSENT if tour is None else tour)
@@ -0,0 +1,68 @@
+"""Implémentation de la classe VueCartes"""
+
+from collections.abc import Sequence
+
+from business_object.carte import Carte
+
+
+class VueCartes(Sequence):
+    """
+    Vue en lecture seule sur les cartes d'une AbstractListeCartes.
+
+    Aucune copie n'est faite : la vue reflète les ajouts et retraits ultérieurs de
+    la liste. La source peut être une liste ou toute séquence de cartes (la réserve,
+    stockée dans un tableau circulaire, fournit la sienne). La vue se compare à une
+    liste ou un tuple de cartes, et la concaténation avec `+` renvoie une nouvelle
+    liste. Pour obtenir une liste modifiable, utiliser AbstractListeCartes.copie().
+    """
+
+    __slots__ = ("__cartes",)
+
+    def __init__(self, cartes: Sequence[Carte]):
+        """
+        Crée une vue sur une séquence de cartes
+
+        Paramètres
+        ----------
+        cartes : Sequence[Carte]
+            séquence observée (elle n'est pas copiée)
+        """
+        self.__cartes = cartes
+
+    def __getitem__(self, indice):
+        return self.__cartes[indice]
+
+    def __len__(self) -> int:
+        return len(self.__cartes)
+
+    def __iter__(self):
+        return iter(self.__cartes)
+
+    def __contains__(self, carte) -> bool:
+        return carte in self.__cartes
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, VueCartes):
+            other = other.__cartes
+        elif not isinstance(other, (list, tuple)):
+            return NotImplemented
+        if type(self.__cartes) is list and type(other) is list:
+            return self.__cartes == other
+        return len(self.__cartes) == len(other) and all(
+            a == b for a, b in zip(self.__cartes, other)
+        )
+
+    __hash__ = None
+
+    def __add__(self, other) -> list[Carte]:
+        if isinstance(other, (VueCartes, list, tuple)):
+            return list(self.__cartes) + list(other)
+        return NotImplemented
+
+    def __radd__(self, other) -> list[Carte]:
+        if isinstance(other, (list, tuple)):
+            return list(other) + list(self.__cartes)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self.__cartes))
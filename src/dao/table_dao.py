@@ -0,0 +1,275 @@
+"""Implémentation de la classe TableDao"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+from business_object.format_binaire import FormatBinaire
+from business_object.journal_manche import JournalManche
+from business_object.table import Table
+from utils.log_decorator import log
+
+logger = logging.getLogger(__name__)
+
+
+class TableDao:
+    """
+    Sauvegarde locale (SQLite) des tables en mémoire et de leur manche en cours.
+
+    Les tables vivent dans TableService et sont perdues à l'arrêt du serveur : ce DAO
+    les enregistre après chaque modification pour les restaurer au redémarrage. Une table
+    tient en une ligne ; la manche est stockée sous forme de journal (voir JournalManche),
+    dont seuls les nouveaux événements et instantanés sont ajoutés à chaque sauvegarde,
+    au format binaire de FormatBinaire.
+
+    Contrairement aux autres DAO, il ne dépend pas de PostgreSQL : la base est un simple
+    fichier, ouvert en mode WAL pour que les écritures après chaque action restent rapides.
+    Le journal d'une manche contient la graine de son mélange, donc les cartes à venir :
+    le fichier n'est lisible que par son propriétaire.
+    """
+
+    def __init__(self, chemin: str = "tables.sqlite"):
+        """
+        Ouverture (et création si besoin) de la base de sauvegarde
+
+        Paramètres
+        ----------
+        chemin : str
+            chemin du fichier SQLite (":memory:" pour une base temporaire)
+        """
+
+        if chemin != ":memory:":
+            os.close(os.open(chemin, os.O_CREAT | os.O_RDWR, 0o600))
+            os.chmod(chemin, 0o600)
+        self.__connexion = sqlite3.connect(chemin, check_same_thread=False)
+        self.__connexion.execute("PRAGMA journal_mode=WAL")
+        self.__connexion.execute("PRAGMA synchronous=NORMAL")
+        with self.__connexion:
+            self.__connexion.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS table_jeu (
+                    numero_table INTEGER PRIMARY KEY,
+                    joueurs_max  INTEGER NOT NULL,
+                    grosse_blind INTEGER NOT NULL,
+                    mode_jeu     INTEGER NOT NULL,
+                    id_joueurs   TEXT    NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS evenement_manche (
+                    numero_table INTEGER NOT NULL,
+                    position     INTEGER NOT NULL,
+                    evenement    BLOB    NOT NULL,
+                    PRIMARY KEY (numero_table, position)
+                );
+                CREATE TABLE IF NOT EXISTS instantane_manche (
+                    numero_table INTEGER NOT NULL,
+                    position     INTEGER NOT NULL,
+                    etat         BLOB    NOT NULL,
+                    PRIMARY KEY (numero_table, position)
+                );
+                """
+            )
+        # numero_table -> (journal sauvegardé, événements écrits, instantanés écrits)
+        self.__ecrits = {}
+        # La connexion est partagée par les threads du webservice
+        self.__verrou = threading.Lock()
+
+    @log
+    def sauvegarder(self, table: Table) -> None:
+        """
+        Enregistre une table et les nouveautés du journal de sa manche
+
+        Paramètres
+        ----------
+        table : Table
+            table à sauvegarder
+        """
+
+        numero = table.numero_table
+        manche = table.manche
+        journal = None if manche is None else manche.journal
+
+        with self.__verrou:
+            with self.__connexion as connexion:
+                connexion.execute(
+                    "INSERT OR REPLACE INTO table_jeu VALUES (?, ?, ?, ?, ?)",
+                    (
+                        numero,
+                        table.joueurs_max,
+                        table.grosse_blind,
+                        table.mode_jeu,
+                        json.dumps(table.id_joueurs),
+                    ),
+                )
+
+                # Sans trace de sauvegarde dans ce processus, le journal stocké est remplacé
+                deja_ecrit, n_evenements, n_instantanes = self.__ecrits.get(numero, (False, 0, 0))
+                if journal is not deja_ecrit:
+                    # Nouvelle manche : le journal est réécrit depuis le début
+                    self.__effacer_manche(connexion, numero)
+                    n_evenements, n_instantanes = 0, 0
+
+                if journal is not None:
+                    evenements = journal.evenements
+                    instantanes = journal.instantanes
+                    connexion.executemany(
+                        "INSERT INTO evenement_manche VALUES (?, ?, ?)",
+                        [
+                            (numero, position, FormatBinaire.encoder_evenement(evenement))
+                            for position, evenement in enumerate(
+                                evenements[n_evenements:], start=n_evenements
+                            )
+                        ],
+                    )
+                    connexion.executemany(
+                        "INSERT INTO instantane_manche VALUES (?, ?, ?)",
+                        [
+                            (numero, position, FormatBinaire.encoder_etat(etat))
+                            for position, etat in instantanes[n_instantanes:]
+                        ],
+                    )
+                    n_evenements, n_instantanes = len(evenements), len(instantanes)
+
+            self.__ecrits[numero] = (journal, n_evenements, n_instantanes)
+
+    @log
+    def charger(self, numero_table: int) -> Table | None:
+        """
+        Restaure une table sauvegardée, avec sa manche reconstruite depuis son journal
+
+        Paramètres
+        ----------
+        numero_table : int
+            numéro de la table
+
+        Renvois
+        -------
+        Table
+            la table restaurée, None si elle n'a pas été sauvegardée
+        """
+
+        with self.__verrou:
+            connexion = self.__connexion
+            ligne = connexion.execute(
+                "SELECT joueurs_max, grosse_blind, mode_jeu, id_joueurs FROM table_jeu "
+                "WHERE numero_table = ?",
+                (numero_table,),
+            ).fetchone()
+            if ligne is None:
+                return None
+
+            evenements = connexion.execute(
+                "SELECT evenement FROM evenement_manche WHERE numero_table = ? ORDER BY position",
+                (numero_table,),
+            ).fetchall()
+            instantanes = connexion.execute(
+                "SELECT position, etat FROM instantane_manche WHERE numero_table = ? ORDER BY position",
+                (numero_table,),
+            ).fetchall()
+
+        manche = None
+        if evenements:
+            try:
+                journal = JournalManche.depuis_evenements(
+                    [FormatBinaire.decoder_evenement(donnees) for (donnees,) in evenements],
+                    [
+                        (position, FormatBinaire.decoder_etat(donnees))
+                        for position, donnees in instantanes
+                    ],
+                )
+                manche = journal.reconstruire()
+            except Exception as e:
+                logger.warning(f"Manche de la table {numero_table} non restaurée : {e}")
+
+        joueurs_max, grosse_blind, mode_jeu, id_joueurs = ligne
+        table = Table(
+            joueurs_max=joueurs_max,
+            grosse_blind=grosse_blind,
+            numero_table=numero_table,
+            mode_jeu=mode_jeu,
+            id_joueurs=json.loads(id_joueurs),
+            manche=manche,
+        )
+        with self.__verrou:
+            if manche is None:
+                self.__ecrits.pop(numero_table, None)
+            else:
+                # Le journal de la manche reconstruite contient déjà tout ce qui est écrit
+                self.__ecrits[numero_table] = (
+                    manche.journal,
+                    len(evenements),
+                    len(manche.journal.instantanes),
+                )
+        return table
+
+    def entetes(self) -> list[Table]:
+        """
+        Tables sauvegardées sans leur manche, par numéro croissant
+
+        Une seule requête, sans décoder ni rejouer de journal : de quoi connaître toutes
+        les tables au démarrage, chacune n'étant restaurée entièrement (voir charger)
+        que lorsqu'elle sert.
+
+        Renvois
+        -------
+        list[Table]
+            les tables sauvegardées (numéro, grosse blind, places et joueurs assis)
+        """
+
+        requete = (
+            "SELECT numero_table, joueurs_max, grosse_blind, mode_jeu, id_joueurs "
+            "FROM table_jeu ORDER BY numero_table"
+        )
+        with self.__verrou:
+            lignes = self.__connexion.execute(requete).fetchall()
+        return [
+            Table(
+                joueurs_max=joueurs_max,
+                grosse_blind=grosse_blind,
+                numero_table=numero_table,
+                mode_jeu=mode_jeu,
+                id_joueurs=json.loads(id_joueurs),
+            )
+            for numero_table, joueurs_max, grosse_blind, mode_jeu, id_joueurs in lignes
+        ]
+
+    def numeros_tables(self) -> list[int]:
+        """Numéros des tables sauvegardées, par ordre croissant"""
+        requete = "SELECT numero_table FROM table_jeu ORDER BY numero_table"
+        with self.__verrou:
+            return [numero for (numero,) in self.__connexion.execute(requete)]
+
+    @log
+    def supprimer(self, numero_table: int) -> bool:
+        """
+        Supprime une table sauvegardée et le journal de sa manche
+
+        Paramètres
+        ----------
+        numero_table : int
+            numéro de la table
+
+        Renvois
+        -------
+        bool
+            True si la table était sauvegardée
+        """
+
+        with self.__verrou, self.__connexion as connexion:
+            supprimees = connexion.execute(
+                "DELETE FROM table_jeu WHERE numero_table = ?", (numero_table,)
+            ).rowcount
+            self.__effacer_manche(connexion, numero_table)
+            self.__ecrits.pop(numero_table, None)
+        return supprimees > 0
+
+    def fermer(self) -> None:
+        """Ferme la base de sauvegarde"""
+        self.__connexion.close()
+
+    @staticmethod
+    def __effacer_manche(connexion: sqlite3.Connection, numero_table: int) -> None:
+        """Efface le journal sauvegardé de la manche d'une table"""
+        connexion.execute("DELETE FROM evenement_manche WHERE numero_table = ?", (numero_table,))
+        connexion.execute("DELETE FROM instantane_manche WHERE numero_table = ?", (numero_table,))
@@ -4,6 +4,7 @@ from business_object.manche import Manche
 from service.credit_service import CreditService
 from service.joueur_service import JoueurService
 from service.table_service import TableService
+from utils.verrous import GestionnaireVerrous
 
 
 class ActionService:
@@ -33,13 +34,14 @@ class ActionService:
         joueur_service = JoueurService()
         table_service = TableService()
         joueur = joueur_service.trouver_par_id(id_joueur)
-        table = table_service.table_par_numero(joueur.numero_table)
 
         if joueur.numero_table is None:
             raise ValueError(
                 f"Le joueur {joueur.pseudo} n'est à aucune table et ne peut effectuer d'action"
             )
 
+        table = table_service.table_par_numero(joueur.numero_table)
+
         if table.manche is None:
             raise ValueError(
                 f"Le joueur {joueur.pseudo} est dans une table mais aucune manche n'est en cours"
@@ -50,6 +52,11 @@ class ActionService:
 
         return table.manche
 
+    @staticmethod
+    def __table_joueur(id_joueur: int) -> int | None:
+        """Numéro de la table du joueur (voir GestionnaireVerrous.verrouiller_joueur)"""
+        return JoueurService().trouver_par_id(id_joueur).numero_table
+
     def all_in(self, id_joueur: int) -> None:
         """
         Fonction qui gère toutes les modifications engendrées par le all-in d'un joueur
@@ -69,15 +76,17 @@ class ActionService:
             si ce n'est pas au tour du joueur de jouer
         """
 
-        joueur = JoueurService().trouver_par_id(id_joueur)
+        with GestionnaireVerrous().verrouiller_joueur(id_joueur, self.__table_joueur):
+            joueur = JoueurService().trouver_par_id(id_joueur)
 
-        manche = self.manche_joueur(id_joueur)
+            manche = self.manche_joueur(id_joueur)
 
-        if not manche.est_tour(id_joueur):
-            raise Exception(f"Ce n'est pas à {joueur.pseudo} de jouer")
+            if not manche.est_tour(id_joueur):
+                raise Exception(f"Ce n'est pas à {joueur.pseudo} de jouer")
 
-        montant = manche.action(id_joueur, "all-in", joueur.credit)
-        CreditService().debiter(id_joueur, montant)
+            montant = manche.action(id_joueur, "all-in", joueur.credit)
+            CreditService().debiter(id_joueur, montant)
+            TableService().sauvegarder_manche(manche)
 
     def checker(self, id_joueur: int) -> None:
         """
@@ -98,9 +107,11 @@ class ActionService:
             si ce n'est pas au tour du joueur de jouer
         """
 
-        manche = self.manche_joueur(id_joueur)
+        with GestionnaireVerrous().verrouiller_joueur(id_joueur, self.__table_joueur):
+            manche = self.manche_joueur(id_joueur)
 
-        manche.action(id_joueur, "checker")
+            manche.action(id_joueur, "checker")
+            TableService().sauvegarder_manche(manche)
 
     def se_coucher(self, id_joueur: int) -> None:
         """
@@ -121,9 +132,11 @@ class ActionService:
             si ce n'est pas au tour du joueur de jouer
         """
 
-        manche = self.manche_joueur(id_joueur)
+        with GestionnaireVerrous().verrouiller_joueur(id_joueur, self.__table_joueur):
+            manche = self.manche_joueur(id_joueur)
 
-        manche.action(id_joueur, "se coucher")
+            manche.action(id_joueur, "se coucher")
+            TableService().sauvegarder_manche(manche)
 
     def suivre(self, id_joueur: int, relance: int = 0) -> None:
         """
@@ -144,9 +157,11 @@ class ActionService:
             si ce n'est pas au tour du joueur de jouer
         """
 
-        joueur = JoueurService().trouver_par_id(id_joueur)
+        with GestionnaireVerrous().verrouiller_joueur(id_joueur, self.__table_joueur):
+            joueur = JoueurService().trouver_par_id(id_joueur)
 
-        manche = self.manche_joueur(id_joueur)
+            manche = self.manche_joueur(id_joueur)
 
-        montant = manche.action(id_joueur, "suivre", joueur.credit, relance)
-        CreditService().debiter(id_joueur, montant)
+            montant = manche.action(id_joueur, "suivre", joueur.credit, relance)
+            CreditService().debiter(id_joueur, montant)
+            TableService().sauvegarder_manche(manche)
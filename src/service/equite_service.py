@@ -0,0 +1,150 @@
+"""Implémentation de la classe EquiteService"""
+
+from business_object.board import Board
+from business_object.equite import CalculateurEquite, ResultatEquite
+from business_object.main import Main
+from business_object.manche import Manche
+from service.table_service import TableService
+from utils.verrous import GestionnaireVerrous
+
+
+class EquiteService:
+    """Calcule les chances de gain des joueurs d'une manche en cours"""
+
+    SEUIL_EXACT = 100_000
+
+    def equite_manche(
+        self,
+        manche: Manche,
+        id_joueur: int = None,
+        n_essais: int = 10000,
+        budget: float = None,
+        n_processus: int = 1,
+        graine: int = None,
+    ) -> dict[int, ResultatEquite]:
+        """
+        Estime l'équité de chaque joueur en lice d'une manche
+
+        Le calcul est exact quand le nombre de donnes possibles est faible, estimé par
+        la table préflop en tête-à-tête avant le flop, et par tirage aléatoire sinon.
+
+        Paramètres
+        ----------
+        manche : Manche
+            la manche en cours
+        id_joueur : int
+            si renseigné, seule la main de ce joueur est considérée comme connue
+            (point de vue du joueur), sinon toutes les mains sont connues (point de vue admin)
+        n_essais : int
+            nombre maximal de donnes tirées
+        budget : float
+            durée maximale du calcul en secondes
+        n_processus : int
+            nombre de processus de calcul
+        graine : int
+            graine du tirage, pour des résultats reproductibles
+
+        Renvois
+        -------
+        dict[int, ResultatEquite]
+            l'équité de chaque joueur en lice, indexée par identifiant de joueur
+
+        Exceptions
+        ----------
+        ValueError
+            si les cartes n'ont pas encore été distribuées
+            si le joueur n'est plus en lice dans la manche
+        """
+
+        ids, mains, board = self.__instantane(manche, id_joueur)
+        return self.__calculer(ids, mains, board, n_essais, budget, n_processus, graine)
+
+    @staticmethod
+    def __instantane(
+        manche: Manche, id_joueur: int | None
+    ) -> tuple[list[int], list[Main | None], Board]:
+        """
+        Copie les joueurs en lice, leurs mains connues et le board d'une manche
+
+        Exceptions
+        ----------
+        ValueError
+            si les cartes n'ont pas encore été distribuées
+            si le joueur n'est plus en lice dans la manche
+        """
+
+        en_lice = manche.joueurs_en_lice
+        if any(manche.info.mains[i] is None for i in en_lice):
+            raise ValueError("Les cartes n'ont pas encore été distribuées")
+
+        ids = [manche.info.joueurs[i] for i in en_lice]
+        if id_joueur is not None and id_joueur not in ids:
+            raise ValueError(f"Le joueur {id_joueur} n'est pas en lice dans la manche")
+
+        mains = [
+            manche.info.mains[i] if id_joueur in (None, manche.info.joueurs[i]) else None
+            for i in en_lice
+        ]
+        return ids, mains, Board(list(manche.board.cartes))
+
+    def __calculer(
+        self,
+        ids: list[int],
+        mains: list[Main | None],
+        board: Board,
+        n_essais: int,
+        budget: float | None,
+        n_processus: int,
+        graine: int | None,
+    ) -> dict[int, ResultatEquite]:
+        """Calcule l'équité à partir d'un instantané de la manche (voir equite_manche)"""
+
+        calculateur = CalculateurEquite(mains, board)
+        # Au turn et à la river, le calcul exact est le moins coûteux
+        if calculateur.preflop_tete_a_tete:
+            resultats = calculateur.estimation_preflop()
+        elif calculateur.n_donnes <= self.SEUIL_EXACT:
+            resultats = calculateur.exacte()
+        else:
+            resultats = calculateur.monte_carlo(
+                n_essais=n_essais, graine=graine, n_processus=n_processus, budget=budget
+            )
+        return dict(zip(ids, resultats))
+
+    def equite_table(
+        self, numero_table: int, id_joueur: int = None, budget: float = None
+    ) -> dict[int, ResultatEquite]:
+        """
+        Estime l'équité des joueurs de la manche en cours sur une table
+
+        Paramètres
+        ----------
+        numero_table : int
+            le numéro de la table
+        id_joueur : int
+            si renseigné, calcul du point de vue de ce joueur
+        budget : float
+            durée maximale du calcul en secondes
+
+        Renvois
+        -------
+        dict[int, ResultatEquite]
+            l'équité de chaque joueur en lice
+
+        Exceptions
+        ----------
+        ValueError
+            si aucune manche n'est en cours sur la table
+        """
+
+        # La manche est copiée sous le verrou de la table, le calcul (parfois long) se fait
+        # ensuite sans bloquer les actions des joueurs
+        with GestionnaireVerrous().verrouiller(tables=[numero_table]):
+            table = TableService().table_par_numero(numero_table)
+            if table.manche is None:
+                raise ValueError(f"Aucune manche n'est en cours sur la table {numero_table}")
+            ids, mains, board = self.__instantane(table.manche, id_joueur)
+
+        return self.__calculer(
+            ids, mains, board, n_essais=10000, budget=budget, n_processus=1, graine=None
+        )
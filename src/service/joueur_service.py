@@ -1,4 +1,5 @@
 import logging
+from threading import Lock
 
 from business_object.joueur import Joueur
 from dao.joueur_dao import JoueurDao
@@ -17,6 +18,8 @@ class JoueurService:
 
     _instance = None
     _joueurs_connectes: dict[int, Joueur] = {}
+    # Les requêtes sont servies par plusieurs threads : protège _joueurs_connectes
+    _verrou_connectes = Lock()
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -35,24 +38,33 @@ class JoueurService:
         if joueur is None:
             raise ValueError(f"Le pseudo '{pseudo}' n'existe pas !")
 
-        if joueur.id_joueur in self._joueurs_connectes:
-            raise Exception(f"Le joueur {joueur.pseudo} est déjà connecté !")
+        # Le joueur retrouve la table où il est assis (après une déconnexion ou un
+        # redémarrage du serveur, les tables étant sauvegardées)
+        from service.table_service import TableService
 
-        self._joueurs_connectes[joueur.id_joueur] = joueur
+        joueur.numero_table = TableService().numero_table_joueur(joueur.id_joueur)
+
+        with self._verrou_connectes:
+            if joueur.id_joueur in self._joueurs_connectes:
+                raise Exception(f"Le joueur {joueur.pseudo} est déjà connecté !")
+
+            self._joueurs_connectes[joueur.id_joueur] = joueur
 
         return joueur
 
     @log
     def deconnexion(self, id_joueur: int) -> None:
         """Déconnecte un joueur de l'application"""
-        if id_joueur not in self._joueurs_connectes:
-            raise Exception(f"Le joueur avec l'identifiant {id_joueur} n'est pas connecté.")
+        with self._verrou_connectes:
+            if id_joueur not in self._joueurs_connectes:
+                raise Exception(f"Le joueur avec l'identifiant {id_joueur} n'est pas connecté.")
 
-        del self._joueurs_connectes[id_joueur]
+            del self._joueurs_connectes[id_joueur]
 
     def joueurs_connectes(self):
         """Renvoie les id des joueurs connectés"""
-        return [id for id in self._joueurs_connectes.keys()]
+        with self._verrou_connectes:
+            return [id for id in self._joueurs_connectes.keys()]
 
     @log
     def pseudo_deja_utilise(self, pseudo: str) -> bool:
@@ -117,7 +129,8 @@ class JoueurService:
 
     def maj_joueur(self, joueur: Joueur) -> None:
         """Met à jour le joueur dans le service"""
-        if joueur.id_joueur not in self._joueurs_connectes:
-            raise Exception(f"Le joueur {joueur.pseudo} n'est pas connecté")
+        with self._verrou_connectes:
+            if joueur.id_joueur not in self._joueurs_connectes:
+                raise Exception(f"Le joueur {joueur.pseudo} n'est pas connecté")
 
-        self._joueurs_connectes[joueur.id_joueur] = joueur
+            self._joueurs_connectes[joueur.id_joueur] = joueur
@@ -0,0 +1,47 @@
+"""Implémentation de la classe PaquetService"""
+
+from threading import Lock
+
+from business_object.melangeur import Melangeur
+from business_object.pool_paquets import PoolPaquets
+from business_object.reserve import Reserve
+
+
+class PaquetService:
+    """
+    Fournit les paquets mélangés des manches à partir d'un pool partagé par toutes
+    les tables. Le remplissage en tâche de fond démarre à la première demande.
+    """
+
+    TAILLE_POOL = 32
+    # Graine maîtresse pour des donnes reproductibles (tests de charge) ; None : mélange sûr
+    GRAINE = None
+    __pool: PoolPaquets = None
+    __verrou = Lock()
+
+    def pool(self) -> PoolPaquets:
+        """Retourne le pool partagé, créé et démarré à la première utilisation"""
+        if PaquetService.__pool is None:
+            # Deux premières demandes simultanées ne doivent créer qu'un seul pool
+            with PaquetService.__verrou:
+                if PaquetService.__pool is None:
+                    melangeur = None if self.GRAINE is None else Melangeur(self.GRAINE)
+                    pool = PoolPaquets(self.TAILLE_POOL, melangeur)
+                    pool.demarrer()
+                    PaquetService.__pool = pool
+        return PaquetService.__pool
+
+    def reserve(self) -> Reserve:
+        """
+        Retourne une réserve prête à être distribuée
+
+        Renvois
+        -------
+        Reserve
+            réserve de 52 cartes déjà mélangée
+        """
+        return self.pool().reserve()
+
+    def statistiques(self) -> dict:
+        """Renvoie l'état du pool de paquets (voir PoolPaquets.statistiques)"""
+        return self.pool().statistiques()
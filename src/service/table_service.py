@@ -1,11 +1,17 @@
 """Implémentation de la classe TableService"""
 
+from threading import RLock
+
+from business_object.resultat_manche import ResultatManche
 from business_object.table import Table
+from dao.table_dao import TableDao
 from service.credit_service import CreditService
 from service.joueur_service import JoueurService
 from service.manche_joueur_service import MancheJoueurService
 from service.manche_service import MancheService
+from service.paquet_service import PaquetService
 from utils.log_decorator import log
+from utils.verrous import GestionnaireVerrous
 
 
 class TableService:
@@ -16,21 +22,149 @@ class TableService:
     - Gestion du déroulement des manches
     """
 
-    __tables: list[Table] = []
+    # Registre des tables par numéro, et index secondaires tenus à jour à chaque
+    # modification d'une table par le service (voir __indexer)
+    __tables: dict[int, Table] = {}
+    __par_blind: dict[int, set[int]] = {}
+    __ouvertes: set[int] = set()
+    __par_manche: dict[int, Table] = {}
+    __par_joueur: dict[int, int] = {}
+    __cles: dict[int, tuple] = {}
+    # Tables connues par leur seule entête sauvegardée, sans leur manche (voir
+    # activer_sauvegarde) : elles sont restaurées entièrement par table_par_numero
+    __a_restaurer: set[int] = set()
+    # Protège le registre et le compteur ; l'état de chaque table est protégé par son
+    # propre verrou (voir GestionnaireVerrous)
+    __verrou_registre = RLock()
     compteur_tables: int = 0
+    sauvegarde: TableDao = None
+
+    @classmethod
+    def activer_sauvegarde(cls, sauvegarde: TableDao) -> None:
+        """
+        Active la sauvegarde des tables, restaurées à la demande après un redémarrage
+
+        Seules les entêtes des tables sauvegardées sont lues ici (numéro, grosse blind,
+        joueurs assis), pour les lister et les indexer : chaque table est restaurée avec
+        sa manche en cours la première fois qu'elle est demandée, par table_par_numero.
+
+        Paramètres
+        ----------
+        sauvegarde : TableDao
+            base de sauvegarde des tables, None pour désactiver la sauvegarde
+        """
+
+        cls.sauvegarde = sauvegarde
+        if sauvegarde is None:
+            return
+        with cls.__verrou_registre:
+            for table in sauvegarde.entetes():
+                if table.numero_table not in cls.__tables:
+                    cls.__indexer(table)
+                    cls.__a_restaurer.add(table.numero_table)
+                cls.compteur_tables = max(cls.compteur_tables, table.numero_table)
+
+    @classmethod
+    def vider(cls) -> None:
+        """Oublie toutes les tables en mémoire (la sauvegarde n'est pas modifiée)"""
+        with cls.__verrou_registre:
+            cls.__tables = {}
+            cls.__par_blind = {}
+            cls.__ouvertes = set()
+            cls.__par_manche = {}
+            cls.__par_joueur = {}
+            cls.__cles = {}
+            cls.__a_restaurer = set()
+
+    @classmethod
+    def __indexer(cls, table: Table) -> None:
+        """Enregistre la table dans le registre et met à jour les index secondaires"""
+
+        numero = table.numero_table
+        with cls.__verrou_registre:
+            if numero in cls.__cles:
+                cls.__desindexer(cls.__tables[numero])
+            cls.__tables[numero] = table
+            cls.__par_blind.setdefault(table.grosse_blind, set()).add(numero)
+            if len(table) < table.joueurs_max:
+                cls.__ouvertes.add(numero)
+            if table.manche is not None:
+                cls.__par_manche[id(table.manche)] = table
+            id_joueurs = tuple(table.id_joueurs)
+            for id_joueur in id_joueurs:
+                cls.__par_joueur[id_joueur] = numero
+            # Valeurs indexées : la table peut changer avant d'être désindexée
+            cls.__cles[numero] = (table.grosse_blind, table.manche, id_joueurs)
+
+    @classmethod
+    def __desindexer(cls, table: Table) -> None:
+        """Retire la table du registre et des index secondaires"""
+
+        numero = table.numero_table
+        with cls.__verrou_registre:
+            grosse_blind, manche, id_joueurs = cls.__cles.pop(numero)
+            del cls.__tables[numero]
+            numeros = cls.__par_blind[grosse_blind]
+            numeros.discard(numero)
+            if not numeros:
+                del cls.__par_blind[grosse_blind]
+            cls.__ouvertes.discard(numero)
+            if manche is not None:
+                cls.__par_manche.pop(id(manche), None)
+            for id_joueur in id_joueurs:
+                if cls.__par_joueur.get(id_joueur) == numero:
+                    del cls.__par_joueur[id_joueur]
+
+    def __mettre_a_jour(self, table: Table) -> None:
+        """Réindexe puis sauvegarde une table modifiée par le service"""
+        self.__indexer(table)
+        self.sauvegarder(table)
+
+    def sauvegarder(self, table: Table) -> None:
+        """Sauvegarde la table et sa manche, si la sauvegarde est activée"""
+        if self.sauvegarde is not None:
+            self.sauvegarde.sauvegarder(table)
+
+    def sauvegarder_manche(self, manche) -> None:
+        """Sauvegarde la table qui joue cette manche (après une action)"""
+        if self.sauvegarde is None:
+            return
+        table = self.__par_manche.get(id(manche))
+        if table is not None and table.manche is manche:
+            self.sauvegarde.sauvegarder(table)
 
     def liste_tables(self) -> list[Table]:
-        """Liste l'ensemble des tables disponibles"""
-        return self.__tables
+        """
+        Liste l'ensemble des tables disponibles, sans en restaurer aucune
+
+        Les tables sauvegardées qui n'ont pas encore servi depuis le redémarrage sont
+        renvoyées sans leur manche : table_par_numero les restaure entièrement.
+        """
+        return list(self.__tables.values())
 
     def affichages_tables(self) -> list[str]:
         """Affichage de l'ensemble des tables créées"""
-        return [str(table) for table in self.__tables]
+        return [str(table) for table in self.liste_tables()]
 
     def table_par_affichage(self, affichage: str) -> Table:
-        """Renvoie la table correspondante à l'affichage"""
-        indice_table = self.affichages_tables().index(affichage)
-        return self.__tables[indice_table]
+        """
+        Renvoie la table correspondante à l'affichage (voir Table.__str__)
+
+        Exceptions
+        ----------
+        ValueError
+            si l'affichage ne correspond à aucune table
+        """
+
+        # L'affichage commence par "Table <numéro>," : inutile de formater toutes les tables
+        try:
+            numero_table = int(affichage.split(",", 1)[0].removeprefix("Table "))
+            table = self.table_par_numero(numero_table)
+        except ValueError:
+            raise ValueError(f"Aucune table ne correspond à l'affichage : {affichage}") from None
+        if str(table) != affichage:
+            raise ValueError(f"Aucune table ne correspond à l'affichage : {affichage}")
+        return table
 
     def table_par_numero(self, numero_table: int) -> Table:
         """
@@ -52,13 +186,93 @@ class TableService:
             si aucune table n'est trouvée avec ce numéro
         """
 
-        for table in self.__tables:
-            print(table.numero_table)
-            if table.numero_table == numero_table:
-                return table
+        table = self.__tables.get(numero_table)
+        if table is not None and numero_table not in self.__a_restaurer:
+            return table
+
+        if self.sauvegarde is not None:
+            with self.__verrou_registre:
+                # Un autre thread a pu restaurer la table pendant l'attente du verrou
+                table = self.__tables.get(numero_table)
+                if table is not None and numero_table not in self.__a_restaurer:
+                    return table
+                table = self.sauvegarde.charger(numero_table)
+                if table is not None:
+                    self.__a_restaurer.discard(numero_table)
+                    self.__indexer(table)
+                    return table
 
         raise ValueError(f"Aucune table existante ne porte le numéro {numero_table}")
 
+    def numero_table_joueur(self, id_joueur: int) -> int | None:
+        """
+        Renvoie le numéro de la table où le joueur est assis, d'après le registre
+
+        Le joueur connecté garde son numéro de table en mémoire (Joueur.numero_table) ;
+        le registre permet de le lui rendre à la connexion, notamment après un redémarrage.
+
+        Paramètres
+        ----------
+        id_joueur : int
+            l'identifiant du joueur
+
+        Renvois
+        -------
+        int | None
+            le numéro de sa table, None s'il n'est assis à aucune table
+        """
+
+        return self.__par_joueur.get(id_joueur)
+
+    @staticmethod
+    def __table_joueur(id_joueur: int) -> int | None:
+        """Numéro de la table du joueur connecté (voir GestionnaireVerrous.verrouiller_joueur)"""
+        return JoueurService().trouver_par_id(id_joueur).numero_table
+
+    def tables_par_blind(self, grosse_blind: int) -> list[Table]:
+        """
+        Renvoie les tables d'une grosse blind donnée, par numéro croissant
+
+        Les tables sauvegardées sont indexées dès le démarrage (voir activer_sauvegarde),
+        sans être restaurées.
+
+        Paramètres
+        ----------
+        grosse_blind : int
+            valeur de la grosse blind
+
+        Renvois
+        -------
+        list[Table]
+            les tables de cette grosse blind
+        """
+
+        numeros = self.__par_blind.get(grosse_blind, ())
+        return [self.__tables[numero] for numero in sorted(numeros)]
+
+    def tables_ouvertes(self, grosse_blind: int = None) -> list[Table]:
+        """
+        Renvoie les tables ayant au moins une place libre, par numéro croissant
+
+        Les tables sauvegardées sont indexées dès le démarrage (voir activer_sauvegarde),
+        sans être restaurées.
+
+        Paramètres
+        ----------
+        grosse_blind : int
+            si renseignée, seules les tables de cette grosse blind sont renvoyées
+
+        Renvois
+        -------
+        list[Table]
+            les tables où un joueur peut s'asseoir
+        """
+
+        numeros = self.__ouvertes
+        if grosse_blind is not None:
+            numeros = numeros & self.__par_blind.get(grosse_blind, set())
+        return [self.__tables[numero] for numero in sorted(numeros)]
+
     @log
     def creer_table(self, joueurs_max: int, grosse_blind: int, mode_jeu: int = 1) -> Table:
         """
@@ -79,8 +293,9 @@ class TableService:
             la table créée
         """
 
-        self.compteur_tables += 1
-        numero = self.compteur_tables
+        with self.__verrou_registre:
+            TableService.compteur_tables += 1
+            numero = TableService.compteur_tables
 
         table = Table(
             numero_table=numero,
@@ -89,7 +304,7 @@ class TableService:
             mode_jeu=mode_jeu,
         )
 
-        self.__tables.append(table)
+        self.__mettre_a_jour(table)
         return table
 
     @log
@@ -107,12 +322,14 @@ class TableService:
         None
         """
 
-        table = self.table_par_numero(numero_table)
+        with GestionnaireVerrous().verrouiller(tables=[numero_table]):
+            table = self.table_par_numero(numero_table)
 
-        for joueur in list(table.joueurs):
-            joueur.quitter_table()
-        if table in self.__tables:
-            self.__tables.remove(table)
+            for joueur in list(table.joueurs):
+                joueur.quitter_table()
+            self.__desindexer(table)
+            if self.sauvegarde is not None:
+                self.sauvegarde.supprimer(numero_table)
 
     @log
     def ajouter_joueur(self, numero_table: int, id_joueur: int) -> None:
@@ -131,28 +348,32 @@ class TableService:
         None
         """
 
-        joueur = JoueurService().trouver_par_id(id_joueur)
+        with GestionnaireVerrous().verrouiller(tables=[numero_table], joueurs=[id_joueur]):
+            joueur = JoueurService().trouver_par_id(id_joueur)
 
-        if not joueur:
-            raise ValueError(f"Le joueur avec l'identifiant {id_joueur} n'existe pas")
-        if joueur.numero_table is not None:
-            raise ValueError("Le joueur est déjà à une table")
+            if not joueur:
+                raise ValueError(f"Le joueur avec l'identifiant {id_joueur} n'existe pas")
+            if joueur.numero_table is not None:
+                raise ValueError("Le joueur est déjà à une table")
 
-        table = self.table_par_numero(numero_table)
+            table = self.table_par_numero(numero_table)
 
-        joueur_dans_table = False
+            joueur_dans_table = False
 
-        try:
-            table.ajouter_joueur(id_joueur)
-            joueur_dans_table = True
-            joueur.rejoindre_table(numero_table)
-        except Exception as e:
-            if joueur_dans_table:
-                table.retirer_joueur(id_joueur)
+            try:
+                table.ajouter_joueur(id_joueur)
+                joueur_dans_table = True
+                joueur.rejoindre_table(numero_table)
+            except Exception as e:
+                if joueur_dans_table:
+                    table.retirer_joueur(id_joueur)
 
-            raise Exception(f"Échec, {joueur.pseudo} n'a pas rejoint la table {numero_table} : {e}")
+                raise Exception(
+                    f"Échec, {joueur.pseudo} n'a pas rejoint la table {numero_table} : {e}"
+                )
 
-        JoueurService().maj_joueur(joueur)
+            JoueurService().maj_joueur(joueur)
+            self.__mettre_a_jour(table)
 
     @log
     def retirer_joueur(self, id_joueur: int) -> None:
@@ -169,11 +390,13 @@ class TableService:
         None
         """
 
-        joueur = JoueurService().trouver_par_id(id_joueur)
-        table = TableService().table_par_numero(joueur.numero_table)
+        with GestionnaireVerrous().verrouiller_joueur(id_joueur, self.__table_joueur):
+            joueur = JoueurService().trouver_par_id(id_joueur)
+            table = self.table_par_numero(joueur.numero_table)
 
-        joueur.quitter_table()
-        table.retirer_joueur(table.id_joueurs.index(id_joueur))
+            joueur.quitter_table()
+            table.retirer_joueur(table.indice_joueur(id_joueur))
+            self.__mettre_a_jour(table)
 
     @log
     def lancer_manche(self, numero_table: int) -> None:
@@ -190,29 +413,31 @@ class TableService:
         None
         """
 
-        table = self.table_par_numero(numero_table)
-        if table.manche is None or table.manche.fin:
-            pseudos = []
+        with GestionnaireVerrous().verrouiller(tables=[numero_table]):
+            table = self.table_par_numero(numero_table)
+            if table.manche is None or table.manche.fin:
+                pseudos = []
 
-            for id in range(len(table)):
-                joueur = JoueurService().trouver_par_id(table.id_joueurs[id])
-                if joueur.credit < table.grosse_blind:
-                    self.retirer_joueur(joueur.id_joueur)
-                else:
-                    pseudos.append(joueur.pseudo)
+                for id in range(len(table)):
+                    joueur = JoueurService().trouver_par_id(table.id_joueurs[id])
+                    if joueur.credit < table.grosse_blind:
+                        self.retirer_joueur(joueur.id_joueur)
+                    else:
+                        pseudos.append(joueur.pseudo)
 
-            table.nouvelle_manche(pseudos)
-            table.manche.preflop()
-            p_blind = table.manche.info.joueurs[0]
-            g_blind = table.manche.info.joueurs[1]
+                table.nouvelle_manche(pseudos, reserve=PaquetService().reserve())
+                table.manche.preflop()
+                p_blind = table.manche.info.joueurs[0]
+                g_blind = table.manche.info.joueurs[1]
 
-            grosse_blind = table.manche.grosse_blind
+                grosse_blind = table.manche.grosse_blind
 
-            from service.action_service import ActionService
+                from service.action_service import ActionService
 
-            ActionService().suivre(p_blind, grosse_blind // 2)
-            ActionService().suivre(g_blind, grosse_blind - grosse_blind // 2)
-            table.manche.info.modifier_statut(1, 0)
+                ActionService().suivre(p_blind, grosse_blind // 2)
+                ActionService().suivre(g_blind, grosse_blind - grosse_blind // 2)
+                table.manche.fin_des_blinds()
+                self.__mettre_a_jour(table)
 
     def affichage_general(self, numero_table: int) -> str:
         """
@@ -231,9 +456,10 @@ class TableService:
             les cartes de la main du joueur
         """
 
-        table = self.table_par_numero(numero_table)
+        with GestionnaireVerrous().verrouiller(tables=[numero_table]):
+            table = self.table_par_numero(numero_table)
 
-        return table.manche.affichage_complet()
+            return table.manche.affichage_complet()
 
     def regarder_main(self, id_joueur: int) -> str:
         """
@@ -252,11 +478,11 @@ class TableService:
             les cartes de la main du joueur
         """
 
-        joueur = JoueurService().trouver_par_id(id_joueur)
-        numero_table = joueur.numero_table
-        table = self.table_par_numero(numero_table)
+        with GestionnaireVerrous().verrouiller_joueur(id_joueur, self.__table_joueur):
+            joueur = JoueurService().trouver_par_id(id_joueur)
+            table = self.table_par_numero(joueur.numero_table)
 
-        return table.manche.regarder_cartes(id_joueur)
+            return table.manche.regarder_cartes(id_joueur)
 
     @log
     def terminer_manche(self, numero_table: int) -> str:
@@ -273,17 +499,60 @@ class TableService:
         None
         """
 
-        table = self.table_par_numero(numero_table)
+        with GestionnaireVerrous().verrouiller(tables=[numero_table]):
+            table = self.table_par_numero(numero_table)
+
+            gains = table.manche.terminer_manche()
+
+            if gains is not None:
+                for id_joueur, montant in gains.items():
+                    joueur = JoueurService().trouver_par_id(id_joueur)
+                    CreditService().crediter(joueur, montant)
 
-        gains = table.manche.terminer_manche()
+                id_manche = MancheService().sauvegarder_manche(table.manche)
+                MancheJoueurService().sauvegarder_manche_joueur(id_manche, table.manche.info, gains)
+                table.rotation_dealer()
+                self.__mettre_a_jour(table)
 
-        if gains is not None:
-            for id_joueur, montant in gains.items():
-                joueur = JoueurService().trouver_par_id(id_joueur)
-                CreditService().crediter(joueur, montant)
+            return table.manche.resultats()
+
+    def resultat_manche(self, numero_table: int) -> ResultatManche:
+        """
+        Renvoie le résultat de la manche terminée d'une table
+
+        Paramètres
+        ----------
+        numero_table : int
+            le numéro de la table
+
+        Renvois
+        -------
+        ResultatManche
+            combinaisons, classement, pots et gains de la manche (calculés une seule fois)
+        """
+
+        with GestionnaireVerrous().verrouiller(tables=[numero_table]):
+            table = self.table_par_numero(numero_table)
+
+            return table.manche.resultat
+
+    def historique_manche(self, numero_table: int) -> list[dict]:
+        """
+        Renvoie l'historique de la manche en cours (ou de la dernière manche) d'une table
+
+        Paramètres
+        ----------
+        numero_table : int
+            le numéro de la table
+
+        Renvois
+        -------
+        list[dict]
+            événements du journal de la manche (distribution, actions, tours, fin) ;
+            la graine du mélange n'y figure qu'une fois la manche terminée
+        """
 
-            id_manche = MancheService().sauvegarder_manche(table.manche)
-            MancheJoueurService().sauvegarder_manche_joueur(id_manche, table.manche.info, gains)
-            table.rotation_dealer()
+        with GestionnaireVerrous().verrouiller(tables=[numero_table]):
+            table = self.table_par_numero(numero_table)
 
-        return table.manche.resultats()
+            return table.manche.journal.historique()
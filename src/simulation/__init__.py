@@ -0,0 +1 @@
+"""Simulation de manches entre robots, sans serveur ni base de données"""
@@ -0,0 +1,406 @@
+"""
+Simulateur de manches entre robots, sans serveur ni base de données
+
+Le simulateur pilote directement Manche (préflop, blinds, appels à action puis
+terminer_manche) : chaque robot choisit ses actions avec une stratégie (voir
+simulation.strategie) et les crédits sont tenus en mémoire. Il sert à éprouver le
+moteur de règles et à régler les structures de blinds.
+
+Le rapport donne le débit (mains par seconde), le nombre de mains où les jetons n'ont
+pas été conservés, les erreurs levées par le moteur et le temps passé à chaque tour.
+Les mains peuvent être réparties entre plusieurs processus.
+
+Utilisation (depuis la racine du dépôt) :
+    PYTHONPATH=src python -m simulation.simulateur --mains 10000 --processus 4 force aleatoire
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from business_object.evaluateur_rapide import EvaluateurRapide
+from business_object.info_manche import InfoManche
+from business_object.manche import Manche
+from business_object.melangeur import Melangeur
+from business_object.reserve import Reserve
+from simulation.strategie import ALL_IN, STRATEGIES, SUIVRE
+
+TOURS = (*Manche.TOURS(), "abattage")
+N_ERREURS_CONSERVEES = 5
+
+
+class CreditsMemoire:
+    """Crédits des joueurs tenus en mémoire, à la place de CreditService et de la DAO"""
+
+    def __init__(self, credits: dict[int, int]):
+        """
+        Instanciation des crédits
+
+        Paramètres
+        ----------
+        credits : dict[int, int]
+            crédit initial de chaque joueur, par identifiant
+        """
+        self.__credits = dict(credits)
+
+    def credit(self, id_joueur: int) -> int:
+        """Crédit d'un joueur"""
+        return self.__credits[id_joueur]
+
+    @property
+    def total(self) -> int:
+        """Somme des crédits de tous les joueurs"""
+        return sum(self.__credits.values())
+
+    def crediter(self, id_joueur: int, montant: int) -> None:
+        """Ajoute un montant au crédit d'un joueur"""
+        if montant < 0:
+            raise ValueError(f"Le montant à créditer doit être positif : {montant}")
+        self.__credits[id_joueur] += montant
+
+    def debiter(self, id_joueur: int, montant: int) -> None:
+        """
+        Retire un montant du crédit d'un joueur
+
+        Exceptions
+        ----------
+        ValueError
+            si le montant est négatif ou dépasse le crédit du joueur
+        """
+        if montant < 0 or montant > self.__credits[id_joueur]:
+            raise ValueError(
+                f"Débit impossible de {montant} pour le joueur {id_joueur} "
+                f"(crédit : {self.__credits[id_joueur]})"
+            )
+        self.__credits[id_joueur] -= montant
+
+
+class Simulateur:
+    """
+    Enchaîne des manches sur une table de robots.
+
+    Le dealer tourne à chaque manche, comme avec Table.rotation_dealer. Un robot dont le
+    crédit ne couvre plus la grosse blind est recavé au tapis initial, et la recave est
+    comptée dans le bilan de conservation des jetons.
+    """
+
+    MAX_ACTIONS = 1000
+
+    def __init__(
+        self,
+        strategies: list[str],
+        grosse_blind: int = 20,
+        tapis: int = 2000,
+        graine: int = None,
+    ):
+        """
+        Instanciation d'un simulateur
+
+        Paramètres
+        ----------
+        strategies : list[str]
+            nom de la stratégie de chaque robot (clés de STRATEGIES), dans l'ordre des sièges
+        grosse_blind : int
+            montant de la grosse blind
+        tapis : int
+            crédit initial de chaque robot
+        graine : int
+            graine des paquets et des stratégies, pour rejouer une simulation
+
+        Exceptions
+        ----------
+        ValueError
+            si moins de deux robots sont demandés, si une stratégie est inconnue ou si
+            le tapis ne couvre pas la grosse blind
+        """
+
+        if len(strategies) < 2:
+            raise ValueError(f"Au moins deux robots sont nécessaires : {len(strategies)}")
+        inconnues = [nom for nom in strategies if nom not in STRATEGIES]
+        if inconnues:
+            raise ValueError(f"Stratégies inconnues : {inconnues}, possibles : {list(STRATEGIES)}")
+        if tapis <= grosse_blind:
+            raise ValueError(f"Le tapis doit dépasser la grosse blind : {tapis}")
+
+        self.__grosse_blind = grosse_blind
+        self.__tapis = tapis
+        self.__melangeur = Melangeur(0 if graine is None else graine)
+        self.__sieges = list(range(1, len(strategies) + 1))
+        self.__strategies = {
+            id_joueur: STRATEGIES[nom](None if graine is None else graine * 1000 + id_joueur)
+            for id_joueur, nom in zip(self.__sieges, strategies)
+        }
+        self.__pseudos = {id_joueur: f"robot_{id_joueur}" for id_joueur in self.__sieges}
+        self.__credits = CreditsMemoire({id_joueur: tapis for id_joueur in self.__sieges})
+
+        self.__n_mains = 0
+        self.__n_actions = 0
+        self.__recaves = 0
+        self.__mains_non_conservees = 0
+        self.__erreurs = 0
+        self.__exemples_erreurs = []
+        self.__durees = dict.fromkeys(TOURS, 0.0)
+
+    @property
+    def credits(self) -> CreditsMemoire:
+        """Crédits des robots"""
+        return self.__credits
+
+    def __recaver(self) -> None:
+        """Remet au tapis initial les robots qui ne couvrent plus la grosse blind"""
+        for id_joueur in self.__sieges:
+            credit = self.__credits.credit(id_joueur)
+            if credit <= self.__grosse_blind:
+                self.__credits.crediter(id_joueur, self.__tapis - credit)
+                self.__recaves += 1
+
+    def __agir(self, manche: Manche, id_joueur: int, action: str, relance: int = 0) -> None:
+        """Joue une action et débite la mise correspondante"""
+        credit = self.__credits.credit(id_joueur)
+        montant = manche.action(id_joueur, action, credit, relance)
+        if action in (SUIVRE, ALL_IN):
+            self.__credits.debiter(id_joueur, montant)
+
+    def jouer_main(self) -> None:
+        """Joue une manche complète, de la distribution au paiement des gains"""
+
+        self.__recaver()
+        total_avant = self.__credits.total
+        manche = None
+
+        try:
+            debut = time.perf_counter()
+            graine, codes = self.__melangeur.paquet()
+            manche = Manche(
+                InfoManche(self.__sieges, [self.__pseudos[j] for j in self.__sieges]),
+                self.__grosse_blind,
+                reserve=Reserve.depuis_codes(codes, graine),
+            )
+            manche.preflop()
+
+            # Blinds, comme TableService.lancer_manche
+            petite_blind = self.__grosse_blind // 2
+            self.__agir(manche, self.__sieges[0], SUIVRE, petite_blind)
+            self.__agir(manche, self.__sieges[1], SUIVRE, self.__grosse_blind - petite_blind)
+            manche.fin_des_blinds()
+
+            n_actions = 0
+            while not manche.fin:
+                if n_actions >= self.MAX_ACTIONS:
+                    raise RuntimeError(f"Manche interrompue après {n_actions} actions")
+                tour = manche.tour
+                indice = manche.indice_joueur_actuel
+                id_joueur = self.__sieges[indice]
+                action, relance = self.__strategies[id_joueur].decider(
+                    manche, indice, self.__credits.credit(id_joueur)
+                )
+                self.__agir(manche, id_joueur, action, relance)
+                n_actions += 1
+                fin = time.perf_counter()
+                self.__durees[TOURS[tour]] += fin - debut
+                debut = fin
+
+            for id_joueur, gain in manche.terminer_manche().items():
+                self.__credits.crediter(id_joueur, gain)
+            self.__durees["abattage"] += time.perf_counter() - debut
+            self.__n_actions += n_actions
+
+        except Exception as e:
+            self.__erreurs += 1
+            if len(self.__exemples_erreurs) < N_ERREURS_CONSERVEES:
+                self.__exemples_erreurs.append(f"{type(e).__name__} : {e}")
+            # Les mises engagées dans la manche interrompue sont rendues
+            if manche is not None:
+                for i, id_joueur in enumerate(manche.info.joueurs):
+                    self.__credits.crediter(id_joueur, manche.info.mises[i])
+
+        if self.__credits.total != total_avant:
+            self.__mains_non_conservees += 1
+
+        self.__n_mains += 1
+        self.__sieges.append(self.__sieges.pop(0))
+
+    def jouer(self, n_mains: int) -> dict:
+        """
+        Joue plusieurs manches et renvoie le rapport de simulation
+
+        Paramètres
+        ----------
+        n_mains : int
+            nombre de manches à jouer
+
+        Renvois
+        -------
+        dict
+            compteurs et durées de la simulation (voir rapport)
+        """
+
+        # Construit les tables de l'évaluateur avant de chronométrer
+        EvaluateurRapide.table_quintes()
+
+        debut = time.perf_counter()
+        for _ in range(n_mains):
+            self.jouer_main()
+        return self.rapport(time.perf_counter() - debut)
+
+    def rapport(self, duree: float) -> dict:
+        """Compteurs de la simulation, pour une durée de jeu donnée en secondes"""
+        return {
+            "mains": self.__n_mains,
+            "actions": self.__n_actions,
+            "duree": duree,
+            "mains_par_seconde": self.__n_mains / duree if duree > 0 else 0.0,
+            "recaves": self.__recaves,
+            "mains_non_conservees": self.__mains_non_conservees,
+            "erreurs": self.__erreurs,
+            "exemples_erreurs": list(self.__exemples_erreurs),
+            "durees_par_tour": dict(self.__durees),
+        }
+
+
+def _simuler_lot(
+    strategies: list[str], n_mains: int, grosse_blind: int, tapis: int, graine: int
+) -> dict:
+    """Tâche d'un processus (fonction de module pour pouvoir être sérialisée)"""
+    return Simulateur(strategies, grosse_blind, tapis, graine).jouer(n_mains)
+
+
+def fusionner(rapports: list[dict], duree: float) -> dict:
+    """
+    Regroupe les rapports de plusieurs processus
+
+    Paramètres
+    ----------
+    rapports : list[dict]
+        rapports de Simulateur.jouer
+    duree : float
+        durée totale mesurée par le processus principal, en secondes
+
+    Renvois
+    -------
+    dict
+        rapport global ; mains_par_seconde est le débit total et mains_par_seconde_coeur
+        le débit moyen d'un processus. Les durées par tour sont cumulées sur tous les
+        processus, avec leur moyenne par main en microsecondes.
+    """
+
+    n_mains = sum(r["mains"] for r in rapports)
+    duree_calcul = sum(r["duree"] for r in rapports)
+    durees = {tour: sum(r["durees_par_tour"][tour] for r in rapports) for tour in TOURS}
+    exemples = [e for r in rapports for e in r["exemples_erreurs"]]
+
+    return {
+        "mains": n_mains,
+        "processus": len(rapports),
+        "actions": sum(r["actions"] for r in rapports),
+        "duree": duree,
+        "mains_par_seconde": n_mains / duree if duree > 0 else 0.0,
+        "mains_par_seconde_coeur": n_mains / duree_calcul if duree_calcul > 0 else 0.0,
+        "recaves": sum(r["recaves"] for r in rapports),
+        "mains_non_conservees": sum(r["mains_non_conservees"] for r in rapports),
+        "jetons_conserves": all(r["mains_non_conservees"] == 0 for r in rapports),
+        "erreurs": sum(r["erreurs"] for r in rapports),
+        "exemples_erreurs": exemples[:N_ERREURS_CONSERVEES],
+        "durees_par_tour": durees,
+        "microsecondes_par_main": {
+            tour: 1e6 * d / n_mains if n_mains else 0.0 for tour, d in durees.items()
+        },
+    }
+
+
+def simuler(
+    strategies: list[str],
+    n_mains: int,
+    n_processus: int = 1,
+    grosse_blind: int = 20,
+    tapis: int = 2000,
+    graine: int = None,
+) -> dict:
+    """
+    Simule des manches entre robots, éventuellement réparties entre plusieurs processus
+
+    Paramètres
+    ----------
+    strategies : list[str]
+        nom de la stratégie de chaque robot
+    n_mains : int
+        nombre total de manches
+    n_processus : int
+        nombre de processus ; chacun joue sa part des manches sur sa propre table
+    grosse_blind : int
+        montant de la grosse blind
+    tapis : int
+        crédit initial de chaque robot
+    graine : int
+        graine de la simulation ; chaque processus reçoit une graine dérivée
+
+    Renvois
+    -------
+    dict
+        rapport global (voir fusionner)
+
+    Exceptions
+    ----------
+    ValueError
+        si n_mains ou n_processus n'est pas strictement positif
+    """
+
+    if n_mains < 1:
+        raise ValueError(f"Le nombre de mains doit être positif : {n_mains}")
+    if n_processus < 1:
+        raise ValueError(f"Le nombre de processus doit être positif : {n_processus}")
+
+    # Vérifie les paramètres avant de lancer les processus
+    Simulateur(strategies, grosse_blind, tapis)
+
+    parts = [n_mains // n_processus + (i < n_mains % n_processus) for i in range(n_processus)]
+    taches = [
+        (strategies, n, grosse_blind, tapis, None if graine is None else graine + i)
+        for i, n in enumerate(parts)
+        if n > 0
+    ]
+
+    debut = time.perf_counter()
+    if len(taches) == 1:
+        rapports = [_simuler_lot(*taches[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=len(taches)) as executeur:
+            rapports = list(executeur.map(_simuler_lot, *zip(*taches)))
+    return fusionner(rapports, time.perf_counter() - debut)
+
+
+def main(arguments: list[str] = None) -> int:
+    """Point d'entrée en ligne de commande, renvoie le code de retour"""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "strategies",
+        nargs="+",
+        choices=list(STRATEGIES),
+        help="stratégie de chaque robot, dans l'ordre des sièges",
+    )
+    parser.add_argument("--mains", type=int, default=1000)
+    parser.add_argument("--processus", type=int, default=1)
+    parser.add_argument("--grosse-blind", type=int, default=20)
+    parser.add_argument("--tapis", type=int, default=2000)
+    parser.add_argument("--graine", type=int, default=39)
+    arguments = parser.parse_args(arguments)
+
+    rapport = simuler(
+        arguments.strategies,
+        arguments.mains,
+        arguments.processus,
+        arguments.grosse_blind,
+        arguments.tapis,
+        arguments.graine,
+    )
+    print(json.dumps(rapport, indent=2, ensure_ascii=False))
+
+    # Code de retour 1 si le moteur a perdu des jetons ou levé une erreur
+    return 0 if rapport["jetons_conserves"] and rapport["erreurs"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""Stratégies des robots du simulateur et actions autorisées d'un joueur"""
+
+import random
+from abc import ABC, abstractmethod
+
+from business_object.evaluateur_rapide import EvaluateurRapide
+from business_object.manche import Manche
+
+CHECKER = "checker"
+SUIVRE = "suivre"
+ALL_IN = "all-in"
+SE_COUCHER = "se coucher"
+
+
+def a_suivre(manche: Manche, indice: int) -> int:
+    """Montant qu'un joueur doit ajouter pour égaler la plus forte mise"""
+    mises = manche.info.mises
+    return max(mises) - mises[indice]
+
+
+def actions_possibles(manche: Manche, indice: int, credit: int) -> list[str]:
+    """
+    Liste les actions que Manche.action acceptera pour un joueur
+
+    Paramètres
+    ----------
+    manche : Manche
+        manche en cours
+    indice : int
+        indice du joueur dont c'est le tour
+    credit : int
+        crédit restant du joueur
+
+    Renvois
+    -------
+    list[str]
+        actions autorisées, parmi "checker", "suivre", "all-in" et "se coucher"
+    """
+
+    statut = manche.info.statuts[indice]
+    pour_suivre = a_suivre(manche, indice)
+
+    if pour_suivre >= credit:
+        return [ALL_IN, SE_COUCHER]
+
+    actions = []
+    if statut == 0 and pour_suivre == 0:
+        actions.append(CHECKER)
+    if peut_suivre(manche, indice, credit) or relance_max(manche, indice, credit) > 0:
+        actions.append(SUIVRE)
+    actions += [ALL_IN, SE_COUCHER]
+    return actions
+
+
+def peut_suivre(manche: Manche, indice: int, credit: int) -> bool:
+    """Indique si le joueur peut suivre sans relancer (refusé à un joueur « innactif »)"""
+    return manche.info.statuts[indice] != 0 and a_suivre(manche, indice) < credit
+
+
+def relance_max(manche: Manche, indice: int, credit: int) -> int:
+    """Plus forte relance possible sans passer all-in (0 si aucune)"""
+    return max(0, credit - a_suivre(manche, indice) - 1)
+
+
+class AbstractStrategie(ABC):
+    """
+    Stratégie d'un robot : choisit l'action du joueur dont c'est le tour.
+
+    Les stratégies ne proposent que des actions autorisées (voir actions_possibles) ;
+    une exception levée par la manche signale donc une incohérence du moteur de règles.
+    """
+
+    PLAFOND_RELANCES = 50
+
+    def __init__(self, graine: int = None):
+        """
+        Instanciation d'une stratégie
+
+        Paramètres
+        ----------
+        graine : int
+            graine du générateur aléatoire de la stratégie, pour rejouer une simulation
+        """
+        self._aleatoire = random.Random(graine)
+
+    @abstractmethod
+    def decider(self, manche: Manche, indice: int, credit: int) -> tuple[str, int]:
+        """
+        Choisit l'action du joueur
+
+        Paramètres
+        ----------
+        manche : Manche
+            manche en cours (lecture seule)
+        indice : int
+            indice du joueur dont c'est le tour
+        credit : int
+            crédit restant du joueur
+
+        Renvois
+        -------
+        tuple[str, int]
+            l'action et le montant de la relance (0 sauf pour une relance)
+        """
+
+    def _relance(self, manche: Manche, indice: int, credit: int, montant: int) -> tuple[str, int]:
+        """
+        Relance du montant demandé, réduit si nécessaire, ou suit à défaut. Les robots
+        cessent de relancer quand la plus forte mise atteint PLAFOND_RELANCES grosses
+        blinds, sans quoi deux robots agressifs relanceraient indéfiniment.
+        """
+        plafond = self.PLAFOND_RELANCES * manche.grosse_blind - max(manche.info.mises)
+        relance = min(montant, relance_max(manche, indice, credit), plafond)
+        if relance > 0:
+            return SUIVRE, relance
+        return self._passer(manche, indice, credit)
+
+    def _passer(self, manche: Manche, indice: int, credit: int) -> tuple[str, int]:
+        """Checke si possible, sinon suit, sinon se couche"""
+        if CHECKER in actions_possibles(manche, indice, credit):
+            return CHECKER, 0
+        if peut_suivre(manche, indice, credit):
+            return SUIVRE, 0
+        return SE_COUCHER, 0
+
+
+class StrategiePassive(AbstractStrategie):
+    """Checke ou suit toujours, se couche face à un all-in"""
+
+    def decider(self, manche: Manche, indice: int, credit: int) -> tuple[str, int]:
+        return self._passer(manche, indice, credit)
+
+
+class StrategieAgressive(AbstractStrategie):
+    """Relance d'une grosse blind dès que possible, suit les all-in"""
+
+    def decider(self, manche: Manche, indice: int, credit: int) -> tuple[str, int]:
+        if a_suivre(manche, indice) >= credit:
+            return ALL_IN, 0
+        return self._relance(manche, indice, credit, manche.grosse_blind)
+
+
+class StrategieAleatoire(AbstractStrategie):
+    """Tire une action autorisée au hasard, avec des relances de une à trois grosses blinds"""
+
+    POIDS = {CHECKER: 4, SUIVRE: 4, ALL_IN: 1, SE_COUCHER: 2}
+
+    def decider(self, manche: Manche, indice: int, credit: int) -> tuple[str, int]:
+        actions = actions_possibles(manche, indice, credit)
+        action = self._aleatoire.choices(actions, [self.POIDS[a] for a in actions])[0]
+        if action != SUIVRE:
+            return action, 0
+
+        if not peut_suivre(manche, indice, credit) or self._aleatoire.random() < 0.3:
+            montant = manche.grosse_blind * self._aleatoire.randint(1, 3)
+            return self._relance(manche, indice, credit, montant)
+        return SUIVRE, 0
+
+
+class StrategieForce(AbstractStrategie):
+    """
+    Joue selon la force de sa main : relance avec une double paire ou mieux, suit avec
+    une paire, checke ou se couche sinon. Avant le flop, relance avec une paire haute
+    (dix ou plus) et suit avec une paire ou deux cartes hautes.
+    """
+
+    RANG_HAUT = 8  # rang du dix
+
+    def decider(self, manche: Manche, indice: int, credit: int) -> tuple[str, int]:
+        main = manche.info.mains[indice]
+        if len(manche.board) == 0:
+            rangs = [carte.rang for carte in main.cartes]
+            paire = rangs[0] == rangs[1]
+            forte = paire and rangs[0] >= self.RANG_HAUT
+            jouable = paire or min(rangs) >= self.RANG_HAUT
+        else:
+            force = EvaluateurRapide.force_fusion(manche.board.analyse, main.cartes)
+            categorie = EvaluateurRapide.categorie(force)
+            forte = categorie >= EvaluateurRapide.DOUBLE_PAIRE
+            jouable = categorie >= EvaluateurRapide.PAIRE
+
+        if forte:
+            if a_suivre(manche, indice) >= credit:
+                return ALL_IN, 0
+            return self._relance(manche, indice, credit, 2 * manche.grosse_blind)
+        if jouable:
+            return self._passer(manche, indice, credit)
+        if CHECKER in actions_possibles(manche, indice, credit):
+            return CHECKER, 0
+        return SE_COUCHER, 0
+
+
+STRATEGIES = {
+    "passive": StrategiePassive,
+    "agressive": StrategieAgressive,
+    "aleatoire": StrategieAleatoire,
+    "force": StrategieForce,
+}
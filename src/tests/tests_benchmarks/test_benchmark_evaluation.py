@@ -0,0 +1,105 @@
+"""Implémentation des tests pour le module benchmark_evaluation"""
+
+import json
+import platform
+
+import pytest
+
+from benchmarks.benchmark_evaluation import comparer, executer, main, tirer_manches
+
+
+class TestBenchmarkEvaluation:
+    @pytest.fixture
+    @staticmethod
+    def reference():
+        return {"version": 1, "mesures": {"eval_7_cartes": 1000.0, "gains_2_joueurs": 500.0}}
+
+    def test_executer_rapport(self):
+        # GIVEN / WHEN
+        rapport = executer(n_mains=20, n_manches=5, joueurs=(2, 3))
+
+        # THEN
+        assert rapport["version"] == 1
+        assert set(rapport["mesures"]) == {
+            "eval_5_cartes",
+            "eval_6_cartes",
+            "eval_7_cartes",
+            "classement_2_joueurs",
+            "classement_3_joueurs",
+            "gains_2_joueurs",
+            "gains_3_joueurs",
+        }
+        assert all(debit > 0 for debit in rapport["mesures"].values())
+
+    def test_tirer_manches_reproductible(self):
+        # GIVEN / WHEN
+        manches_1 = tirer_manches(4, 3, graine=39)
+        manches_2 = tirer_manches(4, 3, graine=39)
+
+        # THEN
+        for m1, m2 in zip(manches_1, manches_2):
+            assert m1.board == m2.board
+            assert m1.info.mises == m2.info.mises
+            assert len(m1.board) == 5
+
+    def test_comparer_sans_regression(self, reference):
+        # GIVEN
+        rapport = {"version": 1, "mesures": {"eval_7_cartes": 850.0, "gains_2_joueurs": 600.0}}
+
+        # WHEN / THEN
+        assert comparer(rapport, reference, tolerance=20) == []
+
+    def test_comparer_regression(self, reference):
+        # GIVEN
+        rapport = {"version": 1, "mesures": {"eval_7_cartes": 700.0, "gains_2_joueurs": 500.0}}
+
+        # WHEN
+        regressions = comparer(rapport, reference, tolerance=20)
+
+        # THEN
+        assert len(regressions) == 1
+        assert regressions[0].startswith("eval_7_cartes")
+        assert "-30.0 %" in regressions[0]
+
+    @pytest.mark.parametrize("tolerance", [-1, 101])
+    def test_comparer_tolerance_invalide(self, reference, tolerance):
+        with pytest.raises(ValueError, match="La tolérance doit être un pourcentage"):
+            comparer(reference, reference, tolerance)
+
+    def test_comparer_versions_differentes(self, reference):
+        with pytest.raises(ValueError, match="Versions de rapport incompatibles"):
+            comparer({"version": 2, "mesures": {}}, reference, 20)
+
+    def test_main_echec_si_regression(self, tmp_path, capsys):
+        # GIVEN : une référence irréaliste, impossible à atteindre
+        chemin = tmp_path / "reference.json"
+        chemin.write_text(json.dumps({"version": 1, "mesures": {"eval_5_cartes": 1e12}}))
+        sortie = tmp_path / "rapport.json"
+
+        # WHEN
+        code = main(
+            ["--mains", "10", "--manches", "2", "--reference", str(chemin), "--sortie", str(sortie)]
+        )
+
+        # THEN
+        assert code == 1
+        assert "Régression : eval_5_cartes" in capsys.readouterr().err
+        assert "mesures" in json.loads(sortie.read_text())
+
+    def test_main_avertit_si_environnement_different(self, tmp_path, capsys):
+        # GIVEN : une référence mesurée avec un autre interpréteur
+        chemin = tmp_path / "reference.json"
+        chemin.write_text(
+            json.dumps(
+                {"version": 1, "python": "2.7.18", "machine": platform.machine(), "mesures": {}}
+            )
+        )
+
+        # WHEN
+        code = main(["--mains", "10", "--manches", "2", "--reference", str(chemin)])
+
+        # THEN
+        erreurs = capsys.readouterr().err
+        assert code == 0
+        assert "python 2.7.18" in erreurs
+        assert "machine" not in erreurs
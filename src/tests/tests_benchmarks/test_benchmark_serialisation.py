@@ -0,0 +1,31 @@
+"""Implémentation des tests pour le module benchmark_serialisation"""
+
+from benchmarks.benchmark_serialisation import DEBIT_MINIMAL, etats_en_cours, executer
+from business_object.format_binaire import FormatBinaire
+
+
+class TestBenchmarkSerialisation:
+    def test_executer_rapport(self):
+        # GIVEN / WHEN
+        rapport = executer(n_joueurs=3, n_etats=20)
+
+        # THEN
+        assert rapport["taille_binaire"] * 2 < rapport["taille_pickle"]
+        assert all(valeur > 0 for valeur in rapport.values())
+
+    def test_executer_debit_minimal(self):
+        # GIVEN / WHEN
+        rapport = executer(n_joueurs=6, n_etats=200)
+
+        # THEN
+        assert rapport["encodage_binaire"] > DEBIT_MINIMAL
+        assert rapport["decodage_binaire"] > DEBIT_MINIMAL
+
+    def test_etats_en_cours(self):
+        # GIVEN / WHEN
+        etats = etats_en_cours(n_joueurs=4, n_etats=5)
+
+        # THEN
+        assert len(etats) == 5
+        for etat in etats:
+            assert FormatBinaire.decoder_etat(FormatBinaire.encoder_etat(etat)) == etat
@@ -0,0 +1,180 @@
+"""Implémentation des tests pour la classe AnalyseMain"""
+
+from unittest.mock import patch
+
+import pytest
+
+from business_object.analyse_main import AnalyseMain
+from business_object.combinaison.brelan import Brelan
+from business_object.combinaison.full import Full
+from business_object.evaluateur_combinaison import EvaluateurCombinaison
+
+
+class TestAnalyseMain:
+    def test_analyse_main_histogramme_et_rangs(self):
+        # GIVEN
+        cartes = [
+            pytest.roi_coeur,
+            pytest.deux_pique,
+            pytest.roi_pique,
+            pytest.as_trefle,
+            pytest.deux_carreau,
+        ]
+
+        # WHEN
+        analyse = AnalyseMain(cartes)
+
+        # THEN
+        assert analyse.histogramme[0] == 2
+        assert analyse.histogramme[11] == 2
+        assert analyse.histogramme[12] == 1
+        assert analyse.rangs == [12, 11, 11, 0, 0]
+        assert analyse.masque == (1 << 12) | (1 << 11) | 1
+        assert analyse.compteur == {"Roi": 2, "2": 2, "As": 1}
+
+    def test_analyse_main_rangs_par_compte(self):
+        # GIVEN
+        cartes = [
+            pytest.roi_coeur,
+            pytest.roi_pique,
+            pytest.roi_carreau,
+            pytest.trois_coeur,
+            pytest.trois_pique,
+            pytest.trois_trefle,
+            pytest.dix_coeur,
+        ]
+
+        # WHEN
+        analyse = AnalyseMain(cartes)
+
+        # THEN
+        assert analyse.rangs_par_compte(3) == [11, 1]
+        assert analyse.rangs_par_compte(2) == [11, 1]
+        assert analyse.rangs_par_compte(3, exact=True) == [11, 1]
+        assert analyse.rangs_par_compte(2, exact=True) == []
+        assert analyse.rangs_par_compte(1) == [11, 8, 1]
+
+    def test_analyse_main_couleurs(self):
+        # GIVEN
+        cartes = [
+            pytest.deux_coeur,
+            pytest.as_coeur,
+            pytest.sept_coeur,
+            pytest.roi_pique,
+            pytest.dix_coeur,
+            pytest.neuf_coeur,
+        ]
+
+        # WHEN
+        analyse = AnalyseMain(cartes)
+
+        # THEN
+        assert analyse.couleur_max() == "Coeur"
+        assert [c.valeur for c in analyse.couleurs["Coeur"]] == ["As", "10", "9", "7", "2"]
+        assert analyse.couleurs["Pique"] == [pytest.roi_pique]
+        assert analyse.quinte_flush() is None
+
+    @pytest.mark.parametrize(
+        "masque, hauteur",
+        [
+            (0b1111100000000, 12),
+            (0b1000000001111, 3),
+            (0b1000000011111, 4),
+            (0b0110110110111, None),
+            (0, None),
+        ],
+    )
+    def test_hauteur_quinte(self, masque, hauteur):
+        # GIVEN / WHEN / THEN
+        assert AnalyseMain.hauteur_quinte(masque) == hauteur
+
+    def test_analyse_main_quinte_flush_basse(self):
+        # GIVEN
+        cartes = [
+            pytest.as_pique,
+            pytest.deux_pique,
+            pytest.trois_pique,
+            pytest.quatre_pique,
+            pytest.cinq_pique,
+            pytest.roi_coeur,
+        ]
+
+        # WHEN
+        analyse = AnalyseMain(cartes)
+
+        # THEN
+        assert analyse.quinte_flush() == 3
+        assert analyse.quinte() == 3
+
+    def test_analyse_main_fusionner(self):
+        # GIVEN
+        board = [pytest.as_coeur, pytest.roi_coeur, pytest.dix_coeur, pytest.deux_pique]
+        main = [pytest.dame_coeur, pytest.valet_coeur]
+        analyse_board = AnalyseMain(board)
+
+        # WHEN
+        fusion = analyse_board.fusionner(main)
+        complete = AnalyseMain(board + main)
+
+        # THEN
+        assert fusion.cartes == board + main
+        assert fusion.histogramme == complete.histogramme
+        assert fusion.masques_couleur == complete.masques_couleur
+        assert fusion.signature == complete.signature
+        assert fusion.quinte_flush() == 12
+        assert analyse_board.quinte_flush() is None
+        assert len(analyse_board.cartes) == 4
+
+    def test_combinaisons_avec_analyse_partagee(self):
+        # GIVEN
+        cartes = [
+            pytest.roi_coeur,
+            pytest.roi_pique,
+            pytest.roi_carreau,
+            pytest.trois_coeur,
+            pytest.trois_pique,
+        ]
+        analyse = AnalyseMain(cartes)
+
+        # WHEN
+        full = Full.from_cartes(cartes, analyse)
+
+        # THEN
+        assert Full.est_present(cartes, analyse)
+        assert Brelan.est_present(cartes, analyse)
+        assert full == Full.from_cartes(cartes)
+
+    def test_eval_analyse_une_seule_fois(self):
+        # GIVEN
+        cartes = [
+            pytest.as_coeur,
+            pytest.roi_pique,
+            pytest.huit_trefle,
+            pytest.six_carreau,
+            pytest.trois_coeur,
+            pytest.deux_trefle,
+            pytest.neuf_pique,
+        ]
+
+        # WHEN
+        with patch(
+            "business_object.evaluateur_combinaison.AnalyseMain", wraps=AnalyseMain
+        ) as mock_analyse:
+            EvaluateurCombinaison.eval(cartes)
+
+        # THEN
+        mock_analyse.assert_called_once_with(cartes)
+
+    def test_eval_avec_analyse_fournie(self):
+        # GIVEN
+        board = [pytest.roi_coeur, pytest.roi_pique, pytest.trois_trefle]
+        main = [pytest.roi_carreau, pytest.trois_coeur]
+        analyse = AnalyseMain(board).fusionner(main)
+
+        # WHEN
+        with patch("business_object.evaluateur_combinaison.AnalyseMain") as mock_analyse:
+            combinaison = EvaluateurCombinaison.eval(board + main, analyse)
+
+        # THEN
+        mock_analyse.assert_not_called()
+        assert combinaison == Full.from_cartes(board + main)
@@ -53,6 +53,32 @@ class TestBoard(AbstractListeCartesTest):
         # THEN
         assert board.cartes == resultat
 
+    def test_board_analyse_par_tour(self):
+        # GIVEN
+        board = Board([pytest.as_pique, pytest.roi_pique, pytest.dame_pique])
+
+        # WHEN
+        analyse_flop = board.analyse
+        board.ajouter_carte(pytest.valet_pique)
+        analyse_turn = board.analyse
+
+        # THEN
+        assert board.analyse is analyse_turn
+        assert analyse_turn is not analyse_flop
+        assert analyse_flop.masque.bit_count() == 3
+        assert analyse_turn.masque.bit_count() == 4
+
+    def test_board_analyse_retirer_carte(self):
+        # GIVEN
+        board = Board([pytest.as_pique, pytest.as_coeur, pytest.roi_pique])
+        assert board.analyse.histogramme[12] == 2
+
+        # WHEN
+        board.retirer_carte(0)
+
+        # THEN
+        assert board.analyse.histogramme[12] == 1
+
     def test_board_ajouter_cartes_echec(self):
         # GIVEN
         board = Board(
@@ -0,0 +1,133 @@
+"""Implémentation des tests pour la classe CacheEvaluation"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from business_object.cache_evaluation import CacheEvaluation
+from business_object.combinaison.full import Full
+from business_object.evaluateur_combinaison import EvaluateurCombinaison
+
+
+class TestCacheEvaluation:
+    @pytest.fixture
+    @staticmethod
+    def mains():
+        return [
+            [
+                pytest.as_pique,
+                pytest.as_coeur,
+                pytest.roi_pique,
+                pytest.roi_coeur,
+                pytest.deux_trefle,
+            ],
+            [
+                pytest.dame_pique,
+                pytest.dame_coeur,
+                pytest.valet_pique,
+                pytest.dix_coeur,
+                pytest.deux_trefle,
+            ],
+            [
+                pytest.neuf_pique,
+                pytest.huit_coeur,
+                pytest.sept_pique,
+                pytest.six_coeur,
+                pytest.deux_trefle,
+            ],
+        ]
+
+    def test_cle_independante_de_l_ordre(self, mains):
+        # GIVEN
+        main = mains[0]
+
+        # WHEN
+        cle = CacheEvaluation.cle(main)
+
+        # THEN
+        assert cle == CacheEvaluation.cle(list(reversed(main)))
+        assert cle.bit_count() == 5
+        assert cle == sum(1 << carte.code for carte in main)
+
+    def test_eval_succes_et_echecs(self, mains):
+        # GIVEN
+        evaluer = Mock(side_effect=lambda cartes: len(cartes))
+        cache = CacheEvaluation(evaluer, taille_max=10)
+
+        # WHEN
+        cache.eval(mains[0])
+        cache.eval(list(reversed(mains[0])))
+        cache.eval(mains[1])
+
+        # THEN
+        assert evaluer.call_count == 2
+        assert cache.succes == 1
+        assert cache.echecs == 2
+        assert cache.taux_succes == pytest.approx(1 / 3)
+        assert len(cache) == 2
+
+    def test_eviction_lru(self, mains):
+        # GIVEN
+        cache = CacheEvaluation(lambda cartes: len(cartes), taille_max=2)
+        cache.eval(mains[0])
+        cache.eval(mains[1])
+
+        # WHEN : la main 0 est réutilisée, la main 1 devient la plus ancienne
+        cache.eval(mains[0])
+        cache.eval(mains[2])
+
+        # THEN
+        assert mains[0] in cache
+        assert mains[1] not in cache
+        assert mains[2] in cache
+        assert len(cache) == 2
+
+    def test_statistiques_et_vider(self, mains):
+        # GIVEN
+        cache = CacheEvaluation(lambda cartes: len(cartes), taille_max=5)
+        cache.eval(mains[0])
+        cache.eval(mains[0])
+
+        # WHEN
+        statistiques = cache.statistiques()
+        cache.vider()
+
+        # THEN
+        assert statistiques == {
+            "taille": 1,
+            "taille_max": 5,
+            "succes": 1,
+            "echecs": 1,
+            "taux_succes": 0.5,
+        }
+        assert len(cache) == 0
+        assert cache.succes == cache.echecs == 0
+
+    @pytest.mark.parametrize("taille_max", [0, -3, 2.5])
+    def test_taille_max_invalide(self, taille_max):
+        with pytest.raises(ValueError, match="taille maximale"):
+            CacheEvaluation(len, taille_max=taille_max)
+
+    def test_evaluer_non_appelable(self):
+        with pytest.raises(TypeError, match="appelable"):
+            CacheEvaluation("eval")
+
+    def test_eval_cache_evaluateur(self):
+        # GIVEN
+        main = [
+            pytest.as_pique,
+            pytest.as_coeur,
+            pytest.as_trefle,
+            pytest.roi_pique,
+            pytest.roi_coeur,
+        ]
+
+        # WHEN
+        premiere = EvaluateurCombinaison.eval_cache(main)
+        seconde = EvaluateurCombinaison.eval_cache(list(reversed(main)))
+
+        # THEN
+        assert isinstance(premiere, Full)
+        assert premiere is seconde
+        assert premiere == EvaluateurCombinaison.eval(main)
+        assert main in EvaluateurCombinaison.cache()
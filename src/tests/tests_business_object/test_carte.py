@@ -1,5 +1,8 @@
 """Implémentation des tests pour la classe Carte"""
 
+import pickle
+from copy import deepcopy
+
 import pytest
 
 from business_object.carte import Carte
@@ -152,3 +155,77 @@ class TestCarte:
         # WHEN / THEN
         with pytest.raises(TypeError, match=message_attendu):
             carte.valeur_egale(other)
+
+    def test_carte_instance_unique(self):
+        # GIVEN / WHEN
+        carte = Carte("Dame", "Coeur")
+
+        # THEN
+        assert carte is pytest.dame_coeur
+
+    def test_carte_code(self):
+        # GIVEN
+        carte = pytest.roi_carreau
+
+        # WHEN
+        code = carte.code
+
+        # THEN
+        assert code == 11 * 4 + 1
+        assert carte.rang == 11
+        assert carte.indice_couleur == 1
+
+    def test_carte_from_code_succes(self):
+        # GIVEN
+        codes = range(52)
+
+        # WHEN
+        cartes = [Carte.from_code(code) for code in codes]
+
+        # THEN
+        assert [carte.code for carte in cartes] == list(codes)
+        assert len(set(cartes)) == 52
+        assert Carte.from_code(0) is pytest.deux_pique
+        assert Carte.from_code(51) is pytest.as_trefle
+
+    @pytest.mark.parametrize("code", [-1, 52, "3"])
+    def test_carte_from_code_echec(self, code):
+        # GIVEN
+        message_attendu = f"Code de carte incorrect : {code}"
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match=message_attendu):
+            Carte.from_code(code)
+
+    def test_carte_copie_et_pickle(self):
+        # GIVEN
+        carte = pytest.sept_pique
+
+        # WHEN
+        copie = deepcopy(carte)
+        restauree = pickle.loads(pickle.dumps(carte))
+
+        # THEN
+        assert copie is carte
+        assert restauree is carte
+
+    def test_carte_masque(self):
+        # GIVEN
+        cartes = [pytest.deux_pique, pytest.as_trefle, pytest.trois_carreau]
+
+        # WHEN
+        masque = Carte.masque(cartes)
+
+        # THEN
+        assert masque == (1 << 0) | (1 << 51) | (1 << 5)
+        assert Carte.depuis_masque(masque) == [
+            pytest.deux_pique,
+            pytest.trois_carreau,
+            pytest.as_trefle,
+        ]
+        assert len(Carte.depuis_masque(Carte.MASQUE_PAQUET & ~masque)) == 49
+
+    @pytest.mark.parametrize("masque", [-1, 1 << 52, "3"])
+    def test_carte_depuis_masque_echec(self, masque):
+        with pytest.raises(ValueError, match="Masque de cartes incorrect"):
+            Carte.depuis_masque(masque)
@@ -0,0 +1,254 @@
+"""Implémentation des tests pour la classe CalculateurEquite"""
+
+import pytest
+
+from business_object.board import Board
+from business_object.equite import CalculateurEquite
+from business_object.evaluateur_rapide import EvaluateurRapide
+from business_object.main import Main
+
+
+class TestCalculateurEquite:
+    def test_monte_carlo_paire_as_contre_paire_rois(self):
+        # GIVEN
+        mains = [
+            Main([pytest.as_pique, pytest.as_coeur]),
+            Main([pytest.roi_pique, pytest.roi_coeur]),
+        ]
+
+        # WHEN
+        resultats = CalculateurEquite(mains).monte_carlo(n_essais=20000, graine=39)
+
+        # THEN
+        assert 79 < resultats[0].equite < 86
+        assert resultats[0].equite + resultats[1].equite == pytest.approx(100)
+        assert resultats[0].victoire + resultats[1].victoire + resultats[0].egalite == (
+            pytest.approx(100)
+        )
+        assert resultats[0].n_essais == 20000
+        bas, haut = resultats[0].intervalle
+        assert bas < resultats[0].equite < haut
+
+    def test_monte_carlo_board_complet(self):
+        # GIVEN
+        mains = [
+            Main([pytest.as_pique, pytest.as_coeur]),
+            Main([pytest.roi_pique, pytest.roi_coeur]),
+        ]
+        board = Board(
+            [
+                pytest.deux_pique,
+                pytest.sept_trefle,
+                pytest.roi_carreau,
+                pytest.trois_coeur,
+                pytest.neuf_coeur,
+            ]
+        )
+
+        # WHEN
+        resultats = CalculateurEquite(mains, board).monte_carlo(n_essais=50, graine=1)
+
+        # THEN
+        assert resultats[0].equite == 0
+        assert resultats[1].victoire == 100
+        assert resultats[1].marge == 0
+
+    def test_monte_carlo_egalite(self):
+        # GIVEN
+        mains = [
+            Main([pytest.deux_pique, pytest.trois_carreau]),
+            Main([pytest.deux_coeur, pytest.trois_trefle]),
+        ]
+        board = Board(
+            [
+                pytest.as_pique,
+                pytest.roi_carreau,
+                pytest.dame_coeur,
+                pytest.valet_trefle,
+                pytest.dix_coeur,
+            ]
+        )
+
+        # WHEN
+        resultats = CalculateurEquite(mains, board).monte_carlo(n_essais=10)
+
+        # THEN
+        assert resultats[0].egalite == resultats[1].egalite == 100
+        assert resultats[0].equite == resultats[1].equite == 50
+
+    def test_monte_carlo_graine_reproductible(self):
+        # GIVEN
+        calculateur = CalculateurEquite(
+            [Main([pytest.as_pique, pytest.roi_pique]), None, None],
+            Board([pytest.dix_pique, pytest.deux_coeur, pytest.sept_pique]),
+        )
+
+        # WHEN
+        premier = calculateur.monte_carlo(n_essais=3000, graine=7)
+        second = calculateur.monte_carlo(n_essais=3000, graine=7)
+
+        # THEN
+        assert [r.equite for r in premier] == [r.equite for r in second]
+
+    def test_monte_carlo_plusieurs_processus(self):
+        # GIVEN
+        calculateur = CalculateurEquite(
+            [
+                Main([pytest.as_pique, pytest.as_coeur]),
+                Main([pytest.sept_trefle, pytest.deux_carreau]),
+            ]
+        )
+
+        # WHEN
+        resultats = calculateur.monte_carlo(n_essais=4001, graine=3, n_processus=2)
+
+        # THEN
+        assert resultats[0].n_essais == 4001
+        assert resultats[0].equite > 80
+
+    def test_monte_carlo_budget(self):
+        # GIVEN
+        calculateur = CalculateurEquite([None, None])
+
+        # WHEN
+        resultats = calculateur.monte_carlo(n_essais=10**9, budget=0)
+
+        # THEN
+        assert resultats[0].n_essais == CalculateurEquite.TAILLE_LOT
+
+    def test_calculateur_equite_carte_en_double(self):
+        # GIVEN
+        mains = [
+            Main([pytest.as_pique, pytest.as_coeur]),
+            Main([pytest.as_pique, pytest.roi_coeur]),
+        ]
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="Une même carte ne peut apparaître plusieurs fois"):
+            CalculateurEquite(mains)
+
+    def test_calculateur_equite_une_seule_main(self):
+        # GIVEN / WHEN / THEN
+        with pytest.raises(ValueError, match="Au moins deux mains"):
+            CalculateurEquite([Main([pytest.as_pique, pytest.as_coeur])])
+
+    def test_calculateur_equite_main_incomplete(self):
+        # GIVEN / WHEN / THEN
+        with pytest.raises(ValueError, match="Une main doit contenir 2 cartes"):
+            CalculateurEquite([Main([pytest.as_pique]), None])
+
+    def test_monte_carlo_essais_incorrects(self):
+        # GIVEN
+        calculateur = CalculateurEquite([None, None])
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="Le nombre d'essais doit être positif"):
+            calculateur.monte_carlo(n_essais=0)
+
+    def test_exacte_turn_parite_evaluateur_rapide(self):
+        # GIVEN
+        mains = [
+            Main([pytest.as_pique, pytest.as_coeur]),
+            Main([pytest.roi_pique, pytest.dame_pique]),
+        ]
+        board = Board(
+            [pytest.deux_pique, pytest.sept_pique, pytest.roi_carreau, pytest.trois_coeur]
+        )
+        calculateur = CalculateurEquite(mains, board)
+
+        # WHEN
+        resultats = calculateur.exacte()
+
+        # THEN
+        victoires = 0
+        for carte in calculateur.restants:
+            cartes = board.cartes + [carte]
+            victoires += EvaluateurRapide.force(mains[0].cartes + cartes) > EvaluateurRapide.force(
+                mains[1].cartes + cartes
+            )
+        assert resultats[0].n_essais == 44
+        assert resultats[0].victoire == pytest.approx(100 * victoires / 44)
+        assert resultats[0].marge == 0
+
+    def test_exacte_main_inconnue(self):
+        # GIVEN
+        board = Board(
+            [
+                pytest.as_carreau,
+                pytest.as_trefle,
+                pytest.roi_carreau,
+                pytest.roi_trefle,
+                pytest.deux_coeur,
+            ]
+        )
+        calculateur = CalculateurEquite([Main([pytest.as_pique, pytest.as_coeur]), None], board)
+
+        # WHEN
+        resultats = calculateur.exacte()
+
+        # THEN
+        assert calculateur.n_donnes == 990
+        assert resultats[0].victoire == 100
+
+    def test_exacte_trop_de_donnes(self):
+        # GIVEN
+        calculateur = CalculateurEquite([None, None, None])
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="Trop de donnes à énumérer"):
+            calculateur.exacte()
+
+    @pytest.mark.parametrize(
+        "cartes, nom",
+        [
+            ([pytest.as_pique, pytest.as_coeur], "AA"),
+            ([pytest.roi_coeur, pytest.as_coeur], "AKs"),
+            ([pytest.as_pique, pytest.roi_coeur], "AKo"),
+            ([pytest.deux_trefle, pytest.sept_carreau], "72o"),
+            ([pytest.dix_trefle, pytest.neuf_trefle], "T9s"),
+        ],
+    )
+    def test_indice_classe(self, cartes, nom):
+        # GIVEN
+        codes = [carte.code for carte in cartes]
+
+        # WHEN
+        indice = CalculateurEquite.indice_classe(codes)
+
+        # THEN
+        assert 0 <= indice < 169
+        assert CalculateurEquite.nom_classe(indice) == nom
+
+    def test_estimation_preflop(self):
+        # GIVEN
+        mains = [
+            Main([pytest.as_pique, pytest.as_coeur]),
+            Main([pytest.roi_pique, pytest.roi_coeur]),
+        ]
+
+        # WHEN
+        resultats = CalculateurEquite(mains).estimation_preflop()
+
+        # THEN
+        # AA contre KK : 82,64 % en énumérant les 1 712 304 boards
+        assert resultats[0].equite == pytest.approx(82.64, abs=resultats[0].marge)
+        assert resultats[0].marge > 0
+        assert resultats[0].equite + resultats[1].equite == pytest.approx(100, abs=0.01)
+        assert resultats[0].egalite == resultats[1].egalite
+
+    def test_estimation_preflop_hors_table(self):
+        # GIVEN
+        mains = [Main([pytest.as_pique, pytest.as_coeur]), None]
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="table préflop"):
+            CalculateurEquite(mains).estimation_preflop()
+
+    def test_charger_table_preflop_fichier_invalide(self, tmp_path):
+        # GIVEN
+        chemin = tmp_path / "table.bin"
+        chemin.write_bytes(b"PASUNETABLE" * 4)
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="table d'équité préflop valide"):
+            CalculateurEquite.charger_table_preflop(chemin)
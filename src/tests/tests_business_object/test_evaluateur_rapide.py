@@ -0,0 +1,230 @@
+"""Implémentation des tests pour la classe EvaluateurRapide"""
+
+import random
+
+import pytest
+
+from business_object.analyse_main import AnalyseMain
+from business_object.carte import Carte
+from business_object.evaluateur_combinaison import EvaluateurCombinaison
+from business_object.evaluateur_rapide import EvaluateurRapide
+
+
+class TestEvaluateurRapide:
+    @pytest.mark.parametrize(
+        "cartes, categorie",
+        [
+            (
+                [
+                    pytest.as_coeur,
+                    pytest.roi_pique,
+                    pytest.huit_trefle,
+                    pytest.six_carreau,
+                    pytest.trois_coeur,
+                ],
+                EvaluateurRapide.SIMPLE,
+            ),
+            (
+                [
+                    pytest.roi_coeur,
+                    pytest.roi_pique,
+                    pytest.dame_carreau,
+                    pytest.dix_trefle,
+                    pytest.neuf_coeur,
+                ],
+                EvaluateurRapide.PAIRE,
+            ),
+            (
+                [
+                    pytest.roi_coeur,
+                    pytest.roi_pique,
+                    pytest.dame_coeur,
+                    pytest.dame_pique,
+                    pytest.neuf_carreau,
+                ],
+                EvaluateurRapide.DOUBLE_PAIRE,
+            ),
+            (
+                [
+                    pytest.roi_coeur,
+                    pytest.roi_pique,
+                    pytest.roi_trefle,
+                    pytest.dame_carreau,
+                    pytest.dix_trefle,
+                ],
+                EvaluateurRapide.BRELAN,
+            ),
+            (
+                [
+                    pytest.as_coeur,
+                    pytest.deux_pique,
+                    pytest.trois_carreau,
+                    pytest.quatre_trefle,
+                    pytest.cinq_coeur,
+                ],
+                EvaluateurRapide.QUINTE,
+            ),
+            (
+                [
+                    pytest.as_coeur,
+                    pytest.roi_coeur,
+                    pytest.dame_coeur,
+                    pytest.dix_coeur,
+                    pytest.deux_coeur,
+                ],
+                EvaluateurRapide.COULEUR,
+            ),
+            (
+                [
+                    pytest.roi_coeur,
+                    pytest.roi_pique,
+                    pytest.roi_carreau,
+                    pytest.dame_trefle,
+                    pytest.dame_coeur,
+                ],
+                EvaluateurRapide.FULL,
+            ),
+            (
+                [
+                    pytest.roi_coeur,
+                    pytest.roi_pique,
+                    pytest.roi_carreau,
+                    pytest.roi_trefle,
+                    pytest.dame_coeur,
+                ],
+                EvaluateurRapide.CARRE,
+            ),
+            (
+                [
+                    pytest.cinq_coeur,
+                    pytest.six_coeur,
+                    pytest.sept_coeur,
+                    pytest.huit_coeur,
+                    pytest.neuf_coeur,
+                ],
+                EvaluateurRapide.QUINTE_FLUSH,
+            ),
+        ],
+    )
+    def test_force_categorie(self, cartes, categorie):
+        # GIVEN
+        # paramètres injectés par parametrize
+
+        # WHEN
+        force = EvaluateurRapide.force(cartes)
+
+        # THEN
+        assert EvaluateurRapide.categorie(force) == categorie
+        assert EvaluateurCombinaison.eval(cartes).FORCE() == categorie
+
+    def test_force_quinte_bat_brelan(self):
+        # GIVEN
+        quinte = [
+            pytest.cinq_coeur,
+            pytest.six_pique,
+            pytest.sept_carreau,
+            pytest.huit_trefle,
+            pytest.neuf_coeur,
+        ]
+        brelan = [
+            pytest.as_coeur,
+            pytest.as_pique,
+            pytest.as_trefle,
+            pytest.roi_carreau,
+            pytest.dame_trefle,
+        ]
+
+        # WHEN / THEN
+        assert EvaluateurRapide.force(quinte) > EvaluateurRapide.force(brelan)
+
+    def test_force_double_brelan_est_un_full(self):
+        # GIVEN
+        cartes = [
+            pytest.neuf_coeur,
+            pytest.neuf_pique,
+            pytest.neuf_trefle,
+            pytest.quatre_carreau,
+            pytest.quatre_trefle,
+            pytest.quatre_coeur,
+            pytest.as_pique,
+        ]
+
+        # WHEN
+        force = EvaluateurRapide.force(cartes)
+
+        # THEN
+        assert force == EvaluateurRapide.coder(EvaluateurRapide.FULL, (7, 2))
+        assert force == EvaluateurRapide.force_combinaison(EvaluateurCombinaison.eval(cartes))
+
+    def test_force_kickers_hors_meilleure_main_ignores(self):
+        # GIVEN : seules les 5 meilleures cartes comptent
+        board = [
+            pytest.as_coeur,
+            pytest.as_pique,
+            pytest.roi_trefle,
+            pytest.dame_carreau,
+            pytest.valet_trefle,
+        ]
+        main1 = [pytest.deux_coeur, pytest.trois_pique]
+        main2 = [pytest.quatre_coeur, pytest.cinq_pique]
+
+        # WHEN / THEN
+        assert EvaluateurRapide.force(main1 + board) == EvaluateurRapide.force(main2 + board)
+
+    @pytest.mark.parametrize("n_cartes", [5, 6, 7])
+    def test_force_coherente_avec_eval(self, n_cartes):
+        # GIVEN
+        generateur = random.Random(39)
+        paquet = [Carte(v, c) for v in Carte.VALEURS() for c in Carte.COULEURS()]
+
+        for _ in range(300):
+            cartes = generateur.sample(paquet, n_cartes)
+
+            # WHEN
+            force = EvaluateurRapide.force(cartes)
+            combinaison = EvaluateurCombinaison.eval(cartes)
+
+            # THEN
+            assert force == EvaluateurRapide.force_combinaison(combinaison)
+
+    @pytest.mark.parametrize("n_board", [3, 4, 5])
+    def test_force_fusion_coherente_avec_force(self, n_board):
+        # GIVEN
+        generateur = random.Random(39)
+        paquet = [Carte(v, c) for v in Carte.VALEURS() for c in Carte.COULEURS()]
+
+        for _ in range(300):
+            cartes = generateur.sample(paquet, n_board + 2)
+            analyse_board = AnalyseMain(cartes[2:])
+
+            # WHEN
+            force = EvaluateurRapide.force_fusion(analyse_board, cartes[:2])
+
+            # THEN
+            assert force == EvaluateurRapide.force(cartes)
+
+    def test_force_fusion_nombre_cartes_incorrect(self):
+        # GIVEN
+        analyse_board = AnalyseMain([pytest.as_pique, pytest.roi_pique])
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="Entre 5 et 7 cartes sont nécessaires"):
+            EvaluateurRapide.force_fusion(analyse_board, [pytest.deux_coeur])
+
+    @pytest.mark.parametrize("n_cartes", [0, 4, 8])
+    def test_force_nombre_cartes_incorrect(self, n_cartes):
+        # GIVEN
+        paquet = [Carte(v, c) for v in Carte.VALEURS() for c in Carte.COULEURS()]
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="Entre 5 et 7 cartes sont nécessaires"):
+            EvaluateurRapide.force(paquet[:n_cartes])
+
+    def test_coder_ordre(self):
+        # GIVEN / WHEN
+        paire_as = EvaluateurRapide.coder(EvaluateurRapide.PAIRE, (12, 3, 2, 1))
+        paire_roi = EvaluateurRapide.coder(EvaluateurRapide.PAIRE, (11, 10, 9, 8))
+        double_paire = EvaluateurRapide.coder(EvaluateurRapide.DOUBLE_PAIRE, (1, 0, 2))
+
+        # THEN
+        assert paire_roi < paire_as < double_paire
@@ -0,0 +1,169 @@
+"""Implémentation des tests pour la classe EvaluateurVectoriel"""
+
+import numpy as np
+import pytest
+
+from business_object.carte import Carte
+from business_object.evaluateur_rapide import EvaluateurRapide
+from business_object.evaluateur_vectoriel import EvaluateurVectoriel
+
+
+def codes(*noms):
+    """Convertit des descriptions ('As', 'Coeur') en codes de cartes"""
+    return [Carte(valeur, couleur).code for valeur, couleur in noms]
+
+
+MAINS_PAR_CATEGORIE = [
+    (
+        codes(("As", "Coeur"), ("Roi", "Pique"), ("8", "Trêfle"), ("6", "Carreau"), ("3", "Coeur")),
+        EvaluateurRapide.SIMPLE,
+    ),
+    (
+        codes(
+            ("Roi", "Coeur"),
+            ("Roi", "Pique"),
+            ("Dame", "Carreau"),
+            ("10", "Trêfle"),
+            ("9", "Coeur"),
+            ("4", "Pique"),
+            ("2", "Trêfle"),
+        ),
+        EvaluateurRapide.PAIRE,
+    ),
+    (
+        codes(
+            ("Roi", "Coeur"),
+            ("Roi", "Pique"),
+            ("Dame", "Coeur"),
+            ("Dame", "Pique"),
+            ("9", "Carreau"),
+            ("9", "Trêfle"),
+            ("2", "Trêfle"),
+        ),
+        EvaluateurRapide.DOUBLE_PAIRE,
+    ),
+    (
+        codes(
+            ("Roi", "Coeur"),
+            ("Roi", "Pique"),
+            ("Roi", "Trêfle"),
+            ("Dame", "Carreau"),
+            ("10", "Trêfle"),
+            ("3", "Pique"),
+        ),
+        EvaluateurRapide.BRELAN,
+    ),
+    (
+        codes(
+            ("As", "Coeur"),
+            ("2", "Pique"),
+            ("3", "Carreau"),
+            ("4", "Trêfle"),
+            ("5", "Coeur"),
+            ("Roi", "Coeur"),
+            ("9", "Pique"),
+        ),
+        EvaluateurRapide.QUINTE,
+    ),
+    (
+        codes(
+            ("As", "Coeur"),
+            ("Roi", "Coeur"),
+            ("Dame", "Coeur"),
+            ("10", "Coeur"),
+            ("2", "Coeur"),
+            ("7", "Coeur"),
+            ("Valet", "Pique"),
+        ),
+        EvaluateurRapide.COULEUR,
+    ),
+    (
+        codes(
+            ("Roi", "Coeur"),
+            ("Roi", "Pique"),
+            ("Roi", "Carreau"),
+            ("3", "Trêfle"),
+            ("3", "Coeur"),
+            ("3", "Pique"),
+            ("As", "Trêfle"),
+        ),
+        EvaluateurRapide.FULL,
+    ),
+    (
+        codes(
+            ("Roi", "Coeur"),
+            ("Roi", "Pique"),
+            ("Roi", "Carreau"),
+            ("Roi", "Trêfle"),
+            ("Dame", "Coeur"),
+            ("Dame", "Pique"),
+            ("Dame", "Carreau"),
+        ),
+        EvaluateurRapide.CARRE,
+    ),
+    (
+        codes(
+            ("As", "Pique"),
+            ("2", "Pique"),
+            ("3", "Pique"),
+            ("4", "Pique"),
+            ("5", "Pique"),
+            ("6", "Coeur"),
+        ),
+        EvaluateurRapide.QUINTE_FLUSH,
+    ),
+]
+
+
+class TestEvaluateurVectoriel:
+    @pytest.mark.parametrize("main, categorie", MAINS_PAR_CATEGORIE)
+    def test_eval_batch_categorie(self, main, categorie):
+        # GIVEN
+        lot = np.array([main])
+
+        # WHEN
+        forces, categories = EvaluateurVectoriel.eval_batch(lot)
+
+        # THEN
+        assert categories[0] == categorie
+        assert forces[0] == EvaluateurRapide.force_codes(main)
+
+    @pytest.mark.parametrize("n_cartes", [5, 6, 7])
+    def test_eval_batch_parite_evaluateur_rapide(self, n_cartes):
+        # GIVEN
+        rng = np.random.default_rng(39)
+        lot = np.argsort(rng.random((5000, 52)), axis=1)[:, :n_cartes]
+
+        # WHEN
+        forces, categories = EvaluateurVectoriel.eval_batch(lot)
+
+        # THEN
+        attendues = [EvaluateurRapide.force_codes(main.tolist()) for main in lot]
+        assert forces.tolist() == attendues
+        assert categories.tolist() == [EvaluateurRapide.categorie(f) for f in attendues]
+
+    def test_eval_batch_lot_vide(self):
+        # GIVEN
+        lot = np.zeros((0, 7), dtype=np.int64)
+
+        # WHEN
+        forces, categories = EvaluateurVectoriel.eval_batch(lot)
+
+        # THEN
+        assert forces.shape == (0,)
+        assert categories.shape == (0,)
+
+    @pytest.mark.parametrize(
+        "lot, message",
+        [
+            (np.zeros((3, 4), dtype=np.int64), "Le lot doit être de dimension"),
+            (np.zeros((3, 8), dtype=np.int64), "Le lot doit être de dimension"),
+            (np.zeros(7, dtype=np.int64), "Le lot doit être de dimension"),
+            (np.array([[0, 1, 2, 3, 52]]), "compris entre 0 et 51"),
+            (np.array([[-1, 1, 2, 3, 4]]), "compris entre 0 et 51"),
+        ],
+    )
+    def test_eval_batch_echec(self, lot, message):
+        # GIVEN / WHEN / THEN
+        with pytest.raises(ValueError, match=message):
+            EvaluateurVectoriel.eval_batch(lot)
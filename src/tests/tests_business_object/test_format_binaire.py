@@ -0,0 +1,182 @@
+import pickle
+from array import array
+
+import pytest
+
+from business_object.board import Board
+from business_object.carte import Carte
+from business_object.format_binaire import FormatBinaire
+from business_object.info_manche import InfoManche
+from business_object.main import Main
+from business_object.manche import Manche
+from business_object.reserve import Reserve
+
+
+class TestFormatBinaire:
+    @pytest.fixture
+    @staticmethod
+    def manche():
+        joueurs = [101, 202, 303, 404, 505, 606]
+        manche = Manche(InfoManche(joueurs, [f"joueur{j}" for j in joueurs]), grosse_blind=20)
+        manche.preflop()
+        manche.action(101, "suivre", 5000, 10)
+        manche.action(202, "suivre", 5000, 10)
+        manche.fin_des_blinds()
+        manche.action(303, "suivre", 5000, 300)
+        manche.action(404, "se coucher")
+        return manche
+
+    def test_main(self):
+        # GIVEN
+        main = Main([Carte("As", "Pique"), Carte("10", "Coeur")])
+
+        # WHEN
+        donnees = FormatBinaire.encoder(main)
+
+        # THEN
+        assert len(donnees) == 5
+        assert FormatBinaire.decoder(donnees).cartes == main.cartes
+
+    def test_board(self):
+        # GIVEN
+        board = Board([Carte("2", "Trêfle"), Carte("Roi", "Carreau"), Carte("7", "Pique")])
+
+        # WHEN
+        decode = FormatBinaire.decoder(FormatBinaire.encoder(board))
+
+        # THEN
+        assert isinstance(decode, Board)
+        assert decode.cartes == board.cartes
+
+    def test_board_vide(self):
+        # GIVEN / WHEN
+        decode = FormatBinaire.decoder(FormatBinaire.encoder(Board([])))
+
+        # THEN
+        assert len(decode) == 0
+
+    def test_reserve(self):
+        # GIVEN
+        reserve = Reserve()
+        reserve.melanger()
+        reserve.bruler()
+        reserve.reveler(Board([]))
+
+        # WHEN
+        decode = FormatBinaire.decoder(FormatBinaire.encoder(reserve))
+
+        # THEN
+        assert decode.codes() == reserve.codes()
+        assert decode.graine == reserve.graine
+        assert len(decode) == len(reserve)
+
+    def test_info_manche(self, manche):
+        # GIVEN
+        info = manche.info
+
+        # WHEN
+        decode = FormatBinaire.decoder(FormatBinaire.encoder(info))
+
+        # THEN
+        assert decode.joueurs == info.joueurs
+        assert decode.pseudos == info.pseudos
+        assert decode.statuts == info.statuts
+        assert decode.mises == info.mises
+        assert decode.tour_couche == info.tour_couche
+        assert [m.cartes for m in decode.mains] == [m.cartes for m in info.mains]
+
+    def test_info_manche_sans_mains_ni_pseudos(self):
+        # GIVEN
+        info = InfoManche([-3, 70000])
+        info.modifier_mise(1, 123456)
+
+        # WHEN
+        decode = FormatBinaire.decoder(FormatBinaire.encoder(info))
+
+        # THEN
+        assert decode.joueurs == [-3, 70000]
+        assert decode.pseudos is None
+        assert decode.mises == [0, 123456]
+        assert decode.mains == [None, None]
+
+    def test_manche(self, manche):
+        # GIVEN
+        donnees = FormatBinaire.encoder(manche)
+
+        # WHEN
+        decode = FormatBinaire.decoder(donnees)
+
+        # THEN
+        assert isinstance(decode, Manche)
+        assert decode.etat() == manche.etat()
+
+    def test_etat_plus_compact_que_pickle(self, manche):
+        # GIVEN
+        etat = manche.etat()
+
+        # WHEN
+        donnees = FormatBinaire.encoder_etat(etat)
+
+        # THEN
+        assert FormatBinaire.decoder_etat(donnees) == etat
+        assert len(donnees) < 200
+        assert 2 * len(donnees) < len(pickle.dumps(etat))
+
+    def test_evenements(self, manche):
+        # GIVEN
+        evenements = manche.journal.evenements
+
+        # WHEN
+        decodes = [
+            FormatBinaire.decoder_evenement(FormatBinaire.encoder_evenement(e)) for e in evenements
+        ]
+
+        # THEN
+        assert decodes == evenements
+
+    def test_version_inconnue(self, manche):
+        # GIVEN
+        donnees = bytearray(FormatBinaire.encoder(manche))
+        donnees[0] = FormatBinaire.VERSION + 1
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="Version"):
+            FormatBinaire.decoder(bytes(donnees))
+
+    def test_donnees_tronquees(self, manche):
+        # GIVEN
+        donnees = FormatBinaire.encoder(manche)
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="tronquées"):
+            FormatBinaire.decoder(donnees[:-10])
+
+    def test_donnees_en_trop(self):
+        # GIVEN
+        donnees = FormatBinaire.encoder(Main([Carte("As", "Pique")])) + b"\x00"
+
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            FormatBinaire.decoder(donnees)
+
+    def test_mauvais_type(self):
+        # GIVEN
+        donnees = FormatBinaire.encoder(Board([]))
+
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            FormatBinaire.decoder_etat(donnees)
+        with pytest.raises(TypeError):
+            FormatBinaire.encoder([Carte("As", "Pique")])
+
+    def test_reserve_depuis_codes_circulaire(self):
+        # GIVEN
+        reserve = Reserve.depuis_codes(array("b", range(52)))
+        carte = reserve.retirer_carte()
+        reserve.ajouter_carte(carte)
+
+        # WHEN
+        decode = FormatBinaire.decoder(FormatBinaire.encoder(reserve))
+
+        # THEN
+        assert decode.codes() == reserve.codes() == bytes([*range(1, 52), 0])
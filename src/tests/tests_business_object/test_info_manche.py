@@ -126,4 +126,58 @@ class TestInfoManche:
         assert "mises=" in affichage
         assert "tour_couche=" in affichage
 
-    
\ No newline at end of file
+    
+    def test_indice_joueur(self):
+        # GIVEN
+        joueurs = [7, 3, 9]
+        manche = InfoManche(joueurs)
+
+        # WHEN
+        joueurs.pop(0)
+
+        # THEN
+        assert manche.joueurs == [7, 3, 9]
+        assert manche.indice_joueur(9) == 2
+        with pytest.raises(ValueError, match="Le joueur n'est pas dans cette manche"):
+            manche.indice_joueur(4)
+
+    # -------- Tests des compteurs -------- #
+
+    def test_compte_statut_suit_les_modifications(self, joueurs):
+        # GIVEN
+        manche = InfoManche(joueurs + [3])
+
+        # WHEN
+        manche.modifier_statut(0, 3)
+        manche.modifier_statut(2, 4)
+        manche.statuts[1] = 1
+
+        # THEN
+        assert manche.compte_statut(0) == 0
+        assert manche.compte_statut(1) == 1
+        assert manche.compte_statut(3) == 1
+        assert manche.compte_statut(4) == 1
+
+    def test_compte_statut_affectation_par_tranche(self, joueurs):
+        # GIVEN
+        manche = InfoManche(joueurs)
+
+        # WHEN
+        manche.statuts[:] = [3, 3]
+
+        # THEN
+        assert manche.compte_statut(3) == 2
+        assert manche.compte_statut(0) == 0
+
+    def test_pot_suit_les_mises(self, joueurs):
+        # GIVEN
+        manche = InfoManche(joueurs)
+
+        # WHEN
+        manche.modifier_mise(0, 50)
+        manche.modifier_mise(1, 100)
+        manche.modifier_mise(0, 100)
+
+        # THEN
+        assert manche.pot == 200
+        assert manche.pot == sum(manche.mises)
@@ -0,0 +1,197 @@
+import pytest
+
+from business_object.info_manche import InfoManche
+from business_object.journal_manche import JournalManche
+from business_object.manche import Manche
+from business_object.melangeur import Melangeur
+
+
+class TestJournalManche:
+    @staticmethod
+    def lancer_manche(joueurs=(1, 2, 3)):
+        manche = Manche(InfoManche(list(joueurs), [f"j{j}" for j in joueurs]), grosse_blind=20)
+        manche.preflop()
+        manche.action(joueurs[0], "suivre", 1000, 10)
+        manche.action(joueurs[1], "suivre", 1000, 10)
+        manche.fin_des_blinds()
+        return manche
+
+    @staticmethod
+    def jouer_jusqu_a_la_fin(manche):
+        while not manche.fin:
+            indice = manche.indice_joueur_actuel
+            id_joueur = manche.info.joueurs[indice]
+            mises = manche.info.mises
+            if manche.info.statuts[indice] == 0 and mises[indice] == max(mises):
+                manche.action(id_joueur, "checker", 1000)
+            else:
+                manche.action(id_joueur, "suivre", 1000)
+
+    def test_journal_ouverture(self):
+        # GIVEN
+        manche = Manche(InfoManche([1, 2], ["a", "b"]), grosse_blind=20)
+
+        # WHEN
+        evenements = manche.journal.evenements
+
+        # THEN
+        assert evenements == [(JournalManche.OUVERTURE, (1, 2), ("a", "b"), 20)]
+
+    def test_journal_manche_complete(self):
+        # GIVEN
+        manche = self.lancer_manche()
+
+        # WHEN
+        self.jouer_jusqu_a_la_fin(manche)
+
+        # THEN
+        types = [evenement[0] for evenement in manche.journal.evenements]
+        assert types[:5] == [
+            JournalManche.OUVERTURE,
+            JournalManche.PREFLOP,
+            JournalManche.ACTION,
+            JournalManche.ACTION,
+            JournalManche.BLINDS,
+        ]
+        assert types.count(JournalManche.TOUR) == 3
+        assert types[-1] == JournalManche.FIN
+        assert list(manche.journal.evenements[-1][1]) == [c.code for c in manche.board.cartes]
+
+    def test_reconstruire_rejoue_la_manche(self):
+        # GIVEN
+        manche = self.lancer_manche()
+        self.jouer_jusqu_a_la_fin(manche)
+
+        # WHEN
+        copie = manche.journal.reconstruire()
+
+        # THEN
+        assert copie.etat() == manche.etat()
+        assert copie.resultat.gains == manche.resultat.gains
+
+    def test_reconstruire_etat_intermediaire(self):
+        # GIVEN
+        manche = self.lancer_manche()
+        n = len(manche.journal)
+        etat = manche.etat()
+        self.jouer_jusqu_a_la_fin(manche)
+
+        # WHEN
+        copie = manche.journal.reconstruire(n)
+
+        # THEN
+        assert copie.etat() == etat
+        assert not copie.fin
+
+    def test_reconstruire_depuis_instantane(self, monkeypatch):
+        # GIVEN
+        monkeypatch.setattr(JournalManche, "INTERVALLE_INSTANTANES", 4)
+        manche = self.lancer_manche()
+        self.jouer_jusqu_a_la_fin(manche)
+        instantanes = manche.journal.instantanes
+
+        # WHEN
+        copie = manche.journal.reconstruire()
+
+        # THEN
+        assert instantanes
+        assert copie.etat() == manche.etat()
+        assert copie.journal.evenements == manche.journal.evenements
+
+    def test_depuis_etat(self):
+        # GIVEN
+        manche = self.lancer_manche()
+        etat = manche.etat()
+
+        # WHEN
+        copie = Manche.depuis_etat(etat)
+
+        # THEN
+        assert copie.etat() == etat
+        assert copie.info.mains[0].cartes == manche.info.mains[0].cartes
+
+    def test_action_refusee_non_journalisee(self):
+        # GIVEN
+        manche = self.lancer_manche()
+        evenements = manche.journal.evenements
+
+        # WHEN
+        with pytest.raises(Exception):
+            manche.action(2, "checker", 1000)
+
+        # THEN
+        assert manche.journal.evenements == evenements
+
+    def test_reconstruire_hors_journal(self):
+        # GIVEN
+        manche = self.lancer_manche()
+
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            manche.journal.reconstruire(len(manche.journal) + 1)
+
+    def test_reconstruire_journal_incoherent(self):
+        # GIVEN
+        manche = self.lancer_manche()
+        self.jouer_jusqu_a_la_fin(manche)
+        journal = manche.journal.copie(len(manche.journal) - 1)
+        journal.ajouter((JournalManche.FIN, (0, 1, 2, 3, 4)))
+
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            journal.reconstruire()
+
+    def test_historique(self):
+        # GIVEN
+        manche = self.lancer_manche()
+
+        # WHEN
+        historique = manche.journal.historique()
+
+        # THEN
+        assert historique[0] == {
+            "type": "ouverture",
+            "joueurs": [1, 2, 3],
+            "pseudos": ["j1", "j2", "j3"],
+            "grosse_blind": 20,
+        }
+        graine = manche.journal.evenements[1][1]
+        assert historique[1] == {"type": "preflop", "engagement": Melangeur.engagement(graine)}
+        assert historique[2] == {
+            "type": "action",
+            "joueur": 1,
+            "action": "suivre",
+            "credit": 1000,
+            "relance": 10,
+        }
+        assert historique[-1] == {"type": "blinds"}
+
+    def test_historique_graine_apres_la_fin(self):
+        # GIVEN
+        manche = self.lancer_manche()
+        graine = manche.journal.evenements[1][1]
+
+        # WHEN
+        self.jouer_jusqu_a_la_fin(manche)
+        historique = manche.journal.historique()
+
+        # THEN
+        assert historique[1] == {
+            "type": "preflop",
+            "engagement": Melangeur.engagement(graine),
+            "graine": graine.hex(),
+        }
+        assert historique[-1]["type"] == "fin"
+
+    def test_historique_engagement_verifiable(self):
+        # GIVEN : l'engagement publié pendant la manche
+        manche = self.lancer_manche()
+        engagement = manche.journal.historique()[1]["engagement"]
+
+        # WHEN
+        self.jouer_jusqu_a_la_fin(manche)
+        graine = manche.journal.historique()[1]["graine"]
+
+        # THEN : la graine révélée correspond à l'engagement publié avant la fin
+        assert engagement == manche.engagement
+        assert Melangeur.engagement(bytes.fromhex(graine)) == engagement
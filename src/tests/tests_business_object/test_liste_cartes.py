@@ -4,6 +4,7 @@ from abc import ABC
 
 import pytest
 
+from business_object.carte import Carte
 from business_object.liste_cartes import AbstractListeCartes
 
 
@@ -194,3 +195,85 @@ class AbstractListeCartesTest(ABC):
         # WHEN / THEN
         with pytest.raises(Exception, match=message_attendu):
             liste.retirer_carte()
+
+    def test_liste_cartes_vue_lecture_seule(self, liste_cartes):
+        # GIVEN
+        vue = liste_cartes.cartes
+
+        # WHEN
+        liste_cartes.ajouter_carte(pytest.cinq_trefle)
+
+        # THEN : la vue suit la liste sans être modifiable
+        assert vue is liste_cartes.cartes
+        assert vue == [pytest.as_pique, pytest.dix_coeur, pytest.cinq_trefle]
+        assert vue[-1] == pytest.cinq_trefle
+        with pytest.raises(AttributeError):
+            vue.append(pytest.deux_pique)
+        with pytest.raises(TypeError):
+            vue[0] = pytest.deux_pique
+
+    def test_liste_cartes_vue_concatenation(self, liste_cartes):
+        # GIVEN
+        autres = [pytest.roi_trefle]
+
+        # WHEN
+        apres = liste_cartes.cartes + autres
+        avant = autres + liste_cartes.cartes
+
+        # THEN
+        assert apres == [pytest.as_pique, pytest.dix_coeur, pytest.roi_trefle]
+        assert avant == [pytest.roi_trefle, pytest.as_pique, pytest.dix_coeur]
+        assert len(liste_cartes) == 2
+
+    def test_liste_cartes_copie(self, liste_cartes):
+        # GIVEN
+        copie = liste_cartes.copie()
+
+        # WHEN
+        copie.clear()
+
+        # THEN
+        assert liste_cartes.cartes == [pytest.as_pique, pytest.dix_coeur]
+        assert isinstance(copie, list)
+
+    def test_liste_cartes_masque(self, liste_cartes):
+        # GIVEN
+        masque_initial = Carte.masque([pytest.as_pique, pytest.dix_coeur])
+        assert liste_cartes.masque == masque_initial
+
+        # WHEN
+        liste_cartes.ajouter_carte(pytest.cinq_trefle)
+        liste_cartes.retirer_carte(0)
+
+        # THEN
+        assert liste_cartes.masque == Carte.masque([pytest.dix_coeur, pytest.cinq_trefle])
+        assert pytest.cinq_trefle in liste_cartes
+        assert pytest.as_pique not in liste_cartes
+        assert "As de Pique" not in liste_cartes
+
+    def test_liste_cartes_masque_doublons(self, cls):
+        # GIVEN
+        liste_cartes = cls([pytest.as_pique, pytest.as_pique], False)
+
+        # WHEN
+        liste_cartes.retirer_carte(0)
+
+        # THEN : un exemplaire reste présent
+        assert pytest.as_pique in liste_cartes
+        liste_cartes.retirer_carte(0)
+        assert liste_cartes.masque == 0
+
+    def test_liste_cartes_init_copie_la_liste(self, cls):
+        # GIVEN
+        cartes = [pytest.as_pique, pytest.dix_coeur]
+        liste_cartes = cls(cartes, False)
+
+        # WHEN
+        cartes.append(pytest.cinq_trefle)
+        cartes.pop(0)
+
+        # THEN
+        assert liste_cartes.cartes == [pytest.as_pique, pytest.dix_coeur]
+        assert liste_cartes.masque == Carte.masque([pytest.as_pique, pytest.dix_coeur])
+        assert pytest.as_pique in liste_cartes
+        assert pytest.cinq_trefle not in liste_cartes
@@ -1,10 +1,16 @@
+from array import array
+from unittest.mock import patch
+
 import pytest
 
 from business_object.board import Board
 from business_object.carte import Carte
+from business_object.evaluateur_combinaison import EvaluateurCombinaison
 from business_object.info_manche import InfoManche
 from business_object.main import Main
 from business_object.manche import Manche
+from business_object.melangeur import Melangeur
+from business_object.reserve import Reserve
 
 
 class Test_Manche:
@@ -48,7 +54,7 @@ class Test_Manche:
 
     @staticmethod
     def remplir_board(manche):
-        manche.board.cartes.clear()
+        manche._Manche__board = Board([])
         for carte in [
             Carte("2", "Pique"),
             Carte("5", "Trêfle"),
@@ -69,6 +75,32 @@ class Test_Manche:
         assert manche.board is not None
         assert manche.reserve is not None
 
+    def test_manche_preflop_reserve_deja_melangee(self, info_manche):
+        # GIVEN
+        reserve = Reserve.depuis_codes(array("b", range(51, -1, -1)))
+        manche = Manche(info_manche, grosse_blind=10, reserve=reserve)
+
+        # WHEN
+        manche.preflop()
+
+        # THEN : l'ordre du paquet fourni est conservé
+        assert manche.reserve is reserve
+        assert manche.info.mains[0].cartes == [Carte.from_code(51), Carte.from_code(48)]
+        assert len(reserve) == 46
+
+    def test_manche_preflop_graine_et_engagement(self, info_manche):
+        # GIVEN
+        manche = Manche(info_manche, grosse_blind=10)
+        assert manche.graine is None
+
+        # WHEN
+        manche.preflop()
+
+        # THEN : la graine permet de reconstituer la donne
+        rejoue = Reserve.depuis_graine(manche.graine)
+        assert rejoue.retirer_carte() == manche.info.mains[0].cartes[0]
+        assert manche.engagement == Melangeur.engagement(manche.graine)
+
     def test_manche_indice_joueur(self, manche, joueurs):
         # THEN
         assert manche.indice_joueur(joueurs[0]) == 0
@@ -223,6 +255,73 @@ class Test_Manche:
         assert gains[manche.info.joueurs[0]] == 200
         assert gains == {1: 200}
 
+    def test_manche_gains_side_pots(self, manche):
+        # GIVEN : le joueur 1 (paire de 5) bat le joueur 0 (paire de 2) et le joueur 2
+        manche.info.statuts[:] = [4, 4, 2]
+        manche.info.mises[:] = [50, 100, 200]
+        Test_Manche.remplir_board(manche)
+
+        # WHEN
+        pots = manche.pots()
+        gains = manche.gains()
+
+        # THEN
+        assert [(p.montant, p.eligibles) for p in pots] == [
+            (150, (0, 1, 2)),
+            (100, (1, 2)),
+            (100, (2,)),
+        ]
+        assert gains == {1: 0, 2: 250, 3: 100}
+
+    def test_manche_resultat_calcule_une_fois(self, manche):
+        # GIVEN
+        manche.info._InfoManche__pseudos = ["a", "b", "c"]
+        manche.info.statuts[:] = [2, 2, 3]
+        manche.info.mises[:] = [100, 100, 40]
+        Test_Manche.remplir_board(manche)
+        manche._Manche__fin = True
+
+        # WHEN
+        with patch.object(
+            EvaluateurCombinaison, "eval_cache", wraps=EvaluateurCombinaison.eval_cache
+        ) as eval_cache:
+            resultat = manche.resultat
+            texte = manche.resultats()
+            gains = manche.terminer_manche()
+
+        # THEN
+        assert manche.resultat is resultat
+        assert eval_cache.call_count == 2
+        assert resultat.classement == (2, 1, 3)
+        assert resultat.combinaisons[2] is None
+        assert gains == {1: 0, 2: 240, 3: 0}
+        assert "c : [?]" in texte
+        assert "b : 240" in texte
+        assert manche.terminer_manche() is None
+
+    def test_manche_resultat_un_seul_joueur(self, manche):
+        # GIVEN
+        manche.info._InfoManche__pseudos = ["a", "b", "c"]
+        manche.info.statuts[:] = [3, 2, 3]
+        manche.info.mises[:] = [20, 60, 20]
+        manche._Manche__fin = True
+
+        # WHEN
+        resultat = manche.resultat
+
+        # THEN
+        assert not resultat.abattage
+        assert resultat.gains == {2: 100}
+        assert resultat.to_dict()["pots"] == [
+            {"montant": 100, "niveau": 60, "eligibles": [1], "contributeurs": [0, 1, 2]}
+        ]
+        assert manche.resultats().endswith("b : 100")
+
+    def test_manche_resultat_manche_non_terminee(self, manche):
+        # GIVEN / WHEN / THEN
+        with pytest.raises(Exception, match="La manche n'est pas encore terminée"):
+            manche.resultat
+
     def test_manche_init_info_type_error(self):
         # GIVEN/WHEN/THEN
         with pytest.raises(TypeError):
@@ -267,7 +366,7 @@ class Test_Manche:
 
     def test_classement_ex_aequo(self, manche):
         # GIVEN
-        manche.board.cartes.clear()
+        manche._Manche__board = Board([])
         board = [
             Carte("As", "Coeur"),
             Carte("As", "Pique"),
@@ -295,6 +394,30 @@ class Test_Manche:
         # THEN
         assert classement[1] != classement[0]
 
+    def test_classement_quinte_bat_brelan(self, manche):
+        # GIVEN
+        for carte in [
+            Carte("2", "Pique"),
+            Carte("5", "Trêfle"),
+            Carte("8", "Carreau"),
+            Carte("9", "Trêfle"),
+            Carte("Roi", "Carreau"),
+        ]:
+            manche.board.ajouter_carte(carte)
+        manche.info.assignation_mains(
+            [
+                Main([Carte("Roi", "Coeur"), Carte("Roi", "Pique")]),
+                Main([Carte("6", "Pique"), Carte("7", "Coeur")]),
+                Main([Carte("Dame", "Pique"), Carte("Valet", "Coeur")]),
+            ]
+        )
+
+        # WHEN
+        classement = manche.classement()
+
+        # THEN
+        assert classement == [2, 1, 3]
+
     def test_manche_init_info_type_error_1(self):
         # GIVEN/WHEN/THEN
         with pytest.raises(TypeError):
@@ -0,0 +1,92 @@
+"""Implémentation des tests pour la classe Melangeur"""
+
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from business_object.melangeur import Melangeur
+
+
+class TestMelangeur:
+    def test_mode_deterministe_reproductible(self):
+        # GIVEN
+        melangeur_1 = Melangeur(39)
+        melangeur_2 = Melangeur("39")
+
+        # WHEN
+        paquets_1 = melangeur_1.paquets(3)
+        paquets_2 = melangeur_2.paquets(3)
+
+        # THEN
+        assert not melangeur_1.securise
+        assert paquets_1 == paquets_2
+        assert paquets_1[0][1] != paquets_1[1][1]
+        assert Melangeur(40).paquet() != paquets_1[0]
+
+    def test_mode_sur_entropie_par_blocs(self):
+        # GIVEN
+        melangeur = Melangeur()
+
+        # WHEN
+        with patch("business_object.melangeur.os.urandom", wraps=__import__("os").urandom) as mock:
+            graines = [melangeur.nouvelle_graine() for _ in range(200)]
+
+        # THEN : 200 graines de 32 octets tiennent dans deux blocs de 4096 octets
+        assert melangeur.securise
+        assert mock.call_count == 2
+        assert len(set(graines)) == 200
+        assert all(len(graine) == Melangeur.TAILLE_GRAINE for graine in graines)
+
+    def test_paquet_depuis_graine(self):
+        # GIVEN
+        graine, paquet = Melangeur().paquet()
+
+        # WHEN
+        rejoue = Melangeur.paquet_depuis_graine(graine)
+
+        # THEN
+        assert rejoue == paquet
+        assert sorted(paquet) == list(range(52))
+
+    def test_melanger_liste(self):
+        # GIVEN
+        elements = list("abcdefgh")
+
+        # WHEN
+        graine = Melangeur(1).melanger(elements)
+
+        # THEN
+        assert sorted(elements) == list("abcdefgh")
+        copie = list("abcdefgh")
+        Melangeur.permuter(graine, copie)
+        assert copie == elements
+
+    def test_engagement(self):
+        # GIVEN
+        graine = bytes(32)
+
+        # WHEN
+        engagement = Melangeur.engagement(graine)
+
+        # THEN
+        assert engagement == "66687aadf862bd776c8fc18b8e9f8e20089714856ee233b3902a591d0d5f2925"
+
+    def test_repartition_uniforme(self):
+        # GIVEN
+        melangeur = Melangeur(7)
+
+        # WHEN : carte du dessus de 5200 paquets
+        dessus = Counter(paquet[0] for _, paquet in melangeur.paquets(5200))
+
+        # THEN : environ 100 fois chaque carte
+        assert len(dessus) == 52
+        assert 55 < min(dessus.values()) and max(dessus.values()) < 150
+
+    def test_graine_type_incorrect(self):
+        with pytest.raises(TypeError, match="La graine doit être"):
+            Melangeur(3.5)
+
+    def test_paquets_nombre_incorrect(self):
+        with pytest.raises(ValueError, match="Le nombre de paquets"):
+            Melangeur(1).paquets(-1)
@@ -0,0 +1,115 @@
+"""Implémentation des tests pour la classe PoolPaquets"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from business_object.melangeur import Melangeur
+from business_object.pool_paquets import PoolPaquets
+from business_object.reserve import Reserve
+
+
+class TestPoolPaquets:
+    def test_remplir_et_prendre(self):
+        # GIVEN
+        pool = PoolPaquets(taille_max=4)
+
+        # WHEN
+        n_ajoutes = pool.remplir()
+        graine, paquet = pool.prendre()
+
+        # THEN
+        assert n_ajoutes == 4
+        assert pool.taille == 3
+        assert sorted(paquet) == list(range(52))
+        assert paquet == Melangeur.paquet_depuis_graine(graine)
+        assert pool.ruptures == 0
+        assert pool.paquets_servis == 1
+        assert pool.debit_melange > 0
+
+    def test_prendre_pool_vide(self):
+        # GIVEN
+        pool = PoolPaquets(taille_max=2)
+
+        # WHEN
+        _, paquet = pool.prendre()
+
+        # THEN
+        assert sorted(paquet) == list(range(52))
+        assert pool.ruptures == 1
+        assert pool.taille == 0
+
+    def test_melangeur_deterministe(self):
+        # GIVEN
+        pool_1 = PoolPaquets(taille_max=2, melangeur=Melangeur(39))
+        pool_2 = PoolPaquets(taille_max=2, melangeur=Melangeur(39))
+        pool_1.remplir()
+
+        # WHEN
+        reserve_1 = pool_1.reserve()
+        reserve_2 = pool_2.reserve()
+
+        # THEN : même graine, même paquet, qu'il vienne du pool ou non
+        assert isinstance(reserve_1, Reserve)
+        assert reserve_1.graine == reserve_2.graine
+        assert reserve_1.cartes == reserve_2.cartes
+
+    def test_remplissage_en_tache_de_fond(self):
+        # GIVEN
+        pool = PoolPaquets(taille_max=3)
+
+        # WHEN
+        pool.demarrer()
+        pool.prendre()
+        limite = time.time() + 5
+        while pool.taille < 3 and time.time() < limite:
+            time.sleep(0.01)
+        actif = pool.actif
+        pool.arreter()
+
+        # THEN
+        assert actif
+        assert not pool.actif
+        assert pool.taille == 3
+
+    def test_statistiques(self):
+        # GIVEN
+        pool = PoolPaquets(taille_max=2)
+        pool.prendre()
+
+        # WHEN
+        statistiques = pool.statistiques()
+
+        # THEN
+        assert statistiques["taille"] == 0
+        assert statistiques["taille_max"] == 2
+        assert statistiques["actif"] is False
+        assert statistiques["paquets_servis"] == 1
+        assert statistiques["ruptures"] == 1
+
+    def test_debit_remplissage_fenetre_glissante(self):
+        # GIVEN : 4 paquets remis dans le pool 10 secondes après sa création
+        instant = [1000.0]
+        with patch("business_object.pool_paquets.time.monotonic", lambda: instant[0]):
+            pool = PoolPaquets(taille_max=4)
+            instant[0] += 10
+            pool.remplir()
+
+            # WHEN
+            debit_initial = pool.debit_remplissage
+            instant[0] += 50
+            debit_minute = pool.debit_remplissage
+            instant[0] += 60
+            debit_apres_fenetre = pool.debit_remplissage
+
+        # THEN
+        assert debit_initial == pytest.approx(0.4)
+        assert debit_minute == pytest.approx(4 / 60)
+        assert debit_apres_fenetre == 0
+        assert pool.debit_melange > 0
+
+    @pytest.mark.parametrize("taille_max", [0, -1, "10"])
+    def test_taille_max_invalide(self, taille_max):
+        with pytest.raises(ValueError, match="La taille maximale du pool"):
+            PoolPaquets(taille_max)
@@ -0,0 +1,115 @@
+import pytest
+
+from business_object.pot import Pot
+
+
+class TestPot:
+    def test_construire_pot_unique(self):
+        # GIVEN
+        mises = [100, 100, 100]
+
+        # WHEN
+        pots = Pot.construire(mises, [0, 1, 2])
+
+        # THEN
+        assert pots == [Pot(300, 100, (0, 1, 2), (0, 1, 2))]
+
+    def test_construire_side_pots(self):
+        # GIVEN : le joueur 0 est à tapis pour 50, les deux autres vont à 200
+        mises = [50, 200, 200]
+
+        # WHEN
+        pots = Pot.construire(mises, [0, 1, 2])
+
+        # THEN
+        assert [p.montant for p in pots] == [150, 300]
+        assert pots[0].eligibles == (0, 1, 2)
+        assert pots[1].eligibles == (1, 2)
+        assert sum(p.montant for p in pots) == sum(mises)
+
+    def test_construire_joueur_couche_fusionne_les_couches(self):
+        # GIVEN : le joueur 1 s'est couché après avoir misé 20
+        mises = [100, 20, 100]
+
+        # WHEN
+        pots = Pot.construire(mises, [0, 2])
+
+        # THEN
+        assert len(pots) == 1
+        assert pots[0].montant == 220
+        assert pots[0].eligibles == (0, 2)
+        assert pots[0].contributeurs == (0, 1, 2)
+
+    def test_construire_trois_side_pots(self):
+        # GIVEN : deux tapis à des niveaux différents, le joueur 3 couché à 10
+        mises = [30, 100, 60, 10, 100]
+
+        # WHEN
+        pots = Pot.construire(mises, [0, 1, 2, 4])
+
+        # THEN
+        assert pots == [
+            Pot(130, 30, (0, 1, 2, 4), (0, 1, 2, 3, 4)),
+            Pot(90, 60, (1, 2, 4), (1, 2, 4)),
+            Pot(80, 100, (1, 4), (1, 4)),
+        ]
+
+    def test_jetons_indivisibles_pot_fusionne(self):
+        # GIVEN : les joueurs 0 et 1 se sont couchés ; 2 et 3 sont ex-aequo. Les couches
+        # 5 (1 x 5) et 3 (1 x 3) forment un seul pot de 8
+        mises = [1, 1, 2, 2, 2]
+        pots = Pot.construire(mises, [2, 3])
+
+        # WHEN
+        gains = pots[0].repartir([0, 0, 1, 1, 0])
+
+        # THEN : le pot est partagé en une fois (4 / 4), pas couche par couche (3 + 2 / 2 + 1)
+        assert len(pots) == 1
+        assert gains == {2: 4, 3: 4}
+
+    def test_construire_sans_mise(self):
+        # GIVEN / WHEN
+        pots = Pot.construire([0, 0], [0, 1])
+
+        # THEN
+        assert pots == []
+
+    def test_init_sans_eligible(self):
+        # GIVEN / WHEN / THEN
+        with pytest.raises(ValueError, match="Au moins un joueur"):
+            Pot(100, 50, (), (0, 1))
+
+    def test_repartir_meilleur_rang(self):
+        # GIVEN
+        pot = Pot(300, 100, (0, 1, 2), (0, 1, 2))
+
+        # WHEN
+        gains = pot.repartir([2, 1, 3])
+
+        # THEN
+        assert gains == {1: 300}
+
+    def test_repartir_ex_aequo_jetons_indivisibles(self):
+        # GIVEN
+        pot = Pot(301, 100, (0, 1, 2), (0, 1, 2))
+
+        # WHEN
+        gains = pot.repartir([1, 3, 1])
+
+        # THEN
+        assert gains == {0: 151, 2: 150}
+
+    def test_to_dict(self):
+        # GIVEN
+        pot = Pot(150, 50, (0, 1), (0, 1, 2))
+
+        # WHEN
+        donnees = pot.to_dict()
+
+        # THEN
+        assert donnees == {
+            "montant": 150,
+            "niveau": 50,
+            "eligibles": [0, 1],
+            "contributeurs": [0, 1, 2],
+        }
@@ -1,10 +1,13 @@
 """Implémentation des tests pour la classe Reserve"""
 
+from array import array
+
 import pytest
 
 from business_object.board import Board
 from business_object.carte import Carte
 from business_object.main import Main
+from business_object.melangeur import Melangeur
 from business_object.reserve import Reserve
 from tests.tests_business_object.test_liste_cartes import AbstractListeCartesTest
 
@@ -109,3 +112,107 @@ class TestReserve(AbstractListeCartesTest):
         # WHEN / THEN
         with pytest.raises(ValueError, match=message_attendu):
             reserve.distribuer(n_joueurs)
+
+    def test_reserve_bruler_paquet_complet(self):
+        # GIVEN
+        reserve = Reserve()
+        premieres = reserve.cartes[:3]
+
+        # WHEN
+        for _ in range(3):
+            reserve.bruler()
+
+        # THEN
+        assert len(reserve) == 52
+        assert reserve.cartes[-3:] == premieres
+        assert reserve.cartes[0] == Carte.from_code(3)
+
+    def test_reserve_tableau_circulaire(self):
+        # GIVEN
+        reserve = Reserve([pytest.as_pique, pytest.roi_pique, pytest.dame_pique], False)
+
+        # WHEN : le curseur fait plusieurs fois le tour du tableau
+        for _ in range(100):
+            reserve.ajouter_carte(reserve.retirer_carte())
+
+        # THEN
+        assert reserve.cartes == [pytest.roi_pique, pytest.dame_pique, pytest.as_pique]
+
+    def test_reserve_ajouter_au_dela_de_52(self):
+        # GIVEN
+        reserve = Reserve()
+        reserve.bruler()
+
+        # WHEN
+        reserve.ajouter_carte(pytest.as_pique)
+
+        # THEN
+        assert len(reserve) == 53
+        assert reserve.cartes[0] == Carte.from_code(1)
+        assert reserve.cartes[-2:] == [Carte.from_code(0), pytest.as_pique]
+
+    def test_reserve_retirer_carte_milieu(self):
+        # GIVEN
+        reserve = Reserve([pytest.as_pique, pytest.roi_pique, pytest.dame_pique], False)
+        reserve.bruler()
+
+        # WHEN
+        carte = reserve.retirer_carte(1)
+
+        # THEN
+        assert carte == pytest.dame_pique
+        assert reserve.cartes == [pytest.roi_pique, pytest.as_pique]
+
+    def test_reserve_melanger_conserve_les_cartes(self):
+        # GIVEN
+        reserve = Reserve()
+        reserve.bruler()
+        reserve.retirer_carte()
+
+        # WHEN
+        reserve.melanger()
+
+        # THEN
+        assert len(reserve) == 51
+        assert {carte.code for carte in reserve.cartes} == set(range(52)) - {1}
+
+    def test_reserve_depuis_codes(self):
+        # GIVEN
+        codes = array("b", [51, 0, 7])
+
+        # WHEN
+        reserve = Reserve.depuis_codes(codes)
+
+        # THEN
+        assert reserve.cartes == [Carte.from_code(51), Carte.from_code(0), Carte.from_code(7)]
+        reserve.bruler()
+        assert reserve.retirer_carte() == Carte.from_code(0)
+
+    def test_reserve_depuis_codes_type_incorrect(self):
+        with pytest.raises(TypeError, match="array"):
+            Reserve.depuis_codes([1, 2, 3])
+
+    def test_reserve_melanger_rejouable(self):
+        # GIVEN
+        reserve = Reserve()
+
+        # WHEN
+        graine = reserve.melanger(Melangeur(39))
+
+        # THEN
+        assert reserve.graine == graine
+        assert Reserve.depuis_graine(graine) == reserve
+
+    def test_reserve_masque_cartes_restantes(self):
+        # GIVEN
+        reserve = Reserve()
+
+        # WHEN
+        mains = reserve.distribuer(3)
+        reserve.bruler()
+
+        # THEN : le paquet restant et les mains distribuées sont disjoints et couvrent tout
+        masque_mains = mains[0].masque | mains[1].masque | mains[2].masque
+        assert reserve.masque & masque_mains == 0
+        assert reserve.masque | masque_mains == Carte.MASQUE_PAQUET
+        assert Reserve.depuis_codes(array("b", [3, 3])).masque == 1 << 3
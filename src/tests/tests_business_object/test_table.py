@@ -124,6 +124,29 @@ class TestTable:
         # THEN
         assert table.id_joueurs == table_attendue.id_joueurs
 
+    def test_table_ajouter_joueur_deja_present(self):
+        # GIVEN
+        table = Table(4, 10, id_joueurs=[1, 2])
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="Le joueur 2 est déjà à la table"):
+            table.ajouter_joueur(2)
+
+    def test_table_indice_joueur_suit_les_sieges(self):
+        # GIVEN
+        table = Table(4, 10, id_joueurs=[1, 2, 3])
+
+        # WHEN
+        table.rotation_dealer()
+        table.retirer_joueur(0)
+        table.ajouter_joueur(4)
+
+        # THEN
+        assert table.id_joueurs == [3, 1, 4]
+        assert [table.indice_joueur(j) for j in table.id_joueurs] == [0, 1, 2]
+        with pytest.raises(ValueError, match="n'est pas à la table"):
+            table.indice_joueur(2)
+
     def test_table_lancer_manche_succes(self):
         # GIVEN
 
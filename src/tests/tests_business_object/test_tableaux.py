@@ -0,0 +1,101 @@
+import copy
+
+import pytest
+
+from business_object.tableaux import TableauMises, TableauStatuts, TableauTours
+
+
+class TestTableaux:
+    def test_tableau_egal_a_une_liste(self):
+        # GIVEN
+        statuts = TableauStatuts([0, 2, 3])
+
+        # THEN
+        assert statuts == [0, 2, 3]
+        assert statuts != [0, 2]
+        assert repr(statuts) == "[0, 2, 3]"
+
+    def test_tableau_taille_fixe(self):
+        # GIVEN
+        mises = TableauMises([0, 0])
+
+        # WHEN / THEN
+        with pytest.raises(TypeError, match="taille fixe"):
+            mises.append(10)
+        with pytest.raises(TypeError, match="taille fixe"):
+            del mises[0]
+        with pytest.raises(ValueError, match="taille fixe"):
+            mises[:] = [1, 2, 3]
+        with pytest.raises(TypeError, match="taille fixe"):
+            mises += TableauMises([10])
+        with pytest.raises(TypeError, match="taille fixe"):
+            mises *= 2
+
+    def test_statuts_byteswap_interdit(self):
+        # GIVEN
+        statuts = TableauStatuts([0, 1])
+
+        # WHEN / THEN
+        with pytest.raises(TypeError):
+            statuts.byteswap()
+        assert statuts == [0, 1]
+        assert statuts.compte(1) == 1
+
+    def test_statuts_comptes_et_version(self):
+        # GIVEN
+        statuts = TableauStatuts([0, 0, 0])
+
+        # WHEN
+        statuts[0] = 3
+        statuts[0] = 3
+        statuts[-1] = 4
+
+        # THEN
+        assert statuts.compte(0) == 1
+        assert statuts.compte(3) == 1
+        assert statuts.compte(4) == 1
+        assert statuts.version == 2
+
+    def test_statuts_valeur_incorrecte(self):
+        # GIVEN
+        statuts = TableauStatuts([0, 0])
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="Statut incorrect"):
+            statuts[0] = 7
+        assert statuts.compte(0) == 2
+
+    def test_mises_total(self):
+        # GIVEN
+        mises = TableauMises([10, 20])
+
+        # WHEN
+        mises[0] = 50
+        mises[:] = [mises[0], 70]
+
+        # THEN
+        assert mises.total == 120
+
+    def test_tours_none(self):
+        # GIVEN
+        tours = TableauTours([None, None])
+
+        # WHEN
+        tours[1] = 2
+
+        # THEN
+        assert tours == [None, 2]
+        assert tours[0] is None
+        assert list(tours) == [None, 2]
+
+    def test_copie_conserve_les_compteurs(self):
+        # GIVEN
+        statuts = TableauStatuts([3, 0])
+
+        # WHEN
+        copie = copy.deepcopy(statuts)
+        copie[1] = 3
+
+        # THEN
+        assert copie.compte(3) == 2
+        assert statuts.compte(3) == 1
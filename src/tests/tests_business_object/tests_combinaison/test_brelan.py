@@ -155,4 +155,4 @@ class Test_Brelan:
 
     def test_brelan_force(self):
         # THEN
-        assert Brelan.FORCE() == 4
+        assert Brelan.FORCE() == 3
@@ -1,5 +1,6 @@
 import pytest
 
+from business_object.carte import Carte
 from business_object.combinaison.combinaison import AbstractCombinaison
 
 
@@ -52,17 +53,18 @@ def test_combinaison_init(hauteur, kicker, expected_hauteur, expected_kicker):
         (("5", "4"), ("3", "2")),
     ],
 )
-def test_combinaison_valeur_comparaison(hauteur, kicker):
+def test_combinaison_cle_valeurs(hauteur, kicker):
     # GIVEN: Une combinaison avec hauteur et kicker
     c = CombinaisonTest(hauteur, kicker)
+    valeurs = [hauteur] if isinstance(hauteur, str) else list(hauteur)
+    valeurs += [kicker] if isinstance(kicker, str) else list(kicker or ())
 
-    # WHEN: On calcule la valeur de comparaison
-    force, hauteur_vals, kicker_vals = c._valeur_comparaison()
+    # WHEN: On décode la clé de comparaison
+    force, rangs = c.cle >> 20, [(c.cle >> (16 - 4 * i)) & 0xF for i in range(5)]
 
-    # THEN
-    assert isinstance(force, int)
-    assert all(isinstance(v, int) for v in hauteur_vals)
-    assert all(isinstance(k, int) for k in kicker_vals)
+    # THEN: FORCE puis les rangs des valeurs, complétés par des zéros
+    assert force == c.FORCE()
+    assert rangs == [Carte.VALEURS().index(v) for v in valeurs] + [0] * (5 - len(valeurs))
 
 
 def test_combinaison_comparaison():
@@ -150,3 +152,35 @@ def test_combinaison_lt_autre_type():
     # __lt__ renvoie NotImplemented → Python doit lever TypeError
     with pytest.raises(TypeError):
         c < other
+
+
+def test_combinaison_cle():
+    # GIVEN
+    c = CombinaisonTest("As", ("Roi", "2"))
+
+    # WHEN
+    cle = c.cle
+
+    # THEN: FORCE puis les rangs sur 4 bits, alignés à gauche
+    assert cle == (1 << 20) | (12 << 16) | (11 << 12) | (0 << 8)
+
+
+def test_combinaison_cle_tri_et_hash():
+    # GIVEN
+    c1 = CombinaisonTest("As", "Roi")
+    c2 = CombinaisonTest("As", "Dame")
+    c3 = CombinaisonTest("As", "Roi")
+    c4 = CombinaisonTest("Roi", None)
+
+    # WHEN
+    tri = sorted([c1, c4, c2])
+
+    # THEN
+    assert tri == [c4, c2, c1]
+    assert hash(c1) == hash(c3)
+    assert len({c1, c2, c3, c4}) == 3
+
+
+def test_combinaison_init_valeur_invalide():
+    with pytest.raises(ValueError, match="Valeur de la carte incorrecte"):
+        CombinaisonTest("Cavalier")
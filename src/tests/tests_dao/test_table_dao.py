@@ -0,0 +1,151 @@
+import os
+
+import pytest
+
+from business_object.journal_manche import JournalManche
+from business_object.table import Table
+from dao.table_dao import TableDao
+
+
+class TestTableDao:
+    @pytest.fixture
+    @staticmethod
+    def chemin(tmp_path):
+        return str(tmp_path / "tables.sqlite")
+
+    @staticmethod
+    def table_en_jeu():
+        table = Table(joueurs_max=6, grosse_blind=20, numero_table=7, id_joueurs=[1, 2, 3])
+        table.nouvelle_manche(["a", "b", "c"])
+        table.manche.preflop()
+        table.manche.action(1, "suivre", 1000, 10)
+        table.manche.action(2, "suivre", 1000, 10)
+        table.manche.fin_des_blinds()
+        return table
+
+    @staticmethod
+    def jouer(manche, n_actions):
+        for _ in range(n_actions):
+            indice = manche.indice_joueur_actuel
+            mises = manche.info.mises
+            if manche.info.statuts[indice] == 0 and mises[indice] == max(mises):
+                manche.action(manche.info.joueurs[indice], "checker", 1000)
+            else:
+                manche.action(manche.info.joueurs[indice], "suivre", 1000)
+
+    def test_charger_table_sans_manche(self, chemin):
+        # GIVEN
+        dao = TableDao(chemin)
+        table = Table(joueurs_max=4, grosse_blind=10, numero_table=3, id_joueurs=[5, 8])
+        dao.sauvegarder(table)
+        dao.fermer()
+
+        # WHEN
+        restauree = TableDao(chemin).charger(3)
+
+        # THEN
+        assert restauree.numero_table == 3
+        assert restauree.joueurs_max == 4
+        assert restauree.grosse_blind == 10
+        assert restauree.id_joueurs == [5, 8]
+        assert restauree.manche is None
+
+    def test_charger_table_inconnue(self, chemin):
+        # GIVEN
+        dao = TableDao(chemin)
+
+        # WHEN
+        table = dao.charger(42)
+
+        # THEN
+        assert table is None
+
+    def test_charger_manche_en_cours(self, chemin):
+        # GIVEN
+        dao = TableDao(chemin)
+        table = self.table_en_jeu()
+        dao.sauvegarder(table)
+        self.jouer(table.manche, 2)
+        dao.sauvegarder(table)
+        dao.fermer()
+
+        # WHEN
+        restauree = TableDao(chemin).charger(7)
+
+        # THEN
+        assert restauree.manche.etat() == table.manche.etat()
+        assert restauree.manche.journal.evenements == table.manche.journal.evenements
+
+    def test_sauvegarde_incrementale_apres_restauration(self, chemin, monkeypatch):
+        # GIVEN
+        monkeypatch.setattr(JournalManche, "INTERVALLE_INSTANTANES", 4)
+        dao = TableDao(chemin)
+        table = self.table_en_jeu()
+        self.jouer(table.manche, 3)
+        dao.sauvegarder(table)
+        dao.fermer()
+
+        # WHEN
+        dao = TableDao(chemin)
+        restauree = dao.charger(7)
+        self.jouer(restauree.manche, 2)
+        self.jouer(table.manche, 2)
+        dao.sauvegarder(restauree)
+        dao.fermer()
+
+        # THEN
+        finale = TableDao(chemin).charger(7)
+        assert finale.manche.etat() == table.manche.etat()
+        assert finale.manche.journal.instantanes
+
+    def test_nouvelle_manche_remplace_le_journal(self, chemin):
+        # GIVEN
+        dao = TableDao(chemin)
+        table = self.table_en_jeu()
+        dao.sauvegarder(table)
+
+        # WHEN
+        table.nouvelle_manche(["a", "b", "c"])
+        dao.sauvegarder(table)
+        dao.fermer()
+
+        # THEN
+        restauree = TableDao(chemin).charger(7)
+        assert len(restauree.manche.journal) == 1
+
+    def test_supprimer(self, chemin):
+        # GIVEN
+        dao = TableDao(chemin)
+        dao.sauvegarder(self.table_en_jeu())
+
+        # WHEN
+        supprimee = dao.supprimer(7)
+
+        # THEN
+        assert supprimee
+        assert dao.charger(7) is None
+        assert dao.numeros_tables() == []
+        assert not dao.supprimer(7)
+
+    def test_entetes_sans_manche(self, chemin):
+        # GIVEN
+        dao = TableDao(chemin)
+        dao.sauvegarder(self.table_en_jeu())
+        dao.sauvegarder(Table(joueurs_max=4, grosse_blind=10, numero_table=3))
+
+        # WHEN
+        entetes = dao.entetes()
+
+        # THEN
+        assert [str(table) for table in entetes] == [
+            "Table 3, grosse blind : 10 (0/4)",
+            "Table 7, grosse blind : 20 (3/6)",
+        ]
+        assert all(table.manche is None for table in entetes)
+
+    def test_fichier_lisible_par_le_proprietaire(self, chemin):
+        # GIVEN / WHEN
+        TableDao(chemin).sauvegarder(self.table_en_jeu())
+
+        # THEN : le journal contient la graine du mélange, donc les cartes à venir
+        assert os.stat(chemin).st_mode & 0o777 == 0o600
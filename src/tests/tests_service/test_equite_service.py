@@ -0,0 +1,121 @@
+from unittest.mock import patch
+
+import pytest
+
+from business_object.board import Board
+from business_object.equite import CalculateurEquite
+from business_object.info_manche import InfoManche
+from business_object.main import Main
+from business_object.manche import Manche
+from service.equite_service import EquiteService
+from utils.verrous import GestionnaireVerrous
+
+
+class TestEquiteService:
+    @pytest.fixture
+    @staticmethod
+    def manche():
+        manche = Manche(InfoManche([1, 2, 3]), grosse_blind=10)
+        manche.info.assignation_mains(
+            [
+                Main([pytest.as_pique, pytest.as_coeur]),
+                Main([pytest.roi_pique, pytest.roi_coeur]),
+                Main([pytest.sept_trefle, pytest.deux_carreau]),
+            ]
+        )
+        return manche
+
+    def test_equite_manche_point_de_vue_admin(self, manche):
+        # GIVEN
+        manche.info.modifier_statut(2, 3)
+
+        # WHEN
+        resultats = EquiteService().equite_manche(manche, n_essais=5000, graine=39)
+
+        # THEN
+        assert list(resultats) == [1, 2]
+        assert resultats[1].equite > resultats[2].equite
+
+    def test_equite_manche_point_de_vue_joueur(self, manche):
+        # GIVEN
+        manche._Manche__board = Board([pytest.roi_carreau, pytest.roi_trefle, pytest.deux_coeur])
+
+        # WHEN
+        resultats = EquiteService().equite_manche(manche, id_joueur=2, n_essais=2000, graine=1)
+
+        # THEN
+        assert list(resultats) == [1, 2, 3]
+        assert resultats[2].equite > 90
+
+    def test_equite_manche_cartes_non_distribuees(self):
+        # GIVEN
+        manche = Manche(InfoManche([1, 2]), grosse_blind=10)
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="pas encore été distribuées"):
+            EquiteService().equite_manche(manche)
+
+    def test_equite_manche_joueur_couche(self, manche):
+        # GIVEN
+        manche.info.modifier_statut(0, 3)
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="n'est pas en lice"):
+            EquiteService().equite_manche(manche, id_joueur=1)
+
+    def test_equite_table_sans_manche(self):
+        # GIVEN
+        table = type("Table", (), {"manche": None, "numero_table": 4})()
+
+        with patch("service.equite_service.TableService") as MockTS:
+            MockTS.return_value.table_par_numero.return_value = table
+
+            # WHEN / THEN
+            with pytest.raises(ValueError, match="Aucune manche n'est en cours"):
+                EquiteService().equite_table(4)
+
+    def test_equite_table_calcul_hors_verrou(self, manche):
+        # GIVEN
+        table = type("Table", (), {"manche": manche, "numero_table": 1301})()
+        gestionnaire = GestionnaireVerrous()
+        acquisitions = gestionnaire.statistiques()["table"]["acquisitions"]
+        verrous = gestionnaire.statistiques()["verrous"]
+        pendant_calcul = []
+
+        def calculateur(mains, board):
+            pendant_calcul.append(gestionnaire.statistiques()["verrous"])
+            return CalculateurEquite(mains, board)
+
+        with (
+            patch("service.equite_service.TableService") as MockTS,
+            patch("service.equite_service.CalculateurEquite", side_effect=calculateur),
+        ):
+            MockTS.return_value.table_par_numero.return_value = table
+
+            # WHEN
+            resultats = EquiteService().equite_table(1301)
+
+        # THEN
+        assert gestionnaire.statistiques()["table"]["acquisitions"] == acquisitions + 1
+        assert pendant_calcul == [verrous]
+        assert set(resultats) == {1, 2, 3}
+
+    def test_equite_manche_exacte_a_la_river(self, manche):
+        # GIVEN
+        manche._Manche__board = Board(
+            [
+                pytest.roi_carreau,
+                pytest.roi_trefle,
+                pytest.deux_coeur,
+                pytest.neuf_pique,
+                pytest.quatre_coeur,
+            ]
+        )
+
+        # WHEN
+        resultats = EquiteService().equite_manche(manche)
+
+        # THEN
+        assert resultats[2].victoire == 100
+        assert resultats[2].marge == 0
+        assert resultats[2].n_essais == 1
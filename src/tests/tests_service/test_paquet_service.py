@@ -0,0 +1,37 @@
+import threading
+import time
+
+from business_object.pool_paquets import PoolPaquets
+from service.paquet_service import PaquetService
+
+
+class TestPaquetService:
+    def test_pool_cree_une_seule_fois(self, monkeypatch):
+        # GIVEN: un pool long à créer (sans remplissage), et aucun pool existant
+        crees = []
+
+        class PoolLent(PoolPaquets):
+            def __init__(self, *args):
+                time.sleep(0.05)
+                super().__init__(*args)
+                crees.append(self)
+
+            def demarrer(self):
+                pass
+
+        monkeypatch.setattr("service.paquet_service.PoolPaquets", PoolLent)
+        monkeypatch.setattr(PaquetService, "_PaquetService__pool", None)
+        pools = []
+
+        # WHEN: plusieurs premières demandes simultanées
+        threads = [
+            threading.Thread(target=lambda: pools.append(PaquetService().pool())) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        # THEN
+        assert len(crees) == 1
+        assert pools == crees * 4
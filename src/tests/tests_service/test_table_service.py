@@ -0,0 +1,268 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from business_object.joueur import Joueur
+from dao.table_dao import TableDao
+from service.action_service import ActionService
+from service.joueur_service import JoueurService
+from service.table_service import TableService
+
+
+class TestTableService:
+    @pytest.fixture
+    @staticmethod
+    def registre(monkeypatch):
+        TableService.vider()
+        monkeypatch.setattr(TableService, "compteur_tables", 0)
+        monkeypatch.setattr(TableService, "sauvegarde", None)
+        yield TableService()
+        TableService.vider()
+
+    @pytest.fixture
+    @staticmethod
+    def service(registre, tmp_path):
+        TableService.activer_sauvegarde(TableDao(str(tmp_path / "tables.sqlite")))
+        return registre
+
+    @staticmethod
+    def redemarrer(monkeypatch):
+        """Simule un redémarrage : les tables en mémoire sont perdues"""
+        TableService.vider()
+        monkeypatch.setattr(TableService, "compteur_tables", 0)
+        TableService.activer_sauvegarde(TableService.sauvegarde)
+
+    @staticmethod
+    def asseoir(service, numero_table, id_joueur):
+        joueur = Joueur(id_joueur, f"joueur{id_joueur}", 1000, "France")
+        with patch("service.table_service.JoueurService") as mock_joueur_service:
+            mock_joueur_service.return_value.trouver_par_id.return_value = joueur
+            service.ajouter_joueur(numero_table, id_joueur)
+
+    def test_table_par_numero(self, registre):
+        # GIVEN
+        tables = [registre.creer_table(joueurs_max=4, grosse_blind=10) for _ in range(3)]
+
+        # WHEN
+        table = registre.table_par_numero(2)
+
+        # THEN
+        assert table is tables[1]
+        assert registre.liste_tables() == tables
+
+    def test_table_par_numero_inconnu(self, registre):
+        # GIVEN
+        registre.creer_table(joueurs_max=4, grosse_blind=10)
+
+        # WHEN / THEN
+        with pytest.raises(ValueError, match="Aucune table existante"):
+            registre.table_par_numero(2)
+
+    def test_table_par_affichage(self, registre):
+        # GIVEN
+        registre.creer_table(joueurs_max=4, grosse_blind=10)
+        table = registre.creer_table(joueurs_max=6, grosse_blind=20)
+
+        # WHEN
+        trouvee = registre.table_par_affichage(str(table))
+
+        # THEN
+        assert trouvee is table
+        with pytest.raises(ValueError):
+            registre.table_par_affichage("Table 2, grosse blind : 40 (0/6)")
+        with pytest.raises(ValueError):
+            registre.table_par_affichage("Salon 2")
+
+    def test_tables_par_blind(self, registre):
+        # GIVEN
+        t1 = registre.creer_table(joueurs_max=4, grosse_blind=10)
+        registre.creer_table(joueurs_max=4, grosse_blind=20)
+        t3 = registre.creer_table(joueurs_max=6, grosse_blind=10)
+
+        # WHEN
+        tables = registre.tables_par_blind(10)
+
+        # THEN
+        assert tables == [t1, t3]
+        assert registre.tables_par_blind(50) == []
+
+    def test_tables_ouvertes(self, registre):
+        # GIVEN
+        pleine = registre.creer_table(joueurs_max=2, grosse_blind=10)
+        ouverte = registre.creer_table(joueurs_max=3, grosse_blind=10)
+        autre_blind = registre.creer_table(joueurs_max=2, grosse_blind=20)
+        for id_joueur in (1, 2):
+            self.asseoir(registre, pleine.numero_table, id_joueur)
+        self.asseoir(registre, ouverte.numero_table, 3)
+
+        # WHEN
+        tables = registre.tables_ouvertes()
+
+        # THEN
+        assert tables == [ouverte, autre_blind]
+        assert registre.tables_ouvertes(grosse_blind=10) == [ouverte]
+
+    def test_supprimer_table_desindexe(self, registre):
+        # GIVEN
+        table = registre.creer_table(joueurs_max=4, grosse_blind=10)
+
+        # WHEN
+        registre.supprimer_table(table.numero_table)
+
+        # THEN
+        assert registre.liste_tables() == []
+        assert registre.tables_par_blind(10) == []
+        assert registre.tables_ouvertes() == []
+
+    @staticmethod
+    def espionner_chargements(monkeypatch):
+        """Numéros des tables restaurées entièrement (TableDao.charger) à partir de maintenant"""
+        charges = []
+        charger = TableDao.charger
+
+        def espion(dao, numero_table):
+            charges.append(numero_table)
+            return charger(dao, numero_table)
+
+        monkeypatch.setattr(TableDao, "charger", espion)
+        return charges
+
+    def test_table_restauree_a_la_demande(self, service, monkeypatch):
+        # GIVEN
+        service.creer_table(joueurs_max=4, grosse_blind=10)
+        service.creer_table(joueurs_max=6, grosse_blind=20)
+        self.redemarrer(monkeypatch)
+        charges = self.espionner_chargements(monkeypatch)
+
+        # WHEN
+        table = TableService().table_par_numero(2)
+
+        # THEN
+        assert table.grosse_blind == 20
+        assert charges == [2]
+        assert TableService.compteur_tables == 2
+        assert TableService().table_par_numero(2) is table
+        assert charges == [2]
+
+    def test_table_sans_joueur_non_rechargee(self, service):
+        # GIVEN : une table vide (len(table) == 0) déjà en mémoire
+        table = service.creer_table(joueurs_max=4, grosse_blind=10)
+
+        # WHEN
+        trouvee = service.table_par_numero(table.numero_table)
+
+        # THEN : la table vivante est renvoyée, pas une copie relue dans la sauvegarde
+        assert trouvee is table
+
+    def test_index_reconstruits_au_demarrage(self, service, monkeypatch):
+        # GIVEN
+        pleine = service.creer_table(joueurs_max=1, grosse_blind=10)
+        self.asseoir(service, pleine.numero_table, 1)
+        service.creer_table(joueurs_max=4, grosse_blind=10)
+        service.creer_table(joueurs_max=4, grosse_blind=20)
+        self.redemarrer(monkeypatch)
+        charges = self.espionner_chargements(monkeypatch)
+
+        # WHEN
+        ouvertes = TableService().tables_ouvertes()
+        par_blind = TableService().tables_par_blind(10)
+
+        # THEN
+        assert [table.numero_table for table in ouvertes] == [2, 3]
+        assert [table.numero_table for table in par_blind] == [1, 2]
+        assert TableService().tables_ouvertes(grosse_blind=20)[0].numero_table == 3
+        assert charges == []
+
+    def test_liste_tables_sans_restauration(self, service, monkeypatch):
+        # GIVEN
+        service.creer_table(joueurs_max=4, grosse_blind=10)
+        service.creer_table(joueurs_max=6, grosse_blind=20)
+        self.redemarrer(monkeypatch)
+        charges = self.espionner_chargements(monkeypatch)
+
+        # WHEN
+        affichages = TableService().affichages_tables()
+
+        # THEN
+        assert affichages == [
+            "Table 1, grosse blind : 10 (0/4)",
+            "Table 2, grosse blind : 20 (0/6)",
+        ]
+        assert charges == []
+
+    def test_table_supprimee_non_restauree(self, service, monkeypatch):
+        # GIVEN
+        service.creer_table(joueurs_max=4, grosse_blind=10)
+        service.supprimer_table(1)
+
+        # WHEN
+        self.redemarrer(monkeypatch)
+
+        # THEN
+        with pytest.raises(ValueError):
+            TableService().table_par_numero(1)
+
+    @pytest.fixture
+    @staticmethod
+    def base_joueurs(monkeypatch):
+        """Joueurs lus dans une base simulée : chaque connexion renvoie un nouvel objet"""
+        ids = {"alice": 1, "bob": 2}
+        dao = Mock()
+        dao.se_connecter.side_effect = lambda pseudo: Joueur(ids[pseudo], pseudo, 1000, "France")
+        for module in ("service.joueur_service", "service.credit_service"):
+            monkeypatch.setattr(f"{module}.JoueurDao", Mock(return_value=dao))
+        monkeypatch.setattr("service.table_service.MancheService", Mock())
+        monkeypatch.setattr("service.table_service.MancheJoueurService", Mock())
+        monkeypatch.setattr(JoueurService, "_joueurs_connectes", {})
+        return ids
+
+    @staticmethod
+    def jouer_jusqu_a_la_fin(numero_table):
+        while not (manche := TableService().table_par_numero(numero_table).manche).fin:
+            indice = manche.indice_joueur_actuel
+            id_joueur = manche.info.joueurs[indice]
+            mises = manche.info.mises
+            if manche.info.statuts[indice] == 0 and mises[indice] == max(mises):
+                ActionService().checker(id_joueur)
+            else:
+                ActionService().suivre(id_joueur)
+
+    def test_joueur_retrouve_sa_table_a_la_connexion(self, service, base_joueurs, monkeypatch):
+        # GIVEN
+        table = service.creer_table(joueurs_max=4, grosse_blind=10)
+        service.ajouter_joueur(table.numero_table, JoueurService().se_connecter("alice").id_joueur)
+        self.redemarrer(monkeypatch)
+        monkeypatch.setattr(JoueurService, "_joueurs_connectes", {})
+
+        # WHEN
+        alice = JoueurService().se_connecter("alice")
+        bob = JoueurService().se_connecter("bob")
+
+        # THEN
+        assert alice.numero_table == table.numero_table
+        assert bob.numero_table is None
+
+    def test_manche_reprise_apres_redemarrage(self, service, base_joueurs, monkeypatch):
+        # GIVEN : une manche commencée, puis un redémarrage du serveur
+        table = service.creer_table(joueurs_max=4, grosse_blind=10)
+        for pseudo in base_joueurs:
+            service.ajouter_joueur(1, JoueurService().se_connecter(pseudo).id_joueur)
+        service.lancer_manche(1)
+        manche = table.manche
+        ActionService().suivre(manche.info.joueurs[manche.indice_joueur_actuel])
+
+        self.redemarrer(monkeypatch)
+        monkeypatch.setattr(JoueurService, "_joueurs_connectes", {})
+        for pseudo in base_joueurs:
+            JoueurService().se_connecter(pseudo)
+
+        # WHEN : les joueurs terminent la manche
+        self.jouer_jusqu_a_la_fin(1)
+        TableService().terminer_manche(1)
+
+        # THEN
+        reprise = TableService().table_par_numero(1)
+        assert reprise is not table
+        assert reprise.manche.journal.evenements[: len(manche.journal)] == manche.journal.evenements
+        assert reprise.manche.fin
+        assert sum(reprise.manche.resultat.gains.values()) == sum(reprise.manche.info.mises)
@@ -0,0 +1,85 @@
+"""Implémentation des tests pour le module simulateur"""
+
+import pytest
+
+from simulation.simulateur import CreditsMemoire, Simulateur, fusionner, main, simuler
+
+
+class TestSimulateur:
+    def test_credits_memoire(self):
+        # GIVEN
+        credits = CreditsMemoire({1: 100, 2: 50})
+
+        # WHEN
+        credits.debiter(1, 30)
+        credits.crediter(2, 30)
+
+        # THEN
+        assert credits.credit(1) == 70
+        assert credits.total == 150
+        with pytest.raises(ValueError, match="Débit impossible"):
+            credits.debiter(2, 1000)
+
+    def test_simulateur_strategie_inconnue(self):
+        # GIVEN / WHEN / THEN
+        with pytest.raises(ValueError, match="Stratégies inconnues"):
+            Simulateur(["passive", "bluff"])
+
+    def test_jouer_conserve_les_jetons(self):
+        # GIVEN
+        simulateur = Simulateur(["force", "aleatoire", "agressive", "passive"], graine=39)
+
+        # WHEN
+        rapport = simulateur.jouer(200)
+
+        # THEN
+        assert rapport["mains"] == 200
+        assert rapport["erreurs"] == 0, rapport["exemples_erreurs"]
+        assert rapport["mains_non_conservees"] == 0
+        assert rapport["actions"] > 200
+        assert set(rapport["durees_par_tour"]) == {"preflop", "flop", "turn", "river", "abattage"}
+
+    def test_jouer_reproductible(self):
+        # GIVEN
+        strategies = ["aleatoire", "aleatoire", "force"]
+
+        # WHEN
+        premier = Simulateur(strategies, graine=7)
+        second = Simulateur(strategies, graine=7)
+        premier.jouer(50)
+        second.jouer(50)
+
+        # THEN
+        assert [premier.credits.credit(j) for j in (1, 2, 3)] == [
+            second.credits.credit(j) for j in (1, 2, 3)
+        ]
+
+    def test_fusionner(self):
+        # GIVEN
+        rapports = [Simulateur(["passive", "agressive"], graine=g).jouer(20) for g in (1, 2)]
+
+        # WHEN
+        rapport = fusionner(rapports, duree=1.0)
+
+        # THEN
+        assert rapport["mains"] == 40
+        assert rapport["processus"] == 2
+        assert rapport["mains_par_seconde"] == 40
+        assert rapport["jetons_conserves"]
+
+    def test_simuler_deux_processus(self):
+        # GIVEN / WHEN
+        rapport = simuler(["aleatoire", "force", "passive"], n_mains=30, n_processus=2, graine=3)
+
+        # THEN
+        assert rapport["mains"] == 30
+        assert rapport["processus"] == 2
+        assert rapport["erreurs"] == 0
+
+    def test_main_code_retour(self, capsys):
+        # GIVEN / WHEN
+        code = main(["--mains", "20", "passive", "agressive"])
+
+        # THEN
+        assert code == 0
+        assert '"mains": 20' in capsys.readouterr().out
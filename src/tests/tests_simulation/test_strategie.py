@@ -0,0 +1,74 @@
+"""Implémentation des tests pour le module strategie"""
+
+import pytest
+
+from business_object.info_manche import InfoManche
+from business_object.manche import Manche
+from simulation.strategie import (
+    STRATEGIES,
+    StrategieAgressive,
+    StrategiePassive,
+    actions_possibles,
+    relance_max,
+)
+
+
+class TestStrategie:
+    @pytest.fixture
+    @staticmethod
+    def manche():
+        manche = Manche(InfoManche([1, 2, 3]), grosse_blind=20)
+        manche.preflop()
+        return manche
+
+    def test_actions_possibles_checker(self, manche):
+        # GIVEN / WHEN
+        actions = actions_possibles(manche, 0, 1000)
+
+        # THEN
+        assert actions == ["checker", "suivre", "all-in", "se coucher"]
+
+    def test_actions_possibles_mise_a_suivre(self, manche):
+        # GIVEN
+        manche.info.mises[:] = [0, 100, 0]
+        manche.info.statuts[:] = [1, 2, 1]
+
+        # WHEN / THEN
+        assert actions_possibles(manche, 0, 1000) == ["suivre", "all-in", "se coucher"]
+        assert actions_possibles(manche, 0, 100) == ["all-in", "se coucher"]
+        assert relance_max(manche, 0, 150) == 49
+
+    def test_passive_suit(self, manche):
+        # GIVEN
+        manche.info.mises[:] = [0, 100, 0]
+        manche.info.statuts[:] = [1, 2, 1]
+
+        # WHEN
+        decision = StrategiePassive().decider(manche, 0, 1000)
+
+        # THEN
+        assert decision == ("suivre", 0)
+
+    def test_agressive_relance_plafonnee(self, manche):
+        # GIVEN
+        plafond = StrategieAgressive.PLAFOND_RELANCES * manche.grosse_blind
+        manche.info.mises[:] = [0, plafond, 0]
+        manche.info.statuts[:] = [1, 2, 1]
+
+        # WHEN
+        decision = StrategieAgressive().decider(manche, 0, 10 * plafond)
+
+        # THEN
+        assert decision == ("suivre", 0)
+
+    @pytest.mark.parametrize("nom", list(STRATEGIES))
+    def test_decision_autorisee(self, manche, nom):
+        # GIVEN
+        strategie = STRATEGIES[nom](39)
+
+        # WHEN
+        action, relance = strategie.decider(manche, 0, 1000)
+
+        # THEN
+        assert action in actions_possibles(manche, 0, 1000)
+        assert 0 <= relance <= relance_max(manche, 0, 1000)
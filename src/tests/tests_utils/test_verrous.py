@@ -0,0 +1,164 @@
+import threading
+
+import pytest
+
+from utils.verrous import GestionnaireVerrous
+
+
+class TestGestionnaireVerrous:
+    @staticmethod
+    def attentes(type_verrou):
+        return GestionnaireVerrous().statistiques()[type_verrou]["attentes"]
+
+    def test_tables_differentes_en_parallele(self):
+        # GIVEN
+        gestionnaire = GestionnaireVerrous()
+        dans_table_1 = threading.Event()
+        liberer = threading.Event()
+
+        def occuper_table_1():
+            with gestionnaire.verrouiller(tables=[1001]):
+                dans_table_1.set()
+                liberer.wait(5)
+
+        thread = threading.Thread(target=occuper_table_1)
+        thread.start()
+        dans_table_1.wait(5)
+        attentes = self.attentes("table")
+
+        # WHEN
+        with gestionnaire.verrouiller(tables=[1002]):
+            parallele = not liberer.is_set()
+        liberer.set()
+        thread.join(5)
+
+        # THEN
+        assert parallele
+        assert self.attentes("table") == attentes
+
+    def test_meme_table_serialisee(self):
+        # GIVEN
+        gestionnaire = GestionnaireVerrous()
+        ordre = []
+        attentes = self.attentes("table")
+
+        def jouer(nom):
+            with gestionnaire.verrouiller(tables=[1003]):
+                ordre.append(f"debut {nom}")
+                ordre.append(f"fin {nom}")
+
+        # WHEN
+        with gestionnaire.verrouiller(tables=[1003]):
+            thread = threading.Thread(target=jouer, args=("thread",))
+            thread.start()
+            thread.join(0.05)
+            ordre.append("principal")
+        thread.join(5)
+
+        # THEN
+        assert ordre == ["principal", "debut thread", "fin thread"]
+        assert self.attentes("table") >= attentes + 1
+
+    def test_reentrant(self):
+        # GIVEN
+        gestionnaire = GestionnaireVerrous()
+
+        # WHEN
+        with (
+            gestionnaire.verrouiller(tables=[1004], joueurs=[7]),
+            gestionnaire.verrouiller(tables=[1004]),
+            gestionnaire.verrouiller(joueurs=[7, 8]),
+        ):
+            reussi = True
+
+        # THEN
+        assert reussi
+
+    def test_ordre_non_respecte(self):
+        # GIVEN
+        gestionnaire = GestionnaireVerrous()
+
+        # WHEN / THEN
+        with gestionnaire.verrouiller(joueurs=[5]):
+            with (
+                pytest.raises(RuntimeError, match="Ordre de verrouillage"),
+                gestionnaire.verrouiller(tables=[1005]),
+            ):
+                pass
+            with pytest.raises(RuntimeError), gestionnaire.verrouiller(joueurs=[4]):
+                pass
+
+    def test_verrous_liberes_apres_exception(self):
+        # GIVEN
+        gestionnaire = GestionnaireVerrous()
+        with pytest.raises(ValueError), gestionnaire.verrouiller(tables=[1006], joueurs=[9]):
+            raise ValueError
+
+        # WHEN
+        libre = threading.Event()
+
+        def prendre():
+            with gestionnaire.verrouiller(tables=[1006], joueurs=[9]):
+                libre.set()
+
+        thread = threading.Thread(target=prendre)
+        thread.start()
+        thread.join(5)
+
+        # THEN
+        assert libre.is_set()
+        # L'ordre est de nouveau libre pour le thread courant
+        with gestionnaire.verrouiller(tables=[1]):
+            pass
+
+    def test_none_ignore(self):
+        # GIVEN
+        gestionnaire = GestionnaireVerrous()
+        acquisitions = gestionnaire.statistiques()["table"]["acquisitions"]
+
+        # WHEN
+        with gestionnaire.verrouiller(tables=[None], joueurs=[None]):
+            pass
+
+        # THEN
+        assert gestionnaire.statistiques()["table"]["acquisitions"] == acquisitions
+
+    def test_verrous_oublies_apres_liberation(self):
+        # GIVEN
+        gestionnaire = GestionnaireVerrous()
+        verrous = gestionnaire.statistiques()["verrous"]
+
+        # WHEN
+        with gestionnaire.verrouiller(tables=[1101, 1102], joueurs=[1103]):
+            pendant = gestionnaire.statistiques()["verrous"]
+
+        # THEN
+        assert pendant == verrous + 3
+        assert gestionnaire.statistiques()["verrous"] == verrous
+
+    def test_verrouiller_joueur_relit_la_table(self):
+        # GIVEN
+        gestionnaire = GestionnaireVerrous()
+        lectures = iter([1201, 1202, 1202])
+        tables_lues = []
+
+        def table_du_joueur(id_joueur):
+            tables_lues.append(next(lectures))
+            return tables_lues[-1]
+
+        # WHEN
+        with gestionnaire.verrouiller_joueur(1203, table_du_joueur):
+            # La table 1201, lue avant le changement de table, n'est plus verrouillée
+            acquise = threading.Event()
+
+            def prendre_table_1201():
+                with gestionnaire.verrouiller(tables=[1201]):
+                    acquise.set()
+
+            thread = threading.Thread(target=prendre_table_1201)
+            thread.start()
+            thread.join(5)
+
+        # THEN
+        assert tables_lues == [1201, 1202, 1202]
+        assert acquise.is_set()
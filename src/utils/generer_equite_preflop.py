@@ -0,0 +1,109 @@
+"""
+Génère la table d'équité préflop tête-à-tête (data/equite_preflop.bin)
+
+Pour chaque confrontation de classes (AA contre KK, AKs contre QJo, ...), des
+donnes sont tirées au hasard : une paire de mains compatibles parmi celles des deux
+classes, puis un board complet. Les forces sont calculées par lots avec
+EvaluateurVectoriel.
+
+Utilisation (depuis la racine du dépôt) :
+    python src/utils/generer_equite_preflop.py --essais 5000 --graine 39
+"""
+
+import argparse
+import sys
+import time
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from business_object.equite import CalculateurEquite  # noqa: E402
+from business_object.evaluateur_vectoriel import EvaluateurVectoriel  # noqa: E402
+
+N_CLASSES = 169
+
+
+def mains_par_classe() -> list[np.ndarray]:
+    """Renvoie, pour chaque classe, le tableau (k, 2) des codes de ses mains"""
+
+    classes = [[] for _ in range(N_CLASSES)]
+    for main in combinations(range(52), 2):
+        classes[CalculateurEquite.indice_classe(main)].append(main)
+    return [np.array(mains, dtype=np.int64) for mains in classes]
+
+
+def confrontation(
+    mains_1: np.ndarray, mains_2: np.ndarray, n_essais: int, rng: np.random.Generator
+) -> tuple[float, float]:
+    """
+    Estime les probabilités de victoire et d'égalité d'une classe contre une autre
+
+    Renvois
+    -------
+    tuple[float, float]
+        probabilité de victoire de la première classe, probabilité d'égalité
+    """
+
+    # Couples de mains sans carte commune, tous équiprobables
+    couples = np.array(
+        [(*a, *b) for a in mains_1.tolist() for b in mains_2.tolist() if not set(a) & set(b)],
+        dtype=np.int64,
+    )
+    tirage = couples[rng.integers(len(couples), size=n_essais)]
+
+    # Board tiré parmi les 48 cartes restantes de chaque donne
+    cles = rng.random((n_essais, 52))
+    np.put_along_axis(cles, tirage, 2.0, axis=1)
+    board = cles.argpartition(4, axis=1)[:, :5]
+
+    lot = np.empty((2, n_essais, 7), dtype=np.int64)
+    lot[0, :, :2] = tirage[:, :2]
+    lot[1, :, :2] = tirage[:, 2:]
+    lot[:, :, 2:] = board
+    forces, _ = EvaluateurVectoriel.eval_batch(lot.reshape(-1, 7))
+    forces = forces.reshape(2, n_essais)
+
+    return float(np.mean(forces[0] > forces[1])), float(np.mean(forces[0] == forces[1]))
+
+
+def generer(n_essais: int, graine: int) -> tuple[np.ndarray, np.ndarray]:
+    """Calcule les triangles supérieurs (i <= j) des probabilités de victoire et d'égalité"""
+
+    rng = np.random.default_rng(graine)
+    classes = mains_par_classe()
+    lignes, colonnes = np.triu_indices(N_CLASSES)
+
+    victoires = np.empty(len(lignes))
+    egalites = np.empty(len(lignes))
+    debut = time.time()
+    for k, (i, j) in enumerate(zip(lignes, colonnes)):
+        victoires[k], egalites[k] = confrontation(classes[i], classes[j], n_essais, rng)
+        if i != lignes[k - 1] or k == 0:
+            print(f"{CalculateurEquite.nom_classe(i)} ({time.time() - debut:.0f} s)")
+
+    return victoires, egalites
+
+
+def ecrire(chemin: Path, victoires: np.ndarray, egalites: np.ndarray, n_essais: int) -> None:
+    """Écrit la table au format lu par CalculateurEquite.charger_table_preflop"""
+
+    entete = CalculateurEquite.ENTETE_PREFLOP.pack(
+        CalculateurEquite.SIGNATURE_PREFLOP, 1, N_CLASSES, n_essais
+    )
+    valeurs = np.round(np.concatenate([victoires, egalites]) * 65535).astype("<u2")
+    chemin.write_bytes(entete + valeurs.tobytes())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--essais", type=int, default=5000, help="donnes par confrontation")
+    parser.add_argument("--graine", type=int, default=39)
+    parser.add_argument("--sortie", type=Path, default=CalculateurEquite.FICHIER_PREFLOP)
+    arguments = parser.parse_args()
+
+    victoires, egalites = generer(arguments.essais, arguments.graine)
+    ecrire(arguments.sortie, victoires, egalites, arguments.essais)
+    print(f"Table écrite dans {arguments.sortie}")
@@ -32,9 +32,13 @@ def log(func):
     - la sortie retournée par cette méthode
     """
 
+    logger = logging.getLogger(__name__)
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(__name__)
+        # Sans journalisation active, on évite de formater les paramètres et la sortie
+        if not logger.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
 
         LogIndetation.increase_indentation()
         indentation = LogIndetation.get_indentation()
@@ -0,0 +1,172 @@
+"""Verrous par table et par joueur, pour modifier l'état du jeu depuis plusieurs threads"""
+
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+
+from utils.singleton import Singleton
+
+
+class GestionnaireVerrous(metaclass=Singleton):
+    """
+    Verrous réentrants par table et par joueur.
+
+    Les opérations sur des tables différentes s'exécutent en parallèle, celles d'une même
+    table l'une après l'autre. Pour qu'aucun interblocage ne soit possible, les verrous
+    sont toujours pris dans le même ordre : les tables par numéro croissant, puis les
+    joueurs par identifiant croissant. Un thread qui demande un verrou placé avant l'un
+    de ceux qu'il détient déjà lève une RuntimeError, au lieu de risquer un interblocage.
+
+    Un verrou n'existe que tant qu'un thread le détient ou l'attend : il est oublié à
+    sa dernière libération, si bien que le gestionnaire ne grossit pas avec chaque
+    table ou joueur rencontré. Les attentes sont mesurées par type de verrou (voir
+    statistiques).
+    """
+
+    TABLE, JOUEUR = 0, 1
+    __TYPES = ("table", "joueur")
+
+    def __init__(self):
+        """Création du gestionnaire, sans aucun verrou"""
+
+        # (type, identifiant) -> [verrou, threads qui le détiennent ou l'attendent]
+        self.__verrous = {}
+        self.__verrou_interne = threading.Lock()
+        self.__local = threading.local()
+        # Par type : acquisitions, attentes, attente cumulée et maximale (secondes)
+        self.__mesures = [[0, 0, 0.0, 0.0] for _ in self.__TYPES]
+
+    @contextmanager
+    def verrouiller(self, tables=(), joueurs=()):
+        """
+        Prend les verrous de tables et de joueurs dans l'ordre global, le temps d'un bloc with
+
+        Paramètres
+        ----------
+        tables : iterable[int]
+            numéros des tables à verrouiller (None est ignoré)
+        joueurs : iterable[int]
+            identifiants des joueurs à verrouiller (None est ignoré)
+
+        Exceptions
+        ----------
+        RuntimeError
+            si le thread détient déjà un verrou placé après l'un de ceux demandés
+        """
+
+        cles = sorted(
+            {(self.TABLE, numero) for numero in tables if numero is not None}
+            | {(self.JOUEUR, id_joueur) for id_joueur in joueurs if id_joueur is not None}
+        )
+        detenues = self.__detenues()
+        nouvelles = [cle for cle in cles if cle not in detenues]
+        if nouvelles and detenues and nouvelles[0] < max(detenues):
+            raise RuntimeError(
+                f"Ordre de verrouillage non respecté : {self.__nom(nouvelles[0])} demandé "
+                f"en détenant {self.__nom(max(detenues))}"
+            )
+
+        acquises = []
+        try:
+            for cle in cles:
+                self.__acquerir(cle)
+                acquises.append(cle)
+                detenues.append(cle)
+            yield
+        finally:
+            for cle in reversed(acquises):
+                detenues.remove(cle)
+                self.__liberer(cle)
+
+    @contextmanager
+    def verrouiller_joueur(self, id_joueur: int, table_du_joueur: Callable[[int], int | None]):
+        """
+        Verrouille la table d'un joueur puis le joueur, le temps d'un bloc with
+
+        La table du joueur est relue une fois les verrous pris : s'il en a changé entre
+        la lecture et le verrouillage, les verrous sont relâchés puis pris de nouveau.
+
+        Paramètres
+        ----------
+        id_joueur : int
+            l'identifiant du joueur
+        table_du_joueur : Callable[[int], int | None]
+            renvoie le numéro de la table du joueur (None s'il n'est à aucune table)
+        """
+
+        numero_table = table_du_joueur(id_joueur)
+        while True:
+            with self.verrouiller(tables=[numero_table], joueurs=[id_joueur]):
+                actuel = table_du_joueur(id_joueur)
+                if actuel == numero_table:
+                    yield
+                    return
+            numero_table = actuel
+
+    def statistiques(self) -> dict:
+        """
+        Mesures des verrous depuis le démarrage
+
+        Renvois
+        -------
+        dict
+            nombre de verrous actuellement détenus ou attendus, puis par type de verrou :
+            nombre d'acquisitions, nombre d'attentes (verrou déjà pris par un autre
+            thread), attente cumulée et maximale en millisecondes
+        """
+
+        with self.__verrou_interne:
+            statistiques = {"verrous": len(self.__verrous)}
+            for nom, (acquisitions, attentes, cumul, maximum) in zip(self.__TYPES, self.__mesures):
+                statistiques[nom] = {
+                    "acquisitions": acquisitions,
+                    "attentes": attentes,
+                    "attente_totale_ms": round(1000 * cumul, 3),
+                    "attente_max_ms": round(1000 * maximum, 3),
+                }
+        return statistiques
+
+    def __detenues(self) -> list[tuple[int, int]]:
+        """Verrous détenus par le thread courant, dans l'ordre d'acquisition"""
+        detenues = getattr(self.__local, "detenues", None)
+        if detenues is None:
+            detenues = self.__local.detenues = []
+        return detenues
+
+    def __acquerir(self, cle: tuple[int, int]) -> None:
+        """Prend un verrou et mesure l'attente s'il est détenu par un autre thread"""
+
+        with self.__verrou_interne:
+            entree = self.__verrous.get(cle)
+            if entree is None:
+                entree = self.__verrous[cle] = [threading.RLock(), 0]
+            entree[1] += 1
+        verrou = entree[0]
+
+        attente = 0.0
+        if not verrou.acquire(blocking=False):
+            debut = time.perf_counter()
+            verrou.acquire()
+            attente = time.perf_counter() - debut
+
+        with self.__verrou_interne:
+            mesures = self.__mesures[cle[0]]
+            mesures[0] += 1
+            if attente:
+                mesures[1] += 1
+                mesures[2] += attente
+                mesures[3] = max(mesures[3], attente)
+
+    def __liberer(self, cle: tuple[int, int]) -> None:
+        """Libère un verrou et l'oublie si plus aucun thread ne le détient ni ne l'attend"""
+
+        with self.__verrou_interne:
+            entree = self.__verrous[cle]
+            entree[0].release()
+            entree[1] -= 1
+            if entree[1] == 0:
+                del self.__verrous[cle]
+
+    def __nom(self, cle: tuple[int, int]) -> str:
+        return f"{self.__TYPES[cle[0]]} {cle[1]}"